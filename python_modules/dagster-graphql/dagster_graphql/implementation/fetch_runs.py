@@ -1,4 +1,3 @@
-import datetime
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -18,14 +17,14 @@
     _check as check,
 )
 from dagster._core.definitions.selector import JobSubsetSelector
-from dagster._core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
+from dagster._core.errors import DagsterRunNotFoundError
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
 from dagster._core.storage.event_log.base import AssetRecord
+from dagster._core.storage.runs.base import RunsFeedCursor as RunsFeedCursor
 from dagster._core.storage.tags import BACKFILL_ID_TAG, TagType, get_tag_type
-from dagster._record import copy, record
-from dagster._time import datetime_from_timestamp
+from dagster._record import copy
 from dagster._utils.warnings import disable_dagster_warnings
 
 from dagster_graphql.implementation.external import ensure_valid_config, get_remote_job_or_raise
@@ -43,9 +42,6 @@
     from dagster_graphql.schema.util import ResolveInfo
 
 
-_DELIMITER = "::"
-
-
 async def gen_run_by_id(
     graphene_info: "ResolveInfo", run_id: str
 ) -> Union["GrapheneRun", "GrapheneRunNotFoundError"]:
@@ -392,50 +388,6 @@ def get_logs_for_run(
     )
 
 
-@record
-class RunsFeedCursor:
-    """Three part cursor for paginating the Runs Feed. The run_cursor is the run_id of the oldest run that
-    has been returned. The backfill_cursor is the id of the oldest backfill that has been returned. The
-    timestamp is the timestamp of the oldest entry (run or backfill).
-
-    If the run/backfill cursor is None, that means that no runs/backfills have been returned yet and querying
-    should begin at the start of the table. Once all runs/backfills in the table have been returned, the
-    corresponding cursor should still be set to the id of the last run/backfill returned.
-
-    The timestamp is used for the following case. If a deployment has 20 runs and 0 backfills, and a query is
-    made for 10 Runs Feed entries, the first 10 runs will be returned. At this time, the run_cursor will be an id,
-    and the backfill_cursor will be None. Then a backfill is created. If a second query is made for 10 Runs Feed entries
-    the newly created backfill will get included in the list, even though it should be included on the first page by time
-    order. To prevent this, the timestamp is used to ensure that all returned entires are older than the entries on the
-    previous page.
-    """
-
-    run_cursor: Optional[str]
-    backfill_cursor: Optional[str]
-    timestamp: Optional[float]
-
-    def to_string(self) -> str:
-        return f"{self.run_cursor if self.run_cursor else ''}{_DELIMITER}{self.backfill_cursor if self.backfill_cursor else ''}{_DELIMITER}{self.timestamp if self.timestamp else ''}"
-
-    @staticmethod
-    def from_string(serialized: Optional[str]):
-        if serialized is None:
-            return RunsFeedCursor(
-                run_cursor=None,
-                backfill_cursor=None,
-                timestamp=None,
-            )
-        parts = serialized.split(_DELIMITER)
-        if len(parts) != 3:
-            raise DagsterInvariantViolationError(f"Invalid cursor for querying runs: {serialized}")
-
-        return RunsFeedCursor(
-            run_cursor=parts[0] if parts[0] else None,
-            backfill_cursor=parts[1] if parts[1] else None,
-            timestamp=float(parts[2]) if parts[2] else None,
-        )
-
-
 def _fetch_runs_not_in_backfill(
     instance: DagsterInstance,
     cursor: Optional[str],
@@ -516,23 +468,40 @@ def _bulk_action_filters_from_run_filters(filters: RunsFilter) -> BulkActionsFil
     )
 
 
-def _replace_created_before_with_cursor(
-    filters: RunsFilter, created_before_cursor: Optional[datetime.datetime]
-):
-    """After the first page of results is returned, created_before_cursor will be less than
-    filters.created_before. For pagination of results to work, we need to ensure that the
-    created_before filter is set to the minimum of created_before_cursor and filters.created_before.
+def _get_runs_feed_filters(
+    filters: Optional[RunsFilter], include_runs_from_backfills: bool
+) -> Tuple[Optional[RunsFilter], Optional[BulkActionsFilter]]:
+    """Returns the filters for the runs and the backfills in the runs feed. If the filters for runs
+    or backfills are None, that type of entry is not included in the feed.
     """
-    if filters.created_before and created_before_cursor:
-        created_before = min(created_before_cursor, filters.created_before)
-    elif created_before_cursor:
-        created_before = created_before_cursor
-    elif filters.created_before:
-        created_before = filters.created_before
-    else:  # no created_before should be applied, return filters as is
-        return filters
+    # the UI is oriented toward showing runs that are part of a backfill, but the backend
+    # is oriented toward excluding runs that are part of a backfill, so negate include_runs_from_backfills
+    # to get the value to pass to the backend
+    exclude_subruns = not include_runs_from_backfills
 
-    return copy(filters, created_before=created_before)
+    should_fetch_backfills = exclude_subruns and (
+        _filters_apply_to_backfills(filters) if filters else True
+    )
+    if filters:
+        check.invariant(
+            filters.exclude_subruns is None,
+            "filters.exclude_subruns must be None when fetching the runs feed. Use include_runs_from_backfills instead.",
+        )
+    with disable_dagster_warnings():
+        run_filters = (
+            copy(filters, exclude_subruns=exclude_subruns)
+            if filters
+            else RunsFilter(exclude_subruns=exclude_subruns)
+        )
+    backfill_filters = (
+        _bulk_action_filters_from_run_filters(run_filters) if should_fetch_backfills else None
+    )
+
+    # if we are not showing runs within backfills and the backfill_id filter is set, we know
+    # there will be no results, so we can skip fetching runs
+    should_fetch_runs = not (exclude_subruns and run_filters.tags.get(BACKFILL_ID_TAG) is not None)
+
+    return run_filters if should_fetch_runs else None, backfill_filters
 
 
 def get_runs_feed_entries(
@@ -561,135 +530,26 @@ def get_runs_feed_entries(
     check.int_param(limit, "limit")
     check.opt_inst_param(filters, "filters", RunsFilter)
 
-    instance = graphene_info.context.instance
-    runs_feed_cursor = RunsFeedCursor.from_string(cursor)
-    # the UI is oriented toward showing runs that are part of a backfill, but the backend
-    # is oriented toward excluding runs that are part of a backfill, so negate include_runs_from_backfills
-    # to get the value to pass to the backend
-    exclude_subruns = not include_runs_from_backfills
-
-    # if using limit, fetch limit+1 of each type to know if there are more than limit remaining
-    fetch_limit = limit + 1
-    # filter out any backfills/runs that are newer than the cursor timestamp. See RunsFeedCursor docstring
-    # for case when this is necessary
-    created_before_cursor = (
-        datetime_from_timestamp(runs_feed_cursor.timestamp) if runs_feed_cursor.timestamp else None
-    )
-
-    should_fetch_backfills = exclude_subruns and (
-        _filters_apply_to_backfills(filters) if filters else True
-    )
-    if filters:
-        check.invariant(
-            filters.exclude_subruns is None,
-            "filters.exclude_subruns must be None when fetching the runs feed. Use include_runs_from_backfills instead.",
-        )
-        with disable_dagster_warnings():
-            run_filters = copy(filters, exclude_subruns=exclude_subruns)
-            run_filters = _replace_created_before_with_cursor(run_filters, created_before_cursor)
-        backfill_filters = (
-            _bulk_action_filters_from_run_filters(run_filters) if should_fetch_backfills else None
-        )
-    else:
-        with disable_dagster_warnings():
-            run_filters = RunsFilter(
-                created_before=created_before_cursor, exclude_subruns=exclude_subruns
-            )
-        backfill_filters = BulkActionsFilter(created_before=created_before_cursor)
-
-    if should_fetch_backfills:
-        backfills = [
-            GraphenePartitionBackfill(backfill)
-            for backfill in instance.get_backfills(
-                cursor=runs_feed_cursor.backfill_cursor,
-                limit=fetch_limit,
-                filters=backfill_filters,
-            )
-        ]
-    else:
-        backfills = []
-
-    # if we are not showing runs within backfills and the backfill_id filter is set, we know
-    # there will be no results, so we can skip fetching runs
-    should_fetch_runs = not (exclude_subruns and run_filters.tags.get(BACKFILL_ID_TAG) is not None)
-    if should_fetch_runs:
-        runs = [
-            GrapheneRun(run)
-            for run in instance.get_run_records(
-                limit=fetch_limit, cursor=runs_feed_cursor.run_cursor, filters=run_filters
-            )
-        ]
-    else:
-        runs = []
-
-    # if we fetched limit+1 of either runs or backfills, we know there must be more results
-    # to fetch on the next call since we will return limit results for this call. Additionally,
-    # if we fetched more than limit of runs and backfill combined, we know there are more results
-    has_more = (
-        len(backfills) == fetch_limit
-        or len(runs) == fetch_limit
-        or len(backfills) + len(runs) > limit
-    )
-
-    all_entries = backfills + runs
-
-    # order runs and backfills by create_time. typically we sort by storage id but that won't work here since
-    # they are different tables
-    all_entries = sorted(
-        all_entries,
-        key=lambda x: x.creation_timestamp,
-        reverse=True,
-    )
-
-    to_return = all_entries[:limit]
-
-    new_run_cursor = None
-    new_backfill_cursor = None
-    for run in reversed(to_return):
-        if new_run_cursor is not None and new_backfill_cursor is not None:
-            break
-        if new_backfill_cursor is None and isinstance(run, GraphenePartitionBackfill):
-            new_backfill_cursor = run.id
-        if new_run_cursor is None and isinstance(run, GrapheneRun):
-            new_run_cursor = run.runId
-
-    new_timestamp = to_return[-1].creation_timestamp if to_return else None
-
-    # if either of the new cursors are None, replace with the cursor passed in so the next call doesn't
-    # restart at the top the table.
-    final_cursor = RunsFeedCursor(
-        run_cursor=new_run_cursor if new_run_cursor else runs_feed_cursor.run_cursor,
-        backfill_cursor=new_backfill_cursor
-        if new_backfill_cursor
-        else runs_feed_cursor.backfill_cursor,
-        timestamp=new_timestamp if new_timestamp else runs_feed_cursor.timestamp,
+    run_filters, backfill_filters = _get_runs_feed_filters(filters, include_runs_from_backfills)
+    conn = graphene_info.context.instance.get_runs_feed_entries(
+        limit=limit,
+        run_filters=run_filters,
+        backfill_filters=backfill_filters,
+        cursor=RunsFeedCursor.from_string(cursor),
     )
 
     return GrapheneRunsFeedConnection(
-        results=to_return, cursor=final_cursor.to_string(), hasMore=has_more
+        results=[
+            GrapheneRun(entry) if isinstance(entry, RunRecord) else GraphenePartitionBackfill(entry)
+            for entry in conn.entries
+        ],
+        cursor=conn.cursor.to_string(),
+        hasMore=conn.has_more,
     )
 
 
 def get_runs_feed_count(
     graphene_info: "ResolveInfo", filters: Optional[RunsFilter], include_runs_from_backfills: bool
 ) -> int:
-    # the UI is oriented toward showing runs that are part of a backfill, but the backend
-    # is oriented toward excluding runs that are part of a backfill, so negate include_runs_in_backfills
-    # to get the value to pass to the backend
-    exclude_subruns = not include_runs_from_backfills
-    should_fetch_backfills = exclude_subruns and (
-        _filters_apply_to_backfills(filters) if filters else True
-    )
-    with disable_dagster_warnings():
-        run_filters = (
-            copy(filters, exclude_subruns=exclude_subruns)
-            if filters
-            else RunsFilter(exclude_subruns=exclude_subruns)
-        )
-    if should_fetch_backfills:
-        backfill_filters = _bulk_action_filters_from_run_filters(run_filters)
-        backfills_count = graphene_info.context.instance.get_backfills_count(backfill_filters)
-    else:
-        backfills_count = 0
-
-    return graphene_info.context.instance.get_runs_count(run_filters) + backfills_count
+    run_filters, backfill_filters = _get_runs_feed_filters(filters, include_runs_from_backfills)
+    return graphene_info.context.instance.get_runs_feed_count(run_filters, backfill_filters)
@@ -0,0 +1,181 @@
+# ruff: noqa: T201
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from dagster import AssetsDefinition, BackfillPolicy, HourlyPartitionsDefinition, asset, repository
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.remote_asset_graph import RemoteWorkspaceAssetGraph
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillData,
+    AssetBackfillIterationResult,
+    execute_asset_backfill_iteration_inner,
+)
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import instance_for_test, mock_workspace_from_repos
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Time a single iteration of a very large asset backfill. The backfill targets every partition of
+N hourly-partitioned assets spanning Y years, where asset i depends on assets i-1 and i/2 with the
+default (identity) partition mapping:
+
+    (asset_0) ---> (asset_1) ---> (asset_2) ---> (asset_3) ---> ...
+        |                             ^              ^
+        +-----------------------------+--------------+
+
+N and Y are configurable via the `--num-assets` and `--num-years` args. With a single-run backfill
+policy (the default), the first iteration requests every targeted partition in one run. Without a
+backfill policy (`--no-backfill-policy`), it requests one run per partition of the root asset.
+
+Two iterations are timed: the first iteration, which requests runs for the roots of the backfill
+and everything that can run alongside them, and an iteration after every targeted partition has
+been requested, which finds nothing new to request.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_backfill_iteration",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=200,
+    help="Number of assets targeted by the backfill.",
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=5,
+    help="Number of years of hourly partitions targeted for each asset.",
+)
+
+parser.add_argument(
+    "--backfill-policy",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="Give every asset a single-run backfill policy.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+BACKFILL_START = datetime(2024, 1, 1)
+
+
+def build_assets(
+    num_assets: int,
+    partitions_def: PartitionsDefinition,
+    backfill_policy: Optional[BackfillPolicy],
+) -> Sequence[AssetsDefinition]:
+    assets_defs = []
+    for i in range(num_assets):
+        deps = {assets_defs[i - 1].key, assets_defs[i // 2].key} if i > 0 else set()
+
+        @asset(
+            name=f"asset_{i}",
+            partitions_def=partitions_def,
+            backfill_policy=backfill_policy,
+            deps=deps,
+        )
+        def _asset():
+            pass
+
+        assets_defs.append(_asset)
+    return assets_defs
+
+
+def build_asset_graph(assets_defs: Sequence[AssetsDefinition]) -> RemoteWorkspaceAssetGraph:
+    @repository(name="repo")
+    def repo():
+        return assets_defs
+
+    return mock_workspace_from_repos([repo]).asset_graph
+
+
+def run_iteration(
+    instance: DagsterInstance,
+    asset_graph: RemoteWorkspaceAssetGraph,
+    asset_backfill_data: AssetBackfillData,
+) -> AssetBackfillIterationResult:
+    instance_queryer = AssetGraphView(
+        temporal_context=TemporalContext(
+            effective_dt=asset_backfill_data.backfill_start_datetime, last_event_id=None
+        ),
+        instance=instance,
+        asset_graph=asset_graph,
+    ).get_inner_queryer_for_back_compat()
+    for result in execute_asset_backfill_iteration_inner(
+        backfill_id="benchmark",
+        asset_backfill_data=asset_backfill_data,
+        asset_graph=asset_graph,
+        instance_queryer=instance_queryer,
+        backfill_start_timestamp=asset_backfill_data.backfill_start_timestamp,
+        logger=logging.getLogger("asset_backfill_iteration"),
+    ):
+        if isinstance(result, AssetBackfillIterationResult):
+            return result
+    raise Exception("Backfill iteration did not produce a result")
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_years: int, backfill_policy: bool) -> None:
+    partitions_def = HourlyPartitionsDefinition(
+        start_date=BACKFILL_START - timedelta(days=365 * num_years),
+        end_date=BACKFILL_START,
+    )
+    assets_defs = build_assets(
+        num_assets, partitions_def, BackfillPolicy.single_run() if backfill_policy else None
+    )
+    asset_graph = build_asset_graph(assets_defs)
+
+    with instance_for_test() as instance:
+        asset_backfill_data = AssetBackfillData.from_asset_graph_subset(
+            asset_graph_subset=AssetGraphSubset.all(
+                asset_graph, dynamic_partitions_store=instance, current_time=BACKFILL_START
+            ),
+            backfill_start_timestamp=BACKFILL_START.timestamp(),
+            dynamic_partitions_store=instance,
+        )
+
+        session = ProfilingSession(
+            name="Asset backfill iteration",
+            experiment_settings={
+                "num_assets": num_assets,
+                "num_years": num_years,
+                "num_partitions_per_asset": len(partitions_def.get_partition_keys()),
+                "backfill_policy": backfill_policy,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time("First iteration"):
+            result = run_iteration(instance, asset_graph, asset_backfill_data)
+        print(f"Requested {len(result.run_requests)} runs")
+
+        asset_backfill_data = result.backfill_data.replace_requested_subset(
+            result.backfill_data.target_subset
+        )
+
+        with session.logged_execution_time("Iteration with every partition requested"):
+            result = run_iteration(instance, asset_graph, asset_backfill_data)
+        print(f"Requested {len(result.run_requests)} runs")
+
+        session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_years, args.backfill_policy)
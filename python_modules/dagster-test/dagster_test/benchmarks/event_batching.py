@@ -0,0 +1,156 @@
+# ruff: noqa: T201
+import argparse
+import os
+import tempfile
+import time
+from typing import Optional, Sequence
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the event log write throughput of storing the events of a run one at a time
+(`store_event`) with storing them in batches (`store_event_batch`), as the instance does for the
+informational step events it buffers per run.
+
+The comparison is run against a run-sharded sqlite storage and a consolidated sqlite storage. Pass
+--postgres-url to also run it against a postgres storage (requires dagster-postgres).
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_batching",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=2000,
+    help="Number of events written per run.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=100,
+    help="Number of events written per batch.",
+)
+
+parser.add_argument(
+    "--postgres-url",
+    type=str,
+    default=None,
+    help="URL of a postgres database to also benchmark against.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def create_events(run_id: str, num_events: int) -> Sequence[EventLogEntry]:
+    events = []
+    for i in range(num_events):
+        if i % 2:
+            events.append(
+                EventLogEntry(
+                    error_info=None,
+                    user_message=f"log message {i}",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    step_key="my_step",
+                )
+            )
+        else:
+            events.append(
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    step_key="my_step",
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ENGINE_EVENT.value,
+                        "my_job",
+                        step_key="my_step",
+                        event_specific_data=EngineEventData.in_process(os.getpid()),
+                    ),
+                )
+            )
+    return events
+
+
+def write_one_at_a_time(storage: EventLogStorage, num_events: int) -> float:
+    events = create_events(make_new_run_id(), num_events)
+    start = time.time()
+    for event in events:
+        storage.store_event(event)
+    return num_events / (time.time() - start)
+
+
+def write_batched(storage: EventLogStorage, num_events: int, batch_size: int) -> float:
+    events = create_events(make_new_run_id(), num_events)
+    start = time.time()
+    for i in range(0, num_events, batch_size):
+        storage.store_event_batch(events[i : i + batch_size])
+    return num_events / (time.time() - start)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_events: int, batch_size: int, postgres_url: Optional[str]) -> None:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storages = {
+            "sqlite": SqliteEventLogStorage(os.path.join(tmpdir_path, "sharded")),
+            "consolidated sqlite": ConsolidatedSqliteEventLogStorage(
+                os.path.join(tmpdir_path, "consolidated")
+            ),
+        }
+        if postgres_url:
+            from dagster_postgres import PostgresEventLogStorage
+
+            storages["postgres"] = PostgresEventLogStorage(postgres_url)
+
+        session = ProfilingSession(
+            name="Event batching",
+            experiment_settings={
+                "num_events": num_events,
+                "batch_size": batch_size,
+                "storages": list(storages.keys()),
+            },
+        ).start()
+
+        session.log_start_message()
+
+        for name, storage in storages.items():
+            with session.logged_execution_time(f"{name}: store_event"):
+                single = write_one_at_a_time(storage, num_events)
+            with session.logged_execution_time(f"{name}: store_event_batch"):
+                batched = write_batched(storage, num_events, batch_size)
+            results[name] = (single, batched)
+            storage.dispose()
+
+        session.log_result_summary()
+
+    print()
+    for name, (single, batched) in results.items():
+        print(
+            f"{name:>20}: {single:.0f} events/s one at a time, {batched:.0f} events/s batched"
+            f" ({batched / single:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.batch_size, args.postgres_url)
@@ -0,0 +1,181 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import threading
+import time
+from random import choice
+from typing import Mapping, Optional, Sequence
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
+from dagster._core.storage.event_log.base import EventLogRecord
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the polling event watcher topologies for N concurrently watched runs, as happens when the
+webserver has N run pages open:
+
+    per-run:      one SqlPollingEventWatcher per run, i.e. one polling thread and one SELECT per
+                  watched run on every poll (the previous design)
+    multiplexed:  a single SqlPollingEventWatcher watching all N runs on one polling thread, issuing
+                  one batched SELECT across all runs per poll
+
+Events are written to randomly chosen runs at a fixed rate for the duration of each phase. For each
+topology the script reports the number of watcher threads and the number of event log queries
+issued per second.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_log_watcher",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=200,
+    help="Number of runs watched concurrently.",
+)
+
+parser.add_argument(
+    "--duration",
+    type=float,
+    default=10.0,
+    help="Number of seconds each topology is observed for.",
+)
+
+parser.add_argument(
+    "--events-per-second",
+    type=float,
+    default=50.0,
+    help="Rate at which events are written to randomly chosen watched runs.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class QueryCountingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated sqlite event log storage that counts the batched run queries issued by
+    watchers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._count_lock = threading.Lock()
+        self.query_count = 0
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        with self._count_lock:
+            self.query_count += 1
+        return super().get_records_for_runs(cursors_by_run_id, limit=limit)
+
+
+def create_event(run_id: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def count_watcher_threads() -> int:
+    return len([t for t in threading.enumerate() if t.name.startswith("sql-event-watch")])
+
+
+def observe(
+    storage: QueryCountingEventLogStorage,
+    watchers: Sequence[SqlPollingEventWatcher],
+    run_ids: Sequence[str],
+    duration: float,
+    events_per_second: float,
+) -> Mapping[str, float]:
+    storage.query_count = 0
+    num_threads = count_watcher_threads()
+    start = time.time()
+    while time.time() - start < duration:
+        storage.store_event(create_event(choice(run_ids)))
+        time.sleep(1.0 / events_per_second)
+    elapsed = time.time() - start
+    for watcher in watchers:
+        watcher.close()
+    return {
+        "threads": num_threads,
+        "queries_per_second": storage.query_count / elapsed,
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: int, duration: float, events_per_second: float) -> None:
+    run_ids = [make_new_run_id() for _ in range(num_runs)]
+
+    def _callback(_event, _cursor):
+        pass
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = QueryCountingEventLogStorage(tmpdir_path)
+
+        session = ProfilingSession(
+            name="Event log watcher",
+            experiment_settings={
+                "num_runs": num_runs,
+                "duration": duration,
+                "events_per_second": events_per_second,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time("Per-run watchers"):
+            watchers = []
+            for run_id in run_ids:
+                watcher = SqlPollingEventWatcher(storage)
+                watcher.watch_run(run_id, None, _callback)
+                watchers.append(watcher)
+            results["per-run"] = observe(storage, watchers, run_ids, duration, events_per_second)
+
+        with session.logged_execution_time("Multiplexed watcher"):
+            watcher = SqlPollingEventWatcher(storage)
+            for run_id in run_ids:
+                watcher.watch_run(run_id, None, _callback)
+            results["multiplexed"] = observe(
+                storage, [watcher], run_ids, duration, events_per_second
+            )
+
+        session.log_result_summary()
+        storage.dispose()
+
+    print()
+    for name, result in results.items():
+        print(
+            f"{name:>12}: {result['threads']} watcher threads,"
+            f" {result['queries_per_second']:.1f} queries/s"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.duration, args.events_per_second)
@@ -0,0 +1,171 @@
+# ruff: noqa: T201
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping
+
+from dagster import Definitions, RunRequest, job, op, sensor
+from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
+from dagster._core.remote_representation.handle import RepositoryHandle
+from dagster._core.remote_representation.origin import GrpcServerCodeLocationOrigin
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.client import clear_grpc_channel_pools
+from dagster._grpc.server import GrpcServerProcess
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare sensor evaluation throughput against a local code server with and without the gRPC channel
+pool:
+
+    per-call:  every gRPC call opens a new channel (and HTTP/2 connection) and closes it afterwards,
+               as with DAGSTER_GRPC_DISABLE_CHANNEL_POOL set (the previous behavior)
+    pooled:    every call shares a long-lived channel to the server
+
+Each phase evaluates a trivial sensor from a thread pool for a fixed duration, as the sensor daemon
+does with its threaded evaluation, and reports evaluations per second and mean latency.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="grpc_channel_pool",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--duration",
+    type=float,
+    default=10.0,
+    help="Number of seconds each phase runs for.",
+)
+
+parser.add_argument(
+    "--num-workers",
+    type=int,
+    default=4,
+    help="Number of threads evaluating the sensor concurrently.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+@sensor(job=noop_job)
+def noop_sensor():
+    yield RunRequest(run_key=None)
+
+
+defs = Definitions(jobs=[noop_job], sensors=[noop_sensor])
+
+
+def evaluate_sensor(
+    location: GrpcServerCodeLocation, repository_handle: RepositoryHandle, instance
+) -> float:
+    start = time.time()
+    location.get_sensor_execution_data(
+        instance,
+        repository_handle,
+        "noop_sensor",
+        last_tick_completion_time=None,
+        last_run_key=None,
+        cursor=None,
+        log_key=None,
+        last_sensor_start_time=None,
+    )
+    return time.time() - start
+
+
+def observe(
+    location: GrpcServerCodeLocation,
+    repository_handle: RepositoryHandle,
+    instance,
+    duration: float,
+    num_workers: int,
+) -> Mapping[str, float]:
+    latencies = []
+
+    def _evaluate_until_deadline(deadline: float) -> None:
+        while time.time() < deadline:
+            latencies.append(evaluate_sensor(location, repository_handle, instance))
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for _ in range(num_workers):
+            executor.submit(_evaluate_until_deadline, start + duration)
+    elapsed = time.time() - start
+    return {
+        "evaluations_per_second": len(latencies) / elapsed,
+        "mean_latency_ms": 1000 * sum(latencies) / max(len(latencies), 1),
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(duration: float, num_workers: int) -> None:
+    results = {}
+    with instance_for_test() as instance:
+        loadable_target_origin = LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=__file__,
+            attribute="defs",
+        )
+        with GrpcServerProcess(
+            instance_ref=instance.get_ref(),
+            loadable_target_origin=loadable_target_origin,
+            force_port=True,
+            wait_on_exit=True,
+        ) as server_process:
+            origin = GrpcServerCodeLocationOrigin(
+                host="localhost", port=server_process.port, location_name="benchmark"
+            )
+            with GrpcServerCodeLocation(origin=origin, instance=instance) as location:
+                repository_handle = location.get_repository("__repository__").handle
+
+                session = ProfilingSession(
+                    name="gRPC channel pool",
+                    experiment_settings={"duration": duration, "num_workers": num_workers},
+                ).start()
+
+                session.log_start_message()
+
+                with session.logged_execution_time("Per-call channels"):
+                    location.client._use_channel_pool = False  # noqa: SLF001
+                    results["per-call"] = observe(
+                        location, repository_handle, instance, duration, num_workers
+                    )
+
+                with session.logged_execution_time("Pooled channels"):
+                    location.client._use_channel_pool = True  # noqa: SLF001
+                    results["pooled"] = observe(
+                        location, repository_handle, instance, duration, num_workers
+                    )
+
+                session.log_result_summary()
+            clear_grpc_channel_pools()
+
+    print()
+    for name, result in results.items():
+        print(
+            f"{name:>10}: {result['evaluations_per_second']:.1f} evaluations/s,"
+            f" {result['mean_latency_ms']:.1f} ms mean latency"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.duration, args.num_workers)
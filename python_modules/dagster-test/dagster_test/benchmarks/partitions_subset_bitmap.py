@@ -0,0 +1,162 @@
+# ruff: noqa: T201
+import argparse
+import random
+import timeit
+import tracemalloc
+from typing import Callable, Mapping, Sequence, Tuple
+
+from dagster import StaticPartitionsDefinition
+from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+    PartitionsSubset,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the set-based DefaultPartitionsSubset with the bitmap-based BitmapPartitionsSubset that
+StaticPartitionsDefinition and DynamicPartitionsDefinition now use.
+
+For each number of partitions in `--num-partitions`, two subsets are drawn at random from a static
+partitions definition, each containing `--density` of its partitions. The script reports the best
+time of each operation over `--repeat` runs, and the memory allocated to hold one subset.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partitions_subset_bitmap",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    nargs="+",
+    default=[50_000, 500_000],
+    help="Numbers of partitions in the partitions definition.",
+)
+
+parser.add_argument(
+    "--density",
+    type=float,
+    default=0.5,
+    help="Fraction of the partitions included in each subset.",
+)
+
+parser.add_argument(
+    "--num-keys",
+    type=int,
+    default=1000,
+    help="Number of partition keys looked up by the `contains` operation.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=5,
+    help="Number of times each operation is timed.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_operations(
+    a: PartitionsSubset, b: PartitionsSubset, lookup_keys: Sequence[str]
+) -> Mapping[str, Callable[[], object]]:
+    return {
+        "or": lambda: a | b,
+        "and": lambda: a & b,
+        "sub": lambda: a - b,
+        "len": lambda: len(a),
+        "contains": lambda: [key in a for key in lookup_keys],
+        "get_partition_keys": lambda: list(a.get_partition_keys()),
+        "serialize": lambda: a.serialize(),
+    }
+
+
+def subset_size(build: Callable[[], PartitionsSubset]) -> int:
+    tracemalloc.start()
+    subset = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del subset
+    return size
+
+
+def time_operations(
+    num_partitions: int,
+    density: float,
+    num_keys: int,
+    repeat: int,
+    session: ProfilingSession,
+) -> Mapping[str, Tuple[float, float]]:
+    rng = random.Random(0)
+    partition_keys = [f"customer_{i}" for i in range(num_partitions)]
+    partitions_def = StaticPartitionsDefinition(partition_keys)
+    keys_a = rng.sample(partition_keys, int(num_partitions * density))
+    keys_b = rng.sample(partition_keys, int(num_partitions * density))
+    lookup_keys = rng.sample(partition_keys, min(num_keys, num_partitions))
+
+    subsets = {
+        "set": (DefaultPartitionsSubset(set(keys_a)), DefaultPartitionsSubset(set(keys_b))),
+        "bitmap": (
+            partitions_def.empty_subset().with_partition_keys(keys_a),
+            partitions_def.empty_subset().with_partition_keys(keys_b),
+        ),
+    }
+    assert isinstance(subsets["bitmap"][0], BitmapPartitionsSubset)
+
+    results = {}
+    for op_name in get_operations(*subsets["set"], lookup_keys):
+        timings = []
+        for impl, (a, b) in subsets.items():
+            fn = get_operations(a, b, lookup_keys)[op_name]
+            with session.logged_execution_time(f"{num_partitions} partitions, {impl}: {op_name}"):
+                timings.append(min(timeit.repeat(fn, number=1, repeat=repeat)))
+        results[op_name] = (timings[0], timings[1])
+
+    results["memory (MB)"] = (
+        subset_size(lambda: DefaultPartitionsSubset(set(keys_a))) / 1e6,
+        subset_size(lambda: partitions_def.empty_subset().with_partition_keys(keys_a)) / 1e6,
+    )
+    return results
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions: Sequence[int], density: float, num_keys: int, repeat: int) -> None:
+    session = ProfilingSession(
+        name="Partitions subset bitmaps",
+        experiment_settings={
+            "num_partitions": num_partitions,
+            "density": density,
+            "num_keys": num_keys,
+            "repeat": repeat,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    results = {n: time_operations(n, density, num_keys, repeat, session) for n in num_partitions}
+
+    session.log_result_summary()
+
+    print()
+    for n, timings in results.items():
+        print(f"{n} partitions:")
+        print(f"  {'':>20}  {'set':>10}  {'bitmap':>10}")
+        for op_name, (set_value, bitmap_value) in timings.items():
+            if op_name.startswith("memory"):
+                print(f"  {op_name:>20}  {set_value:>10.2f}  {bitmap_value:>10.2f}")
+            else:
+                print(f"  {op_name:>20}  {set_value * 1000:>8.2f}ms  {bitmap_value * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.density, args.num_keys, args.repeat)
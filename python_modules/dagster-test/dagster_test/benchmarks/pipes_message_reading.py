@@ -0,0 +1,283 @@
+# ruff: noqa: T201
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from random import choice
+from typing import Any, Iterator, List, Mapping, Optional
+
+import dagster._core.pipes.utils as pipes_utils
+from dagster._core.pipes.utils import (
+    PipesBlobStoreMessageReader,
+    PipesFileMessageReader,
+    PipesParams,
+)
+from dagster._utils import tail_file
+from dagster_pipes import _make_message
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the ways Pipes message readers wait for new messages.
+
+File message readers: N concurrent Pipes sessions each tail a local message file, while messages
+are appended to randomly chosen files at a fixed rate:
+
+    legacy:    each reader polls its file every 10ms (the previous design)
+    polling:   each reader polls its file with an interval that backs off while the file is idle
+    watched:   each reader sleeps until a shared inotify watch reports a change to its file
+
+For each mode the script reports the latency between writing and handling a message, and the CPU
+time spent per session per second.
+
+Blob store message readers: a backlog of chunks is written before the reader starts, as happens when
+the external process writes faster than the polling interval:
+
+    legacy:    one chunk is downloaded per polling interval (the previous design)
+    drained:   all the chunks written since the last poll are downloaded at once
+
+For each mode the script reports the time taken to handle the backlog.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="pipes_message_reading",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-sessions",
+    type=int,
+    default=50,
+    help="Number of Pipes sessions reading message files concurrently.",
+)
+
+parser.add_argument(
+    "--duration",
+    type=float,
+    default=10.0,
+    help="Number of seconds each file message reader mode is observed for.",
+)
+
+parser.add_argument(
+    "--messages-per-second",
+    type=float,
+    default=20.0,
+    help="Rate at which messages are written to randomly chosen message files.",
+)
+
+parser.add_argument(
+    "--num-chunks",
+    type=int,
+    default=20,
+    help="Number of chunks in the backlog read by blob store message readers.",
+)
+
+parser.add_argument(
+    "--blob-store-interval",
+    type=float,
+    default=0.1,
+    help="Polling interval in seconds of blob store message readers.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class LatencyRecordingMessageHandler:
+    """Stand-in for a PipesMessageHandler that records how long messages took to be handled."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.received_closed_message = False
+
+    def handle_message(self, message: Mapping[str, Any]) -> None:
+        if message["method"] == "closed":
+            self.received_closed_message = True
+        else:
+            self.latencies.append(time.time() - message["params"]["sent"])
+
+    def report_pipes_framework_exception(self, origin: str, exc_info) -> None:
+        raise Exception(f"{origin} failed") from exc_info[1]
+
+
+class LegacyPipesFileMessageReader(PipesFileMessageReader):
+    """File message reader that polls its file every 10ms."""
+
+    def _reader_thread(self, handler, is_resource_complete, wakeup) -> None:
+        for line in tail_file(self._path, lambda: is_resource_complete.is_set()):
+            handler.handle_message(json.loads(line))
+
+
+class _UnwatchedFileWatcher:
+    @contextmanager
+    def watch(self, path: str, wakeup: threading.Event) -> Iterator[bool]:
+        yield False
+
+
+@contextmanager
+def file_watching_disabled() -> Iterator[None]:
+    file_watcher = pipes_utils._file_watcher  # noqa: SLF001
+    pipes_utils._file_watcher = _UnwatchedFileWatcher()  # noqa: SLF001
+    try:
+        yield
+    finally:
+        pipes_utils._file_watcher = file_watcher  # noqa: SLF001
+
+
+class InMemoryPipesBlobStoreMessageReader(PipesBlobStoreMessageReader):
+    def __init__(self, chunks: Mapping[int, str], interval: float):
+        super().__init__(interval=interval)
+        self.chunks = chunks
+
+    @contextmanager
+    def get_params(self) -> Iterator[PipesParams]:
+        yield {}
+
+    def messages_are_readable(self, params: PipesParams) -> bool:
+        return True
+
+    def download_messages_chunk(self, index: int, params: PipesParams) -> Optional[str]:
+        return self.chunks.get(index)
+
+    def no_messages_debug_text(self) -> str:
+        return "Attempted to read messages from memory."
+
+
+class LegacyInMemoryPipesBlobStoreMessageReader(InMemoryPipesBlobStoreMessageReader):
+    """Blob store message reader that downloads one chunk per polling interval."""
+
+    def download_messages(self, cursor, params):
+        chunk = self.download_messages_chunk(self.counter, params)
+        if chunk:
+            self.counter += 1
+            return self.counter, chunk
+
+
+def make_message_line() -> str:
+    return json.dumps(_make_message(method="log", params={"sent": time.time()}))
+
+
+def observe_file_message_readers(
+    reader_class: type, num_sessions: int, duration: float, messages_per_second: float
+) -> Mapping[str, float]:
+    handler = LatencyRecordingMessageHandler()
+    with tempfile.TemporaryDirectory() as tmpdir_path, ExitStack() as stack:
+        paths = [os.path.join(tmpdir_path, f"messages_{i}.txt") for i in range(num_sessions)]
+        for path in paths:
+            stack.enter_context(reader_class(path).read_messages(handler))
+
+        cpu_start = time.process_time()
+        start = time.time()
+        while time.time() - start < duration:
+            with open(choice(paths), "a") as file:
+                file.write(make_message_line() + "\n")
+            time.sleep(1.0 / messages_per_second)
+        # let the readers handle the last messages
+        time.sleep(0.5)
+        elapsed = time.time() - start
+        cpu_time = time.process_time() - cpu_start
+
+    latencies = sorted(handler.latencies)
+    return {
+        "messages": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "cpu_ms_per_session_second": cpu_time * 1000 / (num_sessions * elapsed),
+    }
+
+
+def observe_blob_store_message_reader(
+    reader_class: type, num_chunks: int, interval: float
+) -> float:
+    chunks = {index: make_message_line() for index in range(1, num_chunks)}
+    chunks[num_chunks] = json.dumps(_make_message(method="closed", params=None))
+    handler = LatencyRecordingMessageHandler()
+    reader = reader_class(chunks, interval)
+    start = time.time()
+    with reader.read_messages(handler):
+        while not handler.received_closed_message:
+            time.sleep(0.001)
+    return time.time() - start
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_sessions: int,
+    duration: float,
+    messages_per_second: float,
+    num_chunks: int,
+    blob_store_interval: float,
+) -> None:
+    file_results = {}
+    blob_store_results = {}
+
+    session = ProfilingSession(
+        name="Pipes message reading",
+        experiment_settings={
+            "num_sessions": num_sessions,
+            "duration": duration,
+            "messages_per_second": messages_per_second,
+            "num_chunks": num_chunks,
+            "blob_store_interval": blob_store_interval,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Legacy file message readers"):
+        file_results["legacy"] = observe_file_message_readers(
+            LegacyPipesFileMessageReader, num_sessions, duration, messages_per_second
+        )
+
+    with session.logged_execution_time("Polling file message readers"):
+        with file_watching_disabled():
+            file_results["polling"] = observe_file_message_readers(
+                PipesFileMessageReader, num_sessions, duration, messages_per_second
+            )
+
+    with session.logged_execution_time("Watched file message readers"):
+        file_results["watched"] = observe_file_message_readers(
+            PipesFileMessageReader, num_sessions, duration, messages_per_second
+        )
+
+    with session.logged_execution_time("Legacy blob store message reader"):
+        blob_store_results["legacy"] = observe_blob_store_message_reader(
+            LegacyInMemoryPipesBlobStoreMessageReader, num_chunks, blob_store_interval
+        )
+
+    with session.logged_execution_time("Drained blob store message reader"):
+        blob_store_results["drained"] = observe_blob_store_message_reader(
+            InMemoryPipesBlobStoreMessageReader, num_chunks, blob_store_interval
+        )
+
+    session.log_result_summary()
+
+    print()
+    for name, result in file_results.items():
+        print(
+            f"{name:>8} file readers: {result['messages']} messages,"
+            f" p50 latency {result['p50_ms']:.1f}ms, p99 latency {result['p99_ms']:.1f}ms,"
+            f" {result['cpu_ms_per_session_second']:.2f}ms CPU per session per second"
+        )
+    for name, elapsed in blob_store_results.items():
+        print(f"{name:>8} blob store reader: {num_chunks} chunks handled in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.num_sessions,
+        args.duration,
+        args.messages_per_second,
+        args.num_chunks,
+        args.blob_store_interval,
+    )
@@ -0,0 +1,221 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
+from dagster._core.remote_representation.origin import (
+    GrpcServerCodeLocationOrigin,
+    RemotePartitionSetOrigin,
+    RemoteRepositoryOrigin,
+)
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.runs import SqliteRunStorage
+from dagster._core.storage.runs.base import RunsFeedCursor, RunStorage
+from dagster._core.storage.runs.schema import BulkActionsTable, RunsTable
+from dagster._core.utils import make_new_run_id
+from dagster._serdes import serialize_value
+from dagster._time import datetime_from_timestamp
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare paging through the runs feed by merging separately fetched runs and backfills in Python
+(the generic `RunStorage.get_runs_feed_entries`) with merging them in a single SQL statement (the
+`SqlRunStorage` implementation).
+
+A sqlite run storage is filled with N runs that are not part of a backfill and one backfill for
+every B runs, created one second apart. The first P pages of size L are then fetched with each
+implementation, with and without a status filter, along with the feed count.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="runs_feed_paging",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=1_000_000,
+    help="Number of runs in the run storage.",
+)
+
+parser.add_argument(
+    "--runs-per-backfill",
+    type=int,
+    default=100,
+    help="Number of runs created for every backfill created.",
+)
+
+parser.add_argument(
+    "--page-size",
+    type=int,
+    default=25,
+    help="Number of runs feed entries per page.",
+)
+
+parser.add_argument(
+    "--num-pages",
+    type=int,
+    default=20,
+    help="Number of pages fetched for each experiment.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+CREATE_START = datetime(2020, 1, 1)
+INSERT_CHUNK_SIZE = 10_000
+
+PARTITION_SET_ORIGIN = RemotePartitionSetOrigin(
+    repository_origin=RemoteRepositoryOrigin(
+        code_location_origin=GrpcServerCodeLocationOrigin(host="localhost", port=4000),
+        repository_name="repo",
+    ),
+    partition_set_name="partition_set",
+)
+
+
+def populate_storage(storage: SqliteRunStorage, num_runs: int, runs_per_backfill: int) -> None:
+    # insert rows directly rather than through add_run / add_backfill, which would take hours for
+    # millions of runs, so that each entry can be given its own creation time
+    statuses = [DagsterRunStatus.SUCCESS, DagsterRunStatus.FAILURE, DagsterRunStatus.CANCELED]
+    run_rows = []
+    backfill_rows = []
+    with storage.connect() as conn:
+        for i in range(num_runs):
+            create_timestamp = CREATE_START + timedelta(seconds=i)
+            run = DagsterRun(
+                job_name="job",
+                run_id=make_new_run_id(),
+                status=statuses[i % len(statuses)],
+            )
+            run_rows.append(
+                dict(
+                    run_id=run.run_id,
+                    pipeline_name=run.job_name,
+                    status=run.status.value,
+                    run_body=serialize_value(run),
+                    create_timestamp=create_timestamp,
+                    update_timestamp=create_timestamp,
+                )
+            )
+            if i % runs_per_backfill == 0:
+                backfill = PartitionBackfill(
+                    f"backfill_{i}",
+                    partition_set_origin=PARTITION_SET_ORIGIN,
+                    status=BulkActionStatus.COMPLETED_SUCCESS,
+                    partition_names=["a"],
+                    from_failure=False,
+                    tags={},
+                    backfill_timestamp=(create_timestamp + timedelta(milliseconds=500)).timestamp(),
+                )
+                backfill_rows.append(
+                    dict(
+                        key=backfill.backfill_id,
+                        status=backfill.status.value,
+                        timestamp=datetime_from_timestamp(backfill.backfill_timestamp),
+                        body=serialize_value(backfill),
+                        job_name=backfill.job_name,
+                    )
+                )
+            if len(run_rows) == INSERT_CHUNK_SIZE:
+                conn.execute(RunsTable.insert(), run_rows)
+                run_rows = []
+        if run_rows:
+            conn.execute(RunsTable.insert(), run_rows)
+        if backfill_rows:
+            conn.execute(BulkActionsTable.insert(), backfill_rows)
+
+
+def page_through_feed(
+    storage: SqliteRunStorage,
+    merge_in_python: bool,
+    run_filters: RunsFilter,
+    backfill_filters: BulkActionsFilter,
+    page_size: int,
+    num_pages: int,
+) -> int:
+    get_runs_feed_entries = (
+        RunStorage.get_runs_feed_entries
+        if merge_in_python
+        else SqliteRunStorage.get_runs_feed_entries
+    )
+    cursor: Optional[RunsFeedCursor] = None
+    num_entries = 0
+    for _ in range(num_pages):
+        conn = get_runs_feed_entries(storage, page_size, run_filters, backfill_filters, cursor)
+        num_entries += len(conn.entries)
+        cursor = conn.cursor
+        if not conn.has_more:
+            break
+    return num_entries
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: int, runs_per_backfill: int, page_size: int, num_pages: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteRunStorage.from_local(temp_dir)
+
+        start = time.time()
+        populate_storage(storage, num_runs, runs_per_backfill)
+        print(f"Populated run storage in {time.time() - start:.2f} seconds")
+
+        unfiltered = (RunsFilter(exclude_subruns=True), BulkActionsFilter())
+        failed = (
+            RunsFilter(statuses=[DagsterRunStatus.FAILURE], exclude_subruns=True),
+            BulkActionsFilter(
+                statuses=[BulkActionStatus.FAILED, BulkActionStatus.COMPLETED_FAILED]
+            ),
+        )
+
+        session = ProfilingSession(
+            name="Runs feed paging",
+            experiment_settings={
+                "num_runs": num_runs,
+                "num_backfills": len(range(0, num_runs, runs_per_backfill)),
+                "page_size": page_size,
+                "num_pages": num_pages,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        for filters_name, (run_filters, backfill_filters) in [
+            ("unfiltered", unfiltered),
+            ("failed runs", failed),
+        ]:
+            for merge_in_python in [True, False]:
+                merge_name = "python merge" if merge_in_python else "sql merge"
+                with session.logged_execution_time(
+                    f"{num_pages} pages, {filters_name}, {merge_name}"
+                ):
+                    page_through_feed(
+                        storage,
+                        merge_in_python,
+                        run_filters,
+                        backfill_filters,
+                        page_size,
+                        num_pages,
+                    )
+
+            with session.logged_execution_time(f"Count, {filters_name}, separate counts"):
+                RunStorage.get_runs_feed_count(storage, run_filters, backfill_filters)
+
+            with session.logged_execution_time(f"Count, {filters_name}, single statement"):
+                storage.get_runs_feed_count(run_filters, backfill_filters)
+
+        session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.runs_per_backfill, args.page_size, args.num_pages)
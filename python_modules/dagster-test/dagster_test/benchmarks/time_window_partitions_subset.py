@@ -0,0 +1,219 @@
+# ruff: noqa: T201
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Mapping, Tuple
+
+from dagster import HourlyPartitionsDefinition, TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import (
+    PersistedTimeWindow,
+    TimeWindowPartitionsSubset,
+)
+from dagster._core.definitions.timestamp import TimestampWithTimezone
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Microbenchmark the set operations of TimeWindowPartitionsSubset over long, fragmented partition
+histories:
+
+    hourly:    an hourly partitions definition spanning `--years` years
+    minutely:  a per-minute partitions definition spanning `--days` days
+
+For each partitions definition, two subsets are generated by alternating runs of included and
+excluded partitions, with run lengths drawn uniformly from [1, `--max-run-length`]. Smaller run
+lengths produce more fragmented subsets, i.e. more time windows per subset. The script reports the
+number of time windows in each subset and the best time of each operation over `--repeat` runs.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions_subset",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--years",
+    type=int,
+    default=3,
+    help="Number of years spanned by the hourly partitions definition.",
+)
+
+parser.add_argument(
+    "--days",
+    type=int,
+    default=30,
+    help="Number of days spanned by the per-minute partitions definition.",
+)
+
+parser.add_argument(
+    "--max-run-length",
+    type=int,
+    default=3,
+    help="Maximum number of consecutive partitions that are included or excluded together.",
+)
+
+parser.add_argument(
+    "--num-keys",
+    type=int,
+    default=50,
+    help="Number of partition keys added to or looked up in a subset by the per-key operations.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=5,
+    help="Number of times each operation is timed.",
+)
+
+START = datetime(2020, 1, 1)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def fragmented_subset(
+    partitions_def: TimeWindowPartitionsDefinition,
+    num_partitions: int,
+    partition_seconds: int,
+    max_run_length: int,
+    rng: random.Random,
+) -> TimeWindowPartitionsSubset:
+    timezone = partitions_def.timezone
+    start_timestamp = START.timestamp()
+    windows = []
+    i = 0
+    while i < num_partitions:
+        run_length = rng.randint(1, max_run_length)
+        end = min(i + run_length, num_partitions)
+        windows.append(
+            PersistedTimeWindow(
+                TimestampWithTimezone(start_timestamp + i * partition_seconds, timezone),
+                TimestampWithTimezone(start_timestamp + end * partition_seconds, timezone),
+            )
+        )
+        # skip a run of excluded partitions
+        i = end + rng.randint(1, max_run_length)
+    return TimeWindowPartitionsSubset(
+        partitions_def=partitions_def, num_partitions=None, included_time_windows=windows
+    )
+
+
+def get_operations(
+    a: TimeWindowPartitionsSubset,
+    b: TimeWindowPartitionsSubset,
+    num_keys: int,
+    rng: random.Random,
+) -> Mapping[str, Callable[[], object]]:
+    partitions_def = a.partitions_def
+    partition_keys = [
+        partitions_def.get_partition_key_for_timestamp(window.start.timestamp())
+        for window in rng.sample(
+            list(b.included_time_windows), min(num_keys, len(b.included_time_windows))
+        )
+    ]
+
+    # each operation runs against fresh copies so that no cached state carries over between runs
+    def _copy(subset: TimeWindowPartitionsSubset) -> TimeWindowPartitionsSubset:
+        return TimeWindowPartitionsSubset(
+            partitions_def=subset.partitions_def,
+            num_partitions=subset.num_partitions,
+            included_time_windows=subset.included_time_windows,
+        )
+
+    return {
+        "and": lambda: _copy(a) & _copy(b),
+        "or": lambda: _copy(a) | _copy(b),
+        "sub": lambda: _copy(a) - _copy(b),
+        "with_partition_keys": lambda: _copy(a).with_partition_keys(partition_keys),
+        "contains": lambda: [key in a for key in partition_keys],
+    }
+
+
+def time_operations(
+    name: str,
+    partitions_def: TimeWindowPartitionsDefinition,
+    num_partitions: int,
+    partition_seconds: int,
+    max_run_length: int,
+    num_keys: int,
+    repeat: int,
+    session: ProfilingSession,
+) -> Tuple[int, Mapping[str, float]]:
+    rng = random.Random(0)
+    a = fragmented_subset(partitions_def, num_partitions, partition_seconds, max_run_length, rng)
+    b = fragmented_subset(partitions_def, num_partitions, partition_seconds, max_run_length, rng)
+
+    results = {}
+    for op_name, fn in get_operations(a, b, num_keys, rng).items():
+        with session.logged_execution_time(f"{name}: {op_name}"):
+            results[op_name] = min(timeit.repeat(fn, number=1, repeat=repeat))
+    return len(a.included_time_windows), results
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(years: int, days: int, max_run_length: int, num_keys: int, repeat: int) -> None:
+    hourly_partitions_def = HourlyPartitionsDefinition(
+        start_date=START, end_date=START + timedelta(days=365 * years)
+    )
+    minutely_partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="* * * * *",
+        start=START,
+        end=START + timedelta(days=days),
+        fmt="%Y-%m-%d-%H:%M",
+    )
+
+    session = ProfilingSession(
+        name="TimeWindowPartitionsSubset operations",
+        experiment_settings={
+            "years": years,
+            "days": days,
+            "max_run_length": max_run_length,
+            "num_keys": num_keys,
+            "repeat": repeat,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    results = {
+        "hourly": time_operations(
+            "hourly",
+            hourly_partitions_def,
+            24 * 365 * years,
+            3600,
+            max_run_length,
+            num_keys,
+            repeat,
+            session,
+        ),
+        "minutely": time_operations(
+            "minutely",
+            minutely_partitions_def,
+            24 * 60 * days,
+            60,
+            max_run_length,
+            num_keys,
+            repeat,
+            session,
+        ),
+    }
+
+    session.log_result_summary()
+
+    print()
+    for name, (num_windows, timings) in results.items():
+        print(f"{name} ({num_windows} time windows per subset):")
+        for op_name, seconds in timings.items():
+            print(f"  {op_name:>32}: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.years, args.days, args.max_run_length, args.num_keys, args.repeat)
@@ -6,13 +6,14 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from starlette.applications import Starlette
 
-from dagster_webserver.webserver import DagsterWebserver
+from dagster_webserver.webserver import DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE, DagsterWebserver
 
 
 def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: Optional[int] = None,
+    max_report_asset_events_batch_size: int = DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
@@ -36,4 +37,5 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        max_report_asset_events_batch_size=max_report_asset_events_batch_size,
     ).create_asgi_app(**kwargs)
@@ -26,6 +26,7 @@
 
 from dagster_webserver.app import create_app_from_workspace_process_context
 from dagster_webserver.version import __version__
+from dagster_webserver.webserver import DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE
 
 
 def create_dagster_webserver_cli():
@@ -179,6 +180,15 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--max-report-asset-events-batch-size",
+    help="Maximum number of events that may be reported in a single request to the"
+    " /report_asset_events endpoint",
+    type=click.INT,
+    required=False,
+    default=DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE,
+    show_default=True,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -194,6 +204,7 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    max_report_asset_events_batch_size: int,
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -230,6 +241,7 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                max_report_asset_events_batch_size,
             )
 
 
@@ -253,6 +265,7 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    max_report_asset_events_batch_size: int = DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -261,11 +274,16 @@ def host_dagster_ui_with_workspace_process_context(
     check.opt_int_param(port, "port")
     check.str_param(path_prefix, "path_prefix")
     check.opt_int_param(live_data_poll_rate, "live_data_poll_rate")
+    check.int_param(max_report_asset_events_batch_size, "max_report_asset_events_batch_size")
 
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        max_report_asset_events_batch_size,
+        lifespan=_lifespan,
     )
 
     if not port:
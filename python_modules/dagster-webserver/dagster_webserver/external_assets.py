@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Mapping, Sequence, Union
 
 import dagster._check as check
 from dagster import AssetObservation
@@ -10,7 +10,8 @@
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.workspace.context import BaseWorkspaceRequestContext
-from dagster._seven import json
+from dagster._seven import JSONDecodeError, json
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
@@ -296,6 +297,145 @@ async def handle_report_asset_observation_request(
     return JSONResponse({})
 
 
+def _asset_event_from_batch_item(
+    item: Any, tags: Mapping[str, str]
+) -> Union[AssetMaterialization, AssetObservation, AssetCheckEvaluation]:
+    # Build a single runless asset event from an item of a report_asset_events body. Raises if
+    # the item is invalid.
+    if not isinstance(item, dict):
+        raise Exception(f"Expected a json object, got {type(item).__name__}.")
+
+    event_type = item.get(ReportAssetEventsParam.type)
+    if ReportAssetEventsParam.asset_key not in item:
+        raise Exception("Missing required parameter 'asset_key'.")
+    asset_key = AssetKey(item[ReportAssetEventsParam.asset_key])
+
+    if event_type == ReportAssetEventType.asset_check_evaluation:
+        if ReportAssetCheckEvalParam.passed not in item:
+            raise Exception("Missing required parameter 'passed'.")
+        return AssetCheckEvaluation(
+            check_name=item.get(ReportAssetCheckEvalParam.check_name),  # type: ignore  # (validated by constructor)
+            passed=item[ReportAssetCheckEvalParam.passed],
+            asset_key=asset_key,
+            metadata=item.get(ReportAssetCheckEvalParam.metadata) or {},
+            severity=AssetCheckSeverity(item.get(ReportAssetCheckEvalParam.severity, "ERROR")),
+        )
+
+    tags = dict(tags)
+    data_version = item.get(ReportAssetMatParam.data_version)
+    if data_version is not None:
+        tags[DATA_VERSION_TAG] = data_version
+        tags[DATA_VERSION_IS_USER_PROVIDED_TAG] = "true"
+
+    if event_type == ReportAssetEventType.asset_materialization:
+        return AssetMaterialization(
+            asset_key=asset_key,
+            partition=item.get(ReportAssetMatParam.partition),
+            metadata=item.get(ReportAssetMatParam.metadata),
+            description=item.get(ReportAssetMatParam.description),
+            tags=tags,
+        )
+    elif event_type == ReportAssetEventType.asset_observation:
+        return AssetObservation(
+            asset_key=asset_key,
+            partition=item.get(ReportAssetObsParam.partition),
+            metadata=item.get(ReportAssetObsParam.metadata) or {},
+            description=item.get(ReportAssetObsParam.description),
+            tags=tags,
+        )
+
+    raise Exception(
+        f"Unknown event type {event_type!r}, expected one of"
+        f" {', '.join(repr(t) for t in ReportAssetEventType.all())}."
+    )
+
+
+def _batch_too_large_response(max_batch_size: int) -> JSONResponse:
+    return JSONResponse(
+        {"error": f"Too many events, at most {max_batch_size} may be reported per request."},
+        status_code=413,
+    )
+
+
+async def handle_report_asset_events_request(
+    context: BaseWorkspaceRequestContext,
+    request: Request,
+    max_batch_size: int,
+) -> JSONResponse:
+    # Record a batch of runless asset materialization, observation and check evaluation events.
+    # The body is either a json array or newline delimited json, with one object per event. Each
+    # object has a type and the same properties as the body of the corresponding single event
+    # endpoint. Valid events are written to the event log together, and the response contains a
+    # result for each event in the order they were sent.
+
+    body_content_type = (request.headers.get("content-type") or "").split(";")[0].strip()
+    items: List[Any] = []
+    parse_errors = {}
+    if body_content_type == "application/json":
+        try:
+            json_body = await request.json()
+        except JSONDecodeError as exc:
+            return JSONResponse({"error": f"Error parsing json body: {exc}"}, status_code=400)
+        if not isinstance(json_body, list):
+            return JSONResponse(
+                {"error": "Expected a json array of events."},
+                status_code=400,
+            )
+        if len(json_body) > max_batch_size:
+            return _batch_too_large_response(max_batch_size)
+        items = json_body
+    elif body_content_type == "application/x-ndjson":
+        # parse lines as they arrive so that an oversized body is rejected without reading it all
+        def _parse_line(line: bytes) -> None:
+            try:
+                items.append(json.loads(line))
+            except JSONDecodeError as exc:
+                parse_errors[len(items)] = f"Error parsing json: {exc}"
+                items.append(None)
+
+        buffer = b""
+        async for chunk in request.stream():
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                if len(items) == max_batch_size:
+                    return _batch_too_large_response(max_batch_size)
+                _parse_line(line)
+        if buffer.strip():
+            if len(items) == max_batch_size:
+                return _batch_too_large_response(max_batch_size)
+            _parse_line(buffer)
+    else:
+        return JSONResponse(
+            {
+                "error": (
+                    f"Unhandled content type {body_content_type or None}, expect"
+                    " application/json or application/x-ndjson"
+                ),
+            },
+            status_code=400,
+        )
+
+    tags = context.get_reporting_user_tags()
+    events: List[Union[AssetMaterialization, AssetObservation, AssetCheckEvaluation]] = []
+    results: List[Mapping[str, Any]] = []
+    for i, item in enumerate(items):
+        if i in parse_errors:
+            results.append({"error": parse_errors[i]})
+            continue
+        try:
+            events.append(_asset_event_from_batch_item(item, tags))
+        except Exception as exc:
+            results.append({"error": f"Error constructing asset event: {exc}"})
+        else:
+            results.append({})
+
+    await run_in_threadpool(context.instance.report_runless_asset_events, events)
+
+    return JSONResponse({"results": results})
+
+
 # note: Enum not used to avoid value type problems X(str, Enum) doesn't work as partition conflicts with keyword
 class ReportAssetMatParam:
     """Class to collect all supported args by report_asset_materialization endpoint
@@ -331,3 +471,29 @@ class ReportAssetObsParam:
     metadata = "metadata"
     description = "description"
     partition = "partition"
+
+
+class ReportAssetEventsParam:
+    """Class to collect the args that identify each event in the body of the report_asset_events
+    endpoint. The remaining args of each event are those of the corresponding single event
+    endpoint.
+    """
+
+    type = "type"
+    asset_key = "asset_key"
+
+
+class ReportAssetEventType:
+    """Class to collect the event types supported by the report_asset_events endpoint."""
+
+    asset_materialization = "asset_materialization"
+    asset_observation = "asset_observation"
+    asset_check_evaluation = "asset_check_evaluation"
+
+    @staticmethod
+    def all() -> Sequence[str]:
+        return [
+            ReportAssetEventType.asset_materialization,
+            ReportAssetEventType.asset_observation,
+            ReportAssetEventType.asset_check_evaluation,
+        ]
@@ -36,6 +36,7 @@
 
 from dagster_webserver.external_assets import (
     handle_report_asset_check_request,
+    handle_report_asset_events_request,
     handle_report_asset_materialization_request,
     handle_report_asset_observation_request,
 )
@@ -46,6 +47,8 @@
 
 T_IWorkspaceProcessContext = TypeVar("T_IWorkspaceProcessContext", bound=IWorkspaceProcessContext)
 
+DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE = 10000
+
 
 class DagsterWebserver(
     GraphQLServer[BaseWorkspaceRequestContext],
@@ -60,10 +63,14 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        max_report_asset_events_batch_size: int = DEFAULT_MAX_REPORT_ASSET_EVENTS_BATCH_SIZE,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
+        self._max_report_asset_events_batch_size = check.int_param(
+            max_report_asset_events_batch_size, "max_report_asset_events_batch_size"
+        )
         super().__init__(app_path_prefix)
 
     def build_graphql_schema(self) -> Schema:
@@ -199,6 +206,12 @@ async def report_asset_observation_endpoint(self, request: Request) -> JSONRespo
         context = self.make_request_context(request)
         return await handle_report_asset_observation_request(context, request)
 
+    async def report_asset_events_endpoint(self, request: Request) -> JSONResponse:
+        context = self.make_request_context(request)
+        return await handle_report_asset_events_request(
+            context, request, self._max_report_asset_events_batch_size
+        )
+
     def index_html_endpoint(self, request: Request):
         """Serves root html."""
         index_path = self.relative_path("webapp/build/index.html")
@@ -335,6 +348,11 @@ def build_routes(self):
                     self.report_asset_observation_endpoint,
                     methods=["POST"],
                 ),
+                Route(
+                    "/report_asset_events",
+                    self.report_asset_events_endpoint,
+                    methods=["POST"],
+                ),
                 Route("/{path:path}", self.index_html_endpoint),
                 Route("/", self.index_html_endpoint),
             ]
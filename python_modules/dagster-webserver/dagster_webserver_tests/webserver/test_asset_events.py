@@ -1,6 +1,10 @@
 import inspect
 
-from dagster import DagsterInstance
+from dagster import (
+    DagsterInstance,
+    __version__ as dagster_version,
+)
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import (
@@ -15,6 +19,7 @@
     ReportAssetMatParam,
     ReportAssetObsParam,
 )
+from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
 
@@ -336,3 +341,99 @@ def test_report_asset_observation_apis_consistent(
             ), "need to add validation that sample payload content was written successfully"
 
     # expect test to cover PipesContext.report_asset_observation once added
+
+
+def test_report_asset_events_endpoint(instance: DagsterInstance, test_client: TestClient):
+    events = [
+        {
+            "type": "asset_materialization",
+            "asset_key": "batch_asset",
+            "partition": "2024-01-01",
+            "data_version": "v1",
+            "metadata": {"meta": "data"},
+        },
+        {"type": "asset_observation", "asset_key": ["batch_observed"], "data_version": "v2"},
+        {
+            "type": "asset_check_evaluation",
+            "asset_key": "batch_asset",
+            "check_name": "batch_check",
+            "passed": True,
+        },
+        {"type": "asset_check_evaluation", "asset_key": "batch_asset", "check_name": "x"},
+        {"type": "asset_tombstone", "asset_key": "batch_asset"},
+        {"type": "asset_observation"},
+        "not_an_object",
+    ]
+    response = test_client.post("/report_asset_events", json=events)
+    assert response.status_code == 200, response.json()
+    results = response.json()["results"]
+    assert len(results) == len(events)
+    assert results[:3] == [{}, {}, {}]
+    assert "Missing required parameter 'passed'" in results[3]["error"]
+    assert "Unknown event type 'asset_tombstone'" in results[4]["error"]
+    assert "Missing required parameter 'asset_key'" in results[5]["error"]
+    assert "Expected a json object" in results[6]["error"]
+
+    mat = instance.get_latest_materialization_event(AssetKey("batch_asset"))
+    assert mat and mat.asset_materialization
+    assert mat.asset_materialization.partition == "2024-01-01"
+    assert mat.asset_materialization.tags
+    assert mat.asset_materialization.tags[DATA_VERSION_TAG] == "v1"
+    assert mat.asset_materialization.metadata.keys() == {"meta"}
+    obs = _assert_stored_obs(instance, "batch_observed")
+    assert obs.data_version == "v2"
+    assert _assert_stored_check_eval(instance, "batch_asset", "batch_check").passed
+
+    # newline delimited json, without a trailing newline and with an invalid line
+    ndjson_events = [
+        json.dumps({"type": "asset_observation", "asset_key": "ndjson_asset", "data_version": n})
+        for n in ["1", "2"]
+    ]
+    response = test_client.post(
+        "/report_asset_events",
+        content="\n".join([ndjson_events[0], "{not json", "", ndjson_events[1]]),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.json()
+    results = response.json()["results"]
+    assert len(results) == 3
+    assert results[0] == {} and results[2] == {}
+    assert "Error parsing json" in results[1]["error"]
+    assert _assert_stored_obs(instance, "ndjson_asset").data_version == "2"
+
+    # invalid bodies
+    response = test_client.post("/report_asset_events", json={"type": "asset_observation"})
+    assert response.status_code == 400
+    response = test_client.post("/report_asset_events", content="a=b")
+    assert response.status_code == 400
+    assert "Unhandled content type" in response.json()["error"]
+
+
+def test_report_asset_events_max_batch_size(instance: DagsterInstance):
+    with get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=dagster_version,
+        read_only=False,
+        kwargs={"empty_workspace": True},  # pyright: ignore[reportArgumentType]
+    ) as process_context:
+        client = TestClient(
+            DagsterWebserver(process_context, max_report_asset_events_batch_size=2).create_asgi_app(
+                debug=True
+            )
+        )
+        event = {"type": "asset_observation", "asset_key": "max_batch_asset"}
+
+        response = client.post("/report_asset_events", json=[event] * 3)
+        assert response.status_code == 413
+        response = client.post(
+            "/report_asset_events",
+            content="\n".join(json.dumps(event) for _ in range(3)),
+            headers={"content-type": "application/x-ndjson"},
+        )
+        assert response.status_code == 413
+        assert not instance.fetch_observations(AssetKey("max_batch_asset"), limit=1).records
+
+        response = client.post("/report_asset_events", json=[event] * 2)
+        assert response.status_code == 200, response.json()
+        assert response.json()["results"] == [{}, {}]
+        assert len(instance.fetch_observations(AssetKey("max_batch_asset"), limit=5).records) == 2
@@ -1,14 +1,66 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Tuple
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import RepositoryErrorSnap, RepositorySnap
+from dagster._core.remote_representation.external_data import (
+    RepositoryErrorSnap,
+    RepositorySnap,
+    RepositorySnapDiff,
+)
+from dagster._grpc.types import RepositorySnapDiffArgs
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+# The sub-snapshots of the last version of each repository loaded by this process, by snapshot id,
+# keyed by code location and repository name. Reloading a code location only fetches and
+# deserializes the sub-snapshots that are not in here.
+_repository_snap_parts: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+_repository_snap_parts_lock = threading.Lock()
+
+
+def _get_known_repository_snap_parts(
+    code_location: "CodeLocation", repository_name: str
+) -> Mapping[str, Any]:
+    with _repository_snap_parts_lock:
+        return _repository_snap_parts.get((code_location.name, repository_name), {})
+
+
+def _repository_snap_from_diff_result(
+    serialized_result: str,
+    code_location: "CodeLocation",
+    repository_name: str,
+    known_parts: Mapping[str, Any],
+) -> RepositorySnap:
+    result = deserialize_value(
+        serialized_result,
+        (RepositorySnapDiff, RepositorySnap, RepositoryErrorSnap),
+    )
+
+    if isinstance(result, RepositoryErrorSnap):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    if isinstance(result, RepositorySnap):
+        # older servers send the whole repository
+        return result
+
+    manifest = result.manifest
+    parts = {
+        snapshot_id: result.parts[snapshot_id]
+        if snapshot_id in result.parts
+        else known_parts[snapshot_id]
+        for ids in manifest.part_ids.values()
+        for snapshot_id in ids
+    }
+
+    with _repository_snap_parts_lock:
+        _repository_snap_parts[(code_location.name, repository_name)] = parts
+
+    return manifest.assemble(parts)
+
 
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
@@ -19,29 +71,20 @@ def sync_get_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                remote_repository_origin=RemoteRepositoryOrigin(
+        known_parts = _get_known_repository_snap_parts(code_location, repository_name)
+        serialized_result = api_client.external_repository_diff(
+            RepositorySnapDiffArgs(
+                repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                known_snapshot_ids=list(known_parts.keys()),
             )
         )
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
+        repo_datas[repository_name] = _repository_snap_from_diff_result(
+            serialized_result, code_location, repository_name, known_parts
         )
-
-        if isinstance(result, RepositoryErrorSnap):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
     return repo_datas
 
 
@@ -54,28 +97,18 @@ async def gen_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = [
-            chunk
-            async for chunk in api_client.gen_streaming_external_repository(
-                remote_repository_origin=RemoteRepositoryOrigin(
+        known_parts = _get_known_repository_snap_parts(code_location, repository_name)
+        serialized_result = await api_client.gen_external_repository_diff(
+            RepositorySnapDiffArgs(
+                repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                known_snapshot_ids=list(known_parts.keys()),
             )
-        ]
-
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
         )
 
-        if isinstance(result, RepositoryErrorSnap):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
+        repo_datas[repository_name] = _repository_snap_from_diff_result(
+            serialized_result, code_location, repository_name, known_parts
+        )
     return repo_datas
@@ -6,7 +6,6 @@
     AbstractSet,
     Any,
     Dict,
-    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -28,16 +27,16 @@
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
-    AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
     AutomationConditionEvaluator,
+    SerializableAutomationResult,
 )
 from dagster._core.definitions.declarative_automation.serialized_objects import (
     AutomationConditionEvaluation,
 )
-from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
-from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.definitions.run_request import RunRequest
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.tags import (
@@ -64,6 +63,7 @@ def __init__(
         emit_backfills: bool,
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
+        num_evaluation_processes: int = 1,
     ):
         resolved_entity_keys = {
             entity_key
@@ -83,6 +83,7 @@ def __init__(
             cursor=cursor,
             evaluation_time=evaluation_time,
             logger=logger,
+            num_evaluation_processes=num_evaluation_processes,
         )
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
@@ -146,11 +147,13 @@ def _build_run_requests(self, entity_subsets: Sequence[EntitySubset]) -> Sequenc
         )
 
     def _get_updated_cursor(
-        self, results: Iterable[AutomationResult], observe_run_requests: Iterable[RunRequest]
+        self,
+        results: Iterable[SerializableAutomationResult],
+        observe_run_requests: Iterable[RunRequest],
     ) -> AssetDaemonCursor:
         return self.cursor.with_updates(
             evaluation_id=self._evaluation_id,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=[result.cursor for result in results],
             newly_observe_requested_asset_keys=[
                 asset_key
                 for run_request in observe_run_requests
@@ -163,7 +166,7 @@ def _get_updated_cursor(
         )
 
     def _get_updated_evaluations(
-        self, results: Iterable[AutomationResult]
+        self, results: Iterable[SerializableAutomationResult]
     ) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
         # only record evaluation results where something changed
         updated_evaluations = []
@@ -171,10 +174,10 @@ def _get_updated_evaluations(
             previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
             if (
                 previous_cursor is None
-                or previous_cursor.result_value_hash != result.value_hash
-                or not result.true_subset.is_empty
+                or previous_cursor.result_value_hash != result.cursor.result_value_hash
+                or not result.evaluation.true_subset.is_empty
             ):
-                updated_evaluations.append(result.serializable_evaluation)
+                updated_evaluations.append(result.evaluation)
         return updated_evaluations
 
     def evaluate(
@@ -183,7 +186,7 @@ def evaluate(
         Sequence[RunRequest], AssetDaemonCursor, Sequence[AutomationConditionEvaluation[EntityKey]]
     ]:
         observe_run_requests = self._legacy_build_auto_observe_run_requests()
-        results, entity_subsets = self._evaluator.evaluate()
+        results, entity_subsets = self._evaluator.evaluate_serializable()
 
         return (
             [*self._build_run_requests(entity_subsets), *observe_run_requests],
@@ -344,57 +347,74 @@ def _build_run_requests_from_partitions_def_mapping(
 
 
 def build_run_requests_with_backfill_policies(
-    asset_partitions: Iterable[AssetKeyPartitionKey],
+    asset_graph_subset: AssetGraphSubset,
     asset_graph: BaseAssetGraph,
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Sequence[RunRequest]:
-    """Build run requests for a selection of asset partitions based on the associated BackfillPolicies."""
-    run_requests = []
+    """Build run requests for a selection of asset partitions based on the associated BackfillPolicies.
 
-    asset_partition_keys: Mapping[AssetKey, Set[str]] = {
-        asset_key_partition.asset_key: set() for asset_key_partition in asset_partitions
-    }
-    for asset_partition in asset_partitions:
-        if asset_partition.partition_key:
-            asset_partition_keys[asset_partition.asset_key].add(asset_partition.partition_key)
+    Partition keys are only enumerated for assets without a backfill policy, which are requested
+    one partition per run. Assets with a backfill policy are requested in ranges computed directly
+    from their partitions subsets.
+    """
+    run_requests = []
 
-    assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy: Mapping[
-        Tuple[Optional[PartitionsDefinition], Optional[FrozenSet[str]], Optional[BackfillPolicy]],
-        Set[AssetKey],
+    unpartitioned_asset_keys_by_backfill_policy: Mapping[
+        Optional[BackfillPolicy], Set[AssetKey]
     ] = defaultdict(set)
+    for asset_key in asset_graph_subset.non_partitioned_asset_keys:
+        unpartitioned_asset_keys_by_backfill_policy[asset_graph.get(asset_key).backfill_policy].add(
+            asset_key
+        )
 
-    # here we are grouping assets by their partitions def, selected partition keys, and backfill policy.
-    for asset_key, partition_keys in asset_partition_keys.items():
-        assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy[
+    # here we are grouping assets by their partitions def, selected partitions subset, and backfill
+    # policy. partitions subsets aren't hashable, so equal subsets are found by comparison.
+    partitioned_asset_groups: List[
+        Tuple[PartitionsDefinition, PartitionsSubset, Optional[BackfillPolicy], Set[AssetKey]]
+    ] = []
+    for asset_key, partitions_subset in asset_graph_subset.partitions_subsets_by_asset_key.items():
+        if partitions_subset.is_empty:
+            continue
+        partitions_def = check.not_none(
             asset_graph.get(asset_key).partitions_def,
-            frozenset(partition_keys) if partition_keys else None,
-            asset_graph.get(asset_key).backfill_policy,
-        ].add(asset_key)
-
-    for (
-        partitions_def,
-        partition_keys,
-        backfill_policy,
-    ), asset_keys in assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy.items():
-        asset_check_keys = asset_graph.get_check_keys_for_assets(asset_keys)
-        if partitions_def is None and partition_keys is not None:
-            check.failed("Partition key provided for unpartitioned asset")
-        elif partitions_def is not None and partition_keys is None:
-            check.failed("Partition key missing for partitioned asset")
-        elif partitions_def is None and partition_keys is None:
-            # non partitioned assets will be backfilled in a single run
-            run_requests.append(
-                RunRequest(
-                    asset_selection=list(asset_keys),
-                    asset_check_keys=list(asset_check_keys),
-                    tags={},
-                )
+            "Partition key provided for unpartitioned asset",
+        )
+        backfill_policy = asset_graph.get(asset_key).backfill_policy
+        for (
+            group_partitions_def,
+            group_subset,
+            group_backfill_policy,
+            asset_keys,
+        ) in partitioned_asset_groups:
+            if (
+                group_partitions_def == partitions_def
+                and group_backfill_policy == backfill_policy
+                and group_subset == partitions_subset
+            ):
+                asset_keys.add(asset_key)
+                break
+        else:
+            partitioned_asset_groups.append(
+                (partitions_def, partitions_subset, backfill_policy, {asset_key})
             )
-        elif backfill_policy is None:
+
+    for asset_keys in unpartitioned_asset_keys_by_backfill_policy.values():
+        # non partitioned assets will be backfilled in a single run
+        run_requests.append(
+            RunRequest(
+                asset_selection=list(asset_keys),
+                asset_check_keys=list(asset_graph.get_check_keys_for_assets(asset_keys)),
+                tags={},
+            )
+        )
+
+    for partitions_def, partitions_subset, backfill_policy, asset_keys in partitioned_asset_groups:
+        asset_check_keys = asset_graph.get_check_keys_for_assets(asset_keys)
+        if backfill_policy is None:
             # just use the normal single-partition behavior
             entity_keys = cast(Set[EntityKey], asset_keys)
             mapping: _PartitionsDefKeyMapping = {
-                (partitions_def, pk): entity_keys for pk in (partition_keys or [None])
+                (partitions_def, pk): entity_keys for pk in partitions_subset.get_partition_keys()
             }
             run_requests.extend(
                 _build_run_requests_from_partitions_def_mapping(mapping, asset_graph, run_tags={})
@@ -404,9 +424,9 @@ def build_run_requests_with_backfill_policies(
                 _build_run_requests_with_backfill_policy(
                     list(asset_keys),
                     list(asset_check_keys),
-                    check.not_none(backfill_policy),
-                    check.not_none(partition_keys),
-                    check.not_none(partitions_def),
+                    backfill_policy,
+                    partitions_subset,
+                    partitions_def,
                     tags={},
                     dynamic_partitions_store=dynamic_partitions_store,
                 )
@@ -418,14 +438,13 @@ def _build_run_requests_with_backfill_policy(
     asset_keys: Sequence[AssetKey],
     asset_check_keys: Sequence[AssetCheckKey],
     backfill_policy: BackfillPolicy,
-    partition_keys: FrozenSet[str],
+    partitions_subset: PartitionsSubset,
     partitions_def: PartitionsDefinition,
     tags: Dict[str, Any],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Sequence[RunRequest]:
     run_requests = []
-    partition_subset = partitions_def.subset_with_partition_keys(partition_keys)
-    partition_key_ranges = partition_subset.get_partition_key_ranges(
+    partition_key_ranges = partitions_subset.get_partition_key_ranges(
         partitions_def, dynamic_partitions_store=dynamic_partitions_store
     )
     for partition_key_range in partition_key_ranges:
@@ -690,7 +690,16 @@ def __init__(
         # hidden_param which should only be set by builtin conditions which require high performance
         # in their serdes layer
         structured_cursor = kwargs.get("structured_cursor")
-        invalid_hidden_params = set(kwargs.keys()) - {"subsets_with_metadata", "structured_cursor"}
+
+        # hidden_param which should only be set by builtin conditions whose subsets are memoized
+        # across evaluations within a tick. True if the subset was reused, False if it was computed
+        self._cache_hit = check.opt_bool_param(kwargs.get("cache_hit"), "cache_hit")
+
+        invalid_hidden_params = set(kwargs.keys()) - {
+            "subsets_with_metadata",
+            "structured_cursor",
+            "cache_hit",
+        }
         check.param_invariant(
             not invalid_hidden_params, "kwargs", f"Invalid hidden params: {invalid_hidden_params}"
         )
@@ -732,6 +741,24 @@ def condition(self) -> AutomationCondition:
     def condition_unique_id(self) -> str:
         return self._context.condition_unique_id
 
+    @cached_property
+    def num_cache_hits(self) -> int:
+        """The number of nodes in this evaluation tree which reused a subset memoized by another
+        evaluation on the same tick.
+        """
+        return int(self._cache_hit is True) + sum(
+            child_result.num_cache_hits for child_result in self._child_results
+        )
+
+    @cached_property
+    def num_cache_misses(self) -> int:
+        """The number of nodes in this evaluation tree which computed a subset and memoized it for
+        other evaluations on the same tick.
+        """
+        return int(self._cache_hit is False) + sum(
+            child_result.num_cache_misses for child_result in self._child_results
+        )
+
     @cached_property
     def value_hash(self) -> str:
         """An identifier for the contents of this AutomationResult. This will be identical for
@@ -777,6 +804,8 @@ def serializable_evaluation(self) -> AutomationConditionEvaluation:
             child_evaluations=[
                 child_result.serializable_evaluation for child_result in self._child_results
             ],
+            num_cache_hits=self.num_cache_hits,
+            num_cache_misses=self.num_cache_misses,
         )
 
     def set_internal_serializable_subset_override(self, override: SerializableEntitySubset) -> None:
@@ -1,11 +1,15 @@
 import asyncio
 import datetime
 import logging
+import multiprocessing
 from collections import defaultdict
-from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_key import EntityKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
@@ -14,15 +18,45 @@
     AutomationCondition,
     AutomationResult,
 )
-from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.automation_context import (
+    AutomationContext,
+    AutomationEvaluationMemo,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.instance import DagsterInstance
+from dagster._record import record
+from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+@record
+class SerializableAutomationResult:
+    """The parts of an AutomationResult that are persisted after a tick. Unlike an AutomationResult,
+    this does not hold a reference to the context it was evaluated in, so it can be passed between
+    processes.
+    """
+
+    cursor: AutomationConditionCursor
+    evaluation: AutomationConditionEvaluation
+
+    @property
+    def key(self) -> EntityKey:
+        return self.evaluation.key
+
+    @staticmethod
+    def from_result(result: AutomationResult) -> "SerializableAutomationResult":
+        return SerializableAutomationResult(
+            cursor=result.get_new_cursor(), evaluation=result.serializable_evaluation
+        )
+
+
 class AutomationConditionEvaluator:
     def __init__(
         self,
@@ -35,6 +69,7 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        num_evaluation_processes: int = 1,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -48,6 +83,9 @@ def __init__(
         self.logger = logger
         self.cursor = cursor
         self.default_condition = default_condition
+        self.num_evaluation_processes = check.int_param(
+            num_evaluation_processes, "num_evaluation_processes"
+        )
 
         self.current_results_by_key: Dict[EntityKey, AutomationResult] = {}
         self.condition_cursors = []
@@ -66,6 +104,7 @@ def __init__(
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
 
         self.request_subsets_by_key: Dict[EntityKey, EntitySubset] = {}
+        self.memo = AutomationEvaluationMemo()
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -109,7 +148,122 @@ async def async_evaluate(
         self,
     ) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         self.prefetch()
-        num_conditions = len(self.entity_keys)
+        await self._async_evaluate_entity_keys(self.entity_keys)
+
+        return list(self.current_results_by_key.values()), [
+            v for v in self.request_subsets_by_key.values() if not v.is_empty
+        ]
+
+    def evaluate_serializable(
+        self,
+    ) -> Tuple[Sequence[SerializableAutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        """Evaluates the conditions of all entities, returning the persisted parts of each result.
+
+        If num_evaluation_processes is greater than one, groups of entities whose conditions cannot
+        depend on each other's results are evaluated in separate processes.
+        """
+        shards = self._get_entity_key_shards() if self.num_evaluation_processes > 1 else []
+        if len(shards) > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            self.logger.warning(
+                "Evaluating automation conditions in a single process, as this platform does not "
+                "support forking processes."
+            )
+        elif len(shards) > 1:
+            return self._evaluate_shards_in_processes(shards)
+
+        results, request_subsets = self.evaluate()
+        return [SerializableAutomationResult.from_result(result) for result in results], list(
+            request_subsets
+        )
+
+    def _get_entity_key_shards(self) -> Sequence[AbstractSet[EntityKey]]:
+        """Splits the entity keys into at most num_evaluation_processes groups, such that the
+        condition of an entity can never depend on the result of an entity in a different group.
+        """
+        # a condition may read the results of any of its ancestors, and the members of an execution
+        # set must be evaluated together, so keys are grouped by the weakly connected components of
+        # the full asset graph
+        component_roots: Dict[EntityKey, EntityKey] = {}
+
+        def _find_root(key: EntityKey) -> EntityKey:
+            component_roots.setdefault(key, key)
+            while component_roots[key] != key:
+                component_roots[key] = component_roots[component_roots[key]]
+                key = component_roots[key]
+            return key
+
+        for level in self.asset_graph.toposorted_entity_keys_by_level:
+            for key in level:
+                node = self.asset_graph.get(key)
+                for neighbor_key in node.parent_entity_keys | node.execution_set_entity_keys:
+                    component_roots[_find_root(neighbor_key)] = _find_root(key)
+
+        components: Dict[EntityKey, Set[EntityKey]] = defaultdict(set)
+        for key in self.entity_keys:
+            components[_find_root(key)].add(key)
+
+        # assign the largest components first, each to the group with the fewest entities so far
+        shards: List[Set[EntityKey]] = [
+            set() for _ in range(min(self.num_evaluation_processes, len(components)))
+        ]
+        for component in sorted(components.values(), key=len, reverse=True):
+            min(shards, key=len).update(component)
+        return shards
+
+    def _evaluate_shards_in_processes(
+        self, shards: Sequence[AbstractSet[EntityKey]]
+    ) -> Tuple[Sequence[SerializableAutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        # prefetch before forking so that every process shares the cached asset records
+        self.prefetch()
+        self.logger.info(f"Evaluating {len(self.entity_keys)} entities in {len(shards)} processes.")
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_evaluation_process,
+            initargs=(self,),
+        ) as executor:
+            serialized_shard_results = list(executor.map(_evaluate_shard_in_process, shards))
+
+        results: List[SerializableAutomationResult] = []
+        for serialized_shard_result in serialized_shard_results:
+            cursors, evaluations, request_subsets = deserialize_value(serialized_shard_result)  # type: ignore
+            results.extend(
+                SerializableAutomationResult(cursor=cursor, evaluation=evaluation)
+                for cursor, evaluation in zip(cursors, evaluations)
+            )
+            for serializable_subset in request_subsets:
+                self._add_request_subset(
+                    check.not_none(
+                        self.asset_graph_view.get_subset_from_serializable_subset(
+                            serializable_subset
+                        )
+                    )
+                )
+
+        return results, [v for v in self.request_subsets_by_key.values() if not v.is_empty]
+
+    def evaluate_shard(
+        self, entity_keys: AbstractSet[EntityKey]
+    ) -> Tuple[Sequence[SerializableAutomationResult], Sequence[SerializableEntitySubset]]:
+        """Evaluates the conditions of a group of entities that do not depend on the results of any
+        other entities. Assumes that prefetch has already been called.
+        """
+        self.current_results_by_key = {}
+        self.request_subsets_by_key = {}
+        self.legacy_expected_data_time_by_key = {}
+        asyncio.run(self._async_evaluate_entity_keys(entity_keys))
+
+        return [
+            SerializableAutomationResult.from_result(result)
+            for result in self.current_results_by_key.values()
+        ], [
+            v.convert_to_serializable_subset()
+            for v in self.request_subsets_by_key.values()
+            if not v.is_empty
+        ]
+
+    async def _async_evaluate_entity_keys(self, entity_keys: AbstractSet[EntityKey]) -> None:
+        num_conditions = len(entity_keys)
         num_evaluated = 0
 
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
@@ -141,15 +295,11 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             coroutines = [
                 _evaluate_entity_async(entity_key, offset)
                 for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
+                if entity_key in entity_keys
             ]
             await asyncio.gather(*coroutines)
             num_evaluated += len(coroutines)
 
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
-        ]
-
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
@@ -200,3 +350,23 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
                     )
 
                 self._add_request_subset(neighbor_true_subset)
+
+
+# the evaluator inherited by a forked evaluation process from its parent process
+_process_evaluator: Optional[AutomationConditionEvaluator] = None
+
+
+def _init_evaluation_process(evaluator: AutomationConditionEvaluator) -> None:
+    global _process_evaluator  # noqa: PLW0603
+    _process_evaluator = evaluator
+
+
+def _evaluate_shard_in_process(entity_keys: AbstractSet[EntityKey]) -> str:
+    results, request_subsets = check.not_none(_process_evaluator).evaluate_shard(entity_keys)
+    return serialize_value(
+        [
+            [result.cursor for result in results],
+            [result.evaluation for result in results],
+            list(request_subsets),
+        ]
+    )
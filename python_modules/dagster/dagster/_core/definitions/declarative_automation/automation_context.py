@@ -1,8 +1,24 @@
+import asyncio
 import datetime
 import inspect
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, Mapping, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
@@ -26,6 +42,7 @@
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.asset_selection import AssetSelection
     from dagster._core.definitions.base_asset_graph import BaseAssetGraph
     from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
         AutomationConditionEvaluator,
@@ -44,6 +61,62 @@ def _has_legacy_condition(condition: AutomationCondition):
         return any(_has_legacy_condition(child) for child in condition.children)
 
 
+class AutomationEvaluationMemo:
+    """Stores values computed while evaluating the condition of one entity that can be reused when
+    evaluating the conditions of other entities on the same tick.
+    """
+
+    def __init__(self):
+        self._subsets_by_memoization_key: Dict[
+            Hashable, List[Tuple[EntitySubset, "asyncio.Future[EntitySubset]"]]
+        ] = defaultdict(list)
+        self._resolved_selections_by_id: Dict[
+            int, Tuple["AssetSelection", AbstractSet[AssetKey]]
+        ] = {}
+
+    async def get_or_compute_subset(
+        self,
+        memoization_key: Hashable,
+        candidate_subset: EntitySubset,
+        compute_fn: Callable[[], Awaitable[EntitySubset]],
+    ) -> Tuple[EntitySubset, bool]:
+        """Returns the subset memoized for the given key and candidate subset, computing and storing
+        it if it does not exist, along with whether the subset was memoized.
+        """
+        for memoized_candidate_subset, memoized_future in self._subsets_by_memoization_key[
+            memoization_key
+        ]:
+            if (
+                memoized_candidate_subset is candidate_subset
+                or memoized_candidate_subset.get_internal_value()
+                == candidate_subset.get_internal_value()
+            ):
+                return await memoized_future, True
+
+        # store a future rather than the subset itself, so that evaluations running concurrently
+        # wait for this computation rather than duplicating it
+        future = asyncio.get_running_loop().create_future()
+        self._subsets_by_memoization_key[memoization_key].append((candidate_subset, future))
+        try:
+            subset = await compute_fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        future.set_result(subset)
+        return subset, False
+
+    def resolve_selection(
+        self, selection: "AssetSelection", asset_graph: "BaseAssetGraph"
+    ) -> AbstractSet[AssetKey]:
+        # selections are not hashable, so they are stored by id along with the selection itself,
+        # which ensures that the id cannot be reused by another object during the tick
+        memoized = self._resolved_selections_by_id.get(id(selection))
+        if memoized is None:
+            memoized = (selection, selection.resolve(asset_graph))
+            self._resolved_selections_by_id[id(selection)] = memoized
+        return memoized[1]
+
+
 @dataclass(frozen=True)
 class AutomationContext(Generic[T_EntityKey]):
     condition: AutomationCondition
@@ -59,6 +132,7 @@ class AutomationContext(Generic[T_EntityKey]):
 
     _cursor: Optional[AutomationConditionCursor]
     _legacy_context: Optional[LegacyRuleEvaluationContext]
+    _memo: AutomationEvaluationMemo
 
     _root_log: logging.Logger
 
@@ -82,6 +156,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             _legacy_context=LegacyRuleEvaluationContext.create(key, evaluator)
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
+            _memo=evaluator.memo,
             _root_log=evaluator.logger,
         )
 
@@ -108,6 +183,7 @@ def for_child_condition(
             )
             if self._legacy_context
             else None,
+            _memo=self._memo,
             _root_log=self._root_log,
         )
 
@@ -241,6 +317,25 @@ def previous_candidate_subset(self) -> Optional[EntitySubset[T_EntityKey]]:
                 else None
             )
 
+    async def compute_memoized_subset(
+        self,
+        memoization_key: Hashable,
+        compute_fn: Callable[[], Awaitable[EntitySubset[T_EntityKey]]],
+    ) -> Tuple[EntitySubset[T_EntityKey], bool]:
+        """Returns the subset memoized on this tick for the given key and the current candidate
+        subset, calling compute_fn to compute it if it does not exist. Also returns whether the
+        memoized subset was reused.
+        """
+        return await self._memo.get_or_compute_subset(
+            memoization_key, self.candidate_subset, compute_fn
+        )
+
+    def resolve_selection(self, selection: "AssetSelection") -> AbstractSet[AssetKey]:
+        """Resolves the given selection against the asset graph, reusing the result of any previous
+        resolution of the same selection object on this tick.
+        """
+        return self._memo.resolve_selection(selection, self.asset_graph)
+
     def get_empty_subset(self) -> EntitySubset[T_EntityKey]:
         """Returns an empty EntitySubset of the currently-evaluated key."""
         return self.asset_graph_view.get_empty_subset(key=self.key)
@@ -1,5 +1,5 @@
 import datetime
-from typing import Optional
+from typing import Hashable, Optional
 
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey
@@ -60,6 +60,9 @@ class MissingAutomationCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "missing"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_missing_subset(
             key=context.key, from_subset=context.candidate_subset
@@ -73,6 +76,9 @@ class RunInProgressAutomationCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "run_in_progress"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_run_in_progress_subset(key=context.key)
 
@@ -84,6 +90,9 @@ class BackfillInProgressAutomationCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "backfill_in_progress"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_backfill_in_progress_subset(key=context.key)
 
@@ -95,6 +104,9 @@ class ExecutionFailedAutomationCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "execution_failed"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_execution_failed_subset(key=context.key)
 
@@ -160,6 +172,10 @@ class NewlyUpdatedCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "newly_updated"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        # the subset depends on the previous evaluation of the condition tree that this is a part of
+        return (self, context.key, context.previous_temporal_context)
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         # if it's the first time evaluating, just return the empty subset
         if context.previous_temporal_context is None:
@@ -238,6 +254,9 @@ def name(self) -> str:
             name += f"(lookback_timedelta={self.lookback_timedelta})"
         return name
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return context.asset_graph_view.compute_latest_time_window_subset(
             context.key, lookback_delta=self.lookback_timedelta
@@ -253,6 +272,9 @@ class CheckResultCondition(SubsetAutomationCondition[AssetCheckKey]):
     def name(self) -> str:
         return "check_passed" if self.passed else "check_failed"
 
+    def get_memoization_key(self, context: AutomationContext) -> Hashable:
+        return (self, context.key)
+
     async def compute_subset(
         self, context: AutomationContext[AssetCheckKey]
     ) -> EntitySubset[AssetCheckKey]:
@@ -1,5 +1,6 @@
 import inspect
 from abc import abstractmethod
+from typing import Hashable, Optional
 
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_key import T_EntityKey
@@ -24,15 +25,33 @@ def compute_subset(
         self, context: AutomationContext[T_EntityKey]
     ) -> EntitySubset[T_EntityKey]: ...
 
+    def get_memoization_key(self, context: AutomationContext[T_EntityKey]) -> Optional[Hashable]:
+        """Returns a key which identifies the subset computed by this condition in the given
+        context, independent of the condition tree that it is a part of. The subset computed for
+        a given key and candidate subset is reused by all other evaluations on the same tick. If
+        None, the subset is not memoized.
+        """
+        return None
+
+    async def _compute_subset_async(
+        self, context: AutomationContext[T_EntityKey]
+    ) -> EntitySubset[T_EntityKey]:
+        if inspect.iscoroutinefunction(self.compute_subset):
+            return await self.compute_subset(context)
+        return self.compute_subset(context)
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
         # don't compute anything if there are no candidates
         if context.candidate_subset.is_empty:
-            true_subset = context.get_empty_subset()
-        elif inspect.iscoroutinefunction(self.compute_subset):
-            true_subset = await self.compute_subset(context)
-        else:
-            true_subset = self.compute_subset(context)
+            return AutomationResult(context, context.get_empty_subset())
+
+        memoization_key = self.get_memoization_key(context)
+        if memoization_key is None:
+            return AutomationResult(context, await self._compute_subset_async(context))
 
-        return AutomationResult(context, true_subset)
+        true_subset, cache_hit = await context.compute_memoized_subset(
+            memoization_key, lambda: self._compute_subset_async(context)
+        )
+        return AutomationResult(context, true_subset, cache_hit=cache_hit)
@@ -4,7 +4,6 @@
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import U_EntityKey
 from dagster._core.definitions.asset_key import AssetKey, T_EntityKey
-from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
     AutomationResult,
@@ -111,14 +110,14 @@ def ignore(self, selection: "AssetSelection") -> "DepsAutomationCondition":
         )
         return copy(self, ignore_selection=ignore_selection)
 
-    def _get_dep_keys(
-        self, key: T_EntityKey, asset_graph: BaseAssetGraph[BaseAssetNode]
-    ) -> AbstractSet[AssetKey]:
-        dep_keys = asset_graph.get(key).parent_entity_keys
+    def _get_dep_keys(self, context: AutomationContext[T_EntityKey]) -> AbstractSet[AssetKey]:
+        dep_keys = context.asset_graph.get(context.key).parent_entity_keys
+        # selections are resolved once per tick and shared by every entity whose condition
+        # references them
         if self.allow_selection is not None:
-            dep_keys &= self.allow_selection.resolve(asset_graph)
+            dep_keys &= context.resolve_selection(self.allow_selection)
         if self.ignore_selection is not None:
-            dep_keys -= self.ignore_selection.resolve(asset_graph)
+            dep_keys -= context.resolve_selection(self.ignore_selection)
         return dep_keys
 
 
@@ -134,7 +133,7 @@ async def evaluate(
         dep_results = []
         true_subset = context.get_empty_subset()
 
-        for i, dep_key in enumerate(sorted(self._get_dep_keys(context.key, context.asset_graph))):
+        for i, dep_key in enumerate(sorted(self._get_dep_keys(context))):
             dep_result = await context.for_child_condition(
                 child_condition=EntityMatchesCondition(key=dep_key, operand=self.operand),
                 child_index=i,
@@ -159,7 +158,7 @@ async def evaluate(
         dep_results = []
         true_subset = context.candidate_subset
 
-        for i, dep_key in enumerate(sorted(self._get_dep_keys(context.key, context.asset_graph))):
+        for i, dep_key in enumerate(sorted(self._get_dep_keys(context))):
             dep_result = await context.for_child_condition(
                 child_condition=EntityMatchesCondition(key=dep_key, operand=self.operand),
                 child_index=i,
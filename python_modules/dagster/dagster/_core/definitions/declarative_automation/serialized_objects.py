@@ -104,6 +104,11 @@ class AutomationConditionEvaluation(Generic[T_EntityKey]):
 
     child_evaluations: Sequence["AutomationConditionEvaluation"]
 
+    # the number of nodes in this subtree whose subset was reused from, or memoized for, the
+    # evaluation of another entity on the same tick
+    num_cache_hits: int = 0
+    num_cache_misses: int = 0
+
     @property
     def key(self) -> T_EntityKey:
         return self.true_subset.key
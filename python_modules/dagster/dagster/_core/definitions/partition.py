@@ -1,10 +1,13 @@
 import copy
 import hashlib
 import json
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from itertools import compress
 from typing import (
     AbstractSet,
     Any,
@@ -12,10 +15,14 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -41,6 +48,12 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import (
+    JsonSerializableValue,
+    NamedTupleSerializer,
+    SerializableObject,
+    WhitelistMap,
+)
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.tags import normalize_tags
@@ -338,6 +351,14 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_property
+    def partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        return PartitionKeyOrdinals(self._partition_keys)
+
     @public
     def get_partition_keys(
         self,
@@ -475,6 +496,19 @@ def __new__(
             name=check.opt_str_param(name, "name"),
         )
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        # partition_fn-based definitions have no stable key table to assign ordinals from
+        return BitmapPartitionsSubset if self.name else DefaultPartitionsSubset
+
+    @cached_property
+    def partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        # Keys are interned as they are first seen, so the table lives and dies with this
+        # definition. Subsets of separately-loaded copies of the definition are still combined
+        # correctly, by converting through their partition keys.
+        self._validated_name()
+        return PartitionKeyOrdinals()
+
     def _validated_name(self) -> str:
         if self.name is None:
             check.failed(
@@ -1091,6 +1125,34 @@ def deserialize(self, partitions_def: PartitionsDefinition) -> PartitionsSubset:
         return partitions_def.deserialize_subset(self.serialized_subset)
 
 
+def _get_partition_key_ranges_in_subset(
+    subset: PartitionsSubset,
+    partitions_def: PartitionsDefinition,
+    current_time: Optional[datetime],
+    dynamic_partitions_store: Optional[DynamicPartitionsStore],
+) -> Sequence[PartitionKeyRange]:
+    partition_keys = partitions_def.get_partition_keys(
+        current_time, dynamic_partitions_store=dynamic_partitions_store
+    )
+    cur_range_start = None
+    cur_range_end = None
+    result = []
+    for partition_key in partition_keys:
+        if partition_key in subset:
+            if cur_range_start is None:
+                cur_range_start = partition_key
+            cur_range_end = partition_key
+        else:
+            if cur_range_start is not None and cur_range_end is not None:
+                result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+            cur_range_start = cur_range_end = None
+
+    if cur_range_start is not None and cur_range_end is not None:
+        result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+    return result
+
+
 @whitelist_for_serdes
 class DefaultPartitionsSubset(
     PartitionsSubset,
@@ -1128,26 +1190,9 @@ def get_partition_key_ranges(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[PartitionKeyRange]:
-        partition_keys = partitions_def.get_partition_keys(
-            current_time, dynamic_partitions_store=dynamic_partitions_store
+        return _get_partition_key_ranges_in_subset(
+            self, partitions_def, current_time, dynamic_partitions_store
         )
-        cur_range_start = None
-        cur_range_end = None
-        result = []
-        for partition_key in partition_keys:
-            if partition_key in self.subset:
-                if cur_range_start is None:
-                    cur_range_start = partition_key
-                cur_range_end = partition_key
-            else:
-                if cur_range_start is not None and cur_range_end is not None:
-                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-                cur_range_start = cur_range_end = None
-
-        if cur_range_start is not None and cur_range_end is not None:
-            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-
-        return result
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset(
@@ -1200,8 +1245,13 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
     def __len__(self) -> int:
         return len(self.subset)
 
@@ -1218,6 +1268,333 @@ def empty_subset(
         return cls()
 
 
+# maps the binary digits of a bitmap to the flags used to select the keys of its set bits
+_BITMAP_DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+# Ordinals are never reassigned, so the keys of a dynamic partitions definition accumulate as
+# partitions are added and deleted. Beyond this many keys on top of the ones it was created with,
+# a PartitionKeyOrdinals stops assigning ordinals and subsets fall back to sets of keys.
+MAX_ADDED_PARTITION_KEY_ORDINALS = 100_000
+
+
+def _bit_count(bitmap: int) -> int:
+    # int.bit_count is only available from python 3.10
+    return bin(bitmap).count("1")
+
+
+def _bitmap_for_ordinals(ordinals: Sequence[int]) -> int:
+    if not ordinals:
+        return 0
+
+    buffer = bytearray((max(ordinals) >> 3) + 1)
+    for ordinal in ordinals:
+        buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class PartitionKeyOrdinals:
+    """Assigns each partition key of a partitions definition an integer ordinal, so that subsets of
+    its partitions can be represented as bitmaps.
+
+    Ordinals are assigned in the order in which keys are first seen and are never reassigned, so
+    bitmaps built against the same PartitionKeyOrdinals can be combined directly. At most
+    MAX_ADDED_PARTITION_KEY_ORDINALS keys are assigned ordinals beyond the initial partition keys.
+    """
+
+    def __init__(self, partition_keys: Iterable[str] = ()):
+        self._keys: List[str] = list(dict.fromkeys(partition_keys))
+        self._ordinals: Dict[str, int] = {key: i for i, key in enumerate(self._keys)}
+        self._max_keys = len(self._keys) + MAX_ADDED_PARTITION_KEY_ORDINALS
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return self._keys
+
+    def __setstate__(self, keys: List[str]):
+        self.__init__(keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def bitmap_for_keys(self, partition_keys: Iterable[str]) -> Optional[int]:
+        """Returns the bitmap of the given partition keys, assigning ordinals to the keys that have
+        not been seen before, or None if there is no room left to assign them.
+        """
+        ordinals = self._ordinals
+        result = []
+        new_keys = []
+        for key in partition_keys:
+            ordinal = ordinals.get(key)
+            if ordinal is None:
+                new_keys.append(key)
+            else:
+                result.append(ordinal)
+        if new_keys:
+            with self._lock:
+                for key in new_keys:
+                    ordinal = ordinals.get(key)
+                    if ordinal is None:
+                        if len(self._keys) >= self._max_keys:
+                            return None
+                        ordinal = len(self._keys)
+                        self._keys.append(key)
+                        ordinals[key] = ordinal
+                    result.append(ordinal)
+        return _bitmap_for_ordinals(result)
+
+    def bitmap_for_known_keys(self, partition_keys: Iterable[str]) -> int:
+        """Returns the bitmap of the given partition keys, leaving out the keys that have no
+        ordinal. Unlike bitmap_for_keys, this never assigns new ordinals.
+        """
+        ordinals = self._ordinals
+        return _bitmap_for_ordinals(
+            [ordinal for ordinal in map(ordinals.get, partition_keys) if ordinal is not None]
+        )
+
+    def keys_for_bitmap(self, bitmap: int) -> Iterator[str]:
+        # the binary digits of the bitmap, lowest ordinal first, select the keys in C
+        return compress(self._keys, bin(bitmap)[:1:-1].encode().translate(_BITMAP_DIGIT_FLAGS))
+
+
+class _BitmapPartitionKeys(AbstractSet[str]):
+    """A read-only set of the partition keys of a BitmapPartitionsSubset, which are decoded from
+    the bitmap as they are iterated over rather than copied into a new set.
+    """
+
+    def __init__(self, subset: "BitmapPartitionsSubset"):
+        self._subset = subset
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> Set[str]:
+        # results of set operations are plain sets
+        return set(it)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._subset
+
+    def __iter__(self) -> Iterator[str]:
+        return self._subset.partition_key_ordinals.keys_for_bitmap(self._subset.bitmap)
+
+    def __len__(self) -> int:
+        return len(self._subset)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    # Bitmaps are only meaningful against the partition key ordinals of the current process, so
+    # BitmapPartitionsSubsets are stored as DefaultPartitionsSubsets.
+    def pack_items(
+        self,
+        value: "BitmapPartitionsSubset",
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
+    ) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        return whitelist_map.object_serializers[DefaultPartitionsSubset.__name__].pack_items(
+            value.to_serializable_subset(), whitelist_map, object_handler, descent_path
+        )
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [("partitions_def", PartitionsDefinition), ("bitmap", int)],
+    ),
+):
+    """A subset of the partitions of a StaticPartitionsDefinition or DynamicPartitionsDefinition,
+    represented as a bitmap over the ordinals of its partition keys.
+
+    Set operations between subsets of the same partitions definition are bitwise operations on
+    the bitmaps. Once the partitions definition has no room left to assign ordinals to new keys,
+    operations that add keys return a DefaultPartitionsSubset instead. This is an in-memory
+    representation: subsets are serialized in the same format as DefaultPartitionsSubset.
+    """
+
+    def __new__(cls, partitions_def: PartitionsDefinition, bitmap: int = 0):
+        return super().__new__(cls, partitions_def=partitions_def, bitmap=bitmap)
+
+    @cached_property
+    def partition_key_ordinals(self) -> PartitionKeyOrdinals:
+        return cast(
+            Union[StaticPartitionsDefinition, DynamicPartitionsDefinition], self.partitions_def
+        ).partition_key_ordinals
+
+    @cached_property
+    def _bitmap_bytes(self) -> bytes:
+        return self.bitmap.to_bytes((self.bitmap.bit_length() + 7) >> 3, "little")
+
+    def _with_bitmap(self, bitmap: int) -> "BitmapPartitionsSubset":
+        subset = BitmapPartitionsSubset(self.partitions_def, bitmap)
+        subset.__dict__["partition_key_ordinals"] = self.partition_key_ordinals
+        return subset
+
+    def _bitmap_of(self, other: PartitionsSubset, known_keys_only: bool = False) -> Optional[int]:
+        """Returns the bitmap of the other subset over the partition key ordinals of this subset,
+        or None if its keys could not all be assigned ordinals.
+        """
+        if (
+            isinstance(other, BitmapPartitionsSubset)
+            and other.partition_key_ordinals is self.partition_key_ordinals
+        ):
+            return other.bitmap
+        if known_keys_only:
+            return self.partition_key_ordinals.bitmap_for_known_keys(other.get_partition_keys())
+        return self.partition_key_ordinals.bitmap_for_keys(other.get_partition_keys())
+
+    @property
+    def is_empty(self) -> bool:
+        return self.bitmap == 0
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        all_bitmap = self.partition_key_ordinals.bitmap_for_keys(partition_keys)
+        if all_bitmap is None:
+            return set(partition_keys) - set(self.get_partition_keys())
+        return set(self.partition_key_ordinals.keys_for_bitmap(all_bitmap & ~self.bitmap))
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        return _BitmapPartitionKeys(self)
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return _get_partition_key_ranges_in_subset(
+            self, partitions_def, current_time, dynamic_partitions_store
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        bitmap = self.partition_key_ordinals.bitmap_for_keys(partition_keys)
+        if bitmap is None:
+            return self.to_serializable_subset().with_partition_keys(partition_keys)
+        return self._with_bitmap(self.bitmap | bitmap)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        bitmap = self._bitmap_of(other)
+        if bitmap is None:
+            return self.to_serializable_subset() | other
+        return self._with_bitmap(self.bitmap | bitmap)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self.partitions_def)
+        # keys without an ordinal are not in this subset, so they can be left out
+        bitmap = check.not_none(self._bitmap_of(other, known_keys_only=True))
+        return self._with_bitmap(self.bitmap & ~bitmap)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        bitmap = check.not_none(self._bitmap_of(other, known_keys_only=True))
+        return self._with_bitmap(self.bitmap & bitmap)
+
+    def serialize(self) -> str:
+        # same format as DefaultPartitionsSubset. Keys come out of the bitmap in ordinal order,
+        # which sorts much faster than the arbitrary order of a set.
+        return json.dumps(
+            {
+                "version": DefaultPartitionsSubset.SERIALIZATION_VERSION,
+                "subset": sorted(self.get_partition_keys()),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        return cls.empty_subset(partitions_def).with_partition_keys(
+            DefaultPartitionsSubset.from_serialized(partitions_def, serialized).get_partition_keys()
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __reduce__(self):
+        # as with serdes, pickle the partition keys rather than the bitmap
+        return (
+            _bitmap_partitions_subset_from_keys,
+            (self.partitions_def, list(self.get_partition_keys())),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            if other.partition_key_ordinals is self.partition_key_ordinals:
+                return self.bitmap == other.bitmap
+            return self.get_partition_keys() == other.get_partition_keys()
+        return (
+            isinstance(other, DefaultPartitionsSubset) and self.get_partition_keys() == other.subset
+        )
+
+    def __ne__(self, other: object) -> bool:
+        # tuple.__ne__ would compare the fields, disagreeing with __eq__
+        return not self == other
+
+    # equal to DefaultPartitionsSubsets of the same keys, which are unhashable
+    __hash__ = None  # type: ignore
+
+    @cached_property
+    def _num_partitions(self) -> int:
+        return _bit_count(self.bitmap)
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    def __contains__(self, value) -> bool:
+        ordinal = self.partition_key_ordinals.get_ordinal(value)
+        if ordinal is None or ordinal >> 3 >= len(self._bitmap_bytes):
+            return False
+        return bool(self._bitmap_bytes[ordinal >> 3] >> (ordinal & 7) & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        return cls(check.not_none(partitions_def), 0)
+
+    def to_serializable_subset(self) -> "DefaultPartitionsSubset":
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
+def _bitmap_partitions_subset_from_keys(
+    partitions_def: PartitionsDefinition, partition_keys: Sequence[str]
+) -> PartitionsSubset:
+    return BitmapPartitionsSubset.empty_subset(partitions_def).with_partition_keys(partition_keys)
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
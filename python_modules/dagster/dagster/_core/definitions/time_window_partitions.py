@@ -2,14 +2,20 @@
 import hashlib
 import json
 import re
-from datetime import date, datetime, timedelta
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
 from enum import Enum
 from functools import cached_property
+from itertools import islice, takewhile
 from typing import (
     Any,
     Callable,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -366,6 +372,28 @@ def end(self) -> Optional[datetime]:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _partition_key_codec(self) -> "_TimePartitionKeyCodec":
+        return _TimePartitionKeyCodec.for_partitions_def(self)
+
+    def keys_to_indexes(self, partition_keys: Iterable[str]) -> Sequence[int]:
+        """Returns the index of each of the given partition keys.
+
+        The index of a partition is the number of partitions between the first partition of this
+        partitions definition and that partition, irrespective of the current time. Hourly, daily,
+        weekly, monthly and every-N-minutes schedules compute indexes arithmetically; other
+        schedules walk the cron schedule.
+
+        Raises a ValueError if a partition key cannot be parsed with the date format.
+        """
+        return self._partition_key_codec.indexes_for_keys(partition_keys)
+
+    def indexes_to_keys(self, indexes: Iterable[int]) -> Sequence[str]:
+        """Returns the partition key for each of the given partition indexes. The inverse of
+        `keys_to_indexes`.
+        """
+        return self._partition_key_codec.keys_for_indexes(indexes)
+
     def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         if not current_time:
             return get_current_timestamp()
@@ -409,9 +437,7 @@ def get_num_partitions(
         if not last_partition_window or not first_partition_window:
             return 0
 
-        return self.get_num_partitions_in_window(
-            TimeWindow(start=first_partition_window.start, end=last_partition_window.end)
-        )
+        return self._partition_key_codec.index_for_datetime(last_partition_window.start) + 1
 
     def get_partition_keys_between_indexes(
         self, start_idx: int, end_idx: int, current_time: Optional[datetime] = None
@@ -420,44 +446,22 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys = []
-        reached_end = False
-
-        for idx, time_window in enumerate(self._iterate_time_windows(self.start.timestamp())):
-            if time_window.end.timestamp() >= current_timestamp:
-                reached_end = True
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                reached_end = True
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                if idx >= start_idx and idx < end_idx:
-                    partition_keys.append(
-                        dst_safe_strftime(
-                            time_window.start, self.timezone, self.fmt, self.cron_schedule
-                        )
-                    )
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-            if len(partition_keys) >= end_idx - start_idx:
-                break
-
-        if reached_end and self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        num_partitions = self.get_num_partitions(current_time)
+        return self._partition_key_codec.keys_for_indexes(
+            range(max(start_idx, 0), min(end_idx, num_partitions))
+        )
 
     def get_partition_keys(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
+        if self.end_offset == 0:
+            return self._partition_key_codec.keys_for_indexes(
+                range(self.get_num_partitions(current_time))
+            )
+
+        # the last partition window is derived from the partition keys when there is an end offset
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -513,8 +517,7 @@ def __hash__(self):
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
+        return self._partition_key_codec.time_window_for_partition_key(partition_key)
 
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
@@ -568,13 +571,12 @@ def time_windows_for_partition_keys(
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         if self.is_basic_hourly or self.is_basic_daily:
-            return partition_key_dt
+            return dst_safe_strptime(partition_key, self.timezone, self.fmt)
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return self._partition_key_codec.time_window_for_partition_key(partition_key).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
@@ -714,18 +716,13 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
-        result: List[str] = []
-        time_window_end_timestamp = time_window.end.timestamp()
-        for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
-            if partition_time_window.start.timestamp() < time_window_end_timestamp:
-                result.append(
-                    dst_safe_strftime(
-                        partition_time_window.start, self.timezone, self.fmt, self.cron_schedule
-                    )
-                )
-            else:
-                break
-        return result
+        codec = self._partition_key_codec
+        return codec.keys_for_indexes(
+            range(
+                codec.index_for_datetime(time_window.start),
+                codec.index_for_datetime(time_window.end),
+            )
+        )
 
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
@@ -740,16 +737,18 @@ def get_partition_keys_in_range(
         partition_key_range: PartitionKeyRange,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
-        start_time = self.start_time_for_partition_key(partition_key_range.start)
+        start_idx, end_idx = self.keys_to_indexes(
+            [partition_key_range.start, partition_key_range.end]
+        )
         check.invariant(
-            start_time.timestamp() >= self.start.timestamp(),
+            start_idx >= 0,
             (
                 f"Partition key range start {partition_key_range.start} is before "
                 f"the partitions definition start time {self.start}"
             ),
         )
-        end_time = self.end_time_for_partition_key(partition_key_range.end)
         if self.end:
+            end_time = self.end_time_for_partition_key(partition_key_range.end)
             check.invariant(
                 end_time.timestamp() <= self.end.timestamp(),
                 (
@@ -758,7 +757,11 @@ def get_partition_keys_in_range(
                 ),
             )
 
-        return self.get_partition_keys_in_time_window(TimeWindow(start_time, end_time))
+        return self._get_partition_keys_in_index_range(start_idx, end_idx + 1)
+
+    @functools.lru_cache(maxsize=5)
+    def _get_partition_keys_in_index_range(self, start_idx: int, end_idx: int) -> Sequence[str]:
+        return self._partition_key_codec.keys_for_indexes(range(start_idx, end_idx))
 
     @public
     @property
@@ -990,26 +993,28 @@ def has_partition_key(
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> bool:
         """Returns a boolean representing if the given partition key is valid."""
+        codec = self._partition_key_codec
         try:
-            partition_start_time = self.start_time_for_partition_key(partition_key)
-            partition_start_timestamp = partition_start_time.timestamp()
+            partition_key_dt = codec.parse_partition_key(partition_key)
         except ValueError:
             # unparseable partition key
             return False
 
-        first_partition_window = self.get_first_partition_window(current_time=current_time)
         last_partition_window = self.get_last_partition_window(current_time=current_time)
-        return not (
+        if (
             # no partitions at all
-            first_partition_window is None
-            or last_partition_window is None
-            # partition starts before the first valid partition
-            or partition_start_timestamp < first_partition_window.start.timestamp()
+            last_partition_window is None
             # partition starts after the last valid partition
-            or partition_start_timestamp > last_partition_window.start.timestamp()
-            # partition key string does not represent the start of an actual partition
-            or dst_safe_strftime(partition_start_time, self.timezone, self.fmt, self.cron_schedule)
-            != partition_key
+            or partition_key_dt.timestamp() > last_partition_window.start.timestamp()
+        ):
+            return False
+
+        partition_idx = codec.index_for_datetime(partition_key_dt)
+        return (
+            # partition starts at or after the first valid partition, and at or before the last
+            0 <= partition_idx <= codec.index_for_datetime(last_partition_window.start)
+            # partition key string represents the start of an actual partition
+            and codec.key_for_index(partition_idx) == partition_key
         )
 
     def equal_except_for_start_or_end(self, other: "TimeWindowPartitionsDefinition") -> bool:
@@ -1685,6 +1690,416 @@ def inner(
     return inner
 
 
+# strftime directives that only depend on the date
+_DATE_FORMAT_DIRECTIVES = frozenset("aAbBdGhjmuUVwWyY%")
+
+
+class _TimePartitionKeyCodec(ABC):
+    """Maps the partition keys of a TimeWindowPartitionsDefinition to integer indexes and back.
+
+    The index of a partition is the number of partitions between the first cron tick at or after
+    the start of the partitions definition and the start of the partition, irrespective of the
+    current time, end and end offset of the partitions definition. A partition key or datetime that
+    does not fall on a cron tick maps to the first partition that starts at or after it, consistent
+    with `start_time_for_partition_key`.
+    """
+
+    def __init__(
+        self, partitions_def: "TimeWindowPartitionsDefinition", first_partition_start: datetime
+    ):
+        self._partitions_def = partitions_def
+        self._first_partition_start = first_partition_start
+
+    @staticmethod
+    def for_partitions_def(
+        partitions_def: "TimeWindowPartitionsDefinition",
+    ) -> "_TimePartitionKeyCodec":
+        first_partition_start = next(
+            iter(partitions_def._iterate_time_windows(partitions_def.start.timestamp()))  # noqa: SLF001
+        ).start
+        schedule_type = partitions_def.schedule_type
+
+        fixed_minute_interval = get_fixed_minute_interval(partitions_def.cron_schedule)
+        if fixed_minute_interval is None and schedule_type == ScheduleType.HOURLY:
+            fixed_minute_interval = 60
+        if fixed_minute_interval:
+            return _FixedIntervalPartitionKeyCodec(
+                partitions_def, first_partition_start, fixed_minute_interval * 60
+            )
+
+        if (
+            schedule_type in (ScheduleType.DAILY, ScheduleType.WEEKLY)
+            or (schedule_type == ScheduleType.MONTHLY and partitions_def.day_offset <= 28)
+        ) and all(
+            directive in _DATE_FORMAT_DIRECTIVES
+            for directive in re.findall(r"%(.)", partitions_def.fmt)
+        ):
+            return _CalendarPartitionKeyCodec(partitions_def, first_partition_start)
+
+        return _CronPartitionKeyCodec(partitions_def, first_partition_start)
+
+    def parse_partition_key(self, partition_key: str) -> datetime:
+        return dst_safe_strptime(
+            partition_key, self._partitions_def.timezone, self._partitions_def.fmt
+        )
+
+    def format_partition_key(self, dt: datetime) -> str:
+        return dst_safe_strftime(
+            dt,
+            self._partitions_def.timezone,
+            self._partitions_def.fmt,
+            self._partitions_def.cron_schedule,
+        )
+
+    @abstractmethod
+    def index_for_datetime(self, dt: datetime) -> int:
+        """Returns the index of the first partition that starts at or after the given datetime."""
+
+    @abstractmethod
+    def key_for_index(self, index: int) -> str: ...
+
+    def indexes_for_keys(self, partition_keys: Iterable[str]) -> List[int]:
+        return [
+            self.index_for_datetime(self.parse_partition_key(partition_key))
+            for partition_key in partition_keys
+        ]
+
+    def keys_for_indexes(self, indexes: Iterable[int]) -> List[str]:
+        return [self.key_for_index(index) for index in indexes]
+
+    def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        return next(
+            iter(
+                self._partitions_def._iterate_time_windows(  # noqa: SLF001
+                    self.parse_partition_key(partition_key).timestamp()
+                )
+            )
+        )
+
+
+class _FixedIntervalPartitionKeyCodec(_TimePartitionKeyCodec):
+    """Codec for schedules with a fixed number of seconds between consecutive partition starts,
+    e.g. hourly or every 15 minutes.
+    """
+
+    def __init__(
+        self,
+        partitions_def: "TimeWindowPartitionsDefinition",
+        first_partition_start: datetime,
+        interval_seconds: int,
+    ):
+        super().__init__(partitions_def, first_partition_start)
+        self._first_partition_start_timestamp = first_partition_start.timestamp()
+        self._interval_seconds = interval_seconds
+        self._tzinfo = get_timezone(partitions_def.timezone)
+        # only keys in the repeated hour of a DST transition get a UTC offset suffix
+        self._may_have_utc_offset_suffix = (
+            partitions_def.timezone.upper() != "UTC" and "%z" not in partitions_def.fmt
+        )
+
+    def index_for_datetime(self, dt: datetime) -> int:
+        # ceiling division, so that datetimes between two partition starts map to the later one
+        return -int(
+            (self._first_partition_start_timestamp - dt.timestamp()) // self._interval_seconds
+        )
+
+    def _start_for_index(self, index: int) -> datetime:
+        return datetime.fromtimestamp(
+            self._first_partition_start_timestamp + index * self._interval_seconds,
+            tz=self._tzinfo,
+        )
+
+    def key_for_index(self, index: int) -> str:
+        start = self._start_for_index(index)
+        if self._may_have_utc_offset_suffix:
+            return self.format_partition_key(start)
+        return start.strftime(self._partitions_def.fmt)
+
+    def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        index = self.index_for_datetime(self.parse_partition_key(partition_key))
+        return TimeWindow(self._start_for_index(index), self._start_for_index(index + 1))
+
+
+class _CalendarPartitionKeyCodec(_TimePartitionKeyCodec):
+    """Codec for daily, weekly and monthly schedules whose partition keys only contain the date.
+
+    Indexes are computed with calendar arithmetic on local dates, so they are unaffected by DST
+    transitions. Datetimes that are neither at midnight nor at the scheduled time of day, or that
+    fall in the repeated hour of a DST transition, are first resolved to the next cron tick, since
+    that tick may fall on a later date.
+    """
+
+    def __init__(
+        self, partitions_def: "TimeWindowPartitionsDefinition", first_partition_start: datetime
+    ):
+        super().__init__(partitions_def, first_partition_start)
+        self._schedule_type = partitions_def.schedule_type
+        self._first_date = first_partition_start.date()
+        self._first_month = self._first_date.year * 12 + self._first_date.month - 1
+        self._scheduled_time = time(partitions_def.hour_offset, partitions_def.minute_offset)
+        self._tzinfo = get_timezone(partitions_def.timezone)
+
+    def _index_for_date(self, d: date) -> int:
+        """Returns the index of the first partition that starts on or after the given date."""
+        if self._schedule_type == ScheduleType.DAILY:
+            return (d - self._first_date).days
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            # ceiling division, so that dates between two partition starts map to the later one
+            return -((self._first_date - d).days // 7)
+        else:
+            month = d.year * 12 + d.month - 1
+            return month - self._first_month + (1 if d.day > self._first_date.day else 0)
+
+    def _date_for_index(self, index: int) -> date:
+        if self._schedule_type == ScheduleType.DAILY:
+            return self._first_date + timedelta(days=index)
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return self._first_date + timedelta(days=7 * index)
+        else:
+            year, month = divmod(self._first_month + index, 12)
+            return date(year, month + 1, self._first_date.day)
+
+    def index_for_datetime(self, dt: datetime) -> int:
+        local_dt = dt.astimezone(self._tzinfo)
+        local_time = local_dt.time()
+        if local_dt.fold or (local_time != time() and local_time != self._scheduled_time):
+            local_dt = next(
+                iter(self._partitions_def._iterate_time_windows(dt.timestamp()))  # noqa: SLF001
+            ).start
+        return self._index_for_date(local_dt.date())
+
+    def key_for_index(self, index: int) -> str:
+        return self._date_for_index(index).strftime(self._partitions_def.fmt)
+
+    def indexes_for_keys(self, partition_keys: Iterable[str]) -> List[int]:
+        fmt = self._partitions_def.fmt
+        indexes = []
+        for partition_key in partition_keys:
+            try:
+                partition_date = datetime.strptime(partition_key, fmt).date()
+            except ValueError:
+                indexes.append(self.index_for_datetime(self.parse_partition_key(partition_key)))
+            else:
+                indexes.append(self._index_for_date(partition_date))
+        return indexes
+
+
+class _CronPartitionKeyCodec(_TimePartitionKeyCodec):
+    """Codec for irregular schedules, which walks the cron schedule.
+
+    The partition starts visited are kept in a table that is extended lazily, so that each cron
+    tick is only computed once per partitions definition.
+    """
+
+    def __init__(
+        self, partitions_def: "TimeWindowPartitionsDefinition", first_partition_start: datetime
+    ):
+        super().__init__(partitions_def, first_partition_start)
+        self._first_partition_start_timestamp = first_partition_start.timestamp()
+        self._partition_starts = [first_partition_start]
+        self._partition_start_timestamps = array("d", [self._first_partition_start_timestamp])
+        self._time_windows = iter(
+            partitions_def._iterate_time_windows(self._first_partition_start_timestamp)  # noqa: SLF001
+        )
+        # the first time window starts at first_partition_start, which is already in the table
+        next(self._time_windows)
+        self._lock = threading.Lock()
+
+    def _extend_partition_starts(
+        self, min_length: int = 0, min_timestamp: float = float("-inf")
+    ) -> None:
+        with self._lock:
+            while (
+                len(self._partition_starts) < min_length
+                or self._partition_start_timestamps[-1] < min_timestamp
+            ):
+                start = next(self._time_windows).start
+                self._partition_starts.append(start)
+                self._partition_start_timestamps.append(start.timestamp())
+
+    def _reverse_partition_starts(self) -> Iterator[datetime]:
+        """Yields the starts of the partitions before the first partition, latest first."""
+        for time_window in self._partitions_def._reverse_iterate_time_windows(  # noqa: SLF001
+            self._first_partition_start_timestamp
+        ):
+            yield time_window.start
+
+    def index_for_datetime(self, dt: datetime) -> int:
+        timestamp = dt.timestamp()
+        if timestamp < self._first_partition_start_timestamp:
+            return -sum(
+                1
+                for _ in takewhile(
+                    lambda start: start.timestamp() >= timestamp, self._reverse_partition_starts()
+                )
+            )
+
+        self._extend_partition_starts(min_timestamp=timestamp)
+        return bisect_left(self._partition_start_timestamps, timestamp)
+
+    def key_for_index(self, index: int) -> str:
+        return self.keys_for_indexes([index])[0]
+
+    def keys_for_indexes(self, indexes: Iterable[int]) -> List[str]:
+        indexes = list(indexes)
+        if not indexes:
+            return []
+
+        self._extend_partition_starts(min_length=max(indexes) + 1)
+        min_index = min(indexes)
+        reverse_partition_starts = (
+            list(islice(self._reverse_partition_starts(), -min_index)) if min_index < 0 else []
+        )
+        return [
+            self.format_partition_key(
+                self._partition_starts[index]
+                if index >= 0
+                else reverse_partition_starts[-index - 1]
+            )
+            for index in indexes
+        ]
+
+
+class _TimestampWindows:
+    """A sequence of time windows packed into parallel arrays of start and end timestamps, sorted
+    by start timestamp.
+
+    TimeWindowPartitionsSubset uses this representation for set algebra, so that each operation is
+    a single linear merge over both operands that never constructs a datetime.
+    """
+
+    __slots__ = ("starts", "ends", "_max_ends")
+
+    def __init__(self, starts: "array[float]", ends: "array[float]"):
+        self.starts = starts
+        self.ends = ends
+        self._max_ends: Optional[array[float]] = None
+
+    @staticmethod
+    def from_persisted_time_windows(
+        time_windows: Sequence[PersistedTimeWindow],
+    ) -> "_TimestampWindows":
+        # index into the underlying tuple to avoid materializing the start and end datetimes
+        pairs = [(tw[0].timestamp, tw[1].timestamp) for tw in time_windows]
+        if any(pairs[i][0] > pairs[i + 1][0] for i in range(len(pairs) - 1)):
+            pairs.sort()
+        return _TimestampWindows(
+            array("d", [start for start, _ in pairs]), array("d", [end for _, end in pairs])
+        )
+
+    @staticmethod
+    def from_time_windows(time_windows: Iterable[TimeWindow]) -> "_TimestampWindows":
+        pairs = sorted((tw.start.timestamp(), tw.end.timestamp()) for tw in time_windows)
+        return _TimestampWindows(
+            array("d", [start for start, _ in pairs]), array("d", [end for _, end in pairs])
+        )
+
+    def to_persisted_time_windows(self, timezone: str) -> Sequence[PersistedTimeWindow]:
+        return [
+            PersistedTimeWindow(
+                TimestampWithTimezone(start, timezone), TimestampWithTimezone(end, timezone)
+            )
+            for start, end in zip(self.starts, self.ends)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, timestamp: float) -> bool:
+        """Whether the given timestamp falls within any of the windows."""
+        if self._max_ends is None:
+            # the running max of the window ends, so that overlapping windows are handled correctly
+            max_ends = array("d", self.ends)
+            for i in range(1, len(max_ends)):
+                if max_ends[i] < max_ends[i - 1]:
+                    max_ends[i] = max_ends[i - 1]
+            self._max_ends = max_ends
+
+        i = bisect_right(self.starts, timestamp) - 1
+        return i >= 0 and timestamp < self._max_ends[i]
+
+    def union(self, other: "_TimestampWindows") -> "_TimestampWindows":
+        """Merges both sets of windows, coalescing windows that overlap or are adjacent."""
+        starts, ends = array("d"), array("d")
+        self_starts, self_ends, other_starts, other_ends = (
+            self.starts,
+            self.ends,
+            other.starts,
+            other.ends,
+        )
+        num_self, num_other = len(self_starts), len(other_starts)
+        i = j = 0
+        while i < num_self or j < num_other:
+            if j >= num_other or (i < num_self and self_starts[i] <= other_starts[j]):
+                start, end = self_starts[i], self_ends[i]
+                i += 1
+            else:
+                start, end = other_starts[j], other_ends[j]
+                j += 1
+
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return _TimestampWindows(starts, ends)
+
+    def intersection(self, other: "_TimestampWindows") -> "_TimestampWindows":
+        starts, ends = array("d"), array("d")
+        self_starts, self_ends, other_starts, other_ends = (
+            self.starts,
+            self.ends,
+            other.starts,
+            other.ends,
+        )
+        num_self, num_other = len(self_starts), len(other_starts)
+        i = j = 0
+        while i < num_self and j < num_other:
+            start = max(self_starts[i], other_starts[j])
+            end = min(self_ends[i], other_ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+
+            # advance past the window with the earliest end to find the next potential intersection
+            if self_ends[i] < other_ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        return _TimestampWindows(starts, ends)
+
+    def difference(self, other: "_TimestampWindows") -> "_TimestampWindows":
+        starts, ends = array("d"), array("d")
+        other_starts, other_ends = other.starts, other.ends
+        num_other = len(other_starts)
+        j = 0
+        for window_start, end in zip(self.starts, self.ends):
+            # windows of other that end before this window starts cannot intersect any later window
+            while j < num_other and other_ends[j] <= window_start:
+                j += 1
+
+            # the start of the part of this window that has not yet been subtracted from
+            start = window_start
+            k = j
+            while k < num_other and other_starts[k] < end:
+                if other_starts[k] > start:
+                    starts.append(start)
+                    ends.append(other_starts[k])
+                start = max(start, other_ends[k])
+                if start >= end:
+                    break
+                k += 1
+
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+
+        return _TimestampWindows(starts, ends)
+
+
 class TimeWindowPartitionsSubsetSerializer(NamedTupleSerializer):
     # TimeWindowPartitionsSubsets have custom logic to delay calculating num_partitions until it
     # is needed to improve performance. When serializing, we want to serialize the number of
@@ -1771,6 +2186,25 @@ def from_all_partitions_subset(subset: AllPartitionsSubset) -> "TimeWindowPartit
     def included_time_windows(self) -> Sequence[PersistedTimeWindow]:
         return self._asdict()["included_time_windows"]
 
+    @cached_property
+    def _timestamp_windows(self) -> _TimestampWindows:
+        return _TimestampWindows.from_persisted_time_windows(self.included_time_windows)
+
+    @staticmethod
+    def _from_timestamp_windows(
+        partitions_def: TimeWindowPartitionsDefinition, timestamp_windows: _TimestampWindows
+    ) -> "TimeWindowPartitionsSubset":
+        subset = TimeWindowPartitionsSubset(
+            partitions_def=partitions_def,
+            num_partitions=None,  # lazily calculated
+            included_time_windows=timestamp_windows.to_persisted_time_windows(
+                partitions_def.timezone
+            ),
+        )
+        # seed the cached property, since the result windows are already packed and sorted
+        subset.__dict__["_timestamp_windows"] = timestamp_windows
+        return subset
+
     @property
     def partitions_def(self) -> TimeWindowPartitionsDefinition:
         return self._asdict()["partitions_def"]
@@ -1838,59 +2272,12 @@ def _get_partition_time_windows_not_in_subset(
             # no partitions
             return []
 
-        last_tw_end_timestamp = last_tw.end.timestamp()
-        first_tw_start_timestamp = first_tw.start.timestamp()
-
-        if len(self.included_time_windows) == 0:
-            return [
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, last_tw.end), self.partitions_def.timezone
-                )
-            ]
-
-        time_windows = []
-        if first_tw_start_timestamp < self.included_time_windows[0].start.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, self.included_time_windows[0].start),
-                    self.partitions_def.timezone,
-                )
-            )
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start.timestamp() >= last_tw_end_timestamp:
-                break
-            if self.included_time_windows[i].end.timestamp() < last_tw_end_timestamp:
-                if self.included_time_windows[i + 1].start.timestamp() <= last_tw_end_timestamp:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                self.included_time_windows[i + 1].start,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                last_tw.end,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-
-        if last_tw_end_timestamp > self.included_time_windows[-1].end.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(self.included_time_windows[-1].end, last_tw.end),
-                    self.partitions_def.timezone,
-                )
-            )
-
-        return time_windows
+        all_windows = _TimestampWindows(
+            array("d", [first_tw.start.timestamp()]), array("d", [last_tw.end.timestamp()])
+        )
+        return all_windows.difference(self._timestamp_windows).to_persisted_time_windows(
+            self.partitions_def.timezone
+        )
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1929,78 +2316,24 @@ def _add_partitions_to_time_windows(
         """Merges a set of partition keys into an existing set of time windows, returning the
         minimized set of time windows and the number of partitions added.
         """
-        result_windows = [*initial_windows]
-        time_windows = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
-
-        num_added_partitions = 0
-        for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
-            window_start_timestamp = window.start.timestamp()
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window_start_timestamp < included_window.end.timestamp()
-                gte_start_of_range = window_start_timestamp >= included_window.start.timestamp()
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end.timestamp() == window_start_timestamp
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end.timestamp() == result_windows[i + 1].start.timestamp()
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, window.end),
-                            self.partitions_def.timezone,
-                        )
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                    else:
-                        result_windows.insert(
-                            i + 1,
-                            PersistedTimeWindow.from_public_time_window(
-                                window, self.partitions_def.timezone
-                            ),
-                        )
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window_start_timestamp == result_windows[0].start.timestamp():
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                elif (
-                    result_windows and window.end.timestamp() == result_windows[0].start.timestamp()
-                ):
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                else:
-                    result_windows.insert(
-                        0,
-                        PersistedTimeWindow.from_public_time_window(
-                            window,
-                            self.partitions_def.timezone,
-                        ),
-                    )
-
-                num_added_partitions += 1
+        added_windows = _TimestampWindows.from_time_windows(
+            cast(
+                TimeWindowPartitionsDefinition, self.partitions_def
+            ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
+        )
+        existing_windows = (
+            self._timestamp_windows
+            if initial_windows is self.included_time_windows
+            else _TimestampWindows.from_persisted_time_windows(initial_windows)
+        )
 
+        # each added window is a single partition
+        num_added_partitions = sum(
+            1 for start in added_windows.starts if not existing_windows.contains(start)
+        )
+        result_windows = existing_windows.union(added_windows).to_persisted_time_windows(
+            self.partitions_def.timezone
+        )
         return result_windows, num_added_partitions
 
     @public
@@ -2053,39 +2386,8 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
-        self_time_windows_iter = iter(
-            sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
-        )
-        other_time_windows_iter = iter(
-            sorted(other.included_time_windows, key=lambda tw: tw.start.timestamp())
-        )
-
-        result_windows = []
-        self_window = next(self_time_windows_iter, None)
-        other_window = next(other_time_windows_iter, None)
-        while self_window and other_window:
-            # find the intersection between the current two windows
-            start = max(self_window.start, other_window.start)
-            end = min(self_window.end, other_window.end)
-
-            # these windows intersect
-            if start.timestamp() < end.timestamp():
-                result_windows.append(
-                    PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(start=start, end=end), self.partitions_def.timezone
-                    )
-                )
-
-            # advance the iterator with the earliest end time to find the next potential intersection
-            if self_window.end.timestamp() < other_window.end.timestamp():
-                self_window = next(self_time_windows_iter, None)
-            else:
-                other_window = next(other_time_windows_iter, None)
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,  # lazily calculated
-            included_time_windows=result_windows,
+        return TimeWindowPartitionsSubset._from_timestamp_windows(
+            self.partitions_def, self._timestamp_windows.intersection(other._timestamp_windows)
         )
 
     def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
@@ -2093,26 +2395,8 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
-        input_time_windows = sorted(
-            [*self.included_time_windows, *other.included_time_windows],
-            key=lambda tw: tw.start.timestamp(),
-        )
-        result_windows = [input_time_windows[0]] if len(input_time_windows) > 0 else []
-        for window in input_time_windows[1:]:
-            latest_window = result_windows[-1]
-            if window.start.timestamp() <= latest_window.end.timestamp():
-                # merge this window with the latest window
-                result_windows[-1] = PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(latest_window.start, max(latest_window.end, window.end)),
-                    self.partitions_def.timezone,
-                )
-            else:
-                result_windows.append(window)
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,  # lazily calculated
-            included_time_windows=result_windows,
+        return TimeWindowPartitionsSubset._from_timestamp_windows(
+            self.partitions_def, self._timestamp_windows.union(other._timestamp_windows)
         )
 
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
@@ -2120,52 +2404,8 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
-        time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
-        other_time_windows = sorted(
-            other.included_time_windows, key=lambda tw: tw.start.timestamp()
-        )
-
-        next_time_window_index_to_process = 0
-        next_other_window_index_to_process = 0
-
-        # Slide through both sets of windows, moving to the next window once its start has passed
-        # the end of the window is it being compared to
-        while (next_time_window_index_to_process < len(time_windows)) and (
-            next_other_window_index_to_process < len(other_time_windows)
-        ):
-            time_window = time_windows[next_time_window_index_to_process]
-            other_time_window = other_time_windows[next_other_window_index_to_process]
-
-            # Perform the subtraction and splice the 0, 1, or 2 result windows
-            # back into the time_windows list
-
-            subtracted_time_windows = time_window.subtract(other_time_window)
-
-            time_windows[
-                next_time_window_index_to_process : next_time_window_index_to_process + 1
-            ] = subtracted_time_windows
-
-            if len(subtracted_time_windows) == 0:
-                # other_time_window fully consumed time_window
-                # next_time_window_index_to_process can stay the same since everything has shifted over one
-                pass
-            else:
-                updated_time_window = time_windows[next_time_window_index_to_process]
-                if updated_time_window.end.timestamp() <= other_time_window.start.timestamp():
-                    # Current subtractor is too early to intersect, can advance
-                    next_time_window_index_to_process += 1
-                elif other_time_window.end.timestamp() <= updated_time_window.start.timestamp():
-                    # current subtractee is too early to intersect, can advance
-                    next_other_window_index_to_process += 1
-                else:
-                    check.failed(
-                        "After subtraction, the new window should no longer intersect with the other window"
-                    )
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,
-            included_time_windows=time_windows,
+        return TimeWindowPartitionsSubset._from_timestamp_windows(
+            self.partitions_def, self._timestamp_windows.difference(other._timestamp_windows)
         )
 
     def __contains__(self, partition_key: Optional[str]) -> bool:
@@ -2180,13 +2420,7 @@ def __contains__(self, partition_key: Optional[str]) -> bool:
             # invalid partition key
             return False
 
-        time_window_start_timestamp = time_window.start.timestamp()
-
-        return any(
-            time_window_start_timestamp >= included_time_window.start.timestamp()
-            and time_window_start_timestamp < included_time_window.end.timestamp()
-            for included_time_window in self.included_time_windows
-        )
+        return self._timestamp_windows.contains(time_window.start.timestamp())
 
     def __len__(self) -> int:
         return self.num_partitions
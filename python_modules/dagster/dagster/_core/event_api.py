@@ -155,6 +155,55 @@ class EventRecordsResult(NamedTuple):
     has_more: bool
 
 
+class EventLogRecordSummary(NamedTuple):
+    """Projection of an event record onto the columns indexed by the event log storage. Unlike an
+    :py:class:`EventLogRecord`, fetching it does not require deserializing the stored event, so it
+    should be preferred by callers that only need to know which asset partitions were updated in
+    which runs, and when.
+
+    The timestamp is read from the indexed timestamp column, which has microsecond precision.
+    """
+
+    storage_id: int
+    run_id: str
+    timestamp: float
+    event_type: DagsterEventType
+    asset_key: Optional[AssetKey]
+    partition_key: Optional[str]
+    step_key: Optional[str]
+
+    @staticmethod
+    def from_event_log_record(record: EventLogRecord) -> "EventLogRecordSummary":
+        return EventLogRecordSummary(
+            storage_id=record.storage_id,
+            run_id=record.run_id,
+            timestamp=record.timestamp,
+            event_type=record.event_type,
+            asset_key=record.asset_key,
+            partition_key=record.partition_key,
+            step_key=record.event_log_entry.step_key,
+        )
+
+
+class EventRecordSummariesResult(NamedTuple):
+    """Return value for a query fetching event record summaries from the instance. Contains a list
+    of event record summaries, a cursor string, and a boolean indicating whether there are more
+    records to fetch.
+    """
+
+    records: Sequence[EventLogRecordSummary]
+    cursor: str
+    has_more: bool
+
+    @staticmethod
+    def from_event_records_result(result: EventRecordsResult) -> "EventRecordSummariesResult":
+        return EventRecordSummariesResult(
+            records=[EventLogRecordSummary.from_event_log_record(r) for r in result.records],
+            cursor=result.cursor,
+            has_more=result.has_more,
+        )
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
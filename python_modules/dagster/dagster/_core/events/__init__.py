@@ -243,6 +243,16 @@ class DagsterEventType(str, Enum):
     DagsterEventType.ASSET_OBSERVATION,
 }
 
+# Step events that only report on the progress of a step, without changing the state of the run,
+# step, or any asset. These may be buffered per run and written to the event log in batches.
+BUFFERABLE_STEP_EVENTS = {
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.HANDLED_OUTPUT,
+    DagsterEventType.LOADED_INPUT,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.ENGINE_EVENT,
+}
+
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
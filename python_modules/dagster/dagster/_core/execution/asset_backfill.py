@@ -2,13 +2,14 @@
 import logging
 import os
 import time
-from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from heapq import heapify, heappop, heappush
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -22,12 +23,19 @@
 )
 
 import dagster._check as check
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.asset_selection import KeysAssetSelection
 from dagster._core.definitions.automation_tick_evaluation_context import (
     build_run_requests_with_backfill_policies,
 )
-from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
+from dagster._core.definitions.base_asset_graph import (
+    BaseAssetGraph,
+    BaseAssetNode,
+    sort_key_for_asset_partition,
+)
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
@@ -204,6 +212,17 @@ def with_run_requests_submitted(
     def get_target_root_asset_partitions(
         self, instance_queryer: CachingInstanceQueryer
     ) -> Iterable[AssetKeyPartitionKey]:
+        return list(
+            self.get_target_root_asset_graph_subset(instance_queryer).iterate_asset_partitions()
+        )
+
+    def get_target_root_asset_graph_subset(
+        self, instance_queryer: CachingInstanceQueryer
+    ) -> AssetGraphSubset:
+        """Returns the targeted partitions that do not have parents in the target subset, plus the
+        partitions of the first assets that cannot be reached from those roots.
+        """
+
         def _get_self_and_downstream_targeted_subset(
             initial_subset: AssetGraphSubset,
         ) -> AssetGraphSubset:
@@ -275,7 +294,7 @@ def _get_self_and_downstream_targeted_subset(
                 " This is likely a system error. Please report this issue to the Dagster team."
             )
 
-        return list(root_subset.iterate_asset_partitions())
+        return root_subset
 
     def get_target_partitions_subset(self, asset_key: AssetKey) -> PartitionsSubset:
         # Return the targeted partitions for the root partitioned asset keys
@@ -1292,7 +1311,9 @@ def get_asset_backfill_iteration_materialized_partitions(
         cursor = None
         has_more = True
         while has_more:
-            result = instance_queryer.instance.fetch_materializations(
+            # only the run and partition of each materialization are needed, so avoid
+            # deserializing the materialization events
+            result = instance_queryer.instance.fetch_materialization_summaries(
                 AssetRecordsFilter(
                     asset_key=asset_key,
                     after_storage_id=asset_backfill_data.latest_storage_id,
@@ -1329,28 +1350,97 @@ def _get_failed_and_downstream_asset_partitions(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
     asset_graph: RemoteWorkspaceAssetGraph,
+    asset_graph_view: AssetGraphView,
     instance_queryer: CachingInstanceQueryer,
-    backfill_start_timestamp: float,
     materialized_subset: AssetGraphSubset,
 ) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda asset_partitions, _: (
-                any(
-                    asset_partition in asset_backfill_data.target_subset
-                    for asset_partition in asset_partitions
-                ),
-                "",
-            ),
+    failed_subset = AssetGraphSubset.from_asset_partition_set(
+        set(
             _get_failed_asset_partitions(
                 instance_queryer, backfill_id, asset_graph, materialized_subset
-            ),
-            evaluation_time=datetime_from_timestamp(backfill_start_timestamp),
-        )[0],
+            )
+        ),
         asset_graph,
     )
-    return failed_and_downstream_subset
+    return _get_self_and_downstream_targeted_subset(
+        asset_graph_view, failed_subset, asset_backfill_data.target_subset
+    )
+
+
+def _get_entity_subset(
+    asset_graph_view: AssetGraphView, asset_graph_subset: AssetGraphSubset, asset_key: AssetKey
+) -> EntitySubset[AssetKey]:
+    return check.not_none(
+        asset_graph_view.get_subset_from_serializable_subset(
+            asset_graph_subset.get_asset_subset(asset_key, asset_graph_view.asset_graph)
+        )
+    )
+
+
+def _get_self_and_downstream_targeted_subset(
+    asset_graph_view: AssetGraphView,
+    initial_subset: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+) -> AssetGraphSubset:
+    """Returns the targeted partitions that are in or downstream of the initial subset. Partition
+    mappings are applied to whole subsets, and are only followed through targeted partitions.
+    """
+    asset_graph = asset_graph_view.asset_graph
+    target_asset_keys = target_subset.asset_keys
+    subsets_by_asset_key: Dict[AssetKey, EntitySubset[AssetKey]] = {}
+    for asset_key in asset_graph.toposorted_asset_keys:
+        if asset_key not in target_asset_keys:
+            continue
+
+        asset_target_subset = _get_entity_subset(asset_graph_view, target_subset, asset_key)
+        subset = _get_entity_subset(asset_graph_view, initial_subset, asset_key)
+        for parent_key in asset_graph.get(asset_key).parent_keys - {asset_key}:
+            if parent_key in subsets_by_asset_key:
+                subset = subset.compute_union(
+                    subsets_by_asset_key[parent_key]
+                    .compute_child_subset(asset_key)
+                    .compute_intersection(asset_target_subset)
+                )
+        subset = subset.compute_intersection(asset_target_subset)
+
+        if asset_graph.get(asset_key).has_self_dependency:
+            # follow the self dependency until it stops reaching new targeted partitions
+            while not subset.is_empty:
+                reached_subset = subset.compute_child_subset(asset_key).compute_intersection(
+                    asset_target_subset
+                )
+                if reached_subset.compute_difference(subset).is_empty:
+                    break
+                subset = subset.compute_union(reached_subset)
+
+        if not subset.is_empty:
+            subsets_by_asset_key[asset_key] = subset
+
+    return AssetGraphSubset.from_entity_subsets(subsets_by_asset_key.values())
+
+
+def _get_targeted_children_subset(
+    asset_graph_view: AssetGraphView,
+    parent_subset: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+) -> AssetGraphSubset:
+    """Returns the targeted partitions that directly depend on a partition in the parent subset."""
+    asset_graph = asset_graph_view.asset_graph
+    target_asset_keys = target_subset.asset_keys
+    subsets_by_asset_key: Dict[AssetKey, EntitySubset[AssetKey]] = {}
+    for parent_key in parent_subset.asset_keys:
+        parent_entity_subset = _get_entity_subset(asset_graph_view, parent_subset, parent_key)
+        for child_key in asset_graph.get(parent_key).child_keys & target_asset_keys:
+            child_subset = parent_entity_subset.compute_child_subset(
+                child_key
+            ).compute_intersection(_get_entity_subset(asset_graph_view, target_subset, child_key))
+            subsets_by_asset_key[child_key] = (
+                subsets_by_asset_key[child_key].compute_union(child_subset)
+                if child_key in subsets_by_asset_key
+                else child_subset
+            )
+
+    return AssetGraphSubset.from_entity_subsets(subsets_by_asset_key.values())
 
 
 def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
@@ -1415,16 +1505,23 @@ def execute_asset_backfill_iteration_inner(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
-    initial_candidates: Set[AssetKeyPartitionKey] = set()
+    backfill_start_datetime = datetime_from_timestamp(backfill_start_timestamp)
+    asset_graph_view = AssetGraphView(
+        temporal_context=TemporalContext(effective_dt=backfill_start_datetime, last_event_id=None),
+        instance=instance_queryer.instance,
+        asset_graph=asset_graph,
+    )
+
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
     if request_roots:
         logger.info(
             "Not all root assets (assets in backfill that do not have parents in the backill) have been requested, finding root assets."
         )
-        target_roots = asset_backfill_data.get_target_root_asset_partitions(instance_queryer)
-        initial_candidates.update(target_roots)
+        initial_candidate_subset = asset_backfill_data.get_target_root_asset_graph_subset(
+            instance_queryer
+        )
         logger.info(
-            f"Root assets that have not yet been requested:\n {_asset_graph_subset_to_str(AssetGraphSubset.from_asset_partition_set(set(target_roots), asset_graph), asset_graph)}"
+            f"Root assets that have not yet been requested:\n {_asset_graph_subset_to_str(initial_candidate_subset, asset_graph)}"
         )
 
         yield None
@@ -1462,16 +1559,11 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
-        parent_materialized_asset_partitions = set().union(
-            *(
-                instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
-                    latest_storage_id=asset_backfill_data.latest_storage_id,
-                    child_asset_key=asset_key,
-                )[0]
-                for asset_key in asset_backfill_data.target_subset.asset_keys
-            )
+        # partitions whose parents were materialized by the backfill since the last tick may now
+        # be ready to run
+        initial_candidate_subset = _get_targeted_children_subset(
+            asset_graph_view, materialized_since_last_tick, asset_backfill_data.target_subset
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
 
         yield None
 
@@ -1479,53 +1571,33 @@ def execute_asset_backfill_iteration_inner(
             backfill_id,
             asset_backfill_data,
             asset_graph,
+            asset_graph_view,
             instance_queryer,
-            backfill_start_timestamp,
             updated_materialized_subset,
         )
 
         yield None
 
-    backfill_start_datetime = datetime_from_timestamp(backfill_start_timestamp)
-
-    asset_partitions_to_request, not_requested_and_reasons = (
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda unit, visited: should_backfill_atomic_asset_partitions_unit(
-                candidates_unit=unit,
-                asset_partitions_to_request=visited,
-                asset_graph=asset_graph,
-                materialized_subset=updated_materialized_subset,
-                requested_subset=asset_backfill_data.requested_subset,
-                target_subset=asset_backfill_data.target_subset,
-                failed_and_downstream_subset=failed_and_downstream_subset,
-                dynamic_partitions_store=instance_queryer,
-                current_time=backfill_start_datetime,
-            ),
-            initial_asset_partitions=initial_candidates,
-            evaluation_time=backfill_start_datetime,
-        )
+    asset_graph_subset_to_request, not_requested_and_reasons = _get_asset_graph_subset_to_request(
+        asset_graph_view,
+        asset_graph,
+        initial_candidate_subset=initial_candidate_subset,
+        target_subset=asset_backfill_data.target_subset,
+        requested_subset=asset_backfill_data.requested_subset,
+        materialized_subset=updated_materialized_subset,
+        failed_and_downstream_subset=failed_and_downstream_subset,
     )
 
     logger.info(
-        f"Asset partitions to request:\n {_asset_graph_subset_to_str(AssetGraphSubset.from_asset_partition_set(asset_partitions_to_request, asset_graph), asset_graph)}"
-        if asset_partitions_to_request
+        f"Asset partitions to request:\n {_asset_graph_subset_to_str(asset_graph_subset_to_request, asset_graph)}"
+        if asset_graph_subset_to_request.asset_keys
         else "No asset partitions to request."
     )
     if len(not_requested_and_reasons) > 0:
-
-        def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
-            return ", ".join(
-                f"({key.asset_key.to_user_string()}, {key.partition_key})"
-                if key.partition_key
-                else key.asset_key.to_user_string()
-                for key in keys
-            )
-
         not_requested_str = "\n".join(
             [
-                f"[{_format_keys(keys)}] - Reason: {reason}."
-                for keys, reason in not_requested_and_reasons
+                f"{_asset_graph_subset_to_str(subset, asset_graph)}  Reason: {reason}."
+                for subset, reason in not_requested_and_reasons
             ]
         )
         logger.info(
@@ -1533,7 +1605,7 @@ def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
         )
 
     run_requests = build_run_requests_with_backfill_policies(
-        asset_partitions=asset_partitions_to_request,
+        asset_graph_subset=asset_graph_subset_to_request,
         asset_graph=asset_graph,
         dynamic_partitions_store=instance_queryer,
     )
@@ -1561,32 +1633,463 @@ def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
     )
 
 
-def can_run_with_parent(
-    parent: AssetKeyPartitionKey,
-    candidate: AssetKeyPartitionKey,
-    candidates_unit: Iterable[AssetKeyPartitionKey],
+def _get_execution_set_keys_in_topological_order(
+    asset_graph: BaseAssetGraph, asset_keys: AbstractSet[AssetKey]
+) -> Sequence[Sequence[AssetKey]]:
+    """Groups the given asset keys by the execution sets (non-subsettable multi-assets) that contain
+    them, ordering the groups so that every group comes after the groups of its members' parents.
+
+    Members of an execution set with different partitions definitions can't share partitions
+    subsets, so they are grouped separately.
+    """
+    level_by_asset_key = {
+        asset_key: level
+        for level, asset_keys_in_level in enumerate(asset_graph.toposorted_asset_keys_by_level)
+        for asset_key in asset_keys_in_level
+    }
+    level_by_execution_set: Dict[FrozenSet[AssetKey], int] = {}
+    for asset_key in asset_keys:
+        execution_set_keys = asset_graph.get(asset_key).execution_set_asset_keys
+        partitions_def = asset_graph.get(asset_key).partitions_def
+        if any(asset_graph.get(key).partitions_def != partitions_def for key in execution_set_keys):
+            execution_set_keys = {asset_key}
+        level_by_execution_set[frozenset(execution_set_keys)] = max(
+            level_by_asset_key[key] for key in execution_set_keys
+        )
+
+    return [
+        sorted(execution_set_keys)
+        for execution_set_keys, _ in sorted(
+            level_by_execution_set.items(), key=lambda item: (item[1], sorted(item[0]))
+        )
+    ]
+
+
+def _with_asset_key(
+    asset_graph_view: AssetGraphView, subset: EntitySubset[AssetKey], asset_key: AssetKey
+) -> EntitySubset[AssetKey]:
+    """Returns the same partitions as the given subset, for another asset with the same partitions
+    definition.
+    """
+    if subset.key == asset_key:
+        return subset
+    return check.not_none(
+        asset_graph_view.get_subset_from_serializable_subset(
+            SerializableEntitySubset(key=asset_key, value=subset.get_internal_value())
+        )
+    )
+
+
+def _get_asset_graph_subset_to_request(
+    asset_graph_view: AssetGraphView,
     asset_graph: RemoteWorkspaceAssetGraph,
+    initial_candidate_subset: AssetGraphSubset,
     target_subset: AssetGraphSubset,
-    asset_partitions_to_request_map: Mapping[AssetKey, AbstractSet[Optional[str]]],
-) -> Tuple[bool, str]:
-    """Returns if a given candidate can be materialized in the same run as a given parent on
-    this tick, and the reason it cannot be materialized, if applicable.
+    requested_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+    failed_and_downstream_subset: AssetGraphSubset,
+) -> Tuple[AssetGraphSubset, Sequence[Tuple[AssetGraphSubset, str]]]:
+    """Returns the targeted partitions that can be requested on this tick, along with the subsets
+    of candidates that were not requested and the reason why.
+
+    The candidates are the initial candidate subset plus the targeted partitions that depend on
+    partitions requested on this tick. Execution sets are visited parents-first, so by the time an
+    execution set is evaluated, the subset requested for each of its parents on this tick is final
+    and the checks against that parent can be made with a single partition mapping of whole
+    subsets.
     """
-    parent_target_subset = target_subset.get_asset_subset(parent.asset_key, asset_graph)
-    candidate_target_subset = target_subset.get_asset_subset(candidate.asset_key, asset_graph)
-    partition_mapping = asset_graph.get_partition_mapping(
-        candidate.asset_key, parent_asset_key=parent.asset_key
+    subsets_to_request: Dict[AssetKey, EntitySubset[AssetKey]] = {}
+    not_requested_and_reasons: List[Tuple[AssetGraphSubset, str]] = []
+
+    for execution_set_keys in _get_execution_set_keys_in_topological_order(
+        asset_graph, target_subset.asset_keys
+    ):
+        # all members of an execution set share a partitions definition, so their candidates and
+        # the partitions that can run are tracked as a single subset of the first member
+        unit_key = execution_set_keys[0]
+        candidate_subset = asset_graph_view.get_empty_subset(key=unit_key)
+        for asset_key in execution_set_keys:
+            asset_candidate_subset = _get_entity_subset(
+                asset_graph_view, initial_candidate_subset, asset_key
+            )
+            for parent_key in asset_graph.get(asset_key).parent_keys - {asset_key}:
+                if parent_key in subsets_to_request:
+                    asset_candidate_subset = asset_candidate_subset.compute_union(
+                        subsets_to_request[parent_key]
+                        .compute_child_subset(asset_key)
+                        .compute_intersection(
+                            _get_entity_subset(asset_graph_view, target_subset, asset_key)
+                        )
+                    )
+            candidate_subset = candidate_subset.compute_union(
+                _with_asset_key(asset_graph_view, asset_candidate_subset, unit_key)
+            )
+
+        if candidate_subset.is_empty:
+            continue
+
+        eligible_subset, rejected_subsets_and_reasons = _get_eligible_subset_for_execution_set(
+            asset_graph_view,
+            asset_graph,
+            execution_set_keys,
+            subsets_to_request,
+            target_subset=target_subset,
+            requested_subset=requested_subset,
+            materialized_subset=materialized_subset,
+            failed_and_downstream_subset=failed_and_downstream_subset,
+        )
+
+        remaining_candidate_subset = candidate_subset
+        for rejected_subset, reason in rejected_subsets_and_reasons:
+            rejected_candidate_subset = remaining_candidate_subset.compute_intersection(
+                rejected_subset
+            )
+            if not rejected_candidate_subset.is_empty:
+                not_requested_and_reasons.append(
+                    (
+                        AssetGraphSubset.from_entity_subsets(
+                            _with_asset_key(asset_graph_view, rejected_candidate_subset, key)
+                            for key in execution_set_keys
+                        ),
+                        reason,
+                    )
+                )
+                remaining_candidate_subset = remaining_candidate_subset.compute_difference(
+                    rejected_candidate_subset
+                )
+
+        for asset_key in execution_set_keys:
+            _check_parent_partitions_exist(
+                asset_graph_view,
+                _with_asset_key(asset_graph_view, remaining_candidate_subset, asset_key),
+            )
+
+        subset_to_request = remaining_candidate_subset
+        for asset_key in execution_set_keys:
+            if not asset_graph.get(asset_key).has_self_dependency:
+                continue
+            subset_to_request, self_dependency_rejections = _get_self_dependent_subset_to_request(
+                asset_graph_view,
+                asset_graph,
+                _with_asset_key(asset_graph_view, subset_to_request, asset_key),
+                eligible_subset=_with_asset_key(asset_graph_view, eligible_subset, asset_key),
+                target_subset=_get_entity_subset(asset_graph_view, target_subset, asset_key),
+                materialized_subset=_get_entity_subset(
+                    asset_graph_view, materialized_subset, asset_key
+                ),
+            )
+            subset_to_request = _with_asset_key(asset_graph_view, subset_to_request, unit_key)
+            for rejected_subset, reason in self_dependency_rejections:
+                not_requested_and_reasons.append(
+                    (
+                        AssetGraphSubset.from_entity_subsets(
+                            _with_asset_key(asset_graph_view, rejected_subset, key)
+                            for key in execution_set_keys
+                        ),
+                        reason,
+                    )
+                )
+
+        if not subset_to_request.is_empty:
+            for asset_key in execution_set_keys:
+                subsets_to_request[asset_key] = _with_asset_key(
+                    asset_graph_view, subset_to_request, asset_key
+                )
+
+    return (
+        AssetGraphSubset.from_entity_subsets(subsets_to_request.values()),
+        not_requested_and_reasons,
     )
 
-    is_self_dependency = parent.asset_key == candidate.asset_key
 
-    parent_node = asset_graph.get(parent.asset_key)
-    candidate_node = asset_graph.get(candidate.asset_key)
-    # checks if there is a simple partition mapping between the parent and the child
-    has_identity_partition_mapping = (
+def _get_eligible_subset_for_execution_set(
+    asset_graph_view: AssetGraphView,
+    asset_graph: RemoteWorkspaceAssetGraph,
+    execution_set_keys: Sequence[AssetKey],
+    subsets_to_request: Mapping[AssetKey, EntitySubset[AssetKey]],
+    target_subset: AssetGraphSubset,
+    requested_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+    failed_and_downstream_subset: AssetGraphSubset,
+) -> Tuple[EntitySubset[AssetKey], Sequence[Tuple[EntitySubset[AssetKey], str]]]:
+    """Returns the partitions of an execution set that could be requested on this tick given what
+    is being requested for their parents, ignoring any self dependencies. Also returns the subsets
+    that were ruled out, in the order they were ruled out, along with the reason why.
+
+    All subsets are expressed in terms of the first asset in the execution set, and a partition is
+    only eligible if it is eligible for every asset in the execution set.
+    """
+    unit_key = execution_set_keys[0]
+
+    def _to_unit(subset: EntitySubset[AssetKey]) -> EntitySubset[AssetKey]:
+        return _with_asset_key(asset_graph_view, subset, unit_key)
+
+    # a partition is only targeted if it is targeted for every asset in the execution set
+    asset_target_subsets = [
+        _to_unit(_get_entity_subset(asset_graph_view, target_subset, asset_key))
+        for asset_key in execution_set_keys
+    ]
+    eligible_subset = asset_target_subsets[0]
+    partially_targeted_subset = asset_target_subsets[0]
+    for asset_target_subset in asset_target_subsets[1:]:
+        eligible_subset = eligible_subset.compute_intersection(asset_target_subset)
+        partially_targeted_subset = partially_targeted_subset.compute_union(asset_target_subset)
+
+    rejected_subsets_and_reasons: List[Tuple[EntitySubset[AssetKey], str]] = []
+
+    def _reject(subset: EntitySubset[AssetKey], reason: str) -> None:
+        nonlocal eligible_subset
+        if not subset.is_empty:
+            rejected_subsets_and_reasons.append((subset, reason))
+            eligible_subset = eligible_subset.compute_difference(subset)
+
+    _reject(
+        partially_targeted_subset.compute_difference(eligible_subset), "not targeted by backfill"
+    )
+    for asset_key in execution_set_keys:
+        _reject(
+            _to_unit(_get_entity_subset(asset_graph_view, failed_and_downstream_subset, asset_key)),
+            "failed or downstream of a failed asset",
+        )
+    for asset_key in execution_set_keys:
+        _reject(
+            _to_unit(_get_entity_subset(asset_graph_view, materialized_subset, asset_key)),
+            "already materialized by backfill",
+        )
+    for asset_key in execution_set_keys:
+        _reject(
+            _to_unit(_get_entity_subset(asset_graph_view, requested_subset, asset_key)),
+            "already requested by backfill",
+        )
+
+    for asset_key in execution_set_keys:
+        asset_target_subset = _get_entity_subset(asset_graph_view, target_subset, asset_key)
+        for parent_key in sorted(asset_graph.get(asset_key).parent_keys - {asset_key}):
+            parent_target_subset = _get_entity_subset(asset_graph_view, target_subset, parent_key)
+            pending_parent_subset = parent_target_subset.compute_difference(
+                _get_entity_subset(asset_graph_view, materialized_subset, parent_key)
+            )
+            if pending_parent_subset.is_empty:
+                continue
+
+            # the eligible partitions that depend on a targeted parent partition that hasn't been
+            # materialized yet, and so must be requested in the same run as it
+            waiting_subset = pending_parent_subset.compute_child_subset(
+                asset_key
+            ).compute_intersection(_with_asset_key(asset_graph_view, eligible_subset, asset_key))
+            if waiting_subset.is_empty:
+                continue
+
+            if parent_key in execution_set_keys and _has_identity_partition_mapping(
+                asset_graph, parent_key, asset_key
+            ):
+                # the parent partitions are part of the same unit as their children
+                continue
+
+            cannot_run_reason = _get_cannot_run_with_parent_reason(
+                asset_graph, parent_key, asset_key
+            )
+            if cannot_run_reason is not None:
+                _reject(_to_unit(waiting_subset), cannot_run_reason)
+                continue
+
+            parent_subset_to_request = subsets_to_request.get(
+                parent_key, asset_graph_view.get_empty_subset(key=parent_key)
+            )
+            not_requested_subset = (
+                pending_parent_subset.compute_difference(parent_subset_to_request)
+                .compute_child_subset(asset_key)
+                .compute_intersection(waiting_subset)
+            )
+            _reject(
+                _to_unit(not_requested_subset),
+                f"parent {parent_key.to_user_string()} has targeted partitions that are not"
+                " requested in this iteration",
+            )
+
+            waiting_subset = waiting_subset.compute_difference(not_requested_subset)
+            if not waiting_subset.is_empty and not _can_run_with_requested_parent(
+                asset_graph,
+                parent_key,
+                asset_key,
+                parent_target_subset=parent_target_subset,
+                target_subset=asset_target_subset,
+                num_parent_partitions_to_request=parent_subset_to_request.size,
+            ):
+                _reject(
+                    _to_unit(waiting_subset),
+                    _get_non_simple_partition_mapping_reason(parent_key, asset_key),
+                )
+
+    return eligible_subset, rejected_subsets_and_reasons
+
+
+def _get_self_dependent_subset_to_request(
+    asset_graph_view: AssetGraphView,
+    asset_graph: RemoteWorkspaceAssetGraph,
+    candidate_subset: EntitySubset[AssetKey],
+    eligible_subset: EntitySubset[AssetKey],
+    target_subset: EntitySubset[AssetKey],
+    materialized_subset: EntitySubset[AssetKey],
+) -> Tuple[EntitySubset[AssetKey], Sequence[Tuple[EntitySubset[AssetKey], str]]]:
+    """Returns the candidates of a self-dependent asset that can be requested on this tick, along
+    with the candidates that cannot and the reason why.
+
+    Without a backfill policy, a partition can only be requested once the partitions it depends
+    on are materialized, so the candidates whose parents are pending are removed in one step.
+    With a backfill policy, a partition can also run alongside the partitions it depends on, which
+    depends on how many partitions have already been added to the run, so the partitions are
+    walked one at a time, oldest first.
+    """
+    asset_key = candidate_subset.key
+    pending_subset = target_subset.compute_difference(materialized_subset)
+    backfill_policy = asset_graph.get(asset_key).backfill_policy
+
+    if backfill_policy is None:
+        waiting_subset = pending_subset.compute_child_subset(asset_key).compute_intersection(
+            candidate_subset
+        )
+        subset_to_request = candidate_subset.compute_difference(waiting_subset)
+        not_requested_subset = (
+            pending_subset.compute_difference(subset_to_request)
+            .compute_child_subset(asset_key)
+            .compute_intersection(waiting_subset)
+        )
+        return subset_to_request, [
+            (subset, reason)
+            for subset, reason in [
+                (
+                    not_requested_subset,
+                    f"parent {asset_key.to_user_string()} has targeted partitions that are not"
+                    " requested in this iteration",
+                ),
+                (
+                    waiting_subset.compute_difference(not_requested_subset),
+                    _get_non_simple_partition_mapping_reason(asset_key, asset_key),
+                ),
+            ]
+            if not subset.is_empty
+        ]
+
+    def _partition_subset(partition_key: str) -> EntitySubset[AssetKey]:
+        return asset_graph_view.get_asset_subset_from_asset_partitions(
+            asset_key, {AssetKeyPartitionKey(asset_key, partition_key)}
+        )
+
+    def _queue_item(partition_key: str) -> Tuple[float, str]:
+        return (
+            sort_key_for_asset_partition(
+                asset_graph, AssetKeyPartitionKey(asset_key, partition_key)
+            ),
+            partition_key,
+        )
+
+    queue = [
+        _queue_item(partition_key)
+        for partition_key in candidate_subset.expensively_compute_partition_keys()
+    ]
+    heapify(queue)
+    queued_partition_keys = {partition_key for _, partition_key in queue}
+    partition_keys_to_request: Set[str] = set()
+    not_requested_partition_keys: Set[str] = set()
+    over_limit_partition_keys: Set[str] = set()
+
+    while queue:
+        _, partition_key = heappop(queue)
+        partition_subset = _partition_subset(partition_key)
+        pending_parent_partition_keys = (
+            partition_subset.compute_parent_subset(asset_key)
+            .compute_intersection(pending_subset)
+            .expensively_compute_partition_keys()
+        )
+        if not pending_parent_partition_keys <= partition_keys_to_request:
+            not_requested_partition_keys.add(partition_key)
+        elif pending_parent_partition_keys and not _can_run_with_requested_parent(
+            asset_graph,
+            asset_key,
+            asset_key,
+            parent_target_subset=target_subset,
+            target_subset=target_subset,
+            num_parent_partitions_to_request=len(partition_keys_to_request),
+        ):
+            over_limit_partition_keys.add(partition_key)
+        else:
+            partition_keys_to_request.add(partition_key)
+            # requesting this partition makes the partitions that depend on it candidates
+            for child_partition_key in (
+                partition_subset.compute_child_subset(asset_key)
+                .compute_intersection(eligible_subset)
+                .expensively_compute_partition_keys()
+            ):
+                if child_partition_key not in queued_partition_keys:
+                    queued_partition_keys.add(child_partition_key)
+                    heappush(queue, _queue_item(child_partition_key))
+
+    def _subset(partition_keys: AbstractSet[str]) -> EntitySubset[AssetKey]:
+        return asset_graph_view.get_asset_subset_from_asset_partitions(
+            asset_key, {AssetKeyPartitionKey(asset_key, pk) for pk in partition_keys}
+        )
+
+    return _subset(partition_keys_to_request), [
+        (_subset(partition_keys), reason)
+        for partition_keys, reason in [
+            (
+                not_requested_partition_keys,
+                f"parent {asset_key.to_user_string()} has targeted partitions that are not"
+                " requested in this iteration",
+            ),
+            (
+                over_limit_partition_keys,
+                _get_non_simple_partition_mapping_reason(asset_key, asset_key),
+            ),
+        ]
+        if partition_keys
+    ]
+
+
+def _check_parent_partitions_exist(
+    asset_graph_view: AssetGraphView, subset: EntitySubset[AssetKey]
+) -> None:
+    asset_graph = asset_graph_view.asset_graph
+    partitions_def = asset_graph.get(subset.key).partitions_def
+    if partitions_def is None or subset.is_empty:
+        return
+
+    for parent_key in sorted(asset_graph.get(subset.key).parent_keys):
+        parent_partitions_def = asset_graph.get(parent_key).partitions_def
+        if parent_partitions_def is None:
+            continue
+
+        mapped_partitions_result = asset_graph.get_partition_mapping(
+            subset.key, parent_key
+        ).get_upstream_mapped_partitions_result_for_partitions(
+            subset.get_internal_subset_value(),
+            partitions_def,
+            parent_partitions_def,
+            current_time=asset_graph_view.effective_dt,
+            dynamic_partitions_store=asset_graph_view.get_inner_queryer_for_back_compat(),
+        )
+        if mapped_partitions_result.required_but_nonexistent_partition_keys:
+            raise DagsterInvariantViolationError(
+                f"Asset {subset.key.to_user_string()} with partitions"
+                f" {{{_partition_subset_str(subset.get_internal_subset_value(), partitions_def)}}}"
+                " depends on invalid partition keys"
+                f" {mapped_partitions_result.required_but_nonexistent_partition_keys} of"
+                f" {parent_key.to_user_string()}"
+            )
+
+
+def _has_identity_partition_mapping(
+    asset_graph: BaseAssetGraph, parent_key: AssetKey, child_key: AssetKey
+) -> bool:
+    """Returns whether each partition of the child maps to the partition of the parent with the
+    same key.
+    """
+    partition_mapping = asset_graph.get_partition_mapping(child_key, parent_asset_key=parent_key)
+    return (
         # both unpartitioned
-        not candidate_node.is_partitioned
-        and not parent_node.is_partitioned
+        not asset_graph.get(child_key).is_partitioned
+        and not asset_graph.get(parent_key).is_partitioned
         # normal identity partition mapping
         or isinstance(partition_mapping, IdentityPartitionMapping)
         # for assets with the same time partitions definition, a non-offset partition
@@ -1597,140 +2100,74 @@ def can_run_with_parent(
             and partition_mapping.end_offset == 0
         )
     )
-    if parent_node.backfill_policy != candidate_node.backfill_policy:
-        return (
-            False,
-            f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} have different backfill policies so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key} is materialized.",
-        )
+
+
+def _get_cannot_run_with_parent_reason(
+    asset_graph: RemoteWorkspaceAssetGraph, parent_key: AssetKey, child_key: AssetKey
+) -> Optional[str]:
+    """Returns the reason that partitions of an asset can never be materialized in the same run as
+    partitions of the given parent, if there is one.
+    """
+    parent_node = asset_graph.get(parent_key)
+    child_node = asset_graph.get(child_key)
+    if parent_node.backfill_policy != child_node.backfill_policy:
+        return f"parent {parent_node.key.to_user_string()} and {child_node.key.to_user_string()} have different backfill policies so they cannot be materialized in the same run. {child_node.key.to_user_string()} can be materialized once {parent_node.key} is materialized."
     if (
         parent_node.resolve_to_singular_repo_scoped_node().repository_handle
-        != candidate_node.resolve_to_singular_repo_scoped_node().repository_handle
-    ):
-        return (
-            False,
-            f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} are in different code locations so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized.",
-        )
-    if parent_node.partitions_def != candidate_node.partitions_def:
-        return (
-            False,
-            f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} have different partitions definitions so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized.",
-        )
-    if (
-        parent.partition_key not in asset_partitions_to_request_map[parent.asset_key]
-        and parent not in candidates_unit
+        != child_node.resolve_to_singular_repo_scoped_node().repository_handle
     ):
-        return (
-            False,
-            f"parent {parent.asset_key.to_user_string()} with partition key {parent.partition_key} is not requested in this iteration",
-        )
-    if (
+        return f"parent {parent_node.key.to_user_string()} and {child_node.key.to_user_string()} are in different code locations so they cannot be materialized in the same run. {child_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized."
+    if parent_node.partitions_def != child_node.partitions_def:
+        return f"parent {parent_node.key.to_user_string()} and {child_node.key.to_user_string()} have different partitions definitions so they cannot be materialized in the same run. {child_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized."
+    return None
+
+
+def _can_run_with_requested_parent(
+    asset_graph: RemoteWorkspaceAssetGraph,
+    parent_key: AssetKey,
+    child_key: AssetKey,
+    parent_target_subset: EntitySubset[AssetKey],
+    target_subset: EntitySubset[AssetKey],
+    num_parent_partitions_to_request: int,
+) -> bool:
+    """Returns whether partitions of an asset whose pending parent partitions are all being
+    requested on this tick can be materialized in the same run as those parent partitions.
+    """
+    backfill_policy = asset_graph.get(parent_key).backfill_policy
+    return (
         # if there is a simple mapping between the parent and the child, then
         # with the parent
-        has_identity_partition_mapping
+        _has_identity_partition_mapping(asset_graph, parent_key, child_key)
         # if there is not a simple mapping, we can only materialize this asset with its
         # parent if...
         or (
             # there is a backfill policy for the parent
-            parent_node.backfill_policy is not None
+            backfill_policy is not None
             # the same subset of parents is targeted as the child
-            and parent_target_subset.value == candidate_target_subset.value
+            and parent_target_subset.get_internal_value() == target_subset.get_internal_value()
             and (
                 # there is no limit on the size of a single run or...
-                parent_node.backfill_policy.max_partitions_per_run is None
+                backfill_policy.max_partitions_per_run is None
                 # a single run can materialize all requested parent partitions
-                or parent_node.backfill_policy.max_partitions_per_run
-                > len(asset_partitions_to_request_map[parent.asset_key])
+                or backfill_policy.max_partitions_per_run > num_parent_partitions_to_request
             )
             # all targeted parents are being requested this tick, or its a self dependency
             and (
-                len(asset_partitions_to_request_map[parent.asset_key]) == parent_target_subset.size
-                or is_self_dependency
-            )
-        )
-    ):
-        return True, ""
-    else:
-        failed_reason = (
-            f"partition mapping between {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} is not simple and "
-            f"{parent_node.key.to_user_string()} does not meet requirements of: targeting the same partitions as "
-            f"{candidate_node.key.to_user_string()}, have all of its partitions requested in this iteration, having "
-            "a backfill policy, and that backfill policy size limit is not exceeded by adding "
-            f"{candidate_node.key.to_user_string()} to the run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized."
-        )
-        return False, failed_reason
-
-
-def should_backfill_atomic_asset_partitions_unit(
-    asset_graph: RemoteWorkspaceAssetGraph,
-    candidates_unit: Iterable[AssetKeyPartitionKey],
-    asset_partitions_to_request: AbstractSet[AssetKeyPartitionKey],
-    target_subset: AssetGraphSubset,
-    requested_subset: AssetGraphSubset,
-    materialized_subset: AssetGraphSubset,
-    failed_and_downstream_subset: AssetGraphSubset,
-    dynamic_partitions_store: DynamicPartitionsStore,
-    current_time: datetime,
-) -> Tuple[bool, str]:
-    """Args:
-    candidates_unit: A set of asset partitions that must all be materialized if any is
-        materialized.
-
-    returns if the candidates_unit can be materialized in this tick of the backfill, and the reason
-    it cannot, if applicable
-    """
-    for candidate in candidates_unit:
-        candidate_asset_partition_string = f"Asset {candidate.asset_key.to_user_string()} {f'with partition {candidate.partition_key}' if candidate.partition_key is not None else ''}"
-        if candidate not in target_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} is not targeted by backfill",
-            )
-        elif candidate in failed_and_downstream_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} has failed or is downstream of a failed asset",
-            )
-        elif candidate in materialized_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} was already materialized by backfill",
+                num_parent_partitions_to_request == parent_target_subset.size
+                or parent_key == child_key
             )
-        elif candidate in requested_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} was already requested by backfill",
-            )
-
-        parent_partitions_result = asset_graph.get_parents_partitions(
-            dynamic_partitions_store, current_time, *candidate
         )
-        if parent_partitions_result.required_but_nonexistent_parents_partitions:
-            raise DagsterInvariantViolationError(
-                f"Asset partition {candidate}"
-                " depends on invalid partition keys"
-                f" {parent_partitions_result.required_but_nonexistent_parents_partitions}"
-            )
-
-        asset_partitions_to_request_map: Dict[AssetKey, Set[Optional[str]]] = defaultdict(set)
-        for asset_partition in asset_partitions_to_request:
-            asset_partitions_to_request_map[asset_partition.asset_key].add(
-                asset_partition.partition_key
-            )
+    )
 
-        for parent in parent_partitions_result.parent_partitions:
-            if parent in target_subset and parent not in materialized_subset:
-                can_run, failed_reason = can_run_with_parent(
-                    parent,
-                    candidate,
-                    candidates_unit,
-                    asset_graph,
-                    target_subset,
-                    asset_partitions_to_request_map,
-                )
-                if not can_run:
-                    return False, failed_reason
 
-    return True, ""
+def _get_non_simple_partition_mapping_reason(parent_key: AssetKey, child_key: AssetKey) -> str:
+    return (
+        f"partition mapping between {parent_key.to_user_string()} and {child_key.to_user_string()} is not simple and "
+        f"{parent_key.to_user_string()} does not meet requirements of: targeting the same partitions as "
+        f"{child_key.to_user_string()}, have all of its partitions requested in this iteration, having "
+        "a backfill policy, and that backfill policy size limit is not exceeded by adding "
+        f"{child_key.to_user_string()} to the run. {child_key.to_user_string()} can be materialized once {parent_key.to_user_string()} is materialized."
+    )
 
 
 def _get_failed_asset_partitions(
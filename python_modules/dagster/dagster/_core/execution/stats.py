@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -36,6 +36,24 @@
     *MARKER_EVENTS,
 }
 
+# step stats events whose event log entry is needed to build step stats, as opposed to just their
+# event type and timestamp
+STEP_STATS_BODY_EVENT_TYPES = {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    *MARKER_EVENTS,
+}
+
+# step stats events that mark the start or end of a step attempt
+STEP_ATTEMPT_EVENT_TYPES = STEP_STATS_EVENT_TYPES - STEP_STATS_BODY_EVENT_TYPES
+
+
+class StepStatsEvent(NamedTuple):
+    step_key: str
+    event_type: DagsterEventType
+    timestamp: float
+    entry: Optional[EventLogEntry] = None
+
 
 def build_run_stats_from_events(
     run_id: str,
@@ -212,6 +230,35 @@ def build_run_step_stats_snapshot_from_events(
     entries: Iterable[EventLogEntry],
     previous_snapshot: Optional["RunStepStatsSnapshot"] = None,
 ) -> "RunStepStatsSnapshot":
+    return build_run_step_stats_snapshot_from_step_events(
+        run_id,
+        (
+            StepStatsEvent(
+                step_key=event.dagster_event.step_key,
+                event_type=event.dagster_event.event_type,
+                timestamp=event.timestamp,
+                entry=event,
+            )
+            for event in entries
+            if event.dagster_event
+            and event.dagster_event.step_key
+            and event.dagster_event.event_type in STEP_STATS_EVENT_TYPES
+        ),
+        previous_snapshot,
+    )
+
+
+def build_run_step_stats_snapshot_from_step_events(
+    run_id: str,
+    step_events: Iterable[StepStatsEvent],
+    previous_snapshot: Optional["RunStepStatsSnapshot"] = None,
+) -> "RunStepStatsSnapshot":
+    """Build step stats from step events given in storage order.
+
+    Only the events in STEP_STATS_BODY_EVENT_TYPES need to carry their event log entry, the
+    remaining step stats are derived from the event type and timestamp alone. This lets storages
+    compute attempt timings from indexed columns without deserializing those events.
+    """
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
     attempts = defaultdict(list)
     markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
@@ -250,76 +297,71 @@ def build_run_step_stats_snapshot_from_events(
                         "end": marker.end_time,
                     }
 
-    def _open_attempt(step_key: str, event: EventLogEntry) -> None:
+    def _open_attempt(step_key: str, timestamp: float) -> None:
         by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        by_step_key[step_key]["partial_attempt_start"] = event.timestamp
+        by_step_key[step_key]["partial_attempt_start"] = timestamp
 
-    def _close_attempt(step_key: str, event: EventLogEntry) -> None:
+    def _close_attempt(step_key: str, timestamp: float) -> None:
         attempts[step_key].append(
             RunStepMarker(
                 start_time=by_step_key[step_key].get("partial_attempt_start"),
-                end_time=event.timestamp,
+                end_time=timestamp,
             )
         )
         by_step_key[step_key]["partial_attempt_start"] = None
 
-    for event in entries:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
-
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
-
-        if dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
-            continue
-
-        if dagster_event.event_type == DagsterEventType.STEP_START:
+    for step_key, event_type, timestamp, entry in step_events:
+        if event_type == DagsterEventType.STEP_START:
             by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-            by_step_key[step_key]["start_time"] = event.timestamp
-            _open_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            _open_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
+            by_step_key[step_key]["start_time"] = timestamp
+            _open_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_RESTARTED:
+            _open_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_FAILURE:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_SUCCESS:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_SKIPPED:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            _close_attempt(step_key, timestamp)
+
+        if event_type not in STEP_STATS_BODY_EVENT_TYPES:
+            continue
+        event = check.not_none(entry, f"Missing event log entry for {event_type} step event")
+        dagster_event = event.get_dagster_event()
+
+        if event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materialization_events = by_step_key[step_key].get("materialization_events", [])
             materialization_events.append(event)
             by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
             expectation_result = expectation_data.expectation_result
             step_expectation_results = by_step_key[step_key].get("expectation_results", [])
             step_expectation_results.append(expectation_result)
             by_step_key[step_key]["expectation_results"] = step_expectation_results
 
-        if dagster_event.event_type in MARKER_EVENTS:
+        if event_type in MARKER_EVENTS:
             if dagster_event.engine_event_data.marker_start:
                 marker_key = dagster_event.engine_event_data.marker_start
                 if marker_key not in markers[step_key]:
-                    markers[step_key][marker_key] = {"key": marker_key, "start": event.timestamp}
+                    markers[step_key][marker_key] = {"key": marker_key, "start": timestamp}
                 else:
-                    markers[step_key][marker_key]["start"] = event.timestamp
+                    markers[step_key][marker_key]["start"] = timestamp
 
             if dagster_event.engine_event_data.marker_end:
                 marker_key = dagster_event.engine_event_data.marker_end
                 if marker_key not in markers[step_key]:
-                    markers[step_key][marker_key] = {"key": marker_key, "end": event.timestamp}
+                    markers[step_key][marker_key] = {"key": marker_key, "end": timestamp}
                 else:
-                    markers[step_key][marker_key]["end"] = event.timestamp
+                    markers[step_key][marker_key]["end"] = timestamp
 
     snapshots = []
     for step_key, step_stats in by_step_key.items():
@@ -3,16 +3,18 @@
 import os
 import queue
 import sys
+import threading
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -66,6 +68,31 @@ def __init__(self, pid, exit_code=None):
         super().__init__()
 
 
+def _execute_command(event_queue: Queue, command: ChildProcessCommand) -> bool:
+    """Executes a ChildProcessCommand, communicating its events across a queue with the parent
+    process. Returns whether the command completed without a system error.
+    """
+    pid = os.getpid()
+    event_queue.put(ChildProcessStartEvent(pid=pid))
+    try:
+        for step_event in command.execute():
+            event_queue.put(step_event)
+        event_queue.put(ChildProcessDoneEvent(pid=pid))
+        return True
+
+    except (
+        Exception,
+        KeyboardInterrupt,
+        DagsterExecutionInterruptedError,
+    ):
+        event_queue.put(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+            )
+        )
+        return False
+
+
 def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
@@ -74,23 +101,40 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
-        pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
-        try:
-            for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
-
-        except (
-            Exception,
-            KeyboardInterrupt,
-            DagsterExecutionInterruptedError,
-        ):
-            event_queue.put(
-                ChildProcessSystemErrorEvent(
-                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
-            )
+        _execute_command(event_queue, command)
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue, event_queue: Queue, term_event: Any, max_tasks: Optional[int]
+):
+    """Executes the ChildProcessCommands received across a queue one at a time, until a None
+    sentinel is received, max_tasks commands have been executed, or a command fails with a system
+    error.
+
+    Setting term_event interrupts the command that is currently executing.
+    """
+    with capture_interrupts():
+        num_tasks = 0
+        while max_tasks is None or num_tasks < max_tasks:
+            command = command_queue.get()
+            if command is None:
+                break
+
+            done_event = threading.Event()
+            termination_thread = start_termination_thread(term_event, done_event)
+            try:
+                completed = _execute_command(event_queue, command)
+            finally:
+                # set events to stop the termination thread, then reset the term event so that it
+                # can be used to interrupt the next command
+                done_event.set()
+                term_event.set()
+                termination_thread.join()
+                term_event.clear()
+
+            num_tasks += 1
+            if not completed:
+                break
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -175,3 +219,142 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time, so that the
+    cost of starting a process is paid once across many commands.
+
+    Commands sent to a worker must be picklable, but unlike commands executed with
+    execute_child_process_command they cannot carry multiprocessing synchronization primitives.
+    Use the worker's term_event to interrupt the command that it is executing.
+    """
+
+    def __init__(
+        self, multiprocessing_ctx: MultiprocessingBaseContext, max_tasks: Optional[int] = None
+    ):
+        self.max_tasks = check.opt_int_param(max_tasks, "max_tasks")
+        self.num_tasks = 0
+        self._failed = False
+        self.term_event = multiprocessing_ctx.Event()
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, self.term_event, self.max_tasks),
+        )
+        self.process.start()
+
+    @property
+    def is_reusable(self) -> bool:
+        return not self._failed and (self.max_tasks is None or self.num_tasks < self.max_tasks)
+
+    def execute_command(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in this worker.
+
+        Yields the same sequence of objects as execute_child_process_command, and raises a
+        ChildProcessCrashException if the worker dies while executing the command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self.is_reusable, "Worker cannot execute any more commands")
+
+        self.num_tasks += 1
+        self._command_queue.put(command)
+        yield self.process
+
+        while True:
+            event = _poll_for_event(self.process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                raise ChildProcessCrashException(
+                    pid=self.process.pid, exit_code=self.process.exitcode
+                )
+
+            yield event
+
+            if isinstance(event, ChildProcessDoneEvent):
+                return
+            if isinstance(event, ChildProcessSystemErrorEvent):
+                # the worker exits after a command fails with a system error
+                self._failed = True
+                return
+
+    def stop(self) -> None:
+        """Signal the worker to exit once it has finished executing its current command."""
+        if self.process.is_alive():
+            self._command_queue.put(None)
+
+    def close(self) -> None:
+        """Wait for the worker to exit and release its resources."""
+        self.process.join()
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of ChildProcessWorkers, started on demand and reused across commands.
+
+    Workers that have executed max_tasks_per_worker commands, or whose command failed with a
+    system error or crashed, are replaced by new workers.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_tasks_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.shutdown()
+
+    def acquire_worker(self) -> ChildProcessWorker:
+        worker = (
+            self._idle_workers.pop()
+            if self._idle_workers
+            else ChildProcessWorker(self._multiprocessing_ctx, self._max_tasks_per_worker)
+        )
+        self._busy_workers.append(worker)
+        return worker
+
+    def execute_command(
+        self, worker: ChildProcessWorker, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in a worker acquired from this pool, and release the
+        worker back to the pool once the command has completed.
+        """
+        completed = False
+        try:
+            yield from worker.execute_command(command)
+            completed = True
+        finally:
+            self._busy_workers.remove(worker)
+            if completed and worker.is_reusable:
+                self._idle_workers.append(worker)
+            elif completed or not worker.process.is_alive():
+                worker.close()
+            else:
+                # abandoned while the command was still executing
+                worker.stop()
+
+    def shutdown(self) -> None:
+        """Stop all workers, waiting for the idle ones to exit. Busy workers exit once they have
+        finished executing their current command.
+        """
+        for worker in self._busy_workers:
+            worker.stop()
+        for worker in self._idle_workers:
+            worker.stop()
+            worker.close()
+        self._idle_workers = []
+        self._busy_workers = []
@@ -1,11 +1,13 @@
 import multiprocessing
+import multiprocessing.util
 import os
 import sys
 import threading
+import time
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
 from dagster import _check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -32,6 +34,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -46,6 +50,35 @@
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
 
+class _WarmWorkerState:
+    """State kept by a worker pool process across the steps that it executes."""
+
+    def __init__(self):
+        self.instance_ref: Optional["InstanceRef"] = None
+        self.instance: Optional[DagsterInstance] = None
+        self.num_steps_executed = 0
+        self.cold_start_seconds: Optional[float] = None
+
+    def get_instance(self, instance_ref: "InstanceRef") -> DagsterInstance:
+        if self.instance is None or self.instance_ref != instance_ref:
+            if self.instance is None:
+                # dispose of the instance when the worker process exits
+                multiprocessing.util.Finalize(None, self.dispose_instance, exitpriority=0)
+            else:
+                self.instance.dispose()
+            self.instance = DagsterInstance.from_ref(instance_ref)
+            self.instance_ref = instance_ref
+        return self.instance
+
+    def dispose_instance(self) -> None:
+        if self.instance is not None:
+            self.instance.dispose()
+            self.instance = None
+
+
+_warm_worker_state = _WarmWorkerState()
+
+
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
         self,
@@ -58,6 +91,7 @@ def __init__(
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
         repository_load_data: Optional[RepositoryLoadData],
+        dispatched_at: Optional[float] = None,
     ):
         self.run_config = run_config
         self.dagster_run = dagster_run
@@ -68,44 +102,78 @@ def __init__(
         self.retry_mode = retry_mode
         self.known_state = known_state
         self.repository_load_data = repository_load_data
+        # set when the command is executed by a warm worker from a ChildProcessWorkerPool, which
+        # handles termination itself
+        self.dispatched_at = dispatched_at
 
     def execute(self) -> Iterator[DagsterEvent]:
-        recon_job = self.recon_pipeline
+        if self.dispatched_at is not None:
+            yield from self._execute_in_warm_worker()
+            return
+
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
             start_termination_thread(self.term_event, done_event)
             try:
-                log_manager = create_context_free_log_manager(instance, self.dagster_run)
-
-                yield DagsterEvent.step_worker_started(
-                    log_manager,
-                    self.dagster_run.job_name,
-                    message=f'Executing step "{self.step_key}" in subprocess.',
-                    metadata={
-                        "pid": MetadataValue.text(str(os.getpid())),
-                    },
-                    step_key=self.step_key,
-                )
-                execution_plan = create_execution_plan(
-                    job=recon_job,
-                    run_config=self.run_config,
-                    step_keys_to_execute=[self.step_key],
-                    known_state=self.known_state,
-                    repository_load_data=self.repository_load_data,
-                )
-                yield from execute_plan_iterator(
-                    execution_plan,
-                    recon_job,
-                    self.dagster_run,
-                    run_config=self.run_config,
-                    retry_mode=self.retry_mode.for_inner_plan(),
-                    instance=instance,
-                )
+                yield from self._execute_step(instance, {})
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
                 self.term_event.set()
 
+    def _execute_in_warm_worker(self) -> Iterator[DagsterEvent]:
+        state = _warm_worker_state
+        instance = state.get_instance(self.instance_ref)
+        # loading the job definition is cached across the steps executed by this worker
+        self.recon_pipeline.get_definition()
+        startup_seconds = time.time() - check.not_none(self.dispatched_at)
+
+        metadata: Dict[str, Any] = {
+            "steps_executed_by_worker": MetadataValue.int(state.num_steps_executed),
+            "startup_seconds": MetadataValue.float(startup_seconds),
+        }
+        if state.cold_start_seconds is None:
+            state.cold_start_seconds = startup_seconds
+        else:
+            metadata["startup_seconds_saved"] = MetadataValue.float(
+                max(state.cold_start_seconds - startup_seconds, 0.0)
+            )
+        state.num_steps_executed += 1
+
+        yield from self._execute_step(instance, metadata)
+
+    def _execute_step(
+        self, instance: DagsterInstance, worker_metadata: Mapping[str, Any]
+    ) -> Iterator[DagsterEvent]:
+        recon_job = self.recon_pipeline
+        log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.dagster_run.job_name,
+            message=f'Executing step "{self.step_key}" in subprocess.',
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+                **worker_metadata,
+            },
+            step_key=self.step_key,
+        )
+        execution_plan = create_execution_plan(
+            job=recon_job,
+            run_config=self.run_config,
+            step_keys_to_execute=[self.step_key],
+            known_state=self.known_state,
+            repository_load_data=self.repository_load_data,
+        )
+        yield from execute_plan_iterator(
+            execution_plan,
+            recon_job,
+            self.dagster_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
+
 
 class MultiprocessExecutor(Executor):
     def __init__(
@@ -115,6 +183,8 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +210,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -202,6 +276,13 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(multiproc_ctx, self._max_tasks_per_worker)
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             processes: Dict[str, BaseProcess] = {}
@@ -237,19 +318,35 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                processes,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
+                            if worker_pool:
+                                worker = worker_pool.acquire_worker()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -391,7 +488,54 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_results(
+        step, execute_child_process_command(multiproc_ctx, command), errors, processes
+    )
+
+
+def execute_step_in_worker(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    processes: Dict[str, BaseProcess],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+        dispatched_at=time.time(),
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Dispatching "{step.key}" to worker process.',
+        metadata={},
+    )
+
+    yield from _handle_child_process_results(
+        step, worker_pool.execute_command(worker, command), errors, processes
+    )
+
+
+def _handle_child_process_results(
+    step: ExecutionStep,
+    results: Iterator[Optional[Union[DagsterEvent, ChildProcessEvent, BaseProcess]]],
+    errors: Dict[int, SerializableErrorInfo],
+    processes: Dict[str, BaseProcess],
+) -> Iterator[Optional[DagsterEvent]]:
+    for ret in results:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -2,8 +2,10 @@
 import math
 import os
 import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set, cast
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -30,11 +32,24 @@ def _default_sleep_seconds():
     return float(os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0"))
 
 
+def _default_watch_events():
+    return os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_WATCH_EVENTS", "0") == "1"
+
+
+def _default_watch_fallback_seconds():
+    return float(os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_WATCH_FALLBACK_SECONDS", "10.0"))
+
+
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
     event log. But we wait until we later tail it from the event log database before yielding it,
     to avoid yielding the same event multiple times to callsites.
+
+    By default the event log is queried for new events on every iteration of the executor loop.
+    With ``watch_events`` set, the executor instead watches the run's events through the event log
+    storage and only queries for them once it has been notified of new ones, falling back to
+    querying every ``watch_fallback_seconds`` in case a notification is missed.
     """
 
     def __init__(
@@ -46,6 +61,8 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        watch_events: Optional[bool] = None,
+        watch_fallback_seconds: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -69,6 +86,17 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._watch_events = check.opt_bool_param(
+            watch_events, "watch_events", default=_default_watch_events()
+        )
+        self._watch_fallback_seconds = cast(
+            float,
+            check.opt_numeric_param(
+                watch_fallback_seconds,
+                "watch_fallback_seconds",
+                default=_default_watch_fallback_seconds(),
+            ),
+        )
 
         self._event_cursor: Optional[str] = None
 
@@ -135,8 +163,40 @@ def _pop_events(
 
         seen_storage_ids.update(returned_storage_ids)
 
+        # Records at or before an id-based cursor are never returned again, so only the storage ids
+        # past it need to be remembered
+        if self._event_cursor:
+            cursor_obj = EventLogCursor.parse(self._event_cursor)
+            if cursor_obj.is_id_cursor():
+                watermark = cursor_obj.storage_id()
+                seen_storage_ids.difference_update(
+                    [storage_id for storage_id in seen_storage_ids if storage_id <= watermark]
+                )
+
         return dagster_events
 
+    @contextmanager
+    def _watch_for_new_events(
+        self, instance: DagsterInstance, run_id: str
+    ) -> Iterator[Optional[threading.Event]]:
+        """Yields an event that is set whenever a new event is stored for the run, or None if the
+        executor is not watching for events.
+        """
+        if not self._watch_events:
+            yield None
+            return
+
+        new_events = threading.Event()
+
+        def _on_new_event(_event, _cursor) -> None:
+            new_events.set()
+
+        instance.event_log_storage.watch(run_id, self._event_cursor, _on_new_event)
+        try:
+            yield new_events
+        finally:
+            instance.event_log_storage.end_watch(run_id, _on_new_event)
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -167,9 +227,12 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             f"Starting execution with step handler {self._step_handler.name}.",
             EngineEventData(),
         )
-        with InstanceConcurrencyContext(
-            plan_context.instance, plan_context.dagster_run
-        ) as instance_concurrency_context:
+        with (
+            InstanceConcurrencyContext(
+                plan_context.instance, plan_context.dagster_run
+            ) as instance_concurrency_context,
+            self._watch_for_new_events(plan_context.instance, plan_context.run_id) as new_events,
+        ):
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -248,6 +311,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         running_steps[step.key] = step
 
                 last_check_step_health_time = get_current_datetime()
+                last_pop_events_time = None
 
                 try:
                     # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
@@ -286,7 +350,18 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                             return
 
-                        if active_execution.has_in_flight_steps:
+                        if active_execution.has_in_flight_steps and (
+                            new_events is None
+                            or new_events.is_set()
+                            or last_pop_events_time is None
+                            or time.time() - last_pop_events_time >= self._watch_fallback_seconds
+                        ):
+                            if new_events is not None:
+                                # clear before querying so that events stored while the query
+                                # runs are picked up on the next iteration
+                                new_events.clear()
+                                last_pop_events_time = time.time()
+
                             for dagster_event in self._pop_events(
                                 plan_context.instance,
                                 plan_context.run_id,
@@ -382,7 +457,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                 )
                             )
 
-                        time.sleep(self._sleep_seconds)
+                        if new_events is not None:
+                            new_events.wait(self._sleep_seconds)
+                        else:
+                            time.sleep(self._sleep_seconds)
                 except Exception:
                     if not active_execution.is_complete and running_steps:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
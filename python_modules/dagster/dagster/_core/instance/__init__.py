@@ -1,12 +1,16 @@
+import atexit
 import logging
 import logging.config
 import os
 import sys
+import threading
 import warnings
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import ExitStack
 from enum import Enum
+from itertools import groupby
 from tempfile import TemporaryDirectory
 from types import TracebackType
 from typing import (
@@ -173,6 +177,7 @@
         EventLogRecord,
         EventRecordsFilter,
         EventRecordsResult,
+        EventRecordSummariesResult,
         PlannedMaterializationInfo,
     )
     from dagster._core.storage.partition_status_cache import (
@@ -181,6 +186,7 @@
     )
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
+    from dagster._core.storage.runs.base import RunsFeedConnection, RunsFeedCursor
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.storage.sql import AlembicVersion
     from dagster._core.workspace.context import BaseWorkspaceRequestContext
@@ -205,6 +211,35 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the number of informational step events (user logs, outputs, expectation results, engine
+# events) that will be buffered per run before being written to the event log in a single batch.
+# Any other event for the run, such as the step or run completing, flushes the buffer along with
+# it, so events are always written in order. The per-run buffer is off unless this is set.
+def _get_run_event_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_RUN_EVENT_BUFFER_SIZE", "0"))
+
+
+# Sets the maximum number of seconds an event may be held in a per-run buffer before it is written.
+def _get_run_event_buffer_interval() -> float:
+    return float(os.getenv("DAGSTER_RUN_EVENT_BUFFER_INTERVAL_SECONDS", "0.5"))
+
+
+# Number of locks that writes of events for runs are spread over. Writes for the same run always use
+# the same lock, so that buffered events are stored in order.
+RUN_EVENT_WRITE_LOCK_COUNT = 16
+
+
+def _make_run_event_buffer_exit_handler(instance: "DagsterInstance") -> Callable[[], None]:
+    instance_ref = weakref.ref(instance)
+
+    def _flush_run_event_buffers() -> None:
+        instance = instance_ref()
+        if instance:
+            instance.flush_run_event_buffers()
+
+    return _flush_run_event_buffers
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -494,6 +529,15 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for buffering informational step events per run. The buffer lock is only held while
+        # events are added to or taken out of a buffer. Events for a run are written while holding
+        # one of the run event write locks, so that they are stored in order.
+        self._run_event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._run_event_buffer_timers: Dict[str, threading.Timer] = {}
+        self._run_event_buffer_lock = threading.Lock()
+        self._run_event_write_locks = [threading.Lock() for _ in range(RUN_EVENT_WRITE_LOCK_COUNT)]
+        self._run_event_buffer_exit_handler: Optional[Callable[[], None]] = None
+
     # ctors
 
     @public
@@ -963,6 +1007,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_num_evaluation_processes(self) -> int:
+        return self.get_settings("auto_materialize").get("num_evaluation_processes", 1)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1010,6 +1058,13 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._event_storage.optimize_for_webserver(
             statement_timeout=statement_timeout, pool_recycle=pool_recycle
         )
+        self.enable_snapshot_cache()
+
+    def enable_snapshot_cache(self) -> None:
+        """Keep deserialized snapshots in memory, for long lived processes like the webserver and
+        the daemon that read the same snapshots repeatedly.
+        """
+        self._run_storage.enable_snapshot_cache()
 
     def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Checking for reindexing...")
@@ -1020,6 +1075,10 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_run_event_buffers()
+        if self._run_event_buffer_exit_handler:
+            atexit.unregister(self._run_event_buffer_exit_handler)
+            self._run_event_buffer_exit_handler = None
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1088,9 +1147,9 @@ def has_snapshot(self, snapshot_id: str) -> bool:
     def get_historical_job(self, snapshot_id: str) -> "HistoricalJob":
         from dagster._core.remote_representation import HistoricalJob
 
-        snapshot = self._run_storage.get_job_snapshot(snapshot_id)
+        snapshot = self.get_job_snapshot(snapshot_id)
         parent_snapshot = (
-            self._run_storage.get_job_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
+            self.get_job_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
             if snapshot.lineage_snapshot
             else None
         )
@@ -1125,6 +1184,12 @@ def get_run_tags(
             tag_keys=tag_keys, value_prefix=value_prefix, limit=limit
         )
 
+    @traced
+    def get_run_tag_value_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_value_counts(tag_keys=tag_keys, filters=filters)
+
     @traced
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._run_storage.get_run_tag_keys()
@@ -2144,6 +2209,62 @@ def fetch_observations(
         """
         return self._event_storage.fetch_observations(records_filter, limit, cursor, ascending)
 
+    @traced
+    def fetch_materialization_summaries(
+        self,
+        records_filter: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> "EventRecordSummariesResult":
+        """Same as `fetch_materializations`, but only returns the storage id, run id, timestamp,
+        asset key, partition and step key of each materialization, which can be fetched without
+        deserializing the stored events.
+
+        Args:
+            records_filter (Union[AssetKey, AssetRecordsFilter]): the filter by which to
+                filter event records.
+            limit (int): Number of results to get.
+            cursor (Optional[str]): Cursor to use for pagination. Defaults to None.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            EventRecordSummariesResult: Object containing a list of event record summaries and a
+                cursor string
+        """
+        return self._event_storage.fetch_materialization_summaries(
+            records_filter, limit, cursor, ascending
+        )
+
+    @traced
+    def fetch_observation_summaries(
+        self,
+        records_filter: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> "EventRecordSummariesResult":
+        """Same as `fetch_observations`, but only returns the storage id, run id, timestamp,
+        asset key, partition and step key of each observation, which can be fetched without
+        deserializing the stored events.
+
+        Args:
+            records_filter (Union[AssetKey, AssetRecordsFilter]): the filter by which to
+                filter event records.
+            limit (int): Number of results to get.
+            cursor (Optional[str]): Cursor to use for pagination. Defaults to None.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            EventRecordSummariesResult: Object containing a list of event record summaries and a
+                cursor string
+        """
+        return self._event_storage.fetch_observation_summaries(
+            records_filter, limit, cursor, ascending
+        )
+
     @public
     @traced
     def fetch_run_status_changes(
@@ -2436,12 +2557,18 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        Independently of `batch_metadata`, if `DAGSTER_RUN_EVENT_BUFFER_SIZE` is set and the event
+        log storage supports batches of any event type, informational step events (see
+        `BUFFERABLE_STEP_EVENTS`) and log messages from steps are kept in a per-run buffer. The
+        buffer is written ahead of the next other event for the run, such as a step or the run
+        completing, when it reaches the run event buffer size, after the run event buffer interval
+        has elapsed, when the instance is disposed, or when the process exits. Buffered events that
+        fail to be written are kept in the buffer to be written again.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        from dagster._core.events import RunFailureReason
-
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
@@ -2453,23 +2580,154 @@ def handle_new_event(
             else:
                 return
 
+        if not self._is_run_event_buffering_enabled():
+            self._store_and_notify_events(events)
+            return
+
+        run_ids = list(dict.fromkeys(event.run_id for event in events))
+        if len(events) == 1 and self._is_run_event_bufferable(event):
+            with self._run_event_buffer_lock:
+                run_buffer = self._run_event_buffer[event.run_id]
+                run_buffer.append(event)
+                if len(run_buffer) < _get_run_event_buffer_size():
+                    self._schedule_run_event_buffer_flush(event.run_id)
+                    return
+            # the event is written along with the rest of the full buffer
+            events = []
+
+        self._write_run_events(run_ids, events)
+
+    def flush_run_event_buffers(self) -> None:
+        """Write any informational step events that are buffered for any run to the event log."""
+        with self._run_event_buffer_lock:
+            run_ids = list(self._run_event_buffer.keys())
+        for run_id in run_ids:
+            self._write_run_events([run_id], [])
+
+    def _is_run_event_buffering_enabled(self) -> bool:
+        return (
+            _get_run_event_buffer_size() > 0
+            and self._event_storage.supports_any_event_type_in_batch
+        )
+
+    def _is_run_event_bufferable(self, event: "EventLogEntry") -> bool:
+        from dagster._core.events import BUFFERABLE_STEP_EVENTS
+
+        if not event.is_dagster_event:
+            return event.step_key is not None
+
+        dagster_event = event.get_dagster_event()
+        return dagster_event.step_key is not None and (
+            dagster_event.event_type in BUFFERABLE_STEP_EVENTS
+        )
+
+    def _schedule_run_event_buffer_flush(self, run_id: str) -> None:
+        if self._run_event_buffer_exit_handler is None:
+            # write the events that are still buffered if the process exits without disposing of
+            # the instance
+            self._run_event_buffer_exit_handler = _make_run_event_buffer_exit_handler(self)
+            atexit.register(self._run_event_buffer_exit_handler)
+
+        if run_id in self._run_event_buffer_timers:
+            return
+
+        timer = threading.Timer(
+            _get_run_event_buffer_interval(), self._flush_run_event_buffer, args=(run_id,)
+        )
+        timer.daemon = True
+        self._run_event_buffer_timers[run_id] = timer
+        timer.start()
+
+    def _pop_run_event_buffer(self, run_id: str) -> Sequence["EventLogEntry"]:
+        timer = self._run_event_buffer_timers.pop(run_id, None)
+        if timer:
+            timer.cancel()
+        return self._run_event_buffer.pop(run_id, [])
+
+    def _flush_run_event_buffer(self, run_id: str) -> None:
+        self._write_run_events([run_id], [])
+
+    def _write_run_events(self, run_ids: Sequence[str], events: Sequence["EventLogEntry"]) -> None:
+        """Writes the events buffered for the given runs, followed by the given events, and notifies
+        subscribers of the stored events. Buffered events that could not be stored are returned to
+        the front of their buffer, and errors are only raised if any of the given events could not
+        be stored.
+        """
+        stored_events: List[EventLogEntry] = []
+        write_lock_indices = sorted(
+            {hash(run_id) % RUN_EVENT_WRITE_LOCK_COUNT for run_id in run_ids}
+        )
+        try:
+            with ExitStack() as stack:
+                for index in write_lock_indices:
+                    stack.enter_context(self._run_event_write_locks[index])
+
+                with self._run_event_buffer_lock:
+                    buffered_events = [
+                        buffered_event
+                        for run_id in run_ids
+                        for buffered_event in self._pop_run_event_buffer(run_id)
+                    ]
+
+                try:
+                    self._store_events([*buffered_events, *events], stored_events)
+                except Exception:
+                    unstored_events = buffered_events[len(stored_events) :]
+                    with self._run_event_buffer_lock:
+                        for run_id in run_ids:
+                            run_events = [e for e in unstored_events if e.run_id == run_id]
+                            if run_events:
+                                self._run_event_buffer[run_id][:0] = run_events
+                                self._schedule_run_event_buffer_flush(run_id)
+
+                    if events:
+                        raise
+
+                    logging.exception(
+                        "Exception while writing buffered events for runs %s. They will be written"
+                        " again.",
+                        ", ".join(run_ids),
+                    )
+        finally:
+            self._notify_stored_events(stored_events)
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
+        stored_events: List[EventLogEntry] = []
+        try:
+            self._store_events(events, stored_events)
+        finally:
+            self._notify_stored_events(stored_events)
+
+    def _store_events(
+        self, events: Sequence["EventLogEntry"], stored_events: List["EventLogEntry"]
+    ) -> None:
+        """Stores events in order, adding each event to `stored_events` once it has been stored."""
+        if not events:
+            return
+
         if len(events) == 1:
             self._event_storage.store_event(events[0])
+            stored_events.append(events[0])
+            return
+
+        try:
+            self._event_storage.store_event_batch(events)
+
+        # Fall back to storing events one by one if writing a batch fails. We catch a generic
+        # Exception because that is the parent class of the actually received error,
+        # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
+        # it living in a cloud package.
+        except Exception as e:
+            sys.stderr.write(f"Exception while storing event batch: {e}\n")
+            sys.stderr.write("Falling back to storing multiple single-event storage requests...\n")
+            for event in events:
+                self._event_storage.store_event(event)
+                stored_events.append(event)
         else:
-            try:
-                self._event_storage.store_event_batch(events)
-
-            # Fall back to storing events one by one if writing a batch fails. We catch a generic
-            # Exception because that is the parent class of the actually received error,
-            # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
-            # it living in a cloud package.
-            except Exception as e:
-                sys.stderr.write(f"Exception while storing event batch: {e}\n")
-                sys.stderr.write(
-                    "Falling back to storing multiple single-event storage requests...\n"
-                )
-                for event in events:
-                    self._event_storage.store_event(event)
+            stored_events.extend(events)
+
+    def _notify_stored_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.events import RunFailureReason
 
         for event in events:
             run_id = event.run_id
@@ -3152,6 +3410,22 @@ def get_backfills(
     def get_backfills_count(self, filters: Optional["BulkActionsFilter"] = None) -> int:
         return self._run_storage.get_backfills_count(filters=filters)
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional["BulkActionsFilter"],
+        cursor: Optional["RunsFeedCursor"] = None,
+    ) -> "RunsFeedConnection":
+        return self._run_storage.get_runs_feed_entries(limit, run_filters, backfill_filters, cursor)
+
+    def get_runs_feed_count(
+        self,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional["BulkActionsFilter"],
+    ) -> int:
+        return self._run_storage.get_runs_feed_count(run_filters, backfill_filters)
+
     def get_backfill(self, backfill_id: str) -> Optional["PartitionBackfill"]:
         return self._run_storage.get_backfill(backfill_id)
 
@@ -3268,6 +3542,64 @@ def report_runless_asset_event(
         asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
     ):
         """Record an event log entry related to assets that does not belong to a Dagster run."""
+        return self.report_dagster_event(
+            run_id=RUNLESS_RUN_ID,
+            dagster_event=self._get_runless_asset_dagster_event(asset_event),
+        )
+
+    @experimental
+    def report_runless_asset_events(
+        self,
+        asset_events: Sequence[
+            Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"]
+        ],
+    ) -> None:
+        """Record a batch of event log entries related to assets that do not belong to a Dagster
+        run.
+
+        The events are written to the event log in order. Where the event log storage accepts
+        batches of any event type, they are written with a single `store_event_batch` call.
+        Otherwise, consecutive materializations and observations are written in batches and asset
+        check evaluations are written one by one.
+        """
+        from dagster._core.events import BATCH_WRITABLE_EVENTS
+        from dagster._core.events.log import EventLogEntry
+
+        timestamp = get_current_timestamp()
+        event_records = [
+            EventLogEntry(
+                user_message="",
+                level=logging.INFO,
+                job_name=RUNLESS_JOB_NAME,
+                run_id=RUNLESS_RUN_ID,
+                error_info=None,
+                timestamp=timestamp,
+                step_key=None,
+                dagster_event=self._get_runless_asset_dagster_event(asset_event),
+            )
+            for asset_event in asset_events
+        ]
+        if not event_records:
+            return
+
+        if self._event_storage.supports_any_event_type_in_batch:
+            self._store_and_notify_events(event_records)
+            return
+
+        for is_batch_writable, group in groupby(
+            event_records,
+            key=lambda record: record.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS,
+        ):
+            if is_batch_writable:
+                self._store_and_notify_events(list(group))
+            else:
+                for event_record in group:
+                    self._store_and_notify_events([event_record])
+
+    def _get_runless_asset_dagster_event(
+        self,
+        asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
+    ) -> "DagsterEvent":
         from dagster._core.events import (
             AssetMaterialization,
             AssetObservationData,
@@ -3291,13 +3623,10 @@ def report_runless_asset_event(
                 " AssetMaterialization, AssetObservation or AssetCheckEvaluation"
             )
 
-        return self.report_dagster_event(
-            run_id=RUNLESS_RUN_ID,
-            dagster_event=DagsterEvent(
-                event_type_value=event_type_value,
-                event_specific_data=data_payload,
-                job_name=RUNLESS_JOB_NAME,
-            ),
+        return DagsterEvent(
+            event_type_value=event_type_value,
+            event_specific_data=data_payload,
+            job_name=RUNLESS_JOB_NAME,
         )
 
     def get_asset_check_support(self) -> "AssetCheckInstanceSupport":
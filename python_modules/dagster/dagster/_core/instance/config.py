@@ -429,6 +429,13 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_processes": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many processes to use to evaluate the automation conditions of independent parts of the asset graph within a single tick"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -67,6 +67,12 @@ def __init__(
         # fetch all the outstanding concurrency keys for in-progress runs
         self._process_in_progress_runs(in_progress_run_records)
 
+    def add_queued_runs(self, instance: DagsterInstance, queued_runs: Sequence[DagsterRun]):
+        """Fetch the concurrency info needed to check whether additional queued runs are blocked,
+        keeping the counts of the runs launched so far.
+        """
+        self._fetch_concurrency_info(instance, queued_runs)
+
     def _fetch_concurrency_info(self, instance: DagsterInstance, queued_runs: Sequence[DagsterRun]):
         # fetch all the concurrency slot information for the root concurrency keys of all the queued
         # runs
@@ -78,7 +84,7 @@ def _fetch_concurrency_info(self, instance: DagsterInstance, queued_runs: Sequen
                 all_run_concurrency_keys.update(run.run_op_concurrency.root_key_counts.keys())
 
         for key in all_run_concurrency_keys:
-            if key is None:
+            if key is None or key in self._concurrency_info_by_key:
                 continue
 
             if key not in configured_concurrency_keys:
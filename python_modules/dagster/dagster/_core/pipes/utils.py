@@ -1,5 +1,5 @@
-import datetime
 import json
+import logging
 import os
 import sys
 import tempfile
@@ -7,8 +7,8 @@
 import warnings
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from threading import Event, Thread
-from typing import IO, Dict, Iterator, Optional, Sequence, Tuple, TypeVar, Union
+from threading import Event, Lock, Thread
+from typing import IO, Dict, Iterator, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 from dagster_pipes import (
     PIPES_PROTOCOL_VERSION_FIELD,
@@ -32,7 +32,6 @@
     PipesSession,
     build_external_execution_context_data,
 )
-from dagster._utils import tail_file
 
 TCursor = TypeVar("TCursor")
 
@@ -128,6 +127,142 @@ def no_messages_debug_text(self) -> str:
         return "Attempted to inject context directly, typically as an environment variable."
 
 
+# Bounds of the interval between checks of a tailed file for new lines. The interval starts at the
+# minimum and doubles while the file is idle. When the file is watched for modifications, the
+# interval only bounds how long a missed notification can delay a read.
+FILE_POLL_MIN_INTERVAL = 0.01
+FILE_POLL_MAX_INTERVAL = 0.25
+WATCHED_FILE_POLL_MAX_INTERVAL = 1
+
+# Event types that mean that the contents of a watched file may have changed
+_FILE_CHANGE_EVENT_TYPES = {"created", "modified", "moved", "closed"}
+
+
+class _PipesFileWatcher:
+    """Wakes up the threads tailing local files when the files change.
+
+    A single watchdog observer, backed by inotify on Linux, is shared by all the Pipes sessions in
+    the process, with one watch per directory containing tailed files.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._observer = None
+        self._handler = None
+        self._watches: Dict[str, Tuple[object, int]] = {}
+        self._wakeups: Dict[str, Set[Event]] = {}
+
+    def _wake(self, path: str) -> None:
+        with self._lock:
+            wakeups = list(self._wakeups.get(path, ()))
+        for wakeup in wakeups:
+            wakeup.set()
+
+    def _get_observer(self):
+        if self._observer is None:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+
+            watcher = self
+
+            class _Handler(FileSystemEventHandler):
+                def dispatch(self, event) -> None:
+                    if event.event_type not in _FILE_CHANGE_EVENT_TYPES:
+                        return
+                    watcher._wake(os.fsdecode(event.src_path))  # noqa: SLF001
+                    if getattr(event, "dest_path", None):
+                        watcher._wake(os.fsdecode(event.dest_path))  # noqa: SLF001
+
+            observer = Observer()
+            observer.daemon = True
+            observer.start()
+            self._handler = _Handler()
+            self._observer = observer
+
+        return self._observer
+
+    @contextmanager
+    def watch(self, path: str, wakeup: Event) -> Iterator[bool]:
+        """Set ``wakeup`` whenever the file at ``path`` changes, while the context is open.
+
+        Yields whether the file is watched. Watching can fail, e.g. when the inotify watch limit
+        has been reached, in which case callers need to poll the file.
+        """
+        path = os.path.realpath(path)
+        directory = os.path.dirname(path)
+
+        try:
+            with self._lock:
+                observer = self._get_observer()
+                if directory in self._watches:
+                    watch, count = self._watches[directory]
+                else:
+                    watch, count = observer.schedule(self._handler, directory), 0
+                self._watches[directory] = (watch, count + 1)
+                self._wakeups.setdefault(path, set()).add(wakeup)
+        except Exception:
+            logging.getLogger("dagster").debug(
+                f"Could not watch {path} for changes, polling it instead.", exc_info=True
+            )
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            with self._lock:
+                self._wakeups[path].discard(wakeup)
+                if not self._wakeups[path]:
+                    del self._wakeups[path]
+
+                watch, count = self._watches.pop(directory)
+                if count > 1:
+                    self._watches[directory] = (watch, count - 1)
+                else:
+                    try:
+                        observer.unschedule(watch)
+                    except Exception:
+                        pass
+
+
+_file_watcher = _PipesFileWatcher()
+
+
+def _tail_file(path: str, is_session_closed: Event, wakeup: Event) -> Iterator[str]:
+    """Yield the lines appended to a file until the session is closed and all lines were read.
+
+    Between reads, the thread sleeps until ``wakeup`` is set by a change to the file or by the
+    session closing, rather than polling at a fixed rate.
+    """
+    with _file_watcher.watch(path, wakeup) as is_watched:
+        max_interval = WATCHED_FILE_POLL_MAX_INTERVAL if is_watched else FILE_POLL_MAX_INTERVAL
+        interval = FILE_POLL_MIN_INTERVAL
+        partial_line = ""
+        with open(path, "r") as file:
+            while True:
+                # Clear before reading, so that changes made during the read wake up the next wait,
+                # and check whether the session is closed before reading, so that lines written
+                # right before it closed are not missed
+                wakeup.clear()
+                is_closed = is_session_closed.is_set()
+                line = file.readline()
+                if line:
+                    interval = FILE_POLL_MIN_INTERVAL
+                    if not line.endswith("\n"):
+                        # The writer is part-way through the line, so wait for the rest of it
+                        partial_line += line
+                        continue
+                    yield partial_line + line
+                    partial_line = ""
+                elif is_closed:
+                    if partial_line:
+                        yield partial_line
+                    break
+                else:
+                    wakeup.wait(interval)
+                    interval = min(interval * 2, max_interval)
+
+
 class PipesFileMessageReader(PipesMessageReader):
     """Message reader that reads messages by tailing a specified file.
 
@@ -166,12 +301,13 @@ def read_messages(
             pipes protocol messages.
         """
         is_session_closed = Event()
+        wakeup = Event()
         thread = None
         try:
             open(self._path, "w").close()  # create file
             thread = Thread(
                 target=self._reader_thread,
-                args=(handler, is_session_closed),
+                args=(handler, is_session_closed, wakeup),
                 daemon=True,
             )
             thread.start()
@@ -181,14 +317,17 @@ def read_messages(
             }
         finally:
             is_session_closed.set()
+            wakeup.set()
             if thread:
                 thread.join()
             if os.path.exists(self._path) and self._cleanup_file:
                 os.remove(self._path)
 
-    def _reader_thread(self, handler: "PipesMessageHandler", is_resource_complete: Event) -> None:
+    def _reader_thread(
+        self, handler: "PipesMessageHandler", is_resource_complete: Event, wakeup: Event
+    ) -> None:
         try:
-            for line in tail_file(self._path, lambda: is_resource_complete.is_set()):
+            for line in _tail_file(self._path, is_resource_complete, wakeup):
                 message = json.loads(line)
                 handler.handle_message(message)
         except:
@@ -264,7 +403,8 @@ class PipesThreadedMessageReader(PipesMessageReader):
     """A base class for message readers that read messages and logs in background threads.
 
     Args:
-        interval (float): The interval in seconds at which to poll for messages.
+        interval (float): The interval in seconds at which to poll for messages. The thread also
+            wakes up as soon as the session closes, to read the final messages.
         log_readers (Optional[Sequence[PipesLogReader]]): A set of log readers to use to read logs.
     """
 
@@ -379,17 +519,20 @@ def _messages_thread(
         is_session_closed: Event,
     ) -> None:
         try:
-            start_or_last_download = datetime.datetime.now()
+            last_download_at = None
             session_closed_at = None
             cursor = None
             can_read_messages = False
+            readable_check_interval = min(DEFAULT_SLEEP_INTERVAL, self.interval)
 
             # main loop to read messages
             # at every step, we:
             # - exit early if we have received the closed message
             # - consume params from the launched_payload if possible
             # - check if we can start reading messages (e.g. log files are available)
-            # - download a chunk of messages and process them
+            # - download a chunk of messages and process them, at most once per interval unless
+            #   the session has closed
+            # - wait until the next download is due, waking up as soon as the session closes
             # - if is_session_closed is set, we exit the loop after waiting for WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL
             while True:
                 # if we have the closed message, we can exit
@@ -402,37 +545,45 @@ def _messages_thread(
                     params = {**params, **(self.launched_payload or {})}
                     can_read_messages = self.messages_are_readable(params)
 
-                now = datetime.datetime.now()
-                if (
-                    now - start_or_last_download
-                ).seconds > self.interval or is_session_closed.is_set():
-                    if can_read_messages:
-                        start_or_last_download = now
-                        result = self.download_messages(cursor, params)
-                        if result is not None:
-                            cursor, chunk = result
-                            for line in chunk.split("\n"):
-                                try:
-                                    message = json.loads(line)
-                                    if PIPES_PROTOCOL_VERSION_FIELD in message.keys():
-                                        handler.handle_message(message)
-                                except json.JSONDecodeError:
-                                    pass
-
-                time.sleep(DEFAULT_SLEEP_INTERVAL)
+                now = time.monotonic()
+                if can_read_messages and (
+                    last_download_at is None
+                    or now - last_download_at >= self.interval
+                    or is_session_closed.is_set()
+                ):
+                    last_download_at = now
+                    result = self.download_messages(cursor, params)
+                    if result is not None:
+                        cursor, chunk = result
+                        for line in chunk.split("\n"):
+                            try:
+                                message = json.loads(line)
+                                if PIPES_PROTOCOL_VERSION_FIELD in message.keys():
+                                    handler.handle_message(message)
+                            except json.JSONDecodeError:
+                                pass
 
                 if is_session_closed.is_set():
                     if session_closed_at is None:
-                        session_closed_at = datetime.datetime.now()
+                        session_closed_at = now
 
                     # After the external process has completed, we don't want to immediately exit
-                    if (
-                        datetime.datetime.now() - session_closed_at
-                    ).seconds > WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL:
+                    if now - session_closed_at > WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL:
                         if not can_read_messages:
                             self._log_unstartable_warning(handler, params)
                         return
 
+                    time.sleep(DEFAULT_SLEEP_INTERVAL)
+                elif last_download_at is not None:
+                    _wait_for_session_close(
+                        is_session_closed, last_download_at + self.interval - time.monotonic()
+                    )
+                else:
+                    # Checking whether messages are readable may be a request to an external
+                    # system, so back off while the external process has not started writing
+                    _wait_for_session_close(is_session_closed, readable_check_interval)
+                    readable_check_interval = min(readable_check_interval * 2, self.interval)
+
         except:
             handler.report_pipes_framework_exception(
                 f"{self.__class__.__name__} messages thread",
@@ -465,37 +616,44 @@ def _logs_thread(
         # only write logs after the process has completed).
         try:
             unstarted_log_readers = {**self.log_readers}
+            started_log_reader_keys: Set[str] = set()
+            readable_check_interval = DEFAULT_SLEEP_INTERVAL
 
             while True:
+                # check whether the session is closed before looking for new readers, so that
+                # readers added right before the session closed are not missed
+                is_closed = is_session_closed.is_set()
+
                 if self.opened_payload is not None:
                     params = {**params, **self.opened_payload}
 
                 # periodically check for new readers which may be added after the
                 # external process has started and add them to the unstarted log readers
                 for key in self.log_readers:
-                    if key not in unstarted_log_readers:
+                    if key not in unstarted_log_readers and key not in started_log_reader_keys:
                         unstarted_log_readers[key] = self.log_readers[key]
+                        readable_check_interval = DEFAULT_SLEEP_INTERVAL
 
                 for key in list(unstarted_log_readers.keys()).copy():
                     if unstarted_log_readers[key].target_is_readable(params):
                         reader = unstarted_log_readers.pop(key)
                         reader.start(params, is_session_closed)
+                        started_log_reader_keys.add(key)
 
                 # In some cases logs might not be written out until after the external process has
                 # exited. That will leave us in this state, where some log readers have not been
                 # started even though the external process is finished. We start a timer and wait
                 # for up to WAIT_FOR_LOGS_TIMEOUT seconds for the logs to be written. If they are
                 # not written after this amount of time has elapsed, we warn the user and bail.
-                if is_session_closed.is_set():
+                if is_closed:
                     if wait_for_logs_start is None:
-                        wait_for_logs_start = datetime.datetime.now()
+                        wait_for_logs_start = time.monotonic()
 
                     if not unstarted_log_readers:
                         return
                     elif (
                         unstarted_log_readers
-                        and (datetime.datetime.now() - wait_for_logs_start).seconds
-                        > WAIT_FOR_LOGS_TIMEOUT
+                        and time.monotonic() - wait_for_logs_start > WAIT_FOR_LOGS_TIMEOUT
                     ):
                         for key, log_reader in unstarted_log_readers.items():
                             warnings.warn(
@@ -507,7 +665,15 @@ def _logs_thread(
 
                         return
 
-                time.sleep(DEFAULT_SLEEP_INTERVAL)
+                    time.sleep(DEFAULT_SLEEP_INTERVAL)
+                else:
+                    # Checking whether log targets are readable may be a request to an external
+                    # system, so back off while they are not
+                    _wait_for_session_close(is_session_closed, readable_check_interval)
+                    if unstarted_log_readers:
+                        readable_check_interval = min(
+                            readable_check_interval * 2, max(DEFAULT_SLEEP_INTERVAL, self.interval)
+                        )
         except Exception:
             handler.report_pipes_framework_exception(
                 f"{self.__class__.__name__} logs thread",
@@ -537,7 +703,8 @@ class PipesBlobStoreMessageReader(PipesThreadedMessageReader):
     `opened` message is received from the external process.
 
     Args:
-        interval (float): interval in seconds between attempts to download a chunk
+        interval (float): interval in seconds between attempts to download the chunks that have
+            been written since the last attempt
         log_readers (Optional[Sequence[PipesLogReader]]): A set of log readers to use to read logs.
     """
 
@@ -562,10 +729,18 @@ def download_messages(
     ) -> Optional[Tuple[int, str]]:
         # mapping new interface to the old one
         # the old interface isn't using the cursor parameter, instead, it keeps track of counter in the "counter" attribute
-        chunk = self.download_messages_chunk(self.counter, params)
-        if chunk:
+        # all the chunks written since the last download are downloaded at once, so that a backlog
+        # of chunks is not read at a rate of one chunk per interval
+        chunks = []
+        while True:
+            chunk = self.download_messages_chunk(self.counter, params)
+            if not chunk:
+                break
+            chunks.append(chunk)
             self.counter += 1
-            return self.counter, chunk
+
+        if chunks:
+            return self.counter, "\n".join(chunks)
 
 
 class PipesLogReader(ABC):
@@ -641,28 +816,37 @@ def _reader_thread(
         params: PipesParams,
         is_session_closed: Event,
     ) -> None:
-        start_or_last_download = datetime.datetime.now()
         after_execution_time_start = None
         while True:
-            now = datetime.datetime.now()
-            if (now - start_or_last_download).seconds > self.interval or is_session_closed.is_set():
-                start_or_last_download = now
-                chunk = self.download_log_chunk(params)
-                if chunk:
-                    self.target_stream.write(chunk)
-
-                # After execution is complete, we don't want to immediately exit, because it is
-                # possible the external system will take some time to flush logs to the external
-                # storage system. Only exit after WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL seconds
-                # have elapsed.
-                elif is_session_closed.is_set():
-                    if after_execution_time_start is None:
-                        after_execution_time_start = datetime.datetime.now()
-                    elif (
-                        datetime.datetime.now() - after_execution_time_start
-                    ).seconds > WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL:
-                        break
-                time.sleep(self.interval)
+            chunk = self.download_log_chunk(params)
+            if chunk:
+                self.target_stream.write(chunk)
+
+            # After execution is complete, we don't want to immediately exit, because it is
+            # possible the external system will take some time to flush logs to the external
+            # storage system. Only exit after WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL seconds
+            # have elapsed.
+            elif is_session_closed.is_set():
+                if after_execution_time_start is None:
+                    after_execution_time_start = time.monotonic()
+                elif (
+                    time.monotonic() - after_execution_time_start
+                    > WAIT_FOR_LOGS_AFTER_EXECUTION_INTERVAL
+                ):
+                    break
+
+            # Download once per interval, and right away when the session closes
+            _wait_for_session_close(is_session_closed, self.interval)
+
+
+def _wait_for_session_close(is_session_closed: Event, timeout: float) -> None:
+    """Sleep for up to ``timeout`` seconds, waking up early if the session closes meanwhile."""
+    if timeout <= 0:
+        return
+    if is_session_closed.is_set():
+        time.sleep(timeout)
+    else:
+        is_session_closed.wait(timeout)
 
 
 def _join_thread(thread: Thread, thread_name: str) -> None:
@@ -101,8 +101,8 @@
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
-from dagster._record import IHaveNew, record, record_custom
-from dagster._serdes import whitelist_for_serdes
+from dagster._record import IHaveNew, copy, record, record_custom
+from dagster._serdes import create_snapshot_id, whitelist_for_serdes
 from dagster._serdes.serdes import (
     FieldSerializer,
     get_prefix_for_a_serialized,
@@ -758,6 +758,72 @@ class RepositoryErrorSnap:
     error: Optional[SerializableErrorInfo]
 
 
+# RepositorySnap fields whose elements are sent as content-addressed sub-snapshots
+REPOSITORY_SNAP_PART_FIELDS: Final = (
+    "schedules",
+    "sensors",
+    "asset_nodes",
+    "job_datas",
+    "job_refs",
+)
+
+
+@whitelist_for_serdes
+@record
+class RepositorySnapManifest:
+    """A RepositorySnap with the elements of its part fields (jobs, asset nodes, sensors and
+    schedules) replaced by their snapshot ids, which are hashes of the serialized elements.
+    """
+
+    repository_snap: RepositorySnap
+    part_ids: Mapping[str, Sequence[str]]
+
+    @staticmethod
+    def from_repository_snap(
+        repository_snap: RepositorySnap,
+    ) -> Tuple["RepositorySnapManifest", Mapping[str, Any]]:
+        """Split a RepositorySnap into its manifest and its sub-snapshots by snapshot id."""
+        parts: Dict[str, Any] = {}
+        part_ids: Dict[str, Sequence[str]] = {}
+        for field_name in REPOSITORY_SNAP_PART_FIELDS:
+            elements = getattr(repository_snap, field_name)
+            if elements is None:
+                continue
+
+            ids = []
+            for element in elements:
+                snapshot_id = create_snapshot_id(element)
+                parts[snapshot_id] = element
+                ids.append(snapshot_id)
+            part_ids[field_name] = ids
+
+        manifest = RepositorySnapManifest(
+            repository_snap=copy(repository_snap, **{field_name: [] for field_name in part_ids}),
+            part_ids=part_ids,
+        )
+        return manifest, parts
+
+    def assemble(self, parts: Mapping[str, Any]) -> RepositorySnap:
+        return copy(
+            self.repository_snap,
+            **{
+                field_name: [parts[snapshot_id] for snapshot_id in ids]
+                for field_name, ids in self.part_ids.items()
+            },
+        )
+
+
+@whitelist_for_serdes
+@record
+class RepositorySnapDiff:
+    """The manifest of a repository, along with the sub-snapshots that the requesting client did
+    not already hold.
+    """
+
+    manifest: RepositorySnapManifest
+    parts: Mapping[str, Any]
+
+
 @whitelist_for_serdes(storage_name="ExternalSensorExecutionErrorData")
 @record
 class SensorExecutionErrorSnap:
@@ -69,6 +69,7 @@ def __init__(
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         block_op_concurrency_limited_runs: Optional[Mapping[str, Any]] = None,
+        dequeue_shards: Optional[Mapping[str, Any]] = None,
         inst_data: Optional[ConfigurableClassData] = None,
     ):
         self._inst_data: Optional[ConfigurableClassData] = check.opt_inst_param(
@@ -116,6 +117,16 @@ def __init__(
                 "is enabled",
             )
 
+        self._num_dequeue_shards: int = dequeue_shards["num_shards"] if dequeue_shards else 1
+        self._dequeue_shard_index: int = dequeue_shards["shard_index"] if dequeue_shards else 0
+        check.invariant(
+            self._num_dequeue_shards >= 1, "dequeue_shards.num_shards must be at least 1"
+        )
+        check.invariant(
+            0 <= self._dequeue_shard_index < self._num_dequeue_shards,
+            "dequeue_shards.shard_index must be between 0 and num_shards - 1",
+        )
+
         self._logger = logging.getLogger("dagster.run_coordinator.queued_run_coordinator")
         super().__init__()
 
@@ -145,6 +156,14 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def num_dequeue_shards(self) -> int:
+        return self._num_dequeue_shards
+
+    @property
+    def dequeue_shard_index(self) -> int:
+        return self._dequeue_shard_index
+
     @property
     def should_block_op_concurrency_limited_runs(self) -> bool:
         return self._should_block_op_concurrency_limited_runs
@@ -251,6 +270,28 @@ def config_type(cls) -> UserConfigSchema:
                     ),
                 }
             ),
+            "dequeue_shards": Field(
+                {
+                    "num_shards": Field(IntSource, description="The number of shards."),
+                    "shard_index": Field(
+                        IntSource,
+                        description=(
+                            "The shard dequeued by this daemon, between 0 and num_shards - 1."
+                            " Usually set from an environment variable that differs between"
+                            " daemon replicas."
+                        ),
+                    ),
+                },
+                is_required=False,
+                description=(
+                    "Split dequeuing across multiple daemon replicas. Each replica only dequeues"
+                    " runs from the code locations assigned to its shard, and launches at most its"
+                    " share of the room left under max_concurrent_runs and the tag concurrency"
+                    " limits, so that the replicas together never exceed them. The room is split"
+                    " only between shards that have queued runs, and any remainder rotates"
+                    " between them."
+                ),
+            ),
         }
 
     @classmethod
@@ -267,6 +308,7 @@ def from_config_value(
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
             block_op_concurrency_limited_runs=config_value.get("block_op_concurrency_limited_runs"),
+            dequeue_shards=config_value.get("dequeue_shards"),
         )
 
     def submit_run(self, context: SubmitRunContext) -> DagsterRun:
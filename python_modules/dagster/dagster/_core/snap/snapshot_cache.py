@@ -0,0 +1,74 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar, Union
+
+import dagster._check as check
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._core.snap.job_snapshot import JobSnap
+
+# Used by long-lived processes such as the webserver and the daemon, which read the same
+# snapshots repeatedly. Other processes only cache snapshots if DAGSTER_SNAPSHOT_CACHE_MAX_BYTES
+# is set.
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+T_Snapshot = TypeVar("T_Snapshot", bound=Union[JobSnap, ExecutionPlanSnapshot])
+
+
+def get_snapshot_cache_max_bytes(default: int = 0) -> int:
+    return int(os.getenv("DAGSTER_SNAPSHOT_CACHE_MAX_BYTES", str(default)))
+
+
+class SnapshotCache(Generic[T_Snapshot]):
+    """In-process LRU cache of deserialized snapshots, keyed by snapshot id.
+
+    Snapshots are immutable for a given snapshot id, so entries never need to be invalidated, only
+    evicted. The cache is bounded by the total stored size of the snapshots it holds, i.e. the size
+    of the snapshot bodies they were read from. A `max_bytes` of 0 disables caching. Snapshots
+    larger than `max_bytes` are never cached.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _entries and _total_bytes
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[T_Snapshot, int]]" = OrderedDict()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._entries
+
+    def get(self, snapshot_id: str) -> Optional[T_Snapshot]:
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def put(self, snapshot_id: str, snapshot: T_Snapshot, size: int) -> None:
+        if self._max_bytes <= 0 or size > self._max_bytes or snapshot_id in self._entries:
+            return
+
+        with self._lock:
+            if snapshot_id in self._entries:
+                return
+            self._entries[snapshot_id] = (snapshot, size)
+            self._total_bytes += size
+            while self._total_bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
@@ -5,7 +5,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import IO, Iterator, Optional, Sequence, Tuple
+from typing import IO, Dict, Iterator, Optional, Sequence, Tuple
 
 from dagster._core.instance import T_DagsterInstance
 from dagster._core.storage.compute_log_manager import (
@@ -22,6 +22,14 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# upper bound on the size of a single partial log chunk, so that a burst of output between two
+# uploads is neither read into memory nor fetched by readers all at once
+MAX_PARTIAL_LOG_CHUNK_BYTES = 64 * 1024 * 1024
+
+# how long the end of a capture waits for an in-flight partial log upload before moving on to the
+# final upload, so that a hanging upload does not block the step from completing
+PARTIAL_LOG_UPLOAD_JOIN_TIMEOUT = 30
+
 
 class CloudStorageComputeLogManager(ComputeLogManager[T_DagsterInstance]):
     """Abstract class that uses the local compute log manager to capture logs and stores them in
@@ -69,6 +77,52 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    @property
+    def upload_partial_chunks(self) -> bool:
+        """Whether partial compute logs are uploaded as append-only chunks holding only the bytes
+        written since the previous upload, instead of re-uploading the whole partial file at every
+        upload interval. Implementations that return True must override the partial log chunk
+        methods below, which otherwise store nothing.
+        """
+        return False
+
+    def upload_partial_log_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, offset: int, data: bytes
+    ) -> None:
+        """Uploads the bytes of the logs for a given log key starting at the given byte offset as a
+        partial log chunk to cloud storage.
+        """
+
+    def get_partial_log_chunks(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Sequence[Tuple[int, int]]:
+        """Returns the (offset, size) of each partial log chunk in cloud storage for a given log
+        key, ordered by offset.
+        """
+        return []
+
+    def download_partial_log_chunk(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunk_offset: int,
+        start: int = 0,
+        max_bytes: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """Downloads up to max_bytes of the partial log chunk at the given offset, starting at the
+        given position within the chunk. Returns None if the chunk no longer exists, e.g. because
+        the capture completed and the partial log chunks were deleted.
+        """
+        return None
+
+    def delete_partial_log_chunks(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        """Deletes the partial log chunks in cloud storage for a given log key."""
+
+    def on_partial_logs_uploaded(self, log_key: Sequence[str]) -> None:
+        """Called in the capturing process whenever new partial logs have been uploaded for a
+        given log key, to be used for notifying subscriptions.
+        """
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -88,6 +142,11 @@ def _on_capture_complete(self, log_key: Sequence[str]):
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR)
 
+        # the complete logs supersede any partial log chunks uploaded during the capture
+        for io_type in ComputeIOType:
+            if self._uploaded_chunk_offsets.pop(_chunk_offset_key(log_key, io_type), None):
+                self.delete_partial_log_chunks(log_key, io_type)
+
     def is_capture_complete(self, log_key: Sequence[str]) -> bool:
         if self.local_manager.is_capture_complete(log_key):
             return True
@@ -107,20 +166,66 @@ def get_log_data_for_type(
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type):
-            self.download_from_cloud_storage(log_key, io_type)
-            local_path = self.local_manager.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[io_type]
-            )
-            return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+            return self._read_cloud_storage_logs(log_key, io_type, offset, max_bytes)
+        if self.upload_partial_chunks:
+            chunks = self.get_partial_log_chunks(log_key, io_type)
+            if chunks:
+                log_data = self._read_partial_log_chunks(
+                    log_key, io_type, chunks, offset, max_bytes
+                )
+                if log_data is not None:
+                    return log_data
+                # the chunks were deleted while being read, because the capture completed and
+                # the complete logs replaced them
+                if self.cloud_storage_has_logs(log_key, io_type):
+                    return self._read_cloud_storage_logs(log_key, io_type, offset, max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type, partial=True):
-            self.download_from_cloud_storage(log_key, io_type, partial=True)
-            local_path = self.local_manager.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[io_type], partial=True
-            )
-            return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+            return self._read_cloud_storage_logs(log_key, io_type, offset, max_bytes, partial=True)
 
         return None, offset
 
+    def _read_cloud_storage_logs(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: Optional[int],
+        partial: bool = False,
+    ) -> Tuple[Optional[bytes], int]:
+        self.download_from_cloud_storage(log_key, io_type, partial=partial)
+        local_path = self.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type], partial=partial
+        )
+        return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+
+    def _read_partial_log_chunks(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunks: Sequence[Tuple[int, int]],
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Optional[Tuple[bytes, int]]:
+        # chunks are contiguous, so only the ones overlapping the requested range are downloaded
+        data = b""
+        for chunk_offset, chunk_size in chunks:
+            if chunk_offset + chunk_size <= offset:
+                continue
+            remaining = max_bytes - len(data) if max_bytes is not None else None
+            if remaining is not None and remaining <= 0:
+                break
+            chunk_data = self.download_partial_log_chunk(
+                log_key,
+                io_type,
+                chunk_offset,
+                start=max(offset - chunk_offset, 0),
+                max_bytes=remaining,
+            )
+            if chunk_data is None:
+                return None
+            data += chunk_data
+        return data, offset + len(data)
+
     def get_log_metadata(self, log_key: Sequence[str]) -> CapturedLogMetadata:
         return CapturedLogMetadata(
             stdout_location=self.display_path_for_type(log_key, ComputeIOType.STDOUT),
@@ -134,9 +239,44 @@ def on_progress(self, log_key):
         if self.is_capture_complete(log_key):
             return
 
+        if self.upload_partial_chunks:
+            uploaded = [self._upload_new_partial_log_chunks(log_key, t) for t in ComputeIOType]
+            if any(uploaded):
+                self.on_partial_logs_uploaded(log_key)
+            return
+
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
 
+    @property
+    def _uploaded_chunk_offsets(self) -> Dict[str, int]:
+        # lazily initialized, since subclasses are not required to call super().__init__()
+        if not hasattr(self, "_uploaded_chunk_offsets_by_key"):
+            self._uploaded_chunk_offsets_by_key: Dict[str, int] = {}
+        return self._uploaded_chunk_offsets_by_key
+
+    def _upload_new_partial_log_chunks(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> bool:
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if not os.path.exists(path):
+            return False
+
+        offset_key = _chunk_offset_key(log_key, io_type)
+        offset = self._uploaded_chunk_offsets.get(offset_key, 0)
+        uploaded = False
+        with open(path, "rb") as f:
+            f.seek(offset, os.SEEK_SET)
+            while True:
+                data = f.read(MAX_PARTIAL_LOG_CHUNK_BYTES)
+                if not data:
+                    break
+                self.upload_partial_log_chunk(log_key, io_type, offset, data)
+                offset += len(data)
+                self._uploaded_chunk_offsets[offset_key] = offset
+                uploaded = True
+        return uploaded
+
     def subscribe(
         self, log_key: Sequence[str], cursor: Optional[str] = None
     ) -> CapturedLogSubscription:
@@ -176,8 +316,12 @@ def _poll_for_local_upload(self, log_key: Sequence[str]) -> Iterator[None]:
             daemon=True,
         )
         thread.start()
-        yield
-        thread_exit.set()
+        try:
+            yield
+        finally:
+            thread_exit.set()
+            # wait for an in-flight upload, so that it does not race with the final upload
+            thread.join(timeout=PARTIAL_LOG_UPLOAD_JOIN_TIMEOUT)
 
     def dispose(self):
         self.local_manager.dispose()
@@ -187,6 +331,7 @@ class PollingComputeLogSubscriptionManager:
     def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
+        self._chunk_states = {}
         self._shutdown_event = None
         self._polling_thread = None
 
@@ -241,6 +386,7 @@ def remove_subscription(self, subscription: CapturedLogSubscription) -> None:
             self._subscriptions[watch_key].remove(subscription)
             if len(self._subscriptions[watch_key]) == 0:
                 del self._subscriptions[watch_key]
+                self._chunk_states.pop(watch_key, None)
             subscription.complete()
 
         if not len(self._subscriptions) and self._polling_thread:
@@ -250,22 +396,39 @@ def remove_all_subscriptions(self, log_key: Sequence[str]) -> None:
         watch_key = self._watch_key(log_key)
         for subscription in self._subscriptions.pop(watch_key, []):
             subscription.complete()
+        self._chunk_states.pop(watch_key, None)
 
         if not len(self._subscriptions) and self._polling_thread:
             self._stop_polling_thread()
 
     def notify_subscriptions(self, log_key: Sequence[str]) -> None:
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions[watch_key]:
+        for subscription in list(self._subscriptions.get(watch_key, [])):
             subscription.fetch()
 
+    def _has_updates(self, watch_key: str, log_key: Sequence[str]) -> bool:
+        if not self._manager.upload_partial_chunks:
+            # no cheap way to tell whether a partial file has changed, so always fetch
+            return True
+
+        # chunks are append-only, so the logs have changed iff the set of chunks has changed
+        chunk_state = tuple(
+            tuple(self._manager.get_partial_log_chunks(log_key, io_type))
+            for io_type in ComputeIOType
+        )
+        if self._chunk_states.get(watch_key) == chunk_state:
+            return False
+        self._chunk_states[watch_key] = chunk_state
+        return True
+
     def _poll(self, shutdown_event: threading.Event) -> None:
         while True:
             if shutdown_event.is_set():
                 return
-            # need to do something smarter here that keeps track of updates
-            for subscriptions in self._subscriptions.values():
-                for subscription in subscriptions:
+            for watch_key, subscriptions in list(self._subscriptions.items()):
+                if not subscriptions or not self._has_updates(watch_key, subscriptions[0].log_key):
+                    continue
+                for subscription in list(subscriptions):
                     if shutdown_event.is_set():
                         return
                     subscription.fetch()
@@ -283,7 +446,10 @@ def _upload_partial_logs(
     interval: int,
 ) -> None:
     while True:
-        time.sleep(interval)
-        if thread_exit.is_set() or compute_log_manager.is_capture_complete(log_key):
+        if thread_exit.wait(interval) or compute_log_manager.is_capture_complete(log_key):
             return
         compute_log_manager.on_progress(log_key)
+
+
+def _chunk_offset_key(log_key: Sequence[str], io_type: ComputeIOType) -> str:
+    return json.dumps([*log_key, io_type.value])
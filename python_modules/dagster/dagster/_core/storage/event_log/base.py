@@ -3,6 +3,7 @@
     TYPE_CHECKING,
     AbstractSet,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -25,6 +26,7 @@
     EventLogRecord,
     EventRecordsFilter,
     EventRecordsResult,
+    EventRecordSummariesResult,
     RunStatusChangeRecordsFilter,
 )
 from dagster._core.events import DagsterEventType
@@ -53,6 +55,8 @@
     from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -254,6 +258,58 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Stream all of the event log records corresponding to a run, in ascending storage id
+        order, without holding the entire event log of the run in memory.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to start streaming records after.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            batch_size (int): Number of records to fetch from the storage at a time.
+        """
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        while True:
+            connection = self.get_records_for_run(
+                run_id, cursor=cursor, of_type=of_type, limit=batch_size
+            )
+            yield from connection.records
+            if not connection.has_more:
+                break
+            cursor = connection.cursor
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for several runs at once, each after its own cursor.
+
+        Records are returned in ascending storage id order. When `limit` is hit, the returned
+        records for each run always form a contiguous prefix of that run's records after its
+        cursor, so callers can advance each run's cursor to the last storage id they received.
+
+        Args:
+            cursors_by_run_id (Mapping[str, Optional[str]]): Storage id cursor for each run to
+                fetch records for. A cursor of None fetches the run from the beginning.
+            limit (Optional[int]): Max number of records to return across all runs.
+        """
+        records = [
+            record
+            for run_id, cursor in cursors_by_run_id.items()
+            for record in self.get_records_for_run(run_id, cursor=cursor, limit=limit).records
+        ]
+        records = sorted(records, key=lambda record: record.storage_id)
+        return records[:limit] if limit else records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(
@@ -286,6 +342,14 @@ def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             self.store_event(event)
 
+    @property
+    def supports_any_event_type_in_batch(self) -> bool:
+        """Indicates that `store_event_batch` accepts events of any type, rather than only the
+        `BATCH_WRITABLE_EVENTS`. Events are only buffered per run and written in batches for
+        storages that do.
+        """
+        return False
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -645,6 +709,34 @@ def fetch_observations(
     ) -> EventRecordsResult:
         raise NotImplementedError()
 
+    def fetch_materialization_summaries(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        """Same as `fetch_materializations`, but returns only the indexed columns of each record.
+        Storages that can read them without deserializing the stored events should override this.
+        """
+        return EventRecordSummariesResult.from_event_records_result(
+            self.fetch_materializations(records_filter, limit, cursor, ascending)
+        )
+
+    def fetch_observation_summaries(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        """Same as `fetch_observations`, but returns only the indexed columns of each record.
+        Storages that can read them without deserializing the stored events should override this.
+        """
+        return EventRecordSummariesResult.from_event_records_result(
+            self.fetch_observations(records_filter, limit, cursor, ascending)
+        )
+
     @property
     def supports_run_status_change_job_name_filter(self) -> bool:
         return False
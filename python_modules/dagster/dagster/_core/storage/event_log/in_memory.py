@@ -79,8 +79,27 @@ def from_config_value(cls, inst_data, config_value):
     def upgrade(self):
         pass
 
+    @property
+    def supports_any_event_type_in_batch(self) -> bool:
+        # the in-memory database is shared between connections with table-level locking, so events
+        # are not buffered for background writes while the same database may be read
+        return False
+
+    @property
+    def supports_streaming_reads(self) -> bool:
+        # an open connection holds table-level locks on the shared in-memory database
+        return False
+
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def store_event_batch(self, events):
+        super(InMemoryEventLogStorage, self).store_event_batch(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
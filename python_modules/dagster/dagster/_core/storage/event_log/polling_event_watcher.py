@@ -1,10 +1,12 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import dagster._check as check
+from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -23,13 +25,12 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
 
-    LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+    All watched run_ids are multiplexed onto a single polling thread
+    (SqlPollingMultiplexedEventWatcherThread), which issues one batched query per poll across every
+    watched run, tracking a separate cursor for each run, and fans the results out to the callbacks
+    registered for each run.
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -37,16 +38,15 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _thread_lock protects _watcher_thread
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._watcher_thread: Optional[SqlPollingMultiplexedEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
-        return _has_run_id
+        with self._thread_lock:
+            return self._watcher_thread is not None and self._watcher_thread.has_run_id(run_id)
 
     def watch_run(
         self,
@@ -59,14 +59,14 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._thread_lock:
+            if self._watcher_thread is None:
+                self._watcher_thread = SqlPollingMultiplexedEventWatcherThread(
+                    self._event_log_storage
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
 
     def unwatch_run(
         self,
@@ -75,113 +75,192 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._thread_lock:
+                if self._watcher_thread is not None:
+                    self._watcher_thread.stop()
+                    self._watcher_thread.join()
+                    self._watcher_thread = None
 
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+class SqlPollingMultiplexedEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches a set of run_ids for new Events by polling.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
+    Holds, for each watched run_id, a cursor and a list of callbacks each passed in by an
+        `Observer`. Each poll issues a single `get_records_for_runs` query across all watched runs,
+        advances each run's cursor past the records it received, and fires the callbacks for each
+        run. Note that the callbacks have a cursor associated; this means that the callbacks
+        should be only executed on EventLogEntrys with an associated id > callback.cursor
+    The poll period backs off exponentially while no watched run has new events, and is reset
+        whenever events arrive or a new run_id starts being watched.
+    Errors are logged and do not stop the thread, so that one run cannot stop updates for the
+        others: a run whose event log is invalid stops being watched, a failed query is retried
+        on the next poll, and a failing callback does not prevent the other callbacks from firing.
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+        INVARIANTS: _run_id_lock protects _callbacks_by_run_id and _cursors_by_run_id
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
+    def __init__(self, event_log_storage: EventLogStorage):
+        super(SqlPollingMultiplexedEventWatcherThread, self).__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+        self._run_id_lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+        self._cursors_by_run_id: Dict[str, Optional[str]] = {}
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        # set to cut the current backoff short, e.g. when a new run_id starts being watched
+        self._wake = threading.Event()
+        self.name = "sql-event-watch-multiplexed"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+    def stop(self) -> None:
+        self._should_thread_exit.set()
+        self._wake.set()
+
+    def has_run_id(self, run_id: str) -> bool:
+        with self._run_id_lock:
+            return run_id in self._callbacks_by_run_id
+
+    def add_callback(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ):
         """Observer has started watching this run.
             Add a callback to execute on new EventLogEntrys after the given cursor.
 
         Args:
+            run_id (str): run_id to watch
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        with self._run_id_lock:
+            if run_id not in self._callbacks_by_run_id:
+                # start the run's cursor at the first observer's cursor, no earlier records are
+                # needed by any callback registered so far
+                self._callbacks_by_run_id[run_id] = []
+                self._cursors_by_run_id[run_id] = cursor
+                self._wake.set()
+            self._callbacks_by_run_id[run_id].append(CallbackAfterCursor(cursor, callback))
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also stop polling for the run_id if no callbacks remain (i.e. no Observers are
+            watching this run_id)
 
         Args:
+            run_id (str): run_id the callback was registered for
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
+        with self._run_id_lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            self._callbacks_by_run_id[run_id] = [
                 callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
+                for callback_with_cursor in self._callbacks_by_run_id[run_id]
                 if callback_with_cursor.callback != callback
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+            if not self._callbacks_by_run_id[run_id]:
+                del self._callbacks_by_run_id[run_id]
+                del self._cursors_by_run_id[run_id]
+
+    def _drop_run(self, run_id: str) -> None:
+        with self._run_id_lock:
+            self._callbacks_by_run_id.pop(run_id, None)
+            self._cursors_by_run_id.pop(run_id, None)
+
+    def _advance_cursors(
+        self, records: Sequence[EventLogRecord]
+    ) -> Sequence[Tuple[EventLogRecord, Sequence[CallbackAfterCursor]]]:
+        """Moves each watched run's cursor past the fetched records and returns the records paired
+        with the callbacks currently registered for their run.
+        """
+        to_fire = []
+        with self._run_id_lock:
+            for record in records:
+                run_id = record.event_log_entry.run_id
+                if run_id not in self._callbacks_by_run_id:
+                    # stopped watching while the query was in flight
+                    continue
+                self._cursors_by_run_id[run_id] = EventLogCursor.from_storage_id(
+                    record.storage_id
+                ).to_string()
+                to_fire.append((record, list(self._callbacks_by_run_id[run_id])))
+        return to_fire
 
     def run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+        Wakes every poll period &
+            1. executes a single SELECT query to get new EventLogEntrys across all watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses a per-run cursor in the DB to make sure that only new records are retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
 
         chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
-            )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
+        while not self._should_thread_exit.is_set():
+            if self._wake.wait(wait_time):
+                self._wake.clear()
+                wait_time = INIT_POLL_PERIOD
+            if self._should_thread_exit.is_set():
+                break
+
+            with self._run_id_lock:
+                cursors_by_run_id: Mapping[str, Optional[str]] = dict(self._cursors_by_run_id)
+
+            if not cursors_by_run_id:
+                wait_time = MAX_POLL_PERIOD
+                continue
+
+            try:
+                records = self._event_log_storage.get_records_for_runs(
+                    cursors_by_run_id, limit=chunk_limit
+                )
+            except DagsterEventLogInvalidForRun as e:
+                logging.exception("Stopped watching run %s with an invalid event log.", e.run_id)
+                self._drop_run(e.run_id)
+                wait_time = INIT_POLL_PERIOD
+                continue
+            except Exception:
+                logging.exception("Exception while polling for events of watched runs.")
+                wait_time = min(wait_time * 2, MAX_POLL_PERIOD)
+                continue
+
+            for event_record, callbacks in self._advance_cursors(records):
+                for callback_with_cursor in callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        try:
                             callback_with_cursor.callback(
                                 event_record.event_log_entry,
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.",
+                                event_record.event_log_entry.run_id,
+                            )
+            wait_time = INIT_POLL_PERIOD if records else min(wait_time * 2, MAX_POLL_PERIOD)
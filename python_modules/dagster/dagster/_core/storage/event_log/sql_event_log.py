@@ -1,5 +1,7 @@
+import heapq
 import logging
 import os
+import threading
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
@@ -45,7 +47,9 @@
     DagsterInvariantViolationError,
 )
 from dagster._core.event_api import (
+    EventLogRecordSummary,
     EventRecordsResult,
+    EventRecordSummariesResult,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -58,9 +62,11 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.stats import (
     RUN_STATS_EVENT_TYPES,
-    STEP_STATS_EVENT_TYPES,
+    STEP_ATTEMPT_EVENT_TYPES,
+    STEP_STATS_BODY_EVENT_TYPES,
     RunStepKeyStatsSnapshot,
-    build_run_step_stats_from_events,
+    StepStatsEvent,
+    build_run_step_stats_snapshot_from_step_events,
 )
 from dagster._core.storage.asset_check_execution_record import (
     COMPLETED_ASSET_CHECK_EXECUTION_RECORD_STATUSES,
@@ -69,6 +75,7 @@
 )
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.event_log.base import (
+    DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetEntry,
     AssetRecord,
@@ -102,10 +109,10 @@
     db_fetch_mappings,
     db_select,
     db_subquery,
+    db_supports_insert_returning,
 )
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_values
 from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
@@ -148,6 +155,10 @@ def enforce_max_records_limit(limit: int):
 # whole can be dropped.
 SqlDbConnection: TypeAlias = Any
 
+# Connections in which each thread is storing an event batch, by the id of the storage, so that the
+# index updates for a batch are written in the same transaction as its events.
+_event_batch_connections = threading.local()
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -179,6 +190,48 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    @contextmanager
+    def _index_write_connection(self) -> Iterator[Connection]:
+        """Context manager yielding a connection to write to cross-run indexed tables, which joins
+        the transaction of the event batch being stored by the current thread, if any.
+        """
+        batch_conn = getattr(_event_batch_connections, "by_storage_id", {}).get(id(self))
+        if batch_conn is not None:
+            yield batch_conn
+        else:
+            with self.index_connection() as conn:
+                yield conn
+
+    @contextmanager
+    def _event_batch_transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a connection to the index shard that has begun a transaction,
+        in which all the writes to cross-run indexed tables made by the current thread are included.
+        """
+        if not hasattr(_event_batch_connections, "by_storage_id"):
+            _event_batch_connections.by_storage_id = {}
+
+        with self.index_transaction() as conn:
+            _event_batch_connections.by_storage_id[id(self)] = conn
+            try:
+                yield conn
+            finally:
+                del _event_batch_connections.by_storage_id[id(self)]
+
+    @property
+    def supports_streaming_reads(self) -> bool:
+        """Whether results can be streamed from a run connection that is held open while the caller
+        consumes them, without blocking other reads and writes to the storage.
+        """
+        return True
+
+    @contextmanager
+    def streaming_run_connection(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to access the event logs for a specific run, which
+        streams query results from a server-side cursor instead of buffering them in memory.
+        """
+        with self.run_connection(run_id) as conn:
+            yield conn.execution_options(stream_results=True)
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -268,7 +321,7 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             )
         )
 
-        with self.index_connection() as conn:
+        with self._index_write_connection() as conn:
             try:
                 conn.execute(insert_statement)
             except db_exc.IntegrityError:
@@ -423,7 +476,7 @@ def store_asset_event_tags(
         # migration to create the table. On read, we will throw an error if the table does not
         # exist.
         if len(all_values) > 0 and self.has_table(AssetEventTagsTable.name):
-            with self.index_connection() as conn:
+            with self._index_write_connection() as conn:
                 conn.execute(AssetEventTagsTable.insert(), all_values)
 
     def _tags_for_asset_event(self, event: EventLogEntry) -> Mapping[str, str]:
@@ -471,6 +524,83 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    @property
+    def supports_any_event_type_in_batch(self) -> bool:
+        return True
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, in order.
+
+        All events are inserted using one multi-row INSERT where the database can return the
+        inserted ids, and the asset index and tag tables are updated once for the whole batch rather
+        than once per event. The events and the index updates are written in a single transaction,
+        so a batch that fails can be stored again without duplicating any of its events.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        if self.is_run_sharded:
+            # events for each run live in a separate shard
+            return super().store_event_batch(events)
+
+        with self._event_batch_transaction() as conn:
+            event_ids = self._insert_event_batch(conn, events)
+            self._store_indexes_for_event_batch(events, event_ids)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[int]:
+        if db_supports_insert_returning(conn):
+            result = conn.execute(
+                self.prepare_insert_event_batch(events).returning(SqlEventLogStorageTable.c.id)
+            )
+            event_ids = [cast(int, row[0]) for row in result.fetchall()]
+        else:
+            event_ids = [
+                cast(int, conn.execute(self.prepare_insert_event(event)).inserted_primary_key[0])
+                for event in events
+            ]
+
+        if len(event_ids) != len(events) or any(event_id is None for event_id in event_ids):
+            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+
+        return event_ids
+
+    def _store_indexes_for_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        asset_events = []
+        asset_event_ids = []
+        # Each asset key row only reflects the latest event of each type, so the earlier events of
+        # the same type in the batch can be skipped when updating the asset index.
+        latest_asset_event_by_key_and_type: Dict[
+            Tuple[AssetKey, DagsterEventType], Tuple[EventLogEntry, int]
+        ] = {}
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type in ASSET_EVENTS and dagster_event.asset_key:
+                asset_events.append(event)
+                asset_event_ids.append(event_id)
+                latest_asset_event_by_key_and_type[
+                    (dagster_event.asset_key, dagster_event.event_type)
+                ] = (event, event_id)
+            if dagster_event.event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
+        for event, event_id in sorted(
+            latest_asset_event_by_key_and_type.values(), key=lambda entry: entry[1]
+        ):
+            self.store_asset_event(event, event_id)
+
+        if asset_events:
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+
     def get_records_for_run(
         self,
         run_id,
@@ -493,6 +623,52 @@ def get_records_for_run(
 
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
+        query = self._get_records_for_run_query(run_id, cursor, of_type, ascending)
+        if limit:
+            query = query.limit(limit)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        last_record_id = None
+        try:
+            records = []
+            for (
+                record_id,
+                json_str,
+            ) in results:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+                last_record_id = record_id
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        if last_record_id is not None:
+            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
+        elif cursor:
+            # record fetch returned no new logs, return the same cursor
+            next_cursor = cursor
+        else:
+            # rely on the fact that all storage ids will be positive integers
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(
+            records=records,
+            cursor=next_cursor,
+            has_more=bool(limit and len(results) == limit),
+        )
+
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
         dagster_event_types = (
             {of_type}
             if isinstance(of_type, DagsterEventType)
@@ -526,43 +702,96 @@ def get_records_for_run(
                 else:
                     query = query.where(SqlEventLogStorageTable.c.id < cursor_obj.storage_id())
 
-        if limit:
-            query = query.limit(limit)
+        return query
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        if not self.supports_streaming_reads:
+            yield from super().iter_records_for_run(run_id, cursor, of_type, batch_size)
+            return
 
-        if last_record_id is not None:
-            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
-        elif cursor:
-            # record fetch returned no new logs, return the same cursor
-            next_cursor = cursor
-        else:
-            # rely on the fact that all storage ids will be positive integers
-            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+        query = self._get_records_for_run_query(run_id, cursor, of_type, ascending=True)
+
+        # A single query is read incrementally, rather than paging through the run with repeated
+        # queries, so the connection stays open until the iterator is exhausted or closed.
+        with self.streaming_run_connection(run_id) as conn:
+            result = conn.execute(query)
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    break
+                for record_id, json_str in rows:
+                    try:
+                        event_log_entry = deserialize_value(json_str, EventLogEntry)
+                    except (seven.JSONDecodeError, DeserializationError) as err:
+                        raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+                    yield EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        check.mapping_param(cursors_by_run_id, "cursors_by_run_id", key_type=str)
+        check.opt_int_param(limit, "limit")
 
-        return EventLogConnection(
-            records=records,
-            cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
+        if self.is_run_sharded:
+            # each run lives in its own shard, so there is no single table to query across runs
+            return super().get_records_for_runs(cursors_by_run_id, limit=limit)
+
+        if not cursors_by_run_id:
+            return []
+
+        uncursored_run_ids = [
+            run_id for run_id, cursor in cursors_by_run_id.items() if cursor is None
+        ]
+        run_filters = [
+            db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id,
+                SqlEventLogStorageTable.c.id > EventLogCursor.parse(cursor).storage_id(),
+            )
+            for run_id, cursor in cursors_by_run_id.items()
+            if cursor is not None
+        ]
+        if uncursored_run_ids:
+            run_filters.append(SqlEventLogStorageTable.c.run_id.in_(uncursored_run_ids))
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*run_filters))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
         )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+        return records
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
@@ -635,40 +864,142 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        # Originally, this was two different queries:
-        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
-        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
-        # 2) one query which fetched all the raw events for a specific event type and then inspected
-        #    the deserialized event object to aggregate stats derived from sequences of events.
-        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
-        #
-        # For simplicity, we now just do the second type of query and derive the stats in Python
-        # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
+        # Step stats are built from three queries, so that only the events whose contents are
+        # needed are deserialized:
+        # 1) an aggregate over the indexed step_key / dagster_event_type columns of the events that
+        #    start and end step attempts.  For steps with at most one event of each type, which is
+        #    every step that was not retried, the aggregate rows are the attempt events themselves.
+        # 2) the step_key / dagster_event_type / timestamp columns of the attempt events of the
+        #    remaining (retried) steps, from which the timings of each attempt are derived.
+        # 3) the raw events for materializations, expectation results and markers, which are
+        #    deserialized as they are streamed from the database.
+        step_key_filter = (
+            [SqlEventLogStorageTable.c.step_key.in_(step_keys)]
+            if step_keys
+            else [SqlEventLogStorageTable.c.step_key != None]  # noqa: E711
+        )
+        aggregate_query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label("n_events_of_type"),
+                    db.func.max(SqlEventLogStorageTable.c.id).label("last_storage_id"),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_timestamp"),
+                ]
+            )
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+            .where(*step_key_filter)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
+                    [event_type.value for event_type in STEP_ATTEMPT_EVENT_TYPES]
                 )
             )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .group_by(
+                SqlEventLogStorageTable.c.step_key, SqlEventLogStorageTable.c.dagster_event_type
+            )
         )
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+        body_query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(*step_key_filter)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in STEP_STATS_BODY_EVENT_TYPES]
+                )
             )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            aggregate_rows = conn.execute(aggregate_query).fetchall()
+
+        attempt_events: List[Tuple[int, StepStatsEvent]] = []
+        retried_step_keys: Set[str] = set()
+        for (
+            step_key,
+            event_type,
+            n_events_of_type,
+            last_storage_id,
+            last_timestamp,
+        ) in aggregate_rows:
+            if n_events_of_type > 1:
+                retried_step_keys.add(step_key)
+            attempt_events.append(
+                (
+                    last_storage_id,
+                    StepStatsEvent(
+                        step_key=step_key,
+                        event_type=DagsterEventType(event_type),
+                        timestamp=utc_datetime_from_naive(last_timestamp).timestamp(),
+                    ),
+                )
+            )
+
+        if retried_step_keys:
+            attempt_events = [
+                (storage_id, step_event)
+                for storage_id, step_event in attempt_events
+                if step_event.step_key not in retried_step_keys
+            ]
+            retried_query = (
+                db_select(
+                    [
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.step_key,
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        SqlEventLogStorageTable.c.timestamp,
+                    ]
+                )
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.step_key.in_(retried_step_keys))
+                .where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in STEP_ATTEMPT_EVENT_TYPES]
+                    )
+                )
+            )
+            with self.run_connection(run_id) as conn:
+                retried_rows = conn.execute(retried_query).fetchall()
+            attempt_events.extend(
+                (
+                    storage_id,
+                    StepStatsEvent(
+                        step_key=step_key,
+                        event_type=DagsterEventType(event_type),
+                        timestamp=utc_datetime_from_naive(timestamp).timestamp(),
+                    ),
+                )
+                for storage_id, step_key, event_type, timestamp in retried_rows
+            )
+
+        attempt_events = sorted(attempt_events, key=lambda event: event[0])
+
+        def _iter_body_events() -> Iterator[Tuple[int, StepStatsEvent]]:
+            with self.streaming_run_connection(run_id) as conn:
+                for storage_id, json_str in conn.execute(body_query):
+                    event = deserialize_value(json_str, EventLogEntry)
+                    dagster_event = event.get_dagster_event()
+                    yield (
+                        storage_id,
+                        StepStatsEvent(
+                            step_key=check.not_none(dagster_event.step_key),
+                            event_type=dagster_event.event_type,
+                            timestamp=event.timestamp,
+                            entry=event,
+                        ),
+                    )
 
         try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
-            return build_run_step_stats_from_events(run_id, records)
+            return build_run_step_stats_snapshot_from_step_events(
+                run_id,
+                (
+                    step_event
+                    for _, step_event in heapq.merge(
+                        attempt_events, _iter_body_events(), key=lambda event: event[0]
+                    )
+                ),
+            ).step_key_stats
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
@@ -1038,32 +1369,118 @@ def _get_event_records_result(
         has_more = len(records) == limit
         return EventRecordsResult(records, cursor=new_cursor, has_more=has_more)
 
-    def fetch_materializations(
+    def _get_event_record_summaries_result(
         self,
-        records_filter: Union[AssetKey, AssetRecordsFilter],
+        event_records_filter: EventRecordsFilter,
         limit: int,
-        cursor: Optional[str] = None,
-        ascending: bool = False,
-    ) -> EventRecordsResult:
-        enforce_max_records_limit(limit)
+        cursor: Optional[str],
+        ascending: bool,
+    ) -> EventRecordSummariesResult:
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+
+        if event_records_filter.asset_key:
+            asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
+        else:
+            asset_details = None
+
+        # only select the indexed columns, so that the event json does not need to be deserialized
+        query = db_select(
+            [
+                SqlEventLogStorageTable.c.id,
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.timestamp,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+                SqlEventLogStorageTable.c.step_key,
+            ]
+        ).select_from(SqlEventLogStorageTable)
+        query = self._apply_filter_to_query(
+            query=query,
+            event_records_filter=event_records_filter,
+            asset_details=asset_details,
+        )
+        query = query.limit(limit)
+        if ascending:
+            query = query.order_by(SqlEventLogStorageTable.c.id.asc())
+        else:
+            query = query.order_by(SqlEventLogStorageTable.c.id.desc())
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        records = [
+            EventLogRecordSummary(
+                storage_id=row_id,
+                run_id=run_id,
+                timestamp=utc_datetime_from_naive(timestamp).timestamp(),
+                event_type=DagsterEventType(event_type),
+                asset_key=AssetKey.from_db_string(asset_key),
+                partition_key=partition,
+                step_key=step_key,
+            )
+            for row_id, run_id, timestamp, event_type, asset_key, partition, step_key in rows
+        ]
+        if records:
+            new_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+        elif cursor:
+            new_cursor = cursor
+        else:
+            new_cursor = EventLogCursor.from_storage_id(-1).to_string()
+        has_more = len(records) == limit
+        return EventRecordSummariesResult(records, cursor=new_cursor, has_more=has_more)
+
+    def _get_asset_event_records_filter(
+        self,
+        event_type: DagsterEventType,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        cursor: Optional[str],
+        ascending: bool,
+    ) -> EventRecordsFilter:
         if isinstance(records_filter, AssetRecordsFilter):
-            event_records_filter = records_filter.to_event_records_filter(
-                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+            return records_filter.to_event_records_filter(
+                event_type=event_type,
                 cursor=cursor,
                 ascending=ascending,
             )
         else:
             before_cursor, after_cursor = EventRecordsFilter.get_cursor_params(cursor, ascending)
             asset_key = records_filter
-            event_records_filter = EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+            return EventRecordsFilter(
+                event_type=event_type,
                 asset_key=asset_key,
                 before_cursor=before_cursor,
                 after_cursor=after_cursor,
             )
 
+    def fetch_materializations(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordsResult:
+        enforce_max_records_limit(limit)
+        event_records_filter = self._get_asset_event_records_filter(
+            DagsterEventType.ASSET_MATERIALIZATION, records_filter, cursor, ascending
+        )
         return self._get_event_records_result(event_records_filter, limit, cursor, ascending)
 
+    def fetch_materialization_summaries(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        enforce_max_records_limit(limit)
+        event_records_filter = self._get_asset_event_records_filter(
+            DagsterEventType.ASSET_MATERIALIZATION, records_filter, cursor, ascending
+        )
+        return self._get_event_record_summaries_result(
+            event_records_filter, limit, cursor, ascending
+        )
+
     def fetch_observations(
         self,
         records_filter: Union[AssetKey, AssetRecordsFilter],
@@ -1072,24 +1489,26 @@ def fetch_observations(
         ascending: bool = False,
     ) -> EventRecordsResult:
         enforce_max_records_limit(limit)
-        if isinstance(records_filter, AssetRecordsFilter):
-            event_records_filter = records_filter.to_event_records_filter(
-                event_type=DagsterEventType.ASSET_OBSERVATION,
-                cursor=cursor,
-                ascending=ascending,
-            )
-        else:
-            before_cursor, after_cursor = EventRecordsFilter.get_cursor_params(cursor, ascending)
-            asset_key = records_filter
-            event_records_filter = EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_OBSERVATION,
-                asset_key=asset_key,
-                before_cursor=before_cursor,
-                after_cursor=after_cursor,
-            )
-
+        event_records_filter = self._get_asset_event_records_filter(
+            DagsterEventType.ASSET_OBSERVATION, records_filter, cursor, ascending
+        )
         return self._get_event_records_result(event_records_filter, limit, cursor, ascending)
 
+    def fetch_observation_summaries(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        enforce_max_records_limit(limit)
+        event_records_filter = self._get_asset_event_records_filter(
+            DagsterEventType.ASSET_OBSERVATION, records_filter, cursor, ascending
+        )
+        return self._get_event_record_summaries_result(
+            event_records_filter, limit, cursor, ascending
+        )
+
     def fetch_run_status_changes(
         self,
         records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
@@ -2818,7 +3237,7 @@ def _store_asset_check_evaluation_planned(
         planned = cast(
             AssetCheckEvaluationPlanned, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
+        with self._index_write_connection() as conn:
             conn.execute(
                 AssetCheckExecutionsTable.insert().values(
                     asset_key=planned.asset_key.to_string(),
@@ -2840,7 +3259,7 @@ def _store_runless_asset_check_evaluation(
         evaluation = cast(
             AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
+        with self._index_write_connection() as conn:
             conn.execute(
                 AssetCheckExecutionsTable.insert().values(
                     asset_key=evaluation.asset_key.to_string(),
@@ -2866,7 +3285,7 @@ def _update_asset_check_evaluation(self, event: EventLogEntry, event_id: Optiona
         evaluation = cast(
             AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
+        with self._index_write_connection() as conn:
             rows_updated = conn.execute(
                 AssetCheckExecutionsTable.update()
                 .where(
@@ -105,6 +105,12 @@ def _connect(self):
             with conn.begin():
                 yield conn
 
+    @property
+    def supports_streaming_reads(self) -> bool:
+        # an open connection holds a lock on the database file, so records are paged through with
+        # short-lived queries instead
+        return False
+
     def run_connection(self, run_id: Optional[str]) -> SqlDbConnection:
         return self._connect()
 
@@ -9,7 +9,7 @@
 from collections import defaultdict
 from contextlib import contextmanager
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, ContextManager, Iterator, List, Optional, Sequence, Union
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -236,6 +236,12 @@ def _connect(self, shard: str) -> Iterator[Connection]:
                     yield conn
             engine.dispose()
 
+    @property
+    def supports_streaming_reads(self) -> bool:
+        # an open connection holds a lock on the database file, so records are paged through with
+        # short-lived queries instead
+        return False
+
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
 
@@ -287,6 +293,45 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write consecutive events for the same run in a single transaction
+        against the run shard. Events that need to be mirrored in the index shard are still stored
+        one at a time, in order.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        pending: List[EventLogEntry] = []
+        for event in events:
+            if pending and pending[0].run_id != event.run_id:
+                self._store_run_shard_events(pending)
+                pending = []
+
+            if self._is_mirrored_in_index_shard(event):
+                self._store_run_shard_events(pending)
+                pending = []
+                self.store_event(event)
+            else:
+                pending.append(event)
+
+        self._store_run_shard_events(pending)
+
+    def _is_mirrored_in_index_shard(self, event: EventLogEntry) -> bool:
+        return event.is_dagster_event and (
+            bool(event.get_dagster_event().asset_key)
+            or event.dagster_event_type in ASSET_CHECK_EVENTS
+            or event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+        )
+
+    def _store_run_shard_events(self, events: Sequence[EventLogEntry]) -> None:
+        if not events:
+            return
+
+        with self.run_connection(events[0].run_id) as conn:
+            conn.execute(self.prepare_insert_event_batch(events))
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -32,9 +32,10 @@
     EventLogStorage,
     EventRecordsFilter,
     EventRecordsResult,
+    EventRecordSummariesResult,
     PlannedMaterializationInfo,
 )
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.base import RunsFeedConnection, RunsFeedCursor, RunStorage
 from dagster._core.storage.schedules.base import ScheduleStorage
 from dagster._core.storage.sql import AlembicVersion
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
@@ -253,6 +254,11 @@ def get_run_tags(
     ) -> Sequence[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags(tag_keys, value_prefix, limit)
 
+    def get_run_tag_value_counts(
+        self, tag_keys: Sequence[str], filters: Optional["RunsFilter"] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._storage.run_storage.get_run_tag_value_counts(tag_keys, filters)
+
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._storage.run_storage.get_run_tag_keys()
 
@@ -314,6 +320,9 @@ def dispose(self) -> None:
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         return self._storage.run_storage.optimize_for_webserver(statement_timeout, pool_recycle)
 
+    def enable_snapshot_cache(self) -> None:
+        return self._storage.run_storage.enable_snapshot_cache()
+
     def add_daemon_heartbeat(self, daemon_heartbeat: "DaemonHeartbeat") -> None:
         return self._storage.run_storage.add_daemon_heartbeat(daemon_heartbeat)
 
@@ -337,6 +346,24 @@ def get_backfills(
     def get_backfills_count(self, filters: Optional["BulkActionsFilter"] = None) -> int:
         return self._storage.run_storage.get_backfills_count(filters=filters)
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        run_filters: Optional["RunsFilter"],
+        backfill_filters: Optional["BulkActionsFilter"],
+        cursor: Optional[RunsFeedCursor] = None,
+    ) -> RunsFeedConnection:
+        return self._storage.run_storage.get_runs_feed_entries(
+            limit, run_filters, backfill_filters, cursor
+        )
+
+    def get_runs_feed_count(
+        self,
+        run_filters: Optional["RunsFilter"],
+        backfill_filters: Optional["BulkActionsFilter"],
+    ) -> int:
+        return self._storage.run_storage.get_runs_feed_count(run_filters, backfill_filters)
+
     def get_backfill(self, backfill_id: str) -> Optional["PartitionBackfill"]:
         return self._storage.run_storage.get_backfill(backfill_id)
 
@@ -440,6 +467,13 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
+    @property
+    def supports_any_event_type_in_batch(self) -> bool:
+        return self._storage.event_log_storage.supports_any_event_type_in_batch
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -507,6 +541,28 @@ def fetch_observations(
     ) -> EventRecordsResult:
         return self._storage.event_log_storage.fetch_observations(filters, limit, cursor, ascending)
 
+    def fetch_materialization_summaries(
+        self,
+        filters: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        return self._storage.event_log_storage.fetch_materialization_summaries(
+            filters, limit, cursor, ascending
+        )
+
+    def fetch_observation_summaries(
+        self,
+        filters: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordSummariesResult:
+        return self._storage.event_log_storage.fetch_observation_summaries(
+            filters, limit, cursor, ascending
+        )
+
     def fetch_run_status_changes(
         self,
         filters: Union["DagsterEventType", "RunStatusChangeRecordsFilter"],
@@ -670,6 +726,13 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        return self._storage.event_log_storage.get_records_for_runs(cursors_by_run_id, limit)
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
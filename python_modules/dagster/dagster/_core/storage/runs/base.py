@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.execution.telemetry import RunTelemetryData
@@ -19,7 +22,10 @@
 )
 from dagster._core.storage.sql import AlembicVersion
 from dagster._daemon.types import DaemonHeartbeat
+from dagster._record import copy, record
+from dagster._time import datetime_from_timestamp
 from dagster._utils import PrintFn
+from dagster._utils.warnings import disable_dagster_warnings
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation.origin import RemoteJobOrigin
@@ -30,6 +36,92 @@ class RunGroupInfo(TypedDict):
     runs: Sequence[DagsterRun]
 
 
+_RUNS_FEED_CURSOR_DELIMITER = "::"
+
+
+@record
+class RunsFeedCursor:
+    """Three part cursor for paginating the runs feed. The run_cursor is the run_id of the oldest run that
+    has been returned. The backfill_cursor is the id of the oldest backfill that has been returned. The
+    timestamp is the timestamp of the oldest entry (run or backfill).
+
+    If the run/backfill cursor is None, that means that no runs/backfills have been returned yet and querying
+    should begin at the start of the table. Once all runs/backfills in the table have been returned, the
+    corresponding cursor should still be set to the id of the last run/backfill returned.
+
+    The timestamp is used for the following case. If a deployment has 20 runs and 0 backfills, and a query is
+    made for 10 runs feed entries, the first 10 runs will be returned. At this time, the run_cursor will be an id,
+    and the backfill_cursor will be None. Then a backfill is created. If a second query is made for 10 runs feed entries
+    the newly created backfill will get included in the list, even though it should be included on the first page by time
+    order. To prevent this, the timestamp is used to ensure that all returned entires are older than the entries on the
+    previous page.
+    """
+
+    run_cursor: Optional[str]
+    backfill_cursor: Optional[str]
+    timestamp: Optional[float]
+
+    def to_string(self) -> str:
+        return f"{self.run_cursor if self.run_cursor else ''}{_RUNS_FEED_CURSOR_DELIMITER}{self.backfill_cursor if self.backfill_cursor else ''}{_RUNS_FEED_CURSOR_DELIMITER}{self.timestamp if self.timestamp else ''}"
+
+    @staticmethod
+    def from_string(serialized: Optional[str]):
+        if serialized is None:
+            return RunsFeedCursor(
+                run_cursor=None,
+                backfill_cursor=None,
+                timestamp=None,
+            )
+        parts = serialized.split(_RUNS_FEED_CURSOR_DELIMITER)
+        if len(parts) != 3:
+            raise DagsterInvariantViolationError(f"Invalid cursor for querying runs: {serialized}")
+
+        return RunsFeedCursor(
+            run_cursor=parts[0] if parts[0] else None,
+            backfill_cursor=parts[1] if parts[1] else None,
+            timestamp=float(parts[2]) if parts[2] else None,
+        )
+
+    def advance(self, entries: Sequence[Union[RunRecord, PartitionBackfill]]) -> "RunsFeedCursor":
+        """Returns the cursor for the page after the given entries, which are ordered newest first."""
+        run_cursor = next(
+            (e.dagster_run.run_id for e in reversed(entries) if isinstance(e, RunRecord)),
+            self.run_cursor,
+        )
+        backfill_cursor = next(
+            (e.backfill_id for e in reversed(entries) if isinstance(e, PartitionBackfill)),
+            self.backfill_cursor,
+        )
+        return RunsFeedCursor(
+            run_cursor=run_cursor,
+            backfill_cursor=backfill_cursor,
+            timestamp=get_runs_feed_entry_timestamp(entries[-1]) if entries else self.timestamp,
+        )
+
+
+class RunsFeedConnection(NamedTuple):
+    entries: Sequence[Union[RunRecord, PartitionBackfill]]
+    cursor: RunsFeedCursor
+    has_more: bool
+
+
+def get_runs_feed_entry_timestamp(entry: Union[RunRecord, PartitionBackfill]) -> float:
+    if isinstance(entry, RunRecord):
+        return entry.create_timestamp.timestamp()
+    return entry.backfill_timestamp
+
+
+def _get_filters_created_before(
+    filters_created_before: Optional[datetime], cursor: RunsFeedCursor
+) -> Optional[datetime]:
+    # the filters may already bound the creation time, so only replace it with the cursor timestamp
+    # if that is earlier
+    cursor_created_before = datetime_from_timestamp(cursor.timestamp) if cursor.timestamp else None
+    if filters_created_before and cursor_created_before:
+        return min(filters_created_before, cursor_created_before)
+    return cursor_created_before or filters_created_before
+
+
 class RunStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance], DaemonCursorStorage):
     """Abstract base class for storing pipeline run history.
 
@@ -182,6 +274,25 @@ def get_run_tag_keys(self) -> Sequence[str]:
             List[str]
         """
 
+    def get_run_tag_value_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        """Get the number of runs that have each value of the given tag keys.
+
+        Args:
+            tag_keys (Sequence[str]): tag keys to count the values of.
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+
+        Returns:
+            Mapping[Tuple[str, str], int]: The number of matching runs for each (key, value) pair.
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run in self.get_runs(filters):
+            for key in tag_keys:
+                if key in run.tags:
+                    counts[(key, run.tags[key])] += 1
+        return dict(counts)
+
     @abstractmethod
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         """Add additional tags for a pipeline run.
@@ -338,6 +449,9 @@ def dispose(self) -> None:
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         """Allows for optimizing database connection / use in the context of a long lived webserver process."""
 
+    def enable_snapshot_cache(self) -> None:
+        """Allows for keeping deserialized snapshots in memory in the context of a long lived process."""
+
     # Daemon Heartbeat Storage
     #
     # Holds heartbeats from the Dagster Daemon so that other system components can alert when it's not
@@ -391,6 +505,91 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
             int: The number of backfills that match the given filters.
         """
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional[BulkActionsFilter],
+        cursor: Optional[RunsFeedCursor] = None,
+    ) -> RunsFeedConnection:
+        """Return a page of the runs feed, the runs and backfills in storage ordered by creation
+        time, newest first.
+
+        Args:
+            limit (int): The maximum number of entries to return.
+            run_filters (Optional[RunsFilter]): The filter by which to filter runs. If None, no
+                runs are included in the feed.
+            backfill_filters (Optional[BulkActionsFilter]): The filter by which to filter
+                backfills. If None, no backfills are included in the feed.
+            cursor (Optional[RunsFeedCursor]): The cursor returned with the previous page. If None,
+                the first page is returned.
+
+        Returns:
+            RunsFeedConnection: The entries, the cursor for the next page and whether there are more
+                entries to fetch.
+        """
+        cursor = cursor or RunsFeedCursor(run_cursor=None, backfill_cursor=None, timestamp=None)
+
+        # fetch limit+1 of each type to know if there are more than limit remaining
+        if run_filters is not None:
+            with disable_dagster_warnings():
+                run_filters = copy(
+                    run_filters,
+                    created_before=_get_filters_created_before(run_filters.created_before, cursor),
+                )
+            runs = self.get_run_records(
+                filters=run_filters, limit=limit + 1, cursor=cursor.run_cursor
+            )
+        else:
+            runs = []
+
+        if backfill_filters is not None:
+            backfill_filters = copy(
+                backfill_filters,
+                created_before=_get_filters_created_before(backfill_filters.created_before, cursor),
+            )
+            backfills = self.get_backfills(
+                filters=backfill_filters, cursor=cursor.backfill_cursor, limit=limit + 1
+            )
+        else:
+            backfills = []
+
+        # order runs and backfills by creation time. typically we sort by storage id but that
+        # won't work here since they are different tables
+        entries = sorted(
+            [*runs, *backfills],
+            key=get_runs_feed_entry_timestamp,
+            reverse=True,
+        )[:limit]
+        return RunsFeedConnection(
+            entries=entries,
+            cursor=cursor.advance(entries),
+            has_more=len(runs) + len(backfills) > limit,
+        )
+
+    def get_runs_feed_count(
+        self,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional[BulkActionsFilter],
+    ) -> int:
+        """Return the number of entries in the runs feed, the runs and backfills that match the
+        given filters.
+
+        Args:
+            run_filters (Optional[RunsFilter]): The filter by which to filter runs. If None, no
+                runs are counted.
+            backfill_filters (Optional[BulkActionsFilter]): The filter by which to filter
+                backfills. If None, no backfills are counted.
+
+        Returns:
+            int: The number of runs feed entries that match the given filters.
+        """
+        runs_count = self.get_runs_count(run_filters) if run_filters is not None else 0
+        backfills_count = (
+            self.get_backfills_count(backfill_filters) if backfill_filters is not None else 0
+        )
+        return runs_count + backfills_count
+
     @abstractmethod
     def get_backfill(self, backfill_id: str) -> Optional[PartitionBackfill]:
         """Get the partition backfill of the given backfill id."""
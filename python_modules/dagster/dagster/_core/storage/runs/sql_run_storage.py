@@ -1,4 +1,5 @@
 import logging
+import os
 import uuid
 import zlib
 from abc import abstractmethod
@@ -41,6 +42,11 @@
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.remote_representation.origin import RemoteJobOrigin
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnap, create_execution_plan_snapshot_id
+from dagster._core.snap.snapshot_cache import (
+    DEFAULT_SNAPSHOT_CACHE_MAX_BYTES,
+    SnapshotCache,
+    get_snapshot_cache_max_bytes,
+)
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     DagsterRunStatus,
@@ -50,7 +56,7 @@
     RunsFilter,
     TagBucket,
 )
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.base import RunsFeedConnection, RunsFeedCursor, RunStorage
 from dagster._core.storage.runs.migration import (
     BACKFILL_JOB_NAME_AND_TAGS,
     OPTIONAL_DATA_MIGRATIONS,
@@ -86,9 +92,10 @@
     RUN_FAILURE_REASON_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import deserialize_value, pack_value, serialize_value, unpack_value
+from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import deserialize_values
-from dagster._seven import JSONDecodeError
+from dagster._seven import JSONDecodeError, is_module_available
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.merger import merge_dicts
@@ -99,9 +106,74 @@ class SnapshotType(Enum):
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
+class SnapshotCodec(Enum):
+    """Encoding used for the body of newly written rows in the snapshots table.
+
+    ZLIB: zlib-compressed serdes JSON. This is the default, and is readable by every version of
+        dagster.
+    ZSTD_MSGPACK: zstd-compressed msgpack of the packed serdes value. Faster to decode for large
+        snapshots, but requires the optional `zstandard` and `msgpack` packages, both to write and
+        to read the rows.
+
+    Rows are decoded based on their leading bytes, so storages may contain a mix of both encodings.
+    """
+
+    ZLIB = "zlib"
+    ZSTD_MSGPACK = "zstd_msgpack"
+
+
+# Leading bytes of every zstd frame. zlib streams always start with 0x78, so the two encodings can
+# be told apart without a separate column.
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+# Note that we don't store the value in a constant so that it can be changed without a process
+# restart.
+def get_snapshot_codec() -> SnapshotCodec:
+    codec = SnapshotCodec(os.getenv("DAGSTER_SNAPSHOT_CODEC", SnapshotCodec.ZLIB.value))
+    if codec == SnapshotCodec.ZSTD_MSGPACK and not (
+        is_module_available("zstandard") and is_module_available("msgpack")
+    ):
+        check.failed(
+            "DAGSTER_SNAPSHOT_CODEC is set to zstd_msgpack, which requires the `zstandard` and"
+            " `msgpack` packages to be installed."
+        )
+    return codec
+
+
+def encode_snapshot_body(
+    snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot], codec: SnapshotCodec
+) -> bytes:
+    if codec == SnapshotCodec.ZSTD_MSGPACK:
+        import msgpack
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(msgpack.packb(pack_value(snapshot_obj)))
+
+    return zlib.compress(serialize_value(snapshot_obj).encode("utf-8"))
+
+
+_RUNS_FEED_RUN_ENTRY = "run"
+_RUNS_FEED_BACKFILL_ENTRY = "backfill"
+
+
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
+    # Snapshots are immutable by id, so deserialized copies can be kept in-process. Only created on
+    # first use, so that subclasses don't need to initialize it.
+    _snapshot_cache: Optional[SnapshotCache] = None
+
+    def _get_snapshot_cache(self) -> SnapshotCache:
+        if self._snapshot_cache is None:
+            self._snapshot_cache = SnapshotCache(get_snapshot_cache_max_bytes())
+        return self._snapshot_cache
+
+    def enable_snapshot_cache(self) -> None:
+        self._snapshot_cache = SnapshotCache(
+            get_snapshot_cache_max_bytes(DEFAULT_SNAPSHOT_CACHE_MAX_BYTES)
+        )
+
     @abstractmethod
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -422,23 +494,17 @@ def get_run_records(
         )
 
         rows = self.fetchall(query)
-        return [
-            RunRecord(
-                storage_id=check.int_param(row["id"], "id"),
-                dagster_run=self._row_to_run(row),
-                create_timestamp=utc_datetime_from_naive(
-                    check.inst(row["create_timestamp"], datetime)
-                ),
-                update_timestamp=utc_datetime_from_naive(
-                    check.inst(row["update_timestamp"], datetime)
-                ),
-                start_time=(
-                    check.opt_inst(row["start_time"], float) if "start_time" in row else None
-                ),
-                end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
-            )
-            for row in rows
-        ]
+        return [self._row_to_run_record(row) for row in rows]
+
+    def _row_to_run_record(self, row: Dict) -> RunRecord:
+        return RunRecord(
+            storage_id=check.int_param(row["id"], "id"),
+            dagster_run=self._row_to_run(row),
+            create_timestamp=utc_datetime_from_naive(check.inst(row["create_timestamp"], datetime)),
+            update_timestamp=utc_datetime_from_naive(check.inst(row["update_timestamp"], datetime)),
+            start_time=(check.opt_inst(row["start_time"], float) if "start_time" in row else None),
+            end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+        )
 
     def get_run_tags(
         self,
@@ -462,6 +528,25 @@ def get_run_tags(
             result[r["key"]].add(r["value"])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tag_value_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+        if not tag_keys:
+            return {}
+
+        runs_subquery = db_subquery(self._runs_query(filters=filters, columns=["run_id"]))
+        query = (
+            db_select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count().label("count")])
+            .select_from(
+                RunTagsTable.join(runs_subquery, RunTagsTable.c.run_id == runs_subquery.c.run_id)
+            )
+            .where(RunTagsTable.c.key.in_(tag_keys))
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        rows = self.fetchall(query)
+        return {(row["key"], row["value"]): row["count"] for row in rows}
+
     def get_run_tag_keys(self) -> Sequence[str]:
         query = db_select([RunTagsTable.c.key]).distinct().order_by(RunTagsTable.c.key)
         rows = self.fetchall(query)
@@ -618,7 +703,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=encode_snapshot_body(snapshot_obj, get_snapshot_codec()),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -650,17 +735,23 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnap]:
+        snapshot_cache = self._get_snapshot_cache()
+        snapshot = snapshot_cache.get(snapshot_id)
+        if snapshot is not None:
+            return snapshot  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
-        )
+        snapshot = defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])
+        if snapshot is not None:
+            snapshot_cache.put(snapshot_id, snapshot, len(row["snapshot_body"]))
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -852,6 +943,7 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self._get_snapshot_cache().clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -878,8 +970,14 @@ def _add_backfill_filters_to_table(
             return table
         return table
 
-    def _backfills_query(self, filters: Optional[BulkActionsFilter] = None):
-        query = db_select([BulkActionsTable.c.body, BulkActionsTable.c.timestamp])
+    def _backfills_query(
+        self,
+        filters: Optional[BulkActionsFilter] = None,
+        columns: Optional[Sequence[Any]] = None,
+    ):
+        if columns is None:
+            columns = [BulkActionsTable.c.body, BulkActionsTable.c.timestamp]
+        query = db_select(columns)
         if filters and filters.tags:
             if not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS):
                 # if the migration was run, we added the query for tags filtering in _add_backfill_filters_to_table
@@ -1027,6 +1125,175 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
         count = row["count"] if row else 0
         return count
 
+    def _requires_backfill_tags_post_filter(self, filters: Optional[BulkActionsFilter]) -> bool:
+        # until the backfill tags table is built, backfills are matched by tag after they are
+        # fetched, so they can't be limited or counted in the database
+        return bool(
+            filters and filters.tags and not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS)
+        )
+
+    def _runs_feed_runs_query(self, filters: RunsFilter, cursor: RunsFeedCursor):
+        # the columns of the runs feed are named after the columns of the runs table, so that rows
+        # for runs can be read like the rows of any other runs query
+        if self.has_run_stats_index_cols():
+            run_stats_columns = [RunsTable.c.start_time, RunsTable.c.end_time]
+        else:
+            run_stats_columns = [
+                db.cast(db.null(), db.Float).label("start_time"),
+                db.cast(db.null(), db.Float).label("end_time"),
+            ]
+
+        table = self._add_filters_to_table(RunsTable, filters)
+        query = db_select(
+            [
+                db.literal_column(f"'{_RUNS_FEED_RUN_ENTRY}'").label("entry_type"),
+                RunsTable.c.id,
+                RunsTable.c.run_body,
+                RunsTable.c.status,
+                RunsTable.c.create_timestamp,
+                RunsTable.c.update_timestamp,
+                *run_stats_columns,
+            ]
+        ).select_from(table)
+        query = self._add_filters_to_query(query, filters)
+
+        # runs before the cursor are selected by storage id. Until the first run has been returned,
+        # only runs created before the oldest entry of the previous page are selected instead
+        if cursor.run_cursor:
+            cursor_query = db_select([RunsTable.c.id]).where(
+                RunsTable.c.run_id == cursor.run_cursor
+            )
+            query = query.where(RunsTable.c.id < db_scalar_subquery(cursor_query))
+        elif cursor.timestamp:
+            query = query.where(
+                RunsTable.c.create_timestamp
+                <= datetime_from_timestamp(cursor.timestamp).replace(tzinfo=None)
+            )
+        return query
+
+    def _runs_feed_backfills_query(self, filters: BulkActionsFilter, cursor: RunsFeedCursor):
+        table = self._add_backfill_filters_to_table(BulkActionsTable, filters)
+        query = self._backfills_query(
+            filters=filters,
+            columns=[
+                db.literal_column(f"'{_RUNS_FEED_BACKFILL_ENTRY}'").label("entry_type"),
+                BulkActionsTable.c.id,
+                BulkActionsTable.c.body.label("run_body"),
+                BulkActionsTable.c.status,
+                BulkActionsTable.c.timestamp.label("create_timestamp"),
+                db.cast(db.null(), db.DateTime).label("update_timestamp"),
+                db.cast(db.null(), db.Float).label("start_time"),
+                db.cast(db.null(), db.Float).label("end_time"),
+            ],
+        ).select_from(table)
+
+        if cursor.backfill_cursor:
+            cursor_query = db_select([BulkActionsTable.c.id]).where(
+                BulkActionsTable.c.key == cursor.backfill_cursor
+            )
+            query = query.where(BulkActionsTable.c.id < db_scalar_subquery(cursor_query))
+        elif cursor.timestamp:
+            query = query.where(
+                BulkActionsTable.c.timestamp <= datetime_from_timestamp(cursor.timestamp)
+            )
+        return query
+
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional[BulkActionsFilter],
+        cursor: Optional[RunsFeedCursor] = None,
+    ) -> RunsFeedConnection:
+        check.int_param(limit, "limit")
+        check.opt_inst_param(run_filters, "run_filters", RunsFilter)
+        check.opt_inst_param(backfill_filters, "backfill_filters", BulkActionsFilter)
+        check.opt_inst_param(cursor, "cursor", RunsFeedCursor)
+
+        if self._requires_backfill_tags_post_filter(backfill_filters):
+            return super().get_runs_feed_entries(limit, run_filters, backfill_filters, cursor)
+
+        cursor = cursor or RunsFeedCursor(run_cursor=None, backfill_cursor=None, timestamp=None)
+        queries = []
+        if run_filters is not None:
+            runs_query = self._runs_feed_runs_query(run_filters, cursor)
+            queries.append((runs_query, RunsTable.c.id, "runs"))
+        if backfill_filters is not None:
+            backfills_query = self._runs_feed_backfills_query(backfill_filters, cursor)
+            queries.append((backfills_query, BulkActionsTable.c.id, "backfills"))
+        if not queries:
+            return RunsFeedConnection(entries=[], cursor=cursor, has_more=False)
+
+        # fetch limit+1 of each type, in storage id order so that the primary key index is used,
+        # then merge them in the database, ordered by creation time. Storage ids order entries of
+        # the same type that were created at the same time
+        limited_queries = []
+        for query, id_column, name in queries:
+            limited = db_subquery(query.order_by(id_column.desc()).limit(limit + 1), name)
+            limited_queries.append(db_select([limited]))
+        feed = db_subquery(
+            db.union_all(*limited_queries) if len(limited_queries) > 1 else limited_queries[0],
+            "runs_feed",
+        )
+        query = (
+            db_select([feed])
+            .order_by(
+                feed.c.create_timestamp.desc(),
+                feed.c.entry_type.desc(),
+                feed.c.id.desc(),
+            )
+            .limit(limit + 1)
+        )
+        rows = self.fetchall(query)
+
+        entries = [
+            self._row_to_run_record(row)
+            if row["entry_type"] == _RUNS_FEED_RUN_ENTRY
+            else deserialize_value(row["run_body"], PartitionBackfill)
+            for row in rows[:limit]
+        ]
+        return RunsFeedConnection(
+            entries=entries, cursor=cursor.advance(entries), has_more=len(rows) > limit
+        )
+
+    def get_runs_feed_count(
+        self,
+        run_filters: Optional[RunsFilter],
+        backfill_filters: Optional[BulkActionsFilter],
+    ) -> int:
+        check.opt_inst_param(run_filters, "run_filters", RunsFilter)
+        check.opt_inst_param(backfill_filters, "backfill_filters", BulkActionsFilter)
+
+        if self._requires_backfill_tags_post_filter(backfill_filters):
+            return super().get_runs_feed_count(run_filters, backfill_filters)
+
+        counts = []
+        if run_filters is not None:
+            runs_query = self._runs_query(filters=run_filters, columns=["id"])
+            counts.append(
+                db_scalar_subquery(
+                    db_select([db.func.count()]).select_from(db_subquery(runs_query, "runs"))
+                )
+            )
+        if backfill_filters is not None:
+            backfills_query = self._backfills_query(
+                filters=backfill_filters, columns=[BulkActionsTable.c.id]
+            ).select_from(self._add_backfill_filters_to_table(BulkActionsTable, backfill_filters))
+            counts.append(
+                db_scalar_subquery(
+                    db_select([db.func.count()]).select_from(
+                        db_subquery(backfills_query, "backfills")
+                    )
+                )
+            )
+        if not counts:
+            return 0
+
+        # count runs and backfills in a single statement
+        total = counts[0] + counts[1] if len(counts) > 1 else counts[0]
+        row = self.fetchone(db_select([total.label("count")]))
+        return row["count"] if row else 0
+
     def get_backfill(self, backfill_id: str) -> Optional[PartitionBackfill]:
         check.str_param(backfill_id, "backfill_id")
         query = db_select([BulkActionsTable.c.body]).where(BulkActionsTable.c.key == backfill_id)
@@ -1146,6 +1413,9 @@ def _warn(msg: str) -> None:
         _warn("First entry in row is not a binary type.")
         return None
 
+    if row[0].startswith(ZSTD_FRAME_MAGIC):
+        return _unpack_zstd_msgpack_snapshot_body(row[0], _warn)
+
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
@@ -1163,3 +1433,35 @@ def _warn(msg: str) -> None:
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
         return None
+
+
+def _unpack_zstd_msgpack_snapshot_body(
+    body: bytes, _warn: Callable[[str], None]
+) -> Optional[Union[ExecutionPlanSnapshot, JobSnap]]:
+    if not (is_module_available("zstandard") and is_module_available("msgpack")):
+        _warn(
+            "Snapshot was stored with the zstd_msgpack codec, but the `zstandard` and `msgpack`"
+            " packages are not installed."
+        )
+        return None
+
+    import msgpack
+    import zstandard
+
+    try:
+        uncompressed_bytes = zstandard.ZstdDecompressor().decompress(body)
+    except zstandard.ZstdError:
+        _warn("Could not decompress bytes stored in snapshot table.")
+        return None
+
+    try:
+        packed = msgpack.unpackb(uncompressed_bytes)
+    except (ValueError, msgpack.UnpackException):
+        _warn("Could not parse msgpack in snapshot table.")
+        return None
+
+    try:
+        return unpack_value(packed, (ExecutionPlanSnapshot, JobSnap))
+    except DeserializationError:
+        _warn("Could not unpack snapshot stored in snapshot table.")
+        return None
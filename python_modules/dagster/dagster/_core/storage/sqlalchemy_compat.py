@@ -43,3 +43,11 @@ def db_scalar_subquery(query):
         return query.scalar_subquery()
 
     return query.as_scalar()
+
+
+def db_supports_insert_returning(conn) -> bool:
+    """Utility class that allows compatibility between SqlAlchemy 1.3.x, 1.4.x, and 2.x."""
+    if not IS_SQLALCHEMY_VERSION_1:
+        return bool(conn.dialect.insert_returning)
+
+    return bool(getattr(conn.dialect, "full_returning", False))
@@ -1,6 +1,7 @@
 import asyncio
 import inspect
 from abc import abstractmethod
+from concurrent.futures import FIRST_EXCEPTION, wait
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
 
@@ -15,6 +16,7 @@
     _check as check,
 )
 from dagster._core.storage.io_manager import IOManager
+from dagster._core.utils import InheritContextThreadPoolExecutor
 
 if TYPE_CHECKING:
     from upath import UPath
@@ -28,6 +30,8 @@ class UPathIOManager(IOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to :py:class:`PartitionMapping`)
      - supports loading multiple partitions concurrently with async `load_from_path` method
+     - supports loading multiple partitions concurrently in a thread pool with sync `load_from_path`
+       method, by setting `max_concurrent_partition_loads`
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
@@ -36,14 +40,28 @@ class UPathIOManager(IOManager):
 
     extension: Optional[str] = None  # override in child class
 
+    # maximum number of partitions loaded at the same time when loading multiple partitions. By
+    # default, a sync `load_from_path` loads one partition at a time and an async `load_from_path`
+    # loads all partitions at once
+    max_concurrent_partition_loads: Optional[int] = None  # override in child class
+
     def __init__(
         self,
         base_path: Optional["UPath"] = None,
+        max_concurrent_partition_loads: Optional[int] = None,
     ):
         from upath import UPath
 
         assert not self.extension or "." in self.extension
         self._base_path = base_path or UPath(".")
+        if max_concurrent_partition_loads is not None:
+            self.max_concurrent_partition_loads = check.int_param(
+                max_concurrent_partition_loads, "max_concurrent_partition_loads"
+            )
+            check.invariant(
+                self.max_concurrent_partition_loads > 0,
+                "max_concurrent_partition_loads must be a positive integer",
+            )
 
     @abstractmethod
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
@@ -59,6 +77,7 @@ def load_partitions(self, context: InputContext):
         When loading a single partition, it will call `load_from_path` on it.
         When loading multiple partitions, it will invoke `load_from_path` multiple times over paths produced by
         `get_path_for_partition` method, and store the results in a dictionary with formatted partitions as keys.
+        Up to `max_concurrent_partition_loads` partitions are loaded at the same time in a thread pool.
         Sometimes, this is not desired. If the serialization format natively supports loading multiple partitions at once, this method should be overridden together with `get_path_for_partition`.
         hint: context.asset_partition_keys can be used to access the partitions to load.
         """
@@ -75,6 +94,14 @@ def load_partitions(self, context: InputContext):
                 context, partition_key, paths[partition_key], backcompat_paths.get(partition_key)
             )
         else:
+            max_workers = min(
+                self.max_concurrent_partition_loads or 1, len(context.asset_partition_keys)
+            )
+            if max_workers > 1:
+                return self._load_partitions_in_threads(
+                    context, paths, backcompat_paths, max_workers
+                )
+
             objs = {}
 
             for partition_key in context.asset_partition_keys:
@@ -89,6 +116,38 @@ def load_partitions(self, context: InputContext):
 
             return objs
 
+    def _load_partitions_in_threads(
+        self,
+        context: InputContext,
+        paths: Mapping[str, "UPath"],
+        backcompat_paths: Mapping[str, "UPath"],
+        max_workers: int,
+    ) -> Dict[str, Any]:
+        with InheritContextThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="upath_io_manager_load"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._load_partition_from_path,
+                    context,
+                    partition_key,
+                    paths[partition_key],
+                    backcompat_paths.get(partition_key),
+                )
+                for partition_key in context.asset_partition_keys
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            # don't start loading the remaining partitions if one of them failed
+            executor.shutdown(cancel_futures=True)
+
+        objs = {}
+        for partition_key, future in zip(context.asset_partition_keys, futures):
+            obj = future.result()  # raises the error of the first partition that failed
+            if obj is not None:  # in case some partitions were skipped
+                objs[partition_key] = obj
+
+        return objs
+
     @property
     def fs(self) -> AbstractFileSystem:
         """Utility function to get the IOManager filesystem.
@@ -336,20 +395,28 @@ def load_partitions_async(self, context: InputContext):
 
         async def collect():
             loop = asyncio.get_running_loop()
+            semaphore = (
+                asyncio.Semaphore(self.max_concurrent_partition_loads)
+                if self.max_concurrent_partition_loads
+                else None
+            )
+
+            async def load_partition(partition_key: str):
+                coro = self._load_partition_from_path(
+                    context,
+                    partition_key,
+                    paths[partition_key],
+                    backcompat_paths.get(partition_key),
+                )
+                if semaphore is None:
+                    return await coro
+                async with semaphore:
+                    return await coro
 
             tasks = []
 
             for partition_key in context.asset_partition_keys:
-                tasks.append(
-                    loop.create_task(
-                        self._load_partition_from_path(
-                            context,
-                            partition_key,
-                            paths[partition_key],
-                            backcompat_paths.get(partition_key),
-                        )
-                    )
-                )
+                tasks.append(loop.create_task(load_partition(partition_key)))
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
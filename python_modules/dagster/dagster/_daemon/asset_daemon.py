@@ -932,6 +932,7 @@ def _evaluate_auto_materialize_tick(
                 ),
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
+                num_evaluation_processes=instance.auto_materialize_num_evaluation_processes,
             ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
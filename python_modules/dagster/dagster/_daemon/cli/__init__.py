@@ -80,6 +80,7 @@ def run_command(
             with get_instance_for_cli(
                 instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None
             ) as instance:
+                instance.enable_snapshot_cache()
                 _daemon_run_command(instance, log_level, code_server_log_level, log_format, kwargs)
     except KeyboardInterrupt:
         return  # Exit cleanly on interrupt
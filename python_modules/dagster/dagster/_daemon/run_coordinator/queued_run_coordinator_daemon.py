@@ -2,9 +2,11 @@
 import sys
 import threading
 import time
+import zlib
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from dagster import (
     DagsterEvent,
@@ -27,16 +29,32 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.storage.tags import PRIORITY_TAG, REPOSITORY_LABEL_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
 from dagster._daemon.utils import DaemonErrorCapture
-from dagster._utils.tags import TagConcurrencyLimitsCounter
+from dagster._utils.tags import TagConcurrencyLimitsCounter, get_shard_share
 
 PAGE_SIZE = 100
 
 
+def _get_priority(priority_tag_value: Optional[str]) -> int:
+    try:
+        return int(priority_tag_value or "0")
+    except ValueError:
+        return 0
+
+
+def get_location_shard(location_name: Optional[str], num_shards: int) -> int:
+    """The shard that dequeues runs from the given code location. Runs without a code location
+    are dequeued by the first shard.
+    """
+    if num_shards == 1 or not location_name:
+        return 0
+    return zlib.crc32(location_name.encode("utf-8")) % num_shards
+
+
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
     store and launches them.
@@ -191,28 +209,58 @@ def _get_runs_to_dequeue(
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> List[DagsterRun]:
-        if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
-            check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
+        run_coordinator = instance.run_coordinator
+        if not isinstance(run_coordinator, QueuedRunCoordinator):
+            check.failed(f"Expected QueuedRunCoordinator, got {run_coordinator}")
 
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
+        shard_index = run_coordinator.dequeue_shard_index
+        num_shards = run_coordinator.num_dequeue_shards
 
-        in_progress_run_records = self._get_in_progress_run_records(instance)
-        in_progress_runs = [record.dagster_run for record in in_progress_run_records]
+        in_progress_filter = RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            in_progress_run_records = self._get_in_progress_run_records(instance)
+            num_in_progress_runs = len(in_progress_run_records)
+        else:
+            # the tag concurrency limits only need counts of the in-progress runs, which we can
+            # get from run storage without loading the runs themselves
+            in_progress_run_records = []
+            num_in_progress_runs = instance.get_runs_count(in_progress_filter)
+
+        # The room under each limit is only split between the shards that have runs queued. The
+        # number of queued runs changes as runs are launched, so using it as the rotation gives the
+        # room left over after an even split to each shard in turn.
+        queued_run_tags: Mapping[str, Sequence[str]] = {}
+        if num_shards > 1:
+            queued_run_counts_by_shard, queued_run_labels_by_shard = self._get_queued_runs_by_shard(
+                instance, num_shards
+            )
+            if not queued_run_counts_by_shard.get(shard_index):
+                return []
+            shard_indices = sorted(queued_run_counts_by_shard.keys())
+            shard_rotation = sum(queued_run_counts_by_shard.values())
+            if shard_index in queued_run_labels_by_shard:
+                # only read the queued runs from the code locations of this shard
+                queued_run_tags = {REPOSITORY_LABEL_TAG: queued_run_labels_by_shard[shard_index]}
+        else:
+            shard_indices = [shard_index]
+            shard_rotation = 0
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len(in_progress_run_records)
+        max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
-                    f"{len(in_progress_run_records)} runs are currently in progress. Maximum is {max_concurrent_runs}, won't launch more."
+                    f"{num_in_progress_runs} runs are currently in progress. Maximum is {max_concurrent_runs}, won't launch more."
                 )
                 return []
-
-        cursor = None
-        has_more = True
-        batch: List[DagsterRun] = []
+            max_runs_to_launch = get_shard_share(
+                max_runs_to_launch, shard_index, shard_indices, shard_rotation
+            )
+            if max_runs_to_launch <= 0:
+                return []
 
         now = fixed_iteration_time or time.time()
 
@@ -230,23 +278,36 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits,
+            [],
+            in_progress_tag_counts=instance.get_run_tag_value_counts(
+                list({tag_limit["key"] for tag_limit in tag_concurrency_limits}),
+                in_progress_filter,
             )
-            has_more = len(queued_runs) >= self._page_size
-
-            if not queued_runs:
-                has_more = False
-                return batch
+            if tag_concurrency_limits
+            else None,
+            shard_index=shard_index,
+            shard_indices=shard_indices if num_shards > 1 else None,
+            shard_rotation=shard_rotation,
+        )
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter] = None
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            try:
+                global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                    instance,
+                    [],
+                    in_progress_run_records,
+                    run_queue_config.op_concurrency_slot_buffer,
+                )
+            except:
+                self._logger.exception("Failed to initialize op concurrency counter")
 
+        batch: List[DagsterRun] = []
+        logged_this_iteration = False
+        # Queued runs are read a page at a time in the order in which they should be dequeued, so
+        # we can stop reading as soon as we have found enough runs to launch.
+        for queued_runs in self._iter_queued_runs_in_priority_order(instance, queued_run_tags):
             if not logged_this_iteration:
                 logged_this_iteration = True
                 self._logger.info(
@@ -254,34 +315,23 @@ def _get_runs_to_dequeue(
                     + locations_clause
                 )
 
-            cursor = queued_runs[-1].run_id
-
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
-            if run_queue_config.should_block_op_concurrency_limited_runs:
+            if global_concurrency_limits_counter:
                 try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
+                    global_concurrency_limits_counter.add_queued_runs(instance, queued_runs)
                 except:
                     self._logger.exception("Failed to initialize op concurrency counter")
                     # when we cannot initialize the global concurrency counter, we should fall back
                     # to not blocking any runs based on op concurrency limits
                     global_concurrency_limits_counter = None
-            else:
-                global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
+            for run in queued_runs:
+                location_name = (
+                    run.remote_job_origin.location_name if run.remote_job_origin else None
+                )
+                if get_location_shard(location_name, num_shards) != shard_index:
+                    continue
+
                 if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
                     continue
                 else:
                     tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -290,7 +340,6 @@ def _get_runs_to_dequeue(
                     global_concurrency_limits_counter
                     and global_concurrency_limits_counter.is_blocked(run)
                 ):
-                    to_remove.append(run)
                     if run.run_id not in self._global_concurrency_blocked_runs:
                         with self._global_concurrency_blocked_runs_lock:
                             self._global_concurrency_blocked_runs.add(run.run_id)
@@ -304,34 +353,109 @@ def _get_runs_to_dequeue(
                 elif global_concurrency_limits_counter:
                     global_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
                 if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
                     continue
 
-            for run in to_remove:
-                batch.remove(run)
-
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+                batch.append(run)
+                if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                    return batch
 
         return batch
 
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _get_queued_runs_by_shard(
+        self, instance: DagsterInstance, num_shards: int
+    ) -> Tuple[Mapping[int, int], Mapping[int, Sequence[str]]]:
+        """Counts the queued runs that each shard dequeues, from the repository label tag of each
+        run, without loading the runs. Also returns the repository labels of the queued runs of
+        each shard, except for the first shard if it dequeues runs without a code location.
+        """
+        queued_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+        counts_by_shard: Dict[int, int] = defaultdict(int)
+        labels_by_shard: Dict[int, List[str]] = defaultdict(list)
+        for (_, label), count in instance.get_run_tag_value_counts(
+            [REPOSITORY_LABEL_TAG], queued_filter
+        ).items():
+            # labels are of the form repository_name@location_name
+            shard = get_location_shard(label.split("@", 1)[-1], num_shards)
+            counts_by_shard[shard] += count
+            labels_by_shard[shard].append(label)
+
+        num_unlabeled_runs = instance.get_runs_count(queued_filter) - sum(counts_by_shard.values())
+        if num_unlabeled_runs > 0:
+            counts_by_shard[get_location_shard(None, num_shards)] += num_unlabeled_runs
+            labels_by_shard.pop(get_location_shard(None, num_shards), None)
+
+        return counts_by_shard, labels_by_shard
+
+    def _iter_queued_runs_in_priority_order(
+        self, instance: DagsterInstance, tags: Mapping[str, Sequence[str]]
+    ) -> Iterator[Sequence[DagsterRun]]:
+        """Yields pages of queued runs with the given tags, in the order in which they should be
+        dequeued: highest priority first, and first in first out for runs with the same priority.
+
+        Each non-default priority is read separately through the run tags index. Runs without a
+        valid priority tag have the default priority, so the runs with the default priority are
+        found by reading through the queue, skipping the runs with other priorities, until all of
+        them have been found.
+        """
+        queued_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED], tags=tags)
+        priority_tag_values: Dict[int, List[str]] = defaultdict(list)
+        num_prioritized_runs = 0
+        for (_, value), count in instance.get_run_tag_value_counts(
+            [PRIORITY_TAG], queued_filter
+        ).items():
+            priority = _get_priority(value)
+            priority_tag_values[priority].append(value)
+            if priority != 0:
+                num_prioritized_runs += count
+
+        num_default_priority_runs = instance.get_runs_count(queued_filter) - num_prioritized_runs
+        for priority in sorted({*priority_tag_values.keys(), 0}, reverse=True):
+            if priority == 0:
+                if num_default_priority_runs > 0:
+                    yield from self._iter_queued_runs(
+                        instance,
+                        tags,
+                        lambda run: _get_priority(run.tags.get(PRIORITY_TAG)) == 0,
+                        num_default_priority_runs,
+                    )
+            else:
+                yield from self._iter_queued_runs(
+                    instance, {**tags, PRIORITY_TAG: priority_tag_values[priority]}, None, None
+                )
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _iter_queued_runs(
+        self,
+        instance: DagsterInstance,
+        tags: Optional[Mapping[str, Sequence[str]]],
+        predicate: Optional[Callable[[DagsterRun], bool]],
+        num_matching_runs: Optional[int],
+    ) -> Iterator[Sequence[DagsterRun]]:
+        # Paginate through our runs list so we don't need to hold every run in memory at once.
+        cursor = None
+        num_found = 0
+        while True:
+            queued_runs = instance.get_runs(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED], tags=tags or {}),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            if not queued_runs:
+                return
+
+            matching_runs = [run for run in queued_runs if predicate is None or predicate(run)]
+            yield matching_runs
+
+            num_found += len(matching_runs)
+            if len(queued_runs) < self._page_size or (
+                num_matching_runs is not None and num_found >= num_matching_runs
+            ):
+                return
+            cursor = queued_runs[-1].run_id
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
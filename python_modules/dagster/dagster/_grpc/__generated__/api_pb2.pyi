@@ -488,6 +488,27 @@ class StreamingExternalRepositoryEvent(google.protobuf.message.Message):
 
 global___StreamingExternalRepositoryEvent = StreamingExternalRepositoryEvent
 
+@typing_extensions.final
+class ExternalRepositoryDiffRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SERIALIZED_REPOSITORY_SNAP_DIFF_ARGS_FIELD_NUMBER: builtins.int
+    serialized_repository_snap_diff_args: builtins.str
+    def __init__(
+        self,
+        *,
+        serialized_repository_snap_diff_args: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "serialized_repository_snap_diff_args",
+            b"serialized_repository_snap_diff_args",
+        ],
+    ) -> None: ...
+
+global___ExternalRepositoryDiffRequest = ExternalRepositoryDiffRequest
+
 @typing_extensions.final
 class ExternalScheduleExecutionRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -1,13 +1,20 @@
+import asyncio
 import os
 import sys
+import threading
+import weakref
+from collections import OrderedDict
 from contextlib import asynccontextmanager, contextmanager
 from threading import Event
 from typing import (
     Any,
     AsyncIterable,
     AsyncIterator,
+    Callable,
     Dict,
+    Hashable,
     Iterator,
+    List,
     NoReturn,
     Optional,
     Sequence,
@@ -40,6 +47,7 @@
     PartitionArgs,
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
+    RepositorySnapDiffArgs,
     SensorExecutionArgs,
 )
 from dagster._grpc.utils import (
@@ -47,6 +55,8 @@
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    grpc_channel_pool_enabled,
+    grpc_keepalive_time_ms,
     max_rx_bytes,
     max_send_bytes,
 )
@@ -61,6 +71,167 @@
 DEFAULT_REPOSITORY_GRPC_TIMEOUT = default_repository_grpc_timeout()
 
 
+MAX_POOLED_CHANNELS = 64
+
+# Calls whose requests and responses are only a few bytes, for which compression only costs CPU.
+# Every other call carries serialized arguments or snapshots and is gzip compressed.
+UNCOMPRESSED_GRPC_METHODS = frozenset(
+    {
+        "Ping",
+        "Heartbeat",
+        "StreamingPing",
+        "GetServerId",
+        "GetCurrentImage",
+        "GetCurrentRuns",
+        "ShutdownServer",
+        "ReloadCode",
+    }
+)
+
+
+def get_grpc_compression(method: str) -> grpc.Compression:
+    return (
+        grpc.Compression.NoCompression
+        if method in UNCOMPRESSED_GRPC_METHODS
+        else grpc.Compression.Gzip
+    )
+
+
+class _PooledChannel:
+    def __init__(self, channel: Any):
+        self.channel = channel
+        self.num_active_calls = 0
+        self.evicted = False
+
+
+class GrpcChannelPool:
+    """Long-lived gRPC channels shared by every client of a server address.
+
+    gRPC channels are thread-safe and multiplex concurrent calls over a single HTTP/2 connection,
+    so the pool keeps one channel per key (the server address and channel options). A channel
+    that fails a call with UNAVAILABLE is evicted so that the next call reconnects, instead of
+    waiting out the channel's reconnect backoff. Evicted channels, and the least recently used
+    channels beyond `max_channels`, are closed once no call is using them.
+
+    Channels are not inherited across a fork: a child process starts with an empty pool.
+    """
+
+    def __init__(
+        self,
+        close_channel: Callable[[Any], None],
+        max_channels: int = MAX_POOLED_CHANNELS,
+    ):
+        self._close_channel = close_channel
+        self._max_channels = check.int_param(max_channels, "max_channels")
+        self._lock = threading.Lock()
+        self._channels: "OrderedDict[Hashable, _PooledChannel]" = OrderedDict()
+        self._pid = os.getpid()
+
+    def acquire(self, key: Hashable, create_channel: Callable[[], Any]) -> _PooledChannel:
+        to_close: List[_PooledChannel] = []
+        with self._lock:
+            if self._pid != os.getpid():
+                # the parent's channels are unusable after a fork, but are left for it to close
+                self._channels = OrderedDict()
+                self._pid = os.getpid()
+
+            pooled = self._channels.get(key)
+            if pooled is None:
+                pooled = _PooledChannel(create_channel())
+                self._channels[key] = pooled
+                while len(self._channels) > self._max_channels:
+                    _, evicted = self._channels.popitem(last=False)
+                    evicted.evicted = True
+                    if not evicted.num_active_calls:
+                        to_close.append(evicted)
+            else:
+                self._channels.move_to_end(key)
+
+            pooled.num_active_calls += 1
+
+        for evicted in to_close:
+            self._close_channel(evicted.channel)
+        return pooled
+
+    def release(self, pooled: _PooledChannel) -> None:
+        with self._lock:
+            pooled.num_active_calls -= 1
+            should_close = pooled.evicted and not pooled.num_active_calls
+
+        if should_close:
+            self._close_channel(pooled.channel)
+
+    def evict(self, key: Hashable, pooled: _PooledChannel) -> None:
+        """Stop handing out the given channel. Must be called while holding the channel."""
+        with self._lock:
+            if self._channels.get(key) is pooled:
+                del self._channels[key]
+            pooled.evicted = True
+
+    def clear(self) -> None:
+        with self._lock:
+            to_close = [pooled for pooled in self._channels.values() if not pooled.num_active_calls]
+            for pooled in self._channels.values():
+                pooled.evicted = True
+            self._channels = OrderedDict()
+
+        for pooled in to_close:
+            self._close_channel(pooled.channel)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._channels)
+
+
+def _is_unavailable_error(e: Exception) -> bool:
+    return isinstance(e, grpc.RpcError) and e.code() == grpc.StatusCode.UNAVAILABLE  # type: ignore  # (bad stubs)
+
+
+_channel_pool = GrpcChannelPool(close_channel=lambda channel: channel.close())
+
+# grpc.aio channels are bound to the event loop they were created on
+_async_channel_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GrpcChannelPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _close_async_channel(loop_ref: "weakref.ref[asyncio.AbstractEventLoop]", channel: Any) -> None:
+    loop = loop_ref()
+    # channels of a loop that has since closed can no longer be closed gracefully, and creating
+    # a task on that loop would raise
+    if loop is None or loop.is_closed():
+        return
+    loop.create_task(channel.close())
+
+
+def _drop_closed_loop_channel_pools() -> None:
+    for loop in list(_async_channel_pools.keys()):
+        if loop.is_closed():
+            _async_channel_pools.pop(loop, None)
+
+
+def _get_async_channel_pool() -> GrpcChannelPool:
+    loop = asyncio.get_running_loop()
+    pool = _async_channel_pools.get(loop)
+    if pool is None:
+        _drop_closed_loop_channel_pools()
+        # only hold the loop weakly so that the pool does not keep its own key alive
+        loop_ref = weakref.ref(loop)
+        pool = GrpcChannelPool(
+            close_channel=lambda channel: _close_async_channel(loop_ref, channel)
+        )
+        _async_channel_pools[loop] = pool
+    return pool
+
+
+def clear_grpc_channel_pools() -> None:
+    """Close the pooled channels to every server, e.g. once the servers have been shut down."""
+    _channel_pool.clear()
+    _drop_closed_loop_channel_pools()
+    for pool in list(_async_channel_pools.values()):
+        pool.clear()
+
+
 def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event) -> None:
     while True:
         shutdown_event.wait(CLIENT_HEARTBEAT_INTERVAL)
@@ -91,6 +262,7 @@ def __init__(
         self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
 
         self._metadata = check.opt_sequence_param(metadata, "metadata")
+        self._use_channel_pool = grpc_channel_pool_enabled()
 
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
@@ -119,13 +291,18 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
-        options = [
+    def _channel_options(self) -> Sequence[Tuple[str, Any]]:
+        return [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            ("grpc.keepalive_time_ms", grpc_keepalive_time_ms()),
+            ("grpc.keepalive_timeout_ms", 20000),
+            # only send keepalive pings while a call is in flight, which servers permit by default
+            ("grpc.keepalive_permit_without_calls", 0),
         ]
-        with (
+
+    def _create_channel(self, options: Sequence[Tuple[str, Any]]) -> grpc.Channel:
+        return (
             grpc.secure_channel(
                 self._server_address,
                 self._ssl_creds,
@@ -138,16 +315,10 @@ def _channel(self) -> Iterator[grpc.Channel]:
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-        ) as channel:
-            yield channel
+        )
 
-    @asynccontextmanager
-    async def _async_channel(self) -> AsyncIterator[grpc.Channel]:
-        options = [
-            ("grpc.max_receive_message_length", max_rx_bytes()),
-            ("grpc.max_send_message_length", max_send_bytes()),
-        ]
-        async with (
+    def _create_async_channel(self, options: Sequence[Tuple[str, Any]]) -> grpc.aio.Channel:
+        return (
             grpc.aio.secure_channel(
                 self._server_address,
                 self._ssl_creds,
@@ -160,8 +331,46 @@ async def _async_channel(self) -> AsyncIterator[grpc.Channel]:
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-        ) as channel:
-            yield channel
+        )
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        options = self._channel_options()
+        if not self._use_channel_pool:
+            with self._create_channel(options) as channel:
+                yield channel
+            return
+
+        key = (self._server_address, self._use_ssl, tuple(options))
+        pooled = _channel_pool.acquire(key, lambda: self._create_channel(options))
+        try:
+            yield pooled.channel
+        except Exception as e:
+            if _is_unavailable_error(e):
+                _channel_pool.evict(key, pooled)
+            raise
+        finally:
+            _channel_pool.release(pooled)
+
+    @asynccontextmanager
+    async def _async_channel(self) -> AsyncIterator[grpc.aio.Channel]:
+        options = self._channel_options()
+        if not self._use_channel_pool:
+            async with self._create_async_channel(options) as channel:
+                yield channel
+            return
+
+        pool = _get_async_channel_pool()
+        key = (self._server_address, self._use_ssl, tuple(options))
+        pooled = pool.acquire(key, lambda: self._create_async_channel(options))
+        try:
+            yield pooled.channel
+        except Exception as e:
+            if _is_unavailable_error(e):
+                pool.evict(key, pooled)
+            raise
+        finally:
+            pool.release(pooled)
 
     def _get_response(
         self,
@@ -171,7 +380,12 @@ def _get_response(
     ):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(
+                request,
+                metadata=self._metadata,
+                timeout=timeout,
+                compression=get_grpc_compression(method),
+            )
 
     async def _gen_response(
         self,
@@ -181,7 +395,12 @@ async def _gen_response(
     ):
         async with self._async_channel() as channel:
             stub = DagsterApiStub(channel)
-            return await getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return await getattr(stub, method)(
+                request,
+                metadata=self._metadata,
+                timeout=timeout,
+                compression=get_grpc_compression(method),
+            )
 
     def _raise_grpc_exception(
         self,
@@ -240,7 +459,12 @@ def _get_streaming_response(
     ) -> Iterator[Any]:
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            yield from getattr(stub, method)(
+                request,
+                metadata=self._metadata,
+                timeout=timeout,
+                compression=get_grpc_compression(method),
+            )
 
     async def _gen_streaming_response(
         self,
@@ -251,7 +475,10 @@ async def _gen_streaming_response(
         async with self._async_channel() as channel:
             stub = DagsterApiStub(channel)
             async for response in getattr(stub, method)(
-                request, metadata=self._metadata, timeout=timeout
+                request,
+                metadata=self._metadata,
+                timeout=timeout,
+                compression=get_grpc_compression(method),
             ):
                 yield response
 
@@ -492,6 +719,76 @@ async def gen_streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def external_repository_diff(
+        self,
+        repository_snap_diff_args: RepositorySnapDiffArgs,
+        timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+    ) -> str:
+        """Returns a serialized RepositorySnapDiff, or a serialized RepositorySnap from servers
+        that predate repository diffs.
+        """
+        check.inst_param(
+            repository_snap_diff_args, "repository_snap_diff_args", RepositorySnapDiffArgs
+        )
+
+        try:
+            chunks = list(
+                self._streaming_query(
+                    "StreamingExternalRepositoryDiff",
+                    api_pb2.ExternalRepositoryDiffRequest,
+                    timeout=timeout,
+                    serialized_repository_snap_diff_args=serialize_value(repository_snap_diff_args),
+                )
+            )
+            return "".join([chunk.serialized_chunk for chunk in chunks])
+        except Exception as e:
+            # On older servers without repository diffs, fall back to fetching the whole repository
+            if self._is_unimplemented_error(e):
+                chunks = list(
+                    self.streaming_external_repository(
+                        repository_snap_diff_args.repository_origin,
+                        defer_snapshots=repository_snap_diff_args.defer_snapshots,
+                        timeout=timeout,
+                    )
+                )
+                return "".join([chunk["serialized_external_repository_chunk"] for chunk in chunks])
+            else:
+                raise
+
+    async def gen_external_repository_diff(
+        self,
+        repository_snap_diff_args: RepositorySnapDiffArgs,
+        timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+    ) -> str:
+        check.inst_param(
+            repository_snap_diff_args, "repository_snap_diff_args", RepositorySnapDiffArgs
+        )
+
+        try:
+            chunks = [
+                chunk
+                async for chunk in self._gen_streaming_query(
+                    "StreamingExternalRepositoryDiff",
+                    api_pb2.ExternalRepositoryDiffRequest,
+                    timeout=timeout,
+                    serialized_repository_snap_diff_args=serialize_value(repository_snap_diff_args),
+                )
+            ]
+            return "".join([chunk.serialized_chunk for chunk in chunks])
+        except Exception as e:
+            if self._is_unimplemented_error(e):
+                chunks = [
+                    chunk
+                    async for chunk in self.gen_streaming_external_repository(
+                        repository_snap_diff_args.repository_origin,
+                        defer_snapshots=repository_snap_diff_args.defer_snapshots,
+                        timeout=timeout,
+                    )
+                ]
+                return "".join([chunk["serialized_external_repository_chunk"] for chunk in chunks])
+            else:
+                raise
+
     def _is_unimplemented_error(self, e: Exception) -> bool:
         return (
             isinstance(e.__cause__, grpc.RpcError)
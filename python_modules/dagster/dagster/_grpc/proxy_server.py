@@ -215,6 +215,9 @@ def GetCurrentImage(self, request, context):
     def StreamingExternalRepository(self, request, context):
         return self._streaming_query("StreamingExternalRepository", request, context)
 
+    def StreamingExternalRepositoryDiff(self, request, context):
+        return self._streaming_query("StreamingExternalRepositoryDiff", request, context)
+
     def Heartbeat(self, request, context):
         return self._query("Heartbeat", request, context)
 
@@ -51,6 +51,8 @@
     RemoteJobSubsetResult,
     RepositoryErrorSnap,
     RepositorySnap,
+    RepositorySnapDiff,
+    RepositorySnapManifest,
     ScheduleExecutionErrorSnap,
     SensorExecutionErrorSnap,
 )
@@ -97,6 +99,7 @@
     PartitionArgs,
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
+    RepositorySnapDiffArgs,
     SensorExecutionArgs,
     ShutdownServerResult,
     StartRunResult,
@@ -383,6 +386,13 @@ def __init__(
         self._termination_times: Dict[str, float] = {}
         self._execution_lock = threading.Lock()
 
+        # Repository manifests and their sub-snapshots by snapshot id, keyed by repository name and
+        # whether job snapshots are deferred. The loaded definitions never change, so neither do these.
+        self._repository_snap_manifests: Dict[
+            Tuple[str, bool], Tuple[RepositorySnapManifest, Mapping[str, Any]]
+        ] = {}
+        self._repository_snap_manifest_lock = threading.Lock()
+
         self._serializable_load_error = None
 
         self._entry_point = (
@@ -536,7 +546,8 @@ def ReloadCode(
         return api_pb2.ReloadCodeReply()
 
     @retrieve_metrics()
-    def Ping(self, request, _context: grpc.ServicerContext) -> api_pb2.PingReply:
+    def Ping(self, request, context: grpc.ServicerContext) -> api_pb2.PingReply:
+        context.set_compression(grpc.Compression.NoCompression)
         echo = request.echo
 
         return api_pb2.PingReply(
@@ -555,15 +566,17 @@ def StreamingPing(
             yield api_pb2.StreamingPingEvent(sequence_number=sequence_number, echo=echo)
 
     def Heartbeat(
-        self, request: api_pb2.StreamingPingRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.StreamingPingRequest, context: grpc.ServicerContext
     ) -> api_pb2.PingReply:
+        context.set_compression(grpc.Compression.NoCompression)
         self.__last_heartbeat_time = time.time()
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
     def GetServerId(
-        self, _request: api_pb2.Empty, _context: grpc.ServicerContext
+        self, _request: api_pb2.Empty, context: grpc.ServicerContext
     ) -> api_pb2.GetServerIdReply:
+        context.set_compression(grpc.Compression.NoCompression)
         return api_pb2.GetServerIdReply(server_id=self._server_id)
 
     def ExecutionPlanSnapshot(
@@ -854,6 +867,56 @@ def StreamingExternalRepository(
                 ],
             )
 
+    def _get_repository_snap_manifest(
+        self, repository_origin: RemoteRepositoryOrigin, defer_snapshots: bool
+    ) -> Tuple[RepositorySnapManifest, Mapping[str, Any]]:
+        key = (repository_origin.repository_name, defer_snapshots)
+        with self._repository_snap_manifest_lock:
+            if key not in self._repository_snap_manifests:
+                self._repository_snap_manifests[key] = RepositorySnapManifest.from_repository_snap(
+                    RepositorySnap.from_def(
+                        self._get_repo_for_origin(repository_origin),
+                        defer_snapshots=defer_snapshots,
+                    )
+                )
+            return self._repository_snap_manifests[key]
+
+    def _get_serialized_external_repository_diff(
+        self, request: api_pb2.ExternalRepositoryDiffRequest
+    ) -> str:
+        try:
+            args = deserialize_value(
+                request.serialized_repository_snap_diff_args,
+                RepositorySnapDiffArgs,
+            )
+
+            manifest, parts = self._get_repository_snap_manifest(
+                args.repository_origin, args.defer_snapshots
+            )
+            known_snapshot_ids = set(args.known_snapshot_ids)
+            return serialize_value(
+                RepositorySnapDiff(
+                    manifest=manifest,
+                    parts={
+                        snapshot_id: part
+                        for snapshot_id, part in parts.items()
+                        if snapshot_id not in known_snapshot_ids
+                    },
+                )
+            )
+        except Exception:
+            _maybe_log_exception(self._logger, "RepositoryDiff")
+            return serialize_value(
+                RepositoryErrorSnap(error=serializable_error_info_from_exc_info(sys.exc_info()))
+            )
+
+    def StreamingExternalRepositoryDiff(
+        self, request: api_pb2.ExternalRepositoryDiffRequest, _context: grpc.ServicerContext
+    ) -> Iterable[api_pb2.StreamingChunkEvent]:
+        yield from self._split_serialized_data_into_chunk_events(
+            self._get_serialized_external_repository_diff(request)
+        )
+
     def _split_serialized_data_into_chunk_events(
         self, serialized_data: str
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
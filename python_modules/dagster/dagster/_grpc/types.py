@@ -702,6 +702,36 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class RepositorySnapDiffArgs(
+    NamedTuple(
+        "_RepositorySnapDiffArgs",
+        [
+            ("repository_origin", RemoteRepositoryOrigin),
+            # snapshot ids of the sub-snapshots that the client already holds
+            ("known_snapshot_ids", Sequence[str]),
+            ("defer_snapshots", bool),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        repository_origin: RemoteRepositoryOrigin,
+        known_snapshot_ids: Sequence[str],
+        defer_snapshots: bool = False,
+    ):
+        return super(RepositorySnapDiffArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", RemoteRepositoryOrigin
+            ),
+            known_snapshot_ids=check.sequence_param(
+                known_snapshot_ids, "known_snapshot_ids", of_type=str
+            ),
+            defer_snapshots=check.bool_param(defer_snapshots, "defer_snapshots"),
+        )
+
+
 @whitelist_for_serdes
 class ShutdownServerResult(
     NamedTuple(
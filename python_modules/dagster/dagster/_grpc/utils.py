@@ -13,6 +13,7 @@
 
 _DEFAULT_GRPC_TIMEOUT_IF_NO_ENV_VAR_SET = 60
 _DEFAULT_REPOSITORY_TIMEOUT_IF_NO_ENV_VAR_SET = 180
+_DEFAULT_GRPC_KEEPALIVE_TIME_MS_IF_NO_ENV_VAR_SET = 5 * 60 * 1000
 
 
 def get_loadable_targets(
@@ -128,3 +129,18 @@ def default_grpc_server_shutdown_grace_period():
     return max(
         default_grpc_timeout(), default_schedule_grpc_timeout(), default_sensor_grpc_timeout()
     )
+
+
+def grpc_channel_pool_enabled() -> bool:
+    # Clients share long-lived channels to each server address unless
+    # DAGSTER_GRPC_DISABLE_CHANNEL_POOL is set, in which case every call opens its own channel
+    return not os.getenv("DAGSTER_GRPC_DISABLE_CHANNEL_POOL")
+
+
+def grpc_keepalive_time_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIME_MS")
+    if env_set:
+        return int(env_set)
+
+    # servers reject keepalive pings sent more often than every 5 minutes by default
+    return _DEFAULT_GRPC_KEEPALIVE_TIME_MS_IF_NO_ENV_VAR_SET
@@ -25,9 +25,12 @@ def get_fixed_minute_interval(cron_schedule: str) -> Optional[int]:
 
     # To match this criteria, every other field besides the first must end in *
     # since it must be an every-n-minutes cronstring like */15
-    if not is_wildcard[1:]:
+    if len(cron_parts) != 5 or not all(is_wildcard[1:]):
         return None
 
+    if cron_parts[0] == "*":
+        return 1
+
     if not cron_parts[0].startswith("*/"):
         return None
 
@@ -1,7 +1,7 @@
 import re
 import warnings
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import dagster._seven as seven
 from dagster import _check as check
@@ -13,8 +13,30 @@
     from dagster._core.storage.dagster_run import DagsterRun
 
 
+def get_shard_share(
+    total: int, shard_index: int, shard_indices: Sequence[int], rotation: int = 0
+) -> int:
+    """Splits a total across the given shards, so that the shares of all shards add up to the
+    total. Shards that are not given get no share. What is left over after an even split is given
+    one at a time to the shards in turn, starting at `rotation`, so that as the rotation advances
+    every shard gets a share of totals smaller than the number of shards.
+    """
+    if shard_index not in shard_indices:
+        return 0
+
+    num_shards = len(shard_indices)
+    position = (sorted(shard_indices).index(shard_index) - rotation) % num_shards
+    return total // num_shards + (1 if position < total % num_shards else 0)
+
+
 class TagConcurrencyLimitsCounter:
-    """Helper object that keeps track of when the tag concurrency limits are met."""
+    """Helper object that keeps track of when the tag concurrency limits are met.
+
+    In-progress items can be passed either directly, or as counts of the in-progress items with
+    each (key, value) tag pair. When the items are being launched by one of several shards, each
+    shard may only launch its share of the remaining room under each limit (see `get_shard_share`),
+    so that the shards together do not exceed it.
+    """
 
     _key_limits: Dict[str, int]
     _key_value_limits: Dict[Tuple[str, str], int]
@@ -22,14 +44,25 @@ class TagConcurrencyLimitsCounter:
     _key_counts: Dict[str, int]
     _key_value_counts: Dict[Tuple[str, str], int]
     _unique_value_counts: Dict[Tuple[str, str], int]
+    _launched_key_counts: Dict[str, int]
+    _launched_key_value_counts: Dict[Tuple[str, str], int]
+    _launched_unique_value_counts: Dict[Tuple[str, str], int]
 
     def __init__(
         self,
         tag_concurrency_limits: Sequence[Mapping[str, Any]],
         in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep"]],
+        in_progress_tag_counts: Optional[Mapping[Tuple[str, str], int]] = None,
+        shard_index: int = 0,
+        shard_indices: Optional[Sequence[int]] = None,
+        shard_rotation: int = 0,
     ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
         check.list_param(in_progress_tagged_items, "in_progress_tagged_items")
+        check.opt_mapping_param(in_progress_tag_counts, "in_progress_tag_counts")
+        self._shard_index = check.int_param(shard_index, "shard_index")
+        self._shard_indices = check.opt_sequence_param(shard_indices, "shard_indices", of_type=int)
+        self._shard_rotation = check.int_param(shard_rotation, "shard_rotation")
 
         self._key_limits = {}
         self._key_value_limits = {}
@@ -50,27 +83,87 @@ def __init__(
         self._key_counts = defaultdict(lambda: 0)
         self._key_value_counts = defaultdict(lambda: 0)
         self._unique_value_counts = defaultdict(lambda: 0)
+        self._launched_key_counts = defaultdict(lambda: 0)
+        self._launched_key_value_counts = defaultdict(lambda: 0)
+        self._launched_unique_value_counts = defaultdict(lambda: 0)
 
         # initialize counters based on current in progress item
         for item in in_progress_tagged_items:
-            self.update_counters_with_launched_item(item)
+            for key, value in item.tags.items():
+                self._add_to_counts(
+                    key,
+                    value,
+                    1,
+                    self._key_counts,
+                    self._key_value_counts,
+                    self._unique_value_counts,
+                )
+        for (key, value), count in (in_progress_tag_counts or {}).items():
+            self._add_to_counts(
+                key,
+                value,
+                count,
+                self._key_counts,
+                self._key_value_counts,
+                self._unique_value_counts,
+            )
+
+    @property
+    def tag_keys(self) -> Set[str]:
+        """The tag keys that the limits apply to."""
+        return {
+            *self._key_limits.keys(),
+            *(key for key, _ in self._key_value_limits.keys()),
+            *self._unique_value_limits.keys(),
+        }
+
+    def _add_to_counts(
+        self,
+        key: str,
+        value: str,
+        count: int,
+        key_counts: Dict[str, int],
+        key_value_counts: Dict[Tuple[str, str], int],
+        unique_value_counts: Dict[Tuple[str, str], int],
+    ) -> None:
+        if key in self._key_limits:
+            key_counts[key] += count
+
+        tag_tuple = (key, value)
+        if tag_tuple in self._key_value_limits:
+            key_value_counts[tag_tuple] += count
+
+        if key in self._unique_value_limits:
+            unique_value_counts[tag_tuple] += count
+
+    def _is_limit_reached(self, limit: int, in_progress_count: int, launched_count: int) -> bool:
+        remaining = max(limit - in_progress_count, 0)
+        if self._shard_indices:
+            remaining = get_shard_share(
+                remaining, self._shard_index, self._shard_indices, self._shard_rotation
+            )
+        return launched_count >= remaining
 
     def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
         """True if there are in progress item which are blocking this item based on tag limits."""
         for key, value in item.tags.items():
-            if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
+            if key in self._key_limits and self._is_limit_reached(
+                self._key_limits[key], self._key_counts[key], self._launched_key_counts[key]
+            ):
                 return True
 
             tag_tuple = (key, value)
-            if (
-                tag_tuple in self._key_value_limits
-                and self._key_value_counts[tag_tuple] >= self._key_value_limits[tag_tuple]
+            if tag_tuple in self._key_value_limits and self._is_limit_reached(
+                self._key_value_limits[tag_tuple],
+                self._key_value_counts[tag_tuple],
+                self._launched_key_value_counts[tag_tuple],
             ):
                 return True
 
-            if (
-                key in self._unique_value_limits
-                and self._unique_value_counts[tag_tuple] >= self._unique_value_limits[key]
+            if key in self._unique_value_limits and self._is_limit_reached(
+                self._unique_value_limits[key],
+                self._unique_value_counts[tag_tuple],
+                self._launched_unique_value_counts[tag_tuple],
             ):
                 return True
 
@@ -81,15 +174,14 @@ def update_counters_with_launched_item(
     ) -> None:
         """Add a new in progress item to the counters."""
         for key, value in item.tags.items():
-            if key in self._key_limits:
-                self._key_counts[key] += 1
-
-            tag_tuple = (key, value)
-            if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
-
-            if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+            self._add_to_counts(
+                key,
+                value,
+                1,
+                self._launched_key_counts,
+                self._launched_key_value_counts,
+                self._launched_unique_value_counts,
+            )
 
 
 def get_boolean_tag_value(tag_value: Optional[str], default_value: bool = False) -> bool:
@@ -19,12 +19,14 @@
     DISABLE_FAST_EXTRACT_ENV_VAR,
     JobDataSnap,
     JobRefSnap,
+    RepositorySnapDiff,
     extract_serialized_job_snap_from_serialized_job_data_snap,
 )
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.types import RepositorySnapDiffArgs
 from dagster._serdes.serdes import deserialize_value, get_storage_fields
 from dagster._serdes.utils import hash_str
 from dagster._utils.env import environ
@@ -76,6 +78,59 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+def test_external_repository_diff(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        repository_snap = deserialize_value(
+            code_location.client.external_repository(repo_origin), RepositorySnap
+        )
+
+        diff = deserialize_value(
+            code_location.client.external_repository_diff(
+                RepositorySnapDiffArgs(repository_origin=repo_origin, known_snapshot_ids=[])
+            ),
+            RepositorySnapDiff,
+        )
+        manifest = diff.manifest
+        assert manifest.repository_snap.job_datas == []
+        assert len(manifest.part_ids["job_datas"]) == 7
+        assert "job_refs" not in manifest.part_ids
+        assert set(diff.parts.keys()) == {
+            snapshot_id for ids in manifest.part_ids.values() for snapshot_id in ids
+        }
+        assert manifest.assemble(diff.parts) == repository_snap
+
+        known_snapshot_ids = manifest.part_ids["job_datas"][:3]
+        partial_diff = deserialize_value(
+            code_location.client.external_repository_diff(
+                RepositorySnapDiffArgs(
+                    repository_origin=repo_origin, known_snapshot_ids=known_snapshot_ids
+                )
+            ),
+            RepositorySnapDiff,
+        )
+        assert partial_diff.manifest == manifest
+        assert set(partial_diff.parts.keys()) == set(diff.parts.keys()) - set(known_snapshot_ids)
+
+
+def test_streaming_external_repositories_reuses_unchanged_parts(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        first = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )["bar_repo"]
+        second = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )["bar_repo"]
+
+        assert first == second
+        assert all(
+            first_job_data is second_job_data
+            for first_job_data, second_job_data in zip(
+                first.get_job_datas(), second.get_job_datas()
+            )
+        )
+
+
 @op
 def do_something():
     return 1
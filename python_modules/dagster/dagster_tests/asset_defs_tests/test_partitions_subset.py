@@ -1,9 +1,22 @@
+import pickle
+import random
 from typing import cast
 from unittest.mock import Mock
 
+import dagster._core.definitions.partition as partition_module
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    HourlyPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
@@ -82,7 +95,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
 
 
@@ -209,3 +222,158 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_time_window_partitions_subset_set_operations_match_partition_keys(seed: int) -> None:
+    rng = random.Random(seed)
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2023-01-01-00:00", end_date="2023-01-08-00:00"
+    )
+    all_keys = partitions_def.get_partition_keys()
+
+    def _random_fragmented_subset() -> TimeWindowPartitionsSubset:
+        keys = [key for key in all_keys if rng.random() < 0.5]
+        return cast(
+            TimeWindowPartitionsSubset, partitions_def.empty_subset().with_partition_keys(keys)
+        )
+
+    a, b = _random_fragmented_subset(), _random_fragmented_subset()
+    a_keys, b_keys = set(a.get_partition_keys()), set(b.get_partition_keys())
+    assert len(a) == len(a_keys)
+
+    for result, expected in [
+        (a & b, a_keys & b_keys),
+        (a | b, a_keys | b_keys),
+        (a - b, a_keys - b_keys),
+    ]:
+        assert set(result.get_partition_keys()) == expected
+        assert len(result) == len(expected)
+        assert all(key in result for key in expected)
+        windows = cast(TimeWindowPartitionsSubset, result).included_time_windows
+        assert all(
+            windows[i].end.timestamp() <= windows[i + 1].start.timestamp()
+            for i in range(len(windows) - 1)
+        )
+
+    # adding keys that are already included does not change the number of partitions
+    a_with_b = a.with_partition_keys(b_keys)
+    assert len(a_with_b) == len(a_keys | b_keys)
+    assert a_with_b == a | b
+
+    assert set(a.get_partition_keys_not_in_subset(partitions_def)) == set(all_keys) - a_keys
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bitmap_partitions_subset_set_operations_match_partition_keys(seed: int) -> None:
+    rng = random.Random(seed)
+    partitions_def = StaticPartitionsDefinition([f"customer_{i}" for i in range(100)])
+    all_keys = partitions_def.get_partition_keys()
+
+    a_keys = {key for key in all_keys if rng.random() < 0.5}
+    b_keys = {key for key in all_keys if rng.random() < 0.5}
+    a = partitions_def.empty_subset().with_partition_keys(a_keys)
+    b = partitions_def.subset_with_partition_keys(b_keys)
+    assert isinstance(a, BitmapPartitionsSubset)
+    assert len(a) == len(a_keys)
+
+    for result, expected in [
+        (a & b, a_keys & b_keys),
+        (a | b, a_keys | b_keys),
+        (a - b, a_keys - b_keys),
+        (a | DefaultPartitionsSubset(b_keys), a_keys | b_keys),
+        (a - DefaultPartitionsSubset(b_keys), a_keys - b_keys),
+    ]:
+        assert isinstance(result, BitmapPartitionsSubset)
+        assert result.get_partition_keys() == expected
+        assert len(result) == len(expected)
+        assert all((key in result) == (key in expected) for key in all_keys)
+        assert result == DefaultPartitionsSubset(expected)
+        assert DefaultPartitionsSubset(expected) == result
+
+    assert set(a.get_partition_keys_not_in_subset(partitions_def)) == set(all_keys) - a_keys
+    assert a.get_partition_key_ranges(partitions_def) == DefaultPartitionsSubset(
+        a_keys
+    ).get_partition_key_ranges(partitions_def)
+
+
+def test_bitmap_partitions_subset_serialization() -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    subset = partitions_def.subset_with_partition_keys(["c", "a"])
+    default_subset = DefaultPartitionsSubset({"a", "c"})
+
+    # stored in the same format as DefaultPartitionsSubset
+    assert subset.serialize() == default_subset.serialize()
+    assert serialize_value(subset) == serialize_value(default_subset)  # type: ignore
+    assert deserialize_value(serialize_value(subset), DefaultPartitionsSubset) == default_subset  # type: ignore
+
+    deserialized = partitions_def.deserialize_subset(default_subset.serialize())
+    assert isinstance(deserialized, BitmapPartitionsSubset)
+    assert deserialized == subset
+
+    unpickled = pickle.loads(pickle.dumps(subset))
+    assert unpickled == subset
+    assert "c" in unpickled and "b" not in unpickled
+
+
+def test_dynamic_bitmap_partitions_subset() -> None:
+    # separately loaded copies of a definition have their own ordinals, but still combine
+    subset = DynamicPartitionsDefinition(name="bitmap_customers").empty_subset()
+    other_subset = DynamicPartitionsDefinition(name="bitmap_customers").empty_subset()
+    assert isinstance(subset, BitmapPartitionsSubset)
+
+    subset = subset.with_partition_keys(["x", "y"])
+    other_subset = other_subset.with_partition_keys(["z", "y"])
+    assert (subset & other_subset).get_partition_keys() == {"y"}
+    assert (subset | other_subset).get_partition_keys() == {"x", "y", "z"}
+    assert (subset - other_subset).get_partition_keys() == {"x"}
+
+    assert isinstance(
+        DynamicPartitionsDefinition(lambda _: ["x", "y"]).empty_subset(), DefaultPartitionsSubset
+    )
+
+
+def test_bitmap_partitions_subset_equality() -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    subset = partitions_def.subset_with_partition_keys(["a", "b"])
+    same_keys_subset = StaticPartitionsDefinition(["c", "b", "a"]).subset_with_partition_keys(
+        ["b", "a"]
+    )
+
+    for equal in [same_keys_subset, DefaultPartitionsSubset({"a", "b"})]:
+        assert subset == equal and equal == subset
+        assert not (subset != equal) and not (equal != subset)
+
+    other = DefaultPartitionsSubset({"a"})
+    assert subset != other and other != subset
+
+    # like DefaultPartitionsSubset, which compares equal to it
+    with pytest.raises(TypeError):
+        hash(subset)
+    with pytest.raises(TypeError):
+        hash(DefaultPartitionsSubset({"a", "b"}))
+
+
+def test_bitmap_partitions_subset_ordinals_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(partition_module, "MAX_ADDED_PARTITION_KEY_ORDINALS", 3)
+    partitions_def = DynamicPartitionsDefinition(name="bounded_customers")
+
+    subset = partitions_def.empty_subset().with_partition_keys(["a", "b"])
+    assert isinstance(subset, BitmapPartitionsSubset)
+
+    # no room to assign ordinals to both new keys, so the result is a set of keys
+    grown = subset.with_partition_keys(["c", "d"])
+    assert isinstance(grown, DefaultPartitionsSubset)
+    assert grown.get_partition_keys() == {"a", "b", "c", "d"}
+    assert (subset | DefaultPartitionsSubset({"d", "e"})).get_partition_keys() == {
+        "a",
+        "b",
+        "d",
+        "e",
+    }
+    assert len(partitions_def.partition_key_ordinals) == 3
+
+    # operations that do not add keys never assign ordinals
+    assert (subset - DefaultPartitionsSubset({"a", "x", "y"})).get_partition_keys() == {"b"}
+    assert (subset & DefaultPartitionsSubset({"b", "x", "y"})).get_partition_keys() == {"b"}
+    assert len(partitions_def.partition_key_ordinals) == 3
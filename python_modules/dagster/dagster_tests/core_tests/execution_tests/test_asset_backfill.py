@@ -1902,3 +1902,75 @@ def foo_check():
     run_request = result.run_requests[0]
     assert run_request.asset_selection == [foo.key]
     assert run_request.asset_check_keys == [foo_check.check_key]
+
+
+def test_asset_backfill_many_partitions_single_run():
+    partitions_def = HourlyPartitionsDefinition("2020-01-01-00:00")
+
+    @asset(partitions_def=partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream():
+        pass
+
+    @asset(
+        partitions_def=partitions_def,
+        backfill_policy=BackfillPolicy.single_run(),
+        deps=[upstream],
+    )
+    def downstream():
+        pass
+
+    assets_by_repo_name = {"repo": [upstream, downstream]}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+    current_time = create_datetime(2024, 1, 1, 0, 0, 0)
+    asset_backfill_data = AssetBackfillData.from_asset_graph_subset(
+        asset_graph_subset=AssetGraphSubset.all(
+            asset_graph, dynamic_partitions_store=MagicMock(), current_time=current_time
+        ),
+        backfill_start_timestamp=current_time.timestamp(),
+        dynamic_partitions_store=MagicMock(),
+    )
+
+    result = execute_asset_backfill_iteration_consume_generator(
+        "apple", asset_backfill_data, asset_graph, DagsterInstance.ephemeral()
+    )
+    assert len(result.run_requests) == 1
+    run_request = result.run_requests[0]
+    assert set(run_request.asset_selection or []) == {upstream.key, downstream.key}
+    assert run_request.tags[ASSET_PARTITION_RANGE_START_TAG] == "2020-01-01-00:00"
+    assert run_request.tags[ASSET_PARTITION_RANGE_END_TAG] == "2023-12-31-23:00"
+
+
+def test_self_dependent_asset_backfill_respects_max_partitions_per_run():
+    partitions_def = DailyPartitionsDefinition("2023-01-01")
+
+    @asset(
+        partitions_def=partitions_def,
+        backfill_policy=BackfillPolicy.multi_run(2),
+        deps=[
+            AssetDep(
+                "self_dependent",
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1),
+            )
+        ],
+    )
+    def self_dependent():
+        pass
+
+    assets_by_repo_name = {"repo": [self_dependent]}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+    asset_backfill_data = AssetBackfillData.from_asset_partitions(
+        asset_graph=asset_graph,
+        partition_names=["2023-01-02", "2023-01-03", "2023-01-04", "2023-01-05"],
+        asset_selection=[self_dependent.key],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=False,
+        backfill_start_timestamp=create_datetime(2023, 1, 10, 0, 0, 0).timestamp(),
+    )
+
+    result = execute_asset_backfill_iteration_consume_generator(
+        "apple", asset_backfill_data, asset_graph, DagsterInstance.ephemeral()
+    )
+    assert len(result.run_requests) == 1
+    run_request = result.run_requests[0]
+    assert run_request.tags[ASSET_PARTITION_RANGE_START_TAG] == "2023-01-02"
+    assert run_request.tags[ASSET_PARTITION_RANGE_END_TAG] == "2023-01-03"
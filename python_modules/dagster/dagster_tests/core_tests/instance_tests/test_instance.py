@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -25,18 +26,22 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.definitions_class import Definitions
 from dagster._core.definitions.events import AssetMaterialization, AssetObservation
+from dagster._core.definitions.graph_definition import GraphDefinition
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
 from dagster._core.errors import (
     DagsterHomeNotSetError,
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.snap import create_execution_plan_snapshot_id, snapshot_from_execution_plan
+from dagster._core.snap.snapshot_cache import SnapshotCache
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
 from dagster._core.storage.partition_status_cache import AssetPartitionStatus, AssetStatusCacheValue
 from dagster._core.storage.sqlite_storage import (
@@ -282,6 +287,193 @@ def test_create_execution_plan_snapshot():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)  # pyright: ignore[reportOptionalMemberAccess]
 
 
+def test_job_snapshot_cache():
+    with instance_for_test() as instance:
+        job_snapshot = noop_job.get_job_snapshot()
+        snapshot_id = job_snapshot.snapshot_id
+        instance.add_snapshot(job_snapshot)
+
+        def _count_snapshot_reads() -> int:
+            with patch.object(
+                instance._run_storage,  # noqa: SLF001
+                "fetchone",
+                wraps=instance._run_storage.fetchone,  # noqa: SLF001
+            ) as fetchone_mock:
+                assert instance.get_job_snapshot(snapshot_id).snapshot_id == snapshot_id
+                assert instance.get_job_snapshot(snapshot_id).snapshot_id == snapshot_id
+                assert (
+                    instance.get_historical_job(snapshot_id).computed_job_snapshot_id == snapshot_id
+                )
+                return fetchone_mock.call_count
+
+        # snapshots are only cached in long lived processes
+        assert _count_snapshot_reads() == 3
+
+        instance.enable_snapshot_cache()
+        assert _count_snapshot_reads() == 1
+        assert _count_snapshot_reads() == 0
+
+        instance.wipe()
+        assert instance.get_job_snapshot(snapshot_id) is None
+
+
+def _step_log_entry(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message=message,
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+    )
+
+
+def _step_start_entry(run_id: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(DagsterEventType.STEP_START.value, "my_job", step_key="my_step"),
+    )
+
+
+def test_run_event_buffer():
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "3",
+            "DAGSTER_RUN_EVENT_BUFFER_INTERVAL_SECONDS": "60",
+        }
+    ):
+        with instance_for_test() as instance:
+            run_id = create_run_for_test(instance, job_name="my_job").run_id
+            subscribed = []
+            instance.add_event_listener(run_id, subscribed.append)
+
+            # informational step events are held until a non-bufferable event for the run
+            instance.handle_new_event(_step_log_entry(run_id, "1"))
+            instance.handle_new_event(_step_log_entry(run_id, "2"))
+            assert instance.all_logs(run_id) == []
+            assert subscribed == []
+
+            instance.handle_new_event(_step_start_entry(run_id))
+            logs = instance.all_logs(run_id)
+            assert [log.user_message for log in logs[:2]] == ["1", "2"]
+            assert logs[2].dagster_event_type == DagsterEventType.STEP_START
+            assert len(subscribed) == 3
+
+            # or until the buffer is full
+            for message in ["3", "4", "5"]:
+                instance.handle_new_event(_step_log_entry(run_id, message))
+            assert [log.user_message for log in instance.all_logs(run_id)[3:]] == ["3", "4", "5"]
+
+            # or until the instance is disposed
+            instance.handle_new_event(_step_log_entry(run_id, "6"))
+            assert len(instance.all_logs(run_id)) == 6
+            instance.dispose()
+            assert instance.all_logs(run_id)[-1].user_message == "6"
+
+
+def test_run_event_buffer_interval():
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "100",
+            "DAGSTER_RUN_EVENT_BUFFER_INTERVAL_SECONDS": "0.1",
+        }
+    ):
+        with instance_for_test() as instance:
+            run_id = create_run_for_test(instance, job_name="my_job").run_id
+            instance.handle_new_event(_step_log_entry(run_id, "1"))
+
+            attempts = 20
+            while not instance.all_logs(run_id) and attempts:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert [log.user_message for log in instance.all_logs(run_id)] == ["1"]
+
+
+def test_run_event_buffer_only_holds_step_events():
+    def _run_log_entry(run_id: str) -> EventLogEntry:
+        return _step_log_entry(run_id, "run")._replace(step_key=None)
+
+    with instance_for_test() as instance:
+        # off by default
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+        instance.handle_new_event(_step_log_entry(run_id, "1"))
+        assert len(instance.all_logs(run_id)) == 1
+
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "3",
+            "DAGSTER_RUN_EVENT_BUFFER_INTERVAL_SECONDS": "60",
+        }
+    ):
+        with instance_for_test() as instance:
+            run_id = create_run_for_test(instance, job_name="my_job").run_id
+            instance.handle_new_event(_run_log_entry(run_id))
+            assert len(instance.all_logs(run_id)) == 1
+
+
+def test_run_event_buffer_keeps_failed_writes():
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "2",
+            "DAGSTER_RUN_EVENT_BUFFER_INTERVAL_SECONDS": "60",
+        }
+    ):
+        with instance_for_test() as instance:
+            run_id = create_run_for_test(instance, job_name="my_job").run_id
+            subscribed = []
+            instance.add_event_listener(run_id, subscribed.append)
+            event_storage = instance._event_storage  # noqa: SLF001
+
+            def _fail(*_args, **_kwargs):
+                raise Exception("storage unavailable")
+
+            # the full buffer fails to be written, and is kept to be written again
+            with (
+                patch.object(event_storage, "store_event_batch", _fail),
+                patch.object(event_storage, "store_event", _fail),
+            ):
+                instance.handle_new_event(_step_log_entry(run_id, "1"))
+                instance.handle_new_event(_step_log_entry(run_id, "2"))
+
+            assert instance.all_logs(run_id) == []
+            assert subscribed == []
+
+            instance.handle_new_event(_step_start_entry(run_id))
+            logs = instance.all_logs(run_id)
+            assert [log.user_message for log in logs[:2]] == ["1", "2"]
+            assert logs[2].dagster_event_type == DagsterEventType.STEP_START
+            assert len(subscribed) == 3
+
+
+def test_snapshot_cache_evicts_by_size():
+    snapshots = [
+        GraphDefinition(name=f"job_{i}", node_defs=[]).to_job().get_job_snapshot() for i in range(3)
+    ]
+    snapshot_size = 100
+
+    cache = SnapshotCache(max_bytes=snapshot_size * 2 + 1)
+    cache.put("a", snapshots[0], snapshot_size)
+    cache.put("b", snapshots[1], snapshot_size)
+    assert cache.get("a") is snapshots[0]  # "b" is now least recently used
+    cache.put("c", snapshots[2], snapshot_size)
+    assert "b" not in cache
+    assert cache.get("a") is snapshots[0]
+    assert cache.get("c") is snapshots[2]
+    assert cache.total_bytes == snapshot_size * 2
+
+    cache.put("d", snapshots[0], snapshot_size * 3)
+    assert "d" not in cache
+
+    disabled = SnapshotCache(max_bytes=0)
+    disabled.put("a", snapshots[0], snapshot_size)
+    assert disabled.get("a") is None
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -1,6 +1,7 @@
 import datetime
 import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from typing import Any, Iterator
 
 import pytest
@@ -12,7 +13,7 @@
 from dagster._core.remote_representation.external import RemoteJob
 from dagster._core.remote_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.remote_representation.origin import ManagedGrpcPythonEnvCodeLocationOrigin
-from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus
+from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.test_utils import (
     create_run_for_test,
@@ -24,7 +25,10 @@
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget, PythonFileTarget
-from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
+    QueuedRunCoordinatorDaemon,
+    get_location_shard,
+)
 from dagster._record import copy
 from dagster._time import create_datetime
 from dagster._utils import file_relative_path
@@ -85,7 +89,7 @@ def concurrency_limited_workspace_context(self, instance):
     def other_location_job_handle(self, job_handle: JobHandle) -> JobHandle:
         code_location_origin = job_handle.repository_handle.code_location_origin
         assert isinstance(code_location_origin, ManagedGrpcPythonEnvCodeLocationOrigin)
-        new_origin = code_location_origin._replace(location_name="other_location_name")
+        new_origin = code_location_origin._replace(location_name="another_location_name")
         with instance_for_test() as temp_instance:
             with new_origin.create_single_location(temp_instance) as location:
                 new_repo_handle = RepositoryHandle.from_location(
@@ -586,6 +590,109 @@ def test_limits_per_unique_value_overlapping_limits_greater_than(
             run_id_4,
         }
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=3, dequeue_shards={"num_shards": 2, "shard_index": 0}),
+            dict(max_concurrent_runs=3, dequeue_shards={"num_shards": 2, "shard_index": 1}),
+        ],
+    )
+    def test_dequeue_shards(
+        self,
+        instance,
+        workspace_context,
+        daemon,
+        job_handle,
+        other_location_job_handle,
+        run_coordinator_config,
+    ):
+        shard_index = run_coordinator_config["dequeue_shards"]["shard_index"]
+        run_ids_by_shard = defaultdict(list)
+        for handle in [job_handle, other_location_job_handle]:
+            shard = get_location_shard(handle.location_name, 2)
+            for _ in range(3):
+                run_id = make_new_run_id()
+                self.create_queued_run(instance, handle, run_id=run_id)
+                run_ids_by_shard[shard].append(run_id)
+
+        list(daemon.run_iteration(workspace_context))
+
+        # each shard launches its share of the 3 runs allowed, from its own code locations
+        assert (
+            self.get_run_ids(instance.run_launcher.queue())
+            == run_ids_by_shard[shard_index][: 2 if shard_index == 0 else 1]
+        )
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [dict(max_concurrent_runs=1, dequeue_shards={"num_shards": 2, "shard_index": 0})],
+    )
+    def test_dequeue_shards_take_turns_with_one_slot(
+        self,
+        instance,
+        workspace_context,
+        daemon,
+        job_handle,
+        other_location_job_handle,
+        monkeypatch,
+    ):
+        assert get_location_shard(job_handle.location_name, 2) != get_location_shard(
+            other_location_job_handle.location_name, 2
+        )
+        for handle in [job_handle, other_location_job_handle]:
+            for _ in range(2):
+                self.create_queued_run(instance, handle, run_id=make_new_run_id())
+
+        launched_shards = []
+        for _ in range(4):
+            # each iteration, both shards try to dequeue runs
+            for shard_index in range(2):
+                monkeypatch.setattr(instance.run_coordinator, "_dequeue_shard_index", shard_index)
+                list(daemon.run_iteration(workspace_context))
+
+            [launched_run] = instance.get_runs(
+                RunsFilter(statuses=[DagsterRunStatus.STARTING, DagsterRunStatus.STARTED])
+            )
+            launched_shards.append(
+                get_location_shard(launched_run.remote_job_origin.location_name, 2)
+            )
+            instance.report_run_failed(launched_run)
+
+        # the single slot goes to each shard in turn, rather than always to the first shard
+        assert sorted(launched_shards) == [0, 0, 1, 1]
+        assert launched_shards[0] != launched_shards[1]
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=2, dequeue_shards={"num_shards": 2, "shard_index": 0}),
+            dict(max_concurrent_runs=2, dequeue_shards={"num_shards": 2, "shard_index": 1}),
+        ],
+    )
+    def test_dequeue_shards_without_queued_runs_leave_room(
+        self,
+        instance,
+        workspace_context,
+        daemon,
+        job_handle,
+        other_location_job_handle,
+        run_coordinator_config,
+    ):
+        shard_index = run_coordinator_config["dequeue_shards"]["shard_index"]
+        [handle] = [
+            handle
+            for handle in [job_handle, other_location_job_handle]
+            if get_location_shard(handle.location_name, 2) == shard_index
+        ]
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for run_id in run_ids:
+            self.create_queued_run(instance, handle, run_id=run_id)
+
+        list(daemon.run_iteration(workspace_context))
+
+        # the other shard has no queued runs, so this shard may use all of the room
+        assert self.get_run_ids(instance.run_launcher.queue()) == run_ids[:2]
+
     def test_locations_not_created(
         self, instance, monkeypatch, workspace_context, daemon, job_handle
     ):
@@ -0,0 +1,125 @@
+import logging
+
+import pytest
+from dagster import (
+    AssetKey,
+    AssetSelection,
+    AssetSpec,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    asset,
+    multi_asset,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.automation_tick_evaluation_context import (
+    AutomationTickEvaluationContext,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+
+missing = AutomationCondition.missing()
+parent_requested = AutomationCondition.any_deps_match(AutomationCondition.will_be_requested())
+
+
+@asset(automation_condition=missing)
+def a1() -> None: ...
+
+
+@asset(deps=[a1], automation_condition=parent_requested)
+def b1() -> None: ...
+
+
+@asset(automation_condition=missing)
+def a2() -> None: ...
+
+
+@asset(deps=[a2], automation_condition=parent_requested)
+def b2() -> None: ...
+
+
+@multi_asset(
+    specs=[
+        AssetSpec("m1", automation_condition=missing),
+        AssetSpec("m2"),
+    ],
+    can_subset=False,
+)
+def m(): ...
+
+
+@asset(deps=["m2"], automation_condition=parent_requested)
+def c() -> None: ...
+
+
+defs = Definitions(assets=[a1, b1, a2, b2, m, c])
+
+
+def _evaluate(instance: DagsterInstance, num_evaluation_processes: int):
+    return AutomationTickEvaluationContext(
+        evaluation_id=1,
+        instance=instance,
+        asset_graph=defs.get_asset_graph(),
+        cursor=AssetDaemonCursor.empty(),
+        materialize_run_tags={},
+        observe_run_tags={},
+        auto_observe_asset_keys=set(),
+        asset_selection=AssetSelection.all(),
+        emit_backfills=False,
+        logger=logging.getLogger("dagster.automation"),
+        num_evaluation_processes=num_evaluation_processes,
+    ).evaluate()
+
+
+def test_entity_key_shards() -> None:
+    asset_graph = defs.get_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys={
+            key
+            for key in asset_graph.get_all_asset_keys()
+            if asset_graph.get(key).automation_condition is not None
+        },
+        instance=DagsterInstance.ephemeral(),
+        asset_graph=asset_graph,
+        cursor=AssetDaemonCursor.empty(),
+        emit_backfills=False,
+        num_evaluation_processes=8,
+    )
+    shards = evaluator._get_entity_key_shards()  # noqa: SLF001
+
+    # one shard per connected component, with m2 joining m1 through the execution set
+    assert sorted(sorted(key.to_user_string() for key in shard) for shard in shards) == [
+        ["a1", "b1"],
+        ["a2", "b2"],
+        ["c", "m1"],
+    ]
+
+    evaluator.num_evaluation_processes = 2
+    assert sorted(len(shard) for shard in evaluator._get_entity_key_shards()) == [2, 4]  # noqa: SLF001
+
+
+@pytest.mark.parametrize("num_evaluation_processes", [2, 3])
+def test_evaluate_in_processes_matches_single_process(num_evaluation_processes: int) -> None:
+    with DagsterInstance.ephemeral() as instance:
+        expected_run_requests, expected_cursor, expected_evaluations = _evaluate(instance, 1)
+        run_requests, cursor, evaluations = _evaluate(instance, num_evaluation_processes)
+
+    def _requested_keys(run_requests):
+        return {key for run_request in run_requests for key in run_request.asset_selection}
+
+    assert _requested_keys(run_requests) == _requested_keys(expected_run_requests)
+    assert _requested_keys(run_requests) == {
+        AssetKey(name) for name in ["a1", "b1", "a2", "b2", "m1", "m2", "c"]
+    }
+
+    assert {e.key: e.true_subset for e in evaluations} == {
+        e.key: e.true_subset for e in expected_evaluations
+    }
+    assert {
+        c.previous_requested_subset.key: c.result_value_hash
+        for c in cursor.previous_condition_cursors or []
+    } == {
+        c.previous_requested_subset.key: c.result_value_hash
+        for c in expected_cursor.previous_condition_cursors or []
+    }
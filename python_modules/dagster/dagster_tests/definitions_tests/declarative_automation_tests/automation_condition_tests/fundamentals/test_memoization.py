@@ -0,0 +1,108 @@
+import datetime
+
+from dagster import (
+    AssetKey,
+    AssetSelection,
+    AutomationCondition,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    evaluate_automation_conditions,
+    materialize,
+)
+
+daily_partitions = DailyPartitionsDefinition(start_date="2024-01-01")
+
+
+@asset
+def parent() -> None: ...
+
+
+@asset(deps=[parent], automation_condition=AutomationCondition.eager())
+def child_a() -> None: ...
+
+
+@asset(deps=[parent], automation_condition=AutomationCondition.eager())
+def child_b() -> None: ...
+
+
+@asset(
+    deps=[parent],
+    automation_condition=AutomationCondition.any_deps_match(AutomationCondition.missing()).ignore(
+        AssetSelection.assets("child_a")
+    ),
+)
+def child_c() -> None: ...
+
+
+defs = Definitions(assets=[parent, child_a, child_b, child_c])
+
+
+def test_parent_subsets_memoized_across_children() -> None:
+    instance = DagsterInstance.ephemeral()
+    cursor = None
+
+    for materialize_parent in [False, True]:
+        if materialize_parent:
+            materialize([parent], instance=instance)
+
+        result = evaluate_automation_conditions(defs=defs, instance=instance, cursor=cursor)
+
+        # the children evaluate the same operands over the same parent, so subsets computed for
+        # one child are reused by the others
+        assert sum(r.num_cache_misses for r in result.results) > 0
+        assert sum(r.num_cache_hits for r in result.results) > 0
+
+        for r in result.results:
+            evaluation = r.serializable_evaluation
+            assert evaluation.num_cache_hits == r.num_cache_hits
+            assert evaluation.num_cache_misses == r.num_cache_misses
+            assert evaluation.num_cache_hits == sum(
+                node.num_cache_hits for node in evaluation.child_evaluations
+            )
+
+            # evaluating the child on its own, where nothing can be reused, gives the same result
+            (individual_result,) = evaluate_automation_conditions(
+                defs=defs,
+                instance=instance,
+                cursor=cursor,
+                asset_selection=AssetSelection.assets(r.key),
+            ).results
+            assert individual_result.get_serializable_subset() == r.get_serializable_subset()
+            assert individual_result.value_hash == r.value_hash
+
+        cursor = result.cursor
+
+
+def test_memoization_respects_candidate_subset() -> None:
+    @asset(partitions_def=daily_partitions)
+    def partitioned_parent() -> None: ...
+
+    @asset(
+        partitions_def=daily_partitions,
+        deps=[partitioned_parent],
+        automation_condition=AutomationCondition.in_latest_time_window()
+        & AutomationCondition.any_deps_match(AutomationCondition.missing()),
+    )
+    def latest_child() -> None: ...
+
+    @asset(
+        partitions_def=daily_partitions,
+        deps=[partitioned_parent],
+        automation_condition=AutomationCondition.any_deps_match(AutomationCondition.missing()),
+    )
+    def all_child() -> None: ...
+
+    instance = DagsterInstance.ephemeral()
+    result = evaluate_automation_conditions(
+        defs=[partitioned_parent, latest_child, all_child],
+        instance=instance,
+        evaluation_time=datetime.datetime(2024, 1, 11),
+    )
+    results_by_key = {r.key: r for r in result.results}
+
+    # the two children evaluate missing() over different candidate subsets of the parent, so
+    # neither reuses the subset of the other
+    assert results_by_key[AssetKey("latest_child")].true_subset.size == 1
+    assert results_by_key[AssetKey("all_child")].true_subset.size == 10
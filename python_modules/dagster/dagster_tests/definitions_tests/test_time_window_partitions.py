@@ -23,6 +23,7 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -1409,6 +1410,67 @@ def test_has_partition_key():
     assert partitions_def.has_partition_key("2020-03-15")
 
 
+@pytest.mark.parametrize(
+    "cron_schedule,fmt,timezone",
+    [
+        ("0 * * * *", "%Y-%m-%d-%H:%M", "UTC"),
+        ("0 * * * *", "%Y-%m-%d-%H:%M", "America/Chicago"),
+        ("15 * * * *", "%Y-%m-%d-%H:%M", "Europe/Berlin"),
+        ("*/15 * * * *", "%Y-%m-%d-%H:%M", "US/Central"),
+        ("0 0 * * *", "%Y-%m-%d", "UTC"),
+        ("0 7 * * *", "%Y-%m-%d", "America/Los_Angeles"),
+        ("30 2 * * *", "%Y-%m-%d", "America/New_York"),
+        ("30 2 * * *", "%Y-%m-%d-%H:%M", "America/New_York"),
+        ("0 3 * * 2", "%Y/%m/%d", "Europe/Berlin"),
+        ("0 0 15 * *", "%Y-%m-%d", "Australia/Sydney"),
+        ("0 0 * * 1-5", "%Y-%m-%d", "US/Central"),
+        ("0 2,14 * * *", "%Y-%m-%d-%H:%M", "UTC"),
+    ],
+)
+def test_partition_key_indexes(cron_schedule: str, fmt: str, timezone: str):
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start=datetime(2022, 3, 5, 4, 5),
+        fmt=fmt,
+        timezone=timezone,
+    )
+    windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        windows.append(window)
+        if len(windows) == 6000 or window.start.year > 2022:
+            break
+    keys = [dst_safe_strftime(window.start, timezone, fmt, cron_schedule) for window in windows]
+
+    assert partitions_def.indexes_to_keys(range(len(keys))) == keys
+    assert partitions_def.keys_to_indexes(keys) == list(range(len(keys)))
+    assert partitions_def.indexes_to_keys([-1]) == [
+        partitions_def.get_partition_key_for_timestamp(partitions_def.start.timestamp() - 1)
+    ]
+    for key, window in zip(keys, windows):
+        assert partitions_def.time_window_for_partition_key(key) == window
+
+    assert (
+        partitions_def.get_partition_keys_in_time_window(
+            TimeWindow(windows[3].start, windows[-3].start)
+        )
+        == keys[3:-3]
+    )
+    assert (
+        partitions_def.get_partition_keys_in_time_window(
+            TimeWindow(
+                windows[3].start + timedelta(seconds=1), windows[-3].end - timedelta(seconds=1)
+            )
+        )
+        == keys[4:-2]
+    )
+    assert (
+        partitions_def.get_partition_keys_in_range(PartitionKeyRange(keys[3], keys[-3]))
+        == keys[3:-2]
+    )
+    assert partitions_def.has_partition_key(keys[5])
+    assert not partitions_def.has_partition_key(partitions_def.indexes_to_keys([-1])[0])
+
+
 @pytest.mark.parametrize(
     "partitions_def,first_partition_window,last_partition_window,number_of_partitions,fmt",
     [
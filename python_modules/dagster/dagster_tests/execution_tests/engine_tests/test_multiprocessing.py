@@ -107,6 +107,85 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def _worker_started_events(result: execution_result.ExecutionResult):
+    return [
+        event
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    ]
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [
+        "spawn",
+        pytest.param(
+            "forkserver",
+            marks=pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows"),
+        ),
+    ],
+)
+def test_worker_pool_execution(start_method):
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "start_method": {start_method: {}},
+                            "worker_pool": {},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_started_events = _worker_started_events(result)
+            assert len(worker_started_events) == 4
+            # all steps execute in the same worker
+            assert len({event.pid for event in worker_started_events}) == 1
+            assert (
+                "startup_seconds_saved" not in worker_started_events[0].event_specific_data.metadata
+            )  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue]
+            for i, event in enumerate(worker_started_events[1:], start=1):
+                metadata = event.event_specific_data.metadata  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue]
+                assert metadata["steps_executed_by_worker"] == MetadataValue.int(i)
+                assert "startup_seconds_saved" in metadata
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_tasks_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = [event.pid for event in _worker_started_events(result)]
+            assert len(pids) == 4
+            assert pids[0] == pids[1]
+            assert pids[2] == pids[3]
+            assert pids[1] != pids[2]
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -497,3 +576,32 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def test_failure_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(failure),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("throw")
+            assert failure_data
+            assert failure_data.error.cls_name == "Failure"  # pyright: ignore[reportOptionalMemberAccess]
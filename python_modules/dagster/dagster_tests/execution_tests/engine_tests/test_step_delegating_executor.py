@@ -34,6 +34,7 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
 from dagster._core.test_utils import environ, instance_for_test
+from dagster._core.utils import make_new_run_id
 from dagster._utils.merger import merge_dicts
 from dagster._utils.test.definitions import lazy_definitions, scoped_definitions_load_context
 
@@ -173,6 +174,51 @@ def test_execute_with_tailer_offset():
     assert TestStepHandler.verify_step_count == 0
 
 
+def test_pop_events_seen_storage_ids_bounded():
+    num_events = 100
+    executor = StepDelegatingExecutor(TestStepHandler(), retries=RetryMode.DISABLED)
+    with instance_for_test() as instance:
+        run_id = make_new_run_id()
+        for i in range(num_events):
+            instance.report_engine_event(f"event {i}", job_name="foo_job", run_id=run_id)
+
+        with environ(
+            {"DAGSTER_EXECUTOR_POP_EVENTS_OFFSET": "5", "DAGSTER_EXECUTOR_POP_EVENTS_LIMIT": "10"}
+        ):
+            seen_storage_ids = set()
+            messages = []
+            for _ in range(num_events):
+                messages.extend(
+                    event.message
+                    for event in executor._pop_events(instance, run_id, seen_storage_ids)  # noqa: SLF001
+                )
+                # storage ids at or before the cursor are dropped, leaving at most the records
+                # returned by the latest query
+                assert len(seen_storage_ids) <= 10
+
+    assert messages == [f"event {i}" for i in range(num_events)]
+
+
+def test_execute_watch_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start = time.time()
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={
+                "execution": {"config": {"watch_events": True, "watch_fallback_seconds": 600}}
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    # step events are picked up as soon as the executor is notified of them rather than after
+    # the fallback interval
+    assert time.time() - start < 120
+
+
 def test_skip_execute():
     from dagster_tests.execution_tests.engine_tests.test_jobs import define_dynamic_skipping_job
 
@@ -9,11 +9,14 @@
 from dagster import AssetExecutionContext, AssetKey, asset, materialize
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
 from dagster._core.pipes.utils import (
+    PipesBlobStoreMessageReader,
     PipesChunkedLogReader,
     PipesEnvContextInjector,
+    PipesFileMessageReader as PipesTailedFileMessageReader,
     PipesLaunchedData,
     PipesParams,
     PipesThreadedMessageReader,
+    _tail_file,
     open_pipes_session,
 )
 from dagster_pipes import PipesDefaultMessageWriter, _make_message
@@ -230,3 +233,90 @@ def log_line_3(message: str):
 
     assert "Hello 3" in captured.err
     assert "Bye 3" in captured.err
+
+
+class PipesDictMessageReader(PipesBlobStoreMessageReader):
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+
+    @contextmanager
+    def get_params(self) -> Iterator[PipesParams]:
+        yield {}
+
+    def messages_are_readable(self, params: PipesParams) -> bool:
+        return True
+
+    def download_messages_chunk(self, index: int, params: PipesParams) -> Optional[str]:
+        return self.chunks.get(index)
+
+    def no_messages_debug_text(self) -> str:
+        return "Attempted to read messages from a dict."
+
+
+class CollectingMessageHandler:
+    def __init__(self):
+        self.messages = []
+        self.received = threading.Event()
+
+    def handle_message(self, message) -> None:
+        self.messages.append(message)
+        self.received.set()
+
+    def report_pipes_framework_exception(self, origin, exc_info) -> None:
+        raise AssertionError(f"{origin} failed") from exc_info[1]
+
+
+def test_blob_store_message_reader_downloads_all_written_chunks():
+    reader = PipesDictMessageReader({1: '{"a": 1}', 2: '{"a": 2}\n{"a": 3}'})
+
+    assert reader.download_messages(None, {}) == (3, '{"a": 1}\n{"a": 2}\n{"a": 3}')
+    assert reader.download_messages(3, {}) is None
+
+    reader.chunks[3] = '{"a": 4}'
+    assert reader.download_messages(3, {}) == (4, '{"a": 4}')
+
+
+def test_tail_file_waits_for_complete_lines(tmp_path):
+    path = str(tmp_path / "messages.txt")
+    open(path, "w").close()
+
+    is_session_closed = threading.Event()
+    wakeup = threading.Event()
+    lines = []
+    thread = threading.Thread(
+        target=lambda: lines.extend(_tail_file(path, is_session_closed, wakeup)), daemon=True
+    )
+    thread.start()
+
+    with open(path, "a") as file:
+        file.write('{"a": ')
+        file.flush()
+        time.sleep(0.1)
+        file.write("1}\n")
+        file.write('{"a": 2}')
+
+    is_session_closed.set()
+    wakeup.set()
+    thread.join(timeout=5)
+
+    assert lines == ['{"a": 1}\n', '{"a": 2}']
+
+
+def test_file_message_reader_latency(tmp_path):
+    path = str(tmp_path / "messages.txt")
+    handler = CollectingMessageHandler()
+    reader = PipesTailedFileMessageReader(path)
+
+    with reader.read_messages(handler):  # type: ignore
+        # let the reader back off to its longest interval between reads
+        time.sleep(2)
+        with open(path, "a") as file:
+            file.write(json.dumps({"method": "opened"}) + "\n")
+        start = time.monotonic()
+        assert handler.received.wait(timeout=5)
+        latency = time.monotonic() - start
+
+    assert handler.messages == [{"method": "opened"}]
+    # the reader is woken up by the change to the file rather than by its next poll
+    assert latency < 0.5
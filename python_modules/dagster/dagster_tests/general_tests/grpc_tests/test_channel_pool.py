@@ -0,0 +1,144 @@
+import asyncio
+from unittest import mock
+
+import grpc
+import pytest
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._grpc import ephemeral_grpc_api_client
+from dagster._grpc.client import (
+    GrpcChannelPool,
+    _async_channel_pools,
+    _channel_pool,
+    _get_async_channel_pool,
+    clear_grpc_channel_pools,
+    get_grpc_compression,
+)
+
+
+class FakeChannel:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+
+def _pool(max_channels=64):
+    closed = []
+
+    def _close(channel):
+        channel.closed = True
+        closed.append(channel.name)
+
+    return GrpcChannelPool(close_channel=_close, max_channels=max_channels), closed
+
+
+def test_channel_reused_for_key():
+    pool, closed = _pool()
+    first = pool.acquire("a", lambda: FakeChannel("a1"))
+    pool.release(first)
+    second = pool.acquire("a", lambda: FakeChannel("a2"))
+    pool.release(second)
+
+    assert first is second
+    assert second.channel.name == "a1"
+    assert len(pool) == 1
+    assert closed == []
+
+
+def test_evicted_channel_closed_after_release():
+    pool, closed = _pool()
+    pooled = pool.acquire("a", lambda: FakeChannel("a1"))
+    other = pool.acquire("a", lambda: FakeChannel("a2"))
+    assert other is pooled
+
+    pool.evict("a", pooled)
+    assert len(pool) == 0
+
+    pool.release(pooled)
+    assert closed == []
+    pool.release(other)
+    assert closed == ["a1"]
+
+    reconnected = pool.acquire("a", lambda: FakeChannel("a3"))
+    assert reconnected.channel.name == "a3"
+    pool.release(reconnected)
+
+
+def test_least_recently_used_channel_closed_over_max():
+    pool, closed = _pool(max_channels=2)
+    for key in ["a", "b", "a", "c"]:
+        pool.release(pool.acquire(key, lambda key=key: FakeChannel(key)))
+
+    assert len(pool) == 2
+    assert closed == ["b"]
+
+
+def test_clear():
+    pool, closed = _pool()
+    idle = pool.acquire("a", lambda: FakeChannel("a"))
+    pool.release(idle)
+    in_use = pool.acquire("b", lambda: FakeChannel("b"))
+
+    pool.clear()
+    assert len(pool) == 0
+    assert closed == ["a"]
+
+    pool.release(in_use)
+    assert closed == ["a", "b"]
+
+
+def test_fork_starts_empty_pool():
+    pool, closed = _pool()
+    pool.release(pool.acquire("a", lambda: FakeChannel("a1")))
+
+    with mock.patch("os.getpid", return_value=-1):
+        pooled = pool.acquire("a", lambda: FakeChannel("a2"))
+        assert pooled.channel.name == "a2"
+        pool.release(pooled)
+
+    assert closed == []
+
+
+def test_grpc_compression():
+    assert get_grpc_compression("Ping") == grpc.Compression.NoCompression
+    assert get_grpc_compression("Heartbeat") == grpc.Compression.NoCompression
+    assert get_grpc_compression("ExternalRepository") == grpc.Compression.Gzip
+    assert get_grpc_compression("SyncExternalSensorExecution") == grpc.Compression.Gzip
+
+
+def test_client_reuses_channel():
+    clear_grpc_channel_pools()
+    with ephemeral_grpc_api_client() as api_client:
+        api_client.ping("foo")
+        assert len(_channel_pool) == 1
+        assert api_client.get_server_id()
+        assert [result for result in api_client.streaming_ping(sequence_length=2, echo="foo")]
+        assert len(_channel_pool) == 1
+
+    clear_grpc_channel_pools()
+    assert len(_channel_pool) == 0
+
+
+def test_client_reconnects_after_unavailable():
+    clear_grpc_channel_pools()
+    with ephemeral_grpc_api_client() as api_client:
+        api_client.ping("foo")
+
+    # the server has shut down, so the next call fails and evicts the channel
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.ping("foo")
+    assert len(_channel_pool) == 0
+
+
+def test_clear_skips_pools_of_closed_loops():
+    async def _acquire_idle_channel():
+        pool = _get_async_channel_pool()
+        pool.release(pool.acquire("a", lambda: FakeChannel("a")))
+        return asyncio.get_running_loop()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(_acquire_idle_channel())
+    loop.close()
+
+    # closing the idle channel would otherwise schedule a task on the closed loop
+    clear_grpc_channel_pools()
+    assert loop not in _async_channel_pools
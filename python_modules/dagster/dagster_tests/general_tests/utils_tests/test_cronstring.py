@@ -0,0 +1,29 @@
+import pytest
+from dagster._utils.cronstring import get_fixed_minute_interval
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, expected_interval",
+    [
+        ("0 * * * *", 60),
+        ("* * * * *", 1),
+        ("*/15 * * * *", 15),
+        ("*/30 * * * *", 30),
+        # */7 jumps from :56 to :00
+        ("*/7 * * * *", None),
+        ("*/0 * * * *", None),
+        ("*/abc * * * *", None),
+        ("15 * * * *", None),
+        # every other field must be a wildcard
+        ("*/15 3 * * *", None),
+        ("*/15 * 1 * *", None),
+        ("*/15 * * 1 *", None),
+        ("*/15 * * * 1", None),
+        ("* 3 * * *", None),
+        ("0 0 * * *", None),
+        ("*/15 * * *", None),
+        ("*/15 * * * * *", None),
+    ],
+)
+def test_get_fixed_minute_interval(cron_schedule, expected_interval):
+    assert get_fixed_minute_interval(cron_schedule) == expected_interval
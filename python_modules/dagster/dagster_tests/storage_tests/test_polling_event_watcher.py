@@ -1,9 +1,11 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Optional
 
 import dagster._check as check
+from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
@@ -146,3 +148,96 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_many_runs_on_one_thread():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = [make_new_run_id() for _ in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+        for run_id in run_ids:
+            storage.watch(run_id, None, callbacks[run_id])
+
+        watcher_threads = [
+            thread for thread in threading.enumerate() if thread.name.startswith("sql-event-watch")
+        ]
+        assert len(watcher_threads) == 1
+
+        for i, run_id in enumerate(run_ids):
+            for count in range(i + 1):
+                storage.store_event(create_event(count, run_id=run_id))
+
+        attempts = 20
+        while any(len(watched[run_id]) < i + 1 for i, run_id in enumerate(run_ids)) and attempts:
+            time.sleep(0.1)
+            attempts -= 1
+
+        for i, run_id in enumerate(run_ids):
+            assert [int(evt.message) for evt in watched[run_id]] == list(range(i + 1))
+            assert all(evt.run_id == run_id for evt in watched[run_id])
+
+        storage.end_watch(run_ids[0], callbacks[run_ids[0]])
+        assert storage._watcher and not storage._watcher.has_run_id(run_ids[0])  # noqa: SLF001
+        assert storage._watcher.has_run_id(run_ids[1])  # noqa: SLF001
+
+        storage.store_event(create_event(100, run_id=run_ids[0]))
+        storage.store_event(create_event(100, run_id=run_ids[1]))
+
+        attempts = 20
+        while len(watched[run_ids[1]]) < 3 and attempts:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched[run_ids[0]]] == [0]
+        assert [int(evt.message) for evt in watched[run_ids[1]]] == [0, 1, 100]
+
+    # disposing the storage stops the polling thread
+    assert not any(thread.name.startswith("sql-event-watch") for thread in threading.enumerate())
+
+
+def test_watch_survives_failing_runs_and_callbacks(monkeypatch):
+    with create_sqlite_run_event_logstorage() as storage:
+        invalid_run_id, failing_run_id, run_id = (make_new_run_id() for _ in range(3))
+        watched = []
+
+        def _failing_callback(_event, _cursor):
+            raise Exception("callback failed")
+
+        get_records_for_runs = storage.get_records_for_runs
+
+        def _get_records_for_runs(cursors_by_run_id, limit=None):
+            if invalid_run_id in cursors_by_run_id:
+                raise DagsterEventLogInvalidForRun(run_id=invalid_run_id)
+            return get_records_for_runs(cursors_by_run_id, limit=limit)
+
+        monkeypatch.setattr(storage, "get_records_for_runs", _get_records_for_runs)
+
+        storage.watch(invalid_run_id, None, lambda _event, _cursor: None)
+        storage.watch(failing_run_id, None, _failing_callback)
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+        storage.store_event(create_event(1, run_id=failing_run_id))
+        storage.store_event(create_event(2, run_id=run_id))
+
+        attempts = 20
+        while not watched and attempts:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert storage._watcher  # noqa: SLF001
+        assert not storage._watcher.has_run_id(invalid_run_id)  # noqa: SLF001
+        assert storage._watcher.has_run_id(failing_run_id)  # noqa: SLF001
+
+        storage.store_event(create_event(3, run_id=failing_run_id))
+        storage.store_event(create_event(4, run_id=run_id))
+
+        attempts = 20
+        while len(watched) < 2 and attempts:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched] == [2, 4]
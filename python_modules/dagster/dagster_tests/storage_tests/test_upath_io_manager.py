@@ -1,6 +1,8 @@
 import inspect
 import json
 import pickle
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -24,6 +26,7 @@
     MultiPartitionsDefinition,
     OpExecutionContext,
     OutputContext,
+    PartitionKeyRange,
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     asset,
@@ -207,6 +210,78 @@ def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
     assert len(downstream_asset_data) == 24, "downstream day should map to upstream 24 hours"
 
 
+class ConcurrencyTrackingIOManager(PickleIOManager):
+    """Records the maximum number of partitions that were being loaded at the same time."""
+
+    def __init__(self, base_path: UPath, max_concurrent_partition_loads: Optional[int] = None):
+        super().__init__(
+            base_path=base_path, max_concurrent_partition_loads=max_concurrent_partition_loads
+        )
+        self._lock = threading.Lock()
+        self._num_loading = 0
+        self.max_num_loading = 0
+
+    def load_from_path(self, context: InputContext, path: UPath) -> List:
+        with self._lock:
+            self._num_loading += 1
+            self.max_num_loading = max(self.max_num_loading, self._num_loading)
+        try:
+            time.sleep(0.05)
+            return super().load_from_path(context, path)
+        finally:
+            with self._lock:
+                self._num_loading -= 1
+
+
+@pytest.mark.parametrize("max_concurrent_partition_loads", [None, 1, 4])
+def test_upath_io_manager_concurrent_partition_loads(
+    tmp_path: Path,
+    daily: DailyPartitionsDefinition,
+    hourly: HourlyPartitionsDefinition,
+    start: datetime,
+    max_concurrent_partition_loads: Optional[int],
+):
+    manager = ConcurrencyTrackingIOManager(
+        base_path=UPath(tmp_path), max_concurrent_partition_loads=max_concurrent_partition_loads
+    )
+
+    @asset(partitions_def=hourly, io_manager_def=manager)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(partitions_def=daily, io_manager_def=manager)
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    for hour in range(23):
+        materialize(
+            [upstream_asset], partition_key=(start + timedelta(hours=hour)).strftime(hourly.fmt)
+        )
+
+    with pytest.raises(FileNotFoundError):
+        materialize(
+            [upstream_asset.to_source_asset(), downstream_asset],
+            partition_key=start.strftime(daily.fmt),
+        )
+
+    materialize([upstream_asset], partition_key=(start + timedelta(hours=23)).strftime(hourly.fmt))
+    manager.max_num_loading = 0
+    result = materialize(
+        [upstream_asset.to_source_asset(), downstream_asset],
+        partition_key=start.strftime(daily.fmt),
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert downstream_asset_data == {
+        key: key
+        for key in hourly.get_partition_keys_in_range(
+            PartitionKeyRange(
+                start.strftime(hourly.fmt), (start + timedelta(hours=23)).strftime(hourly.fmt)
+            )
+        )
+    }
+    assert manager.max_num_loading == (max_concurrent_partition_loads or 1)
+
+
 def test_upath_io_manager_multiple_static_partitions(dummy_io_manager: DummyIOManager):
     upstream_partitions_def = StaticPartitionsDefinition(["A", "B"])
 
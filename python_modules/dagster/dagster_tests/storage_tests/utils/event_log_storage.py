@@ -68,7 +68,12 @@
 )
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
 from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
-from dagster._core.event_api import EventLogCursor, EventRecordsResult, RunStatusChangeRecordsFilter
+from dagster._core.event_api import (
+    EventLogCursor,
+    EventLogRecordSummary,
+    EventRecordsResult,
+    RunStatusChangeRecordsFilter,
+)
 from dagster._core.events import (
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     AssetMaterializationPlannedData,
@@ -83,8 +88,8 @@
 from dagster._core.execution.api import execute_run
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
-from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.plan.objects import StepFailureData, StepRetryData, StepSuccessData
+from dagster._core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.loader import LoadingContextForTest
 from dagster._core.remote_representation.external_data import PartitionsSnap
@@ -857,6 +862,134 @@ def test_event_log_step_stats(
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_event_log_step_stats_with_retries(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        import math
+
+        now = time.time()
+        records = [
+            _event_record(test_run_id, "A", now - 100, DagsterEventType.STEP_START),
+            _event_record(test_run_id, "B", now - 95, DagsterEventType.STEP_START),
+            _event_record(
+                test_run_id,
+                "A",
+                now - 90,
+                DagsterEventType.STEP_UP_FOR_RETRY,
+                StepRetryData(error=None),
+            ),
+            _event_record(test_run_id, "A", now - 80, DagsterEventType.STEP_RESTARTED),
+            _event_record(
+                test_run_id,
+                "B",
+                now - 75,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=20000.0),
+            ),
+            _event_record(
+                test_run_id,
+                "A",
+                now - 70,
+                DagsterEventType.STEP_UP_FOR_RETRY,
+                StepRetryData(error=None),
+            ),
+            _event_record(test_run_id, "A", now - 60, DagsterEventType.STEP_RESTARTED),
+            _event_record(
+                test_run_id,
+                "A",
+                now - 50,
+                DagsterEventType.ASSET_MATERIALIZATION,
+                StepMaterializationData(AssetMaterialization(asset_key="mat_a")),
+            ),
+            _event_record(
+                test_run_id,
+                "A",
+                now - 40,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=60000.0),
+            ),
+            _event_record(test_run_id, "C", now - 30, DagsterEventType.STEP_START),
+        ]
+        for record in records:
+            storage.store_event(record)
+
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        assert [stats.step_key for stats in step_stats] == ["A", "B", "C"]
+
+        a_stats, b_stats, c_stats = step_stats
+        assert a_stats.status == StepEventStatus.SUCCESS
+        assert a_stats.attempts == 3
+        assert len(a_stats.attempts_list) == 3
+        assert len(a_stats.materialization_events) == 1
+        assert a_stats.start_time
+        assert a_stats.end_time
+        assert math.isclose(a_stats.end_time - a_stats.start_time, 60)
+
+        assert b_stats.status == StepEventStatus.SUCCESS
+        assert b_stats.attempts == 1
+        assert len(b_stats.attempts_list) == 1
+
+        assert c_stats.status == StepEventStatus.IN_PROGRESS
+        assert c_stats.attempts == 1
+        assert c_stats.attempts_list == []
+        assert c_stats.partial_attempt_start
+        assert c_stats.end_time is None
+
+        # matches the stats built by replaying the event log
+        expected_stats = build_run_step_stats_from_events(test_run_id, records)
+        for stats, expected in zip(step_stats, expected_stats):
+            assert stats.status == expected.status
+            assert stats.attempts == expected.attempts
+            assert len(stats.attempts_list) == len(expected.attempts_list)
+            for attempt, expected_attempt in zip(stats.attempts_list, expected.attempts_list):
+                assert math.isclose(attempt.start_time or 0, expected_attempt.start_time or 0)
+                assert math.isclose(attempt.end_time or 0, expected_attempt.end_time or 0)
+            assert stats.materialization_events == expected.materialization_events
+
+        assert [
+            stats.step_key for stats in storage.get_step_stats_for_run(test_run_id, ["C", "A"])
+        ] == ["A", "C"]
+
+    def test_iter_records_for_run(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        for i in range(7):
+            storage.store_event(create_test_event_log_record(str(i), test_run_id))
+
+        records = storage.get_records_for_run(test_run_id).records
+        assert len(records) == 7
+
+        assert list(storage.iter_records_for_run(test_run_id, batch_size=3)) == records
+        assert list(storage.iter_records_for_run(test_run_id, batch_size=100)) == records
+        assert (
+            list(
+                storage.iter_records_for_run(
+                    test_run_id,
+                    cursor=EventLogCursor.from_storage_id(records[2].storage_id).to_string(),
+                    batch_size=2,
+                )
+            )
+            == records[3:]
+        )
+        assert (
+            list(
+                storage.iter_records_for_run(
+                    test_run_id, of_type=DagsterEventType.ENGINE_EVENT, batch_size=2
+                )
+            )
+            == records
+        )
+
+        # records stored while iterating do not invalidate the iterator
+        records_iter = storage.iter_records_for_run(test_run_id, batch_size=2)
+        first_record = next(records_iter)
+        storage.store_event(create_test_event_log_record("7", test_run_id))
+        assert [first_record, *records_iter][:7] == records
+
     def test_secondary_index(self, storage: EventLogStorage):
         if not isinstance(storage, SqlEventLogStorage) or isinstance(
             storage, InMemoryEventLogStorage
@@ -942,6 +1075,31 @@ def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_get_records_for_runs(self, storage: EventLogStorage, instance):
+        run_id_1, run_id_2, run_id_3 = make_new_run_id(), make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2, run_id_3]):
+            for i in range(3):
+                for run_id in [run_id_1, run_id_2, run_id_3]:
+                    storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+            run_1_ids = [r.storage_id for r in storage.get_records_for_run(run_id_1).records]
+            run_2_ids = [r.storage_id for r in storage.get_records_for_run(run_id_2).records]
+
+            records = storage.get_records_for_runs(
+                {
+                    run_id_1: None,
+                    run_id_2: EventLogCursor.from_storage_id(run_2_ids[0]).to_string(),
+                }
+            )
+            assert [r.storage_id for r in records] == sorted(run_1_ids + run_2_ids[1:])
+            assert {r.event_log_entry.run_id for r in records} == {run_id_1, run_id_2}
+
+            # a limited fetch returns a prefix of each run's records after its cursor
+            limited = storage.get_records_for_runs({run_id_1: None, run_id_2: None}, limit=3)
+            assert [r.storage_id for r in limited] == sorted(run_1_ids + run_2_ids)[:3]
+
+            assert storage.get_records_for_runs({}) == []
+
     def test_get_logs_for_run_cursor_offset_limit(self, test_run_id, storage):
         if not self.supports_offset_cursor_queries():
             pytest.skip("storage does not support deprecated offset cursor queries")
@@ -1278,6 +1436,80 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_mixed_event_batch(self, storage, test_run_id):
+        if not storage.supports_any_event_type_in_batch:
+            pytest.skip("storage does not support batches of any event type")
+
+        asset_key = AssetKey("mixed_batch_asset")
+
+        @op
+        def materialize_twice(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 1})
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 2})
+            context.log.info("after")
+            yield Output(1)
+
+        def _ops():
+            materialize_twice()
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(_ops, instance=test_instance, run_id=test_run_id)
+
+        storage.store_event_batch(events)
+
+        logs = storage.get_logs_for_run(test_run_id)
+        assert [log.dagster_event_type for log in logs] == [
+            event.dagster_event_type for event in events
+        ]
+        assert [log.user_message for log in logs] == [event.user_message for event in events]
+
+        result = storage.fetch_materializations(asset_key, limit=100)
+        assert len(result.records) == 2
+        latest_record = result.records[0]
+        assert latest_record.asset_materialization
+        assert latest_record.asset_materialization.metadata["count"].value == 2
+
+        [asset_record] = storage.get_asset_records([asset_key])
+        assert asset_record.asset_entry.last_materialization_record == latest_record
+
+    def test_failed_event_batch_is_not_stored(self, storage, test_run_id):
+        if (
+            not isinstance(storage, SqlEventLogStorage)
+            or isinstance(storage, InMemoryEventLogStorage)
+            or storage.is_run_sharded
+        ):
+            pytest.skip("This test is for SQL-backed Event Log behavior with a single index shard")
+
+        asset_key = AssetKey("failed_batch_asset")
+
+        @op
+        def materialize(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(_ops, instance=test_instance, run_id=test_run_id)
+
+        def _fail(*_args, **_kwargs):
+            raise Exception("index update failed")
+
+        with mock.patch.object(storage, "store_asset_event_tags", _fail):
+            with pytest.raises(Exception, match="index update failed"):
+                storage.store_event_batch(events)
+
+        # the events are inserted in the same transaction as the index updates
+        assert storage.get_logs_for_run(test_run_id) == []
+        assert storage.get_asset_records([asset_key]) == []
+
+        storage.store_event_batch(events)
+        assert len(storage.get_logs_for_run(test_run_id)) == len(events)
+        assert len(storage.fetch_materializations(asset_key, limit=100).records) == 1
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -1438,6 +1670,78 @@ def _get_counts(result):
         )
         assert _get_counts(result) == []
 
+    def test_asset_event_summaries_fetch(self, storage, instance):
+        asset_key = AssetKey(["path", "to", "asset_one"])
+        other_asset_key = AssetKey(["path", "to", "asset_two"])
+        test_run_id = make_new_run_id()
+
+        @op
+        def materialize(_):
+            for partition in ["1", "2", "3"]:
+                yield AssetMaterialization(
+                    asset_key=asset_key, metadata={"count": 1}, partition=partition
+                )
+                yield AssetObservation(asset_key=asset_key, partition=partition)
+            yield AssetMaterialization(asset_key=other_asset_key)
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        _synthesize_events(_ops, instance=instance, run_id=test_run_id)
+
+        def _assert_summaries_match(summaries_result, records_result):
+            assert summaries_result.cursor == records_result.cursor
+            assert summaries_result.has_more == records_result.has_more
+            assert len(summaries_result.records) == len(records_result.records)
+            for summary, record in zip(summaries_result.records, records_result.records):
+                expected = EventLogRecordSummary.from_event_log_record(record)
+                assert summary._replace(timestamp=0) == expected._replace(timestamp=0)
+                assert summary.timestamp == pytest.approx(expected.timestamp, abs=1e-3)
+
+        for records_filter, limit, ascending in [
+            (asset_key, 100, False),
+            (asset_key, 2, True),
+            (other_asset_key, 100, False),
+            (AssetRecordsFilter(asset_key=asset_key, asset_partitions=["1", "3"]), 100, False),
+        ]:
+            summaries_result = storage.fetch_materialization_summaries(
+                records_filter, limit=limit, ascending=ascending
+            )
+            _assert_summaries_match(
+                summaries_result,
+                storage.fetch_materializations(records_filter, limit=limit, ascending=ascending),
+            )
+            assert all(
+                summary.event_type == DagsterEventType.ASSET_MATERIALIZATION
+                and summary.run_id == test_run_id
+                for summary in summaries_result.records
+            )
+            _assert_summaries_match(
+                storage.fetch_materialization_summaries(
+                    records_filter,
+                    limit=limit,
+                    cursor=summaries_result.cursor,
+                    ascending=ascending,
+                ),
+                storage.fetch_materializations(
+                    records_filter,
+                    limit=limit,
+                    cursor=summaries_result.cursor,
+                    ascending=ascending,
+                ),
+            )
+            _assert_summaries_match(
+                storage.fetch_observation_summaries(
+                    records_filter, limit=limit, ascending=ascending
+                ),
+                storage.fetch_observations(records_filter, limit=limit, ascending=ascending),
+            )
+
+        summaries = storage.fetch_materialization_summaries(asset_key, limit=100).records
+        assert [summary.partition_key for summary in summaries] == ["3", "2", "1"]
+        assert all(summary.asset_key == asset_key for summary in summaries)
+
     def test_asset_observation_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -24,11 +24,16 @@
     RemoteRepositoryOrigin,
 )
 from dagster._core.run_coordinator import DefaultRunCoordinator
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
 from dagster._core.storage.event_log import InMemoryEventLogStorage
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.base import (
+    RunsFeedConnection,
+    RunsFeedCursor,
+    RunStorage,
+    get_runs_feed_entry_timestamp,
+)
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
@@ -47,6 +52,7 @@
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import serialize_pp
 from dagster._time import create_datetime, datetime_from_timestamp
+from dagster._utils.env import environ
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
 
@@ -600,6 +606,32 @@ def test_fetch_count_by_tag(self, storage: RunStorage):
             ("mytag2", {"world"}),
         ]
 
+    def test_get_run_tag_value_counts(self, storage: RunStorage):
+        for tags, status in [
+            ({"team": "a", "env": "prod"}, DagsterRunStatus.STARTED),
+            ({"team": "a", "env": "dev"}, DagsterRunStatus.STARTED),
+            ({"team": "b", "env": "prod"}, DagsterRunStatus.SUCCESS),
+            ({"team": "b"}, DagsterRunStatus.STARTED),
+            ({}, DagsterRunStatus.STARTED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(), job_name="some_pipeline", tags=tags, status=status
+                )
+            )
+
+        assert storage.get_run_tag_value_counts(tag_keys=["team", "env"]) == {
+            ("team", "a"): 2,
+            ("team", "b"): 2,
+            ("env", "prod"): 2,
+            ("env", "dev"): 1,
+        }
+        assert storage.get_run_tag_value_counts(
+            tag_keys=["team"], filters=RunsFilter(statuses=[DagsterRunStatus.STARTED])
+        ) == {("team", "a"): 2, ("team", "b"): 1}
+        assert storage.get_run_tag_value_counts(tag_keys=["missing"]) == {}
+        assert storage.get_run_tag_value_counts(tag_keys=[]) == {}
+
     def test_fetch_by_tags(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1093,6 +1125,31 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_add_get_snapshot_zstd_msgpack_codec(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("snapshot codecs only apply to sql run storages")
+
+        zlib_job_snapshot = (
+            GraphDefinition(name="zlib_job", node_defs=[]).to_job().get_job_snapshot()
+        )
+        zstd_job_snapshot = (
+            GraphDefinition(name="zstd_job", node_defs=[]).to_job().get_job_snapshot()
+        )
+
+        storage.add_job_snapshot(zlib_job_snapshot)
+        with environ({"DAGSTER_SNAPSHOT_CODEC": "zstd_msgpack"}):
+            storage.add_job_snapshot(zstd_job_snapshot)
+
+        # rows written with either codec can be read back regardless of the current setting
+        for codec in ["zlib", "zstd_msgpack"]:
+            with environ({"DAGSTER_SNAPSHOT_CODEC": codec}):
+                assert serialize_pp(
+                    storage.get_job_snapshot(zlib_job_snapshot.snapshot_id)
+                ) == serialize_pp(zlib_job_snapshot)
+                assert serialize_pp(
+                    storage.get_job_snapshot(zstd_job_snapshot.snapshot_id)
+                ) == serialize_pp(zstd_job_snapshot)
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = str(uuid4())
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1734,6 +1791,100 @@ def test_backfill_id_filtering(self, storage: RunStorage):
         )
         assert backfills_for_id[0].backfill_id == backfill.backfill_id
 
+    def test_runs_feed(self, storage: RunStorage):
+        origin = self.fake_partition_set_origin("fake_partition_set")
+
+        backfill_ids = []
+        run_ids = []
+        for i in range(5):
+            backfill = PartitionBackfill(
+                f"backfill_{i}",
+                partition_set_origin=origin,
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["a", "b", "c"],
+                from_failure=False,
+                tags={},
+                backfill_timestamp=time.time(),
+            )
+            storage.add_backfill(backfill)
+            backfill_ids.append(backfill.backfill_id)
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    job_name="some_pipeline",
+                    tags={BACKFILL_ID_TAG: backfill.backfill_id},
+                )
+            )
+            for _ in range(2):
+                run_id = make_new_run_id()
+                storage.add_run(
+                    TestRunStorage.build_run(
+                        run_id=run_id,
+                        job_name="some_pipeline",
+                        status=DagsterRunStatus.SUCCESS if i % 2 else DagsterRunStatus.FAILURE,
+                    )
+                )
+                run_ids.append(run_id)
+
+        def _page_through_feed(run_filters, backfill_filters, limit):
+            entries = []
+            cursor = None
+            while True:
+                conn = storage.get_runs_feed_entries(
+                    limit=limit,
+                    run_filters=run_filters,
+                    backfill_filters=backfill_filters,
+                    cursor=cursor,
+                )
+                assert len(conn.entries) <= limit
+                entries.extend(conn.entries)
+                cursor = RunsFeedCursor.from_string(conn.cursor.to_string())
+                if not conn.has_more:
+                    break
+                assert len(conn.entries) == limit
+
+            timestamps = [get_runs_feed_entry_timestamp(entry) for entry in entries]
+            assert timestamps == sorted(timestamps, reverse=True)
+            return [
+                entry.dagster_run.run_id if isinstance(entry, RunRecord) else entry.backfill_id
+                for entry in entries
+            ]
+
+        run_filters = RunsFilter(exclude_subruns=True)
+        for limit in [1, 3, 20]:
+            feed_ids = _page_through_feed(run_filters, BulkActionsFilter(), limit)
+            assert len(feed_ids) == len(set(feed_ids))
+            assert set(feed_ids) == set(run_ids + backfill_ids)
+        assert storage.get_runs_feed_count(run_filters, BulkActionsFilter()) == 15
+
+        # only runs, or only backfills
+        assert set(_page_through_feed(run_filters, None, 4)) == set(run_ids)
+        assert storage.get_runs_feed_count(run_filters, None) == 10
+        assert _page_through_feed(None, BulkActionsFilter(), 2) == list(reversed(backfill_ids))
+        assert storage.get_runs_feed_count(None, BulkActionsFilter()) == 5
+        assert storage.get_runs_feed_entries(limit=5, run_filters=None, backfill_filters=None) == (
+            RunsFeedConnection(
+                entries=[],
+                cursor=RunsFeedCursor(run_cursor=None, backfill_cursor=None, timestamp=None),
+                has_more=False,
+            )
+        )
+
+        # filters are applied to each type of entry
+        failed_run_filters = RunsFilter(statuses=[DagsterRunStatus.FAILURE], exclude_subruns=True)
+        failed_run_ids = _page_through_feed(
+            failed_run_filters,
+            BulkActionsFilter(statuses=[BulkActionStatus.COMPLETED_SUCCESS]),
+            2,
+        )
+        assert set(failed_run_ids) == set(run_ids[0:2] + run_ids[4:6] + run_ids[8:10])
+        assert (
+            storage.get_runs_feed_count(
+                failed_run_filters, BulkActionsFilter(statuses=[BulkActionStatus.REQUESTED])
+            )
+            == 11
+        )
+
     def test_secondary_index(self, storage):
         self._skip_in_memory(storage)
 
@@ -116,6 +116,7 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "snapshot-codec": ["msgpack", "zstandard"],
         "test": [
             "buildkite-test-collector",
             "docker",
@@ -134,6 +135,8 @@ def get_version() -> str:
             "fsspec<2024.5.0",  # morefs incompatibly
             "rapidfuzz",
             "flaky",
+            "msgpack",
+            "zstandard",
         ],
         "mypy": ["mypy==1.8.0"],
         "pyright": [
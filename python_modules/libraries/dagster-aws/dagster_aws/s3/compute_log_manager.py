@@ -1,6 +1,7 @@
+import io
 import os
 from contextlib import contextmanager
-from typing import Any, Iterator, Mapping, Optional, Sequence
+from typing import Any, Iterator, Mapping, Optional, Sequence, Tuple
 
 import boto3
 import dagster._seven as seven
@@ -49,6 +50,7 @@ class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
             endpoint_url: "http://alternate-s3-host.io"
             skip_empty_files: true
             upload_interval: 30
+            upload_partial_chunks: false
             upload_extra_args:
               ServerSideEncryption: "AES256"
             show_url_only: false
@@ -66,6 +68,7 @@ class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
         skip_empty_files: (Optional[bool]): Skip upload of empty log files.
         upload_interval: (Optional[int]): Interval in seconds to upload partial log files to S3. By default, will only upload when the capture is complete.
+        upload_partial_chunks: (Optional[bool]): At every upload interval, upload only the bytes logged since the previous upload as a separate S3 object, instead of re-uploading the whole partial log file. Readers then only fetch the chunks past their cursor. Default False.
         upload_extra_args: (Optional[dict]): Extra args for S3 file upload
         show_url_only: (Optional[bool]): Only show the URL of the log file in the UI, instead of fetching and displaying the full content. Default False.
         region: (Optional[str]): The region of the S3 bucket. If not specified, will use the default region of the AWS session.
@@ -88,6 +91,7 @@ def __init__(
         upload_extra_args=None,
         show_url_only=False,
         region=None,
+        upload_partial_chunks=False,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -105,6 +109,9 @@ def __init__(
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._skip_empty_files = check.bool_param(skip_empty_files, "skip_empty_files")
         self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        self._upload_partial_chunks = check.bool_param(
+            upload_partial_chunks, "upload_partial_chunks"
+        )
         check.opt_dict_param(upload_extra_args, "upload_extra_args")
         self._upload_extra_args = upload_extra_args
         self._show_url_only = show_url_only
@@ -135,6 +142,7 @@ def config_type(cls):
             ),
             "show_url_only": Field(bool, is_required=False, default_value=False),
             "region": Field(StringSource, is_required=False),
+            "upload_partial_chunks": Field(bool, is_required=False, default_value=False),
         }
 
     @classmethod
@@ -151,6 +159,10 @@ def local_manager(self) -> LocalComputeLogManager:
     def upload_interval(self) -> Optional[int]:
         return self._upload_interval if self._upload_interval else None
 
+    @property
+    def upload_partial_chunks(self) -> bool:
+        return self._upload_partial_chunks
+
     def _clean_prefix(self, prefix):
         parts = prefix.split("/")
         return "/".join([part for part in parts if part])
@@ -168,6 +180,30 @@ def _s3_key(self, log_key, io_type, partial=False):
         paths = [*self._resolve_path_for_namespace(namespace), filename]
         return "/".join(paths)  # s3 path delimiter
 
+    def _s3_partial_chunk_prefix(self, log_key, io_type):
+        # chunks are kept outside of the storage directory, so that they do not show up when
+        # listing the log files for a log key prefix
+        check.inst_param(io_type, "io_type", ComputeIOType)
+        extension = IO_TYPE_EXTENSION[io_type]
+        [*namespace, filebase] = log_key
+        paths = [self._s3_prefix, "partial_chunks", *namespace, f"{filebase}.{extension}", ""]
+        return "/".join(paths)
+
+    def _s3_partial_chunk_key(self, log_key, io_type, offset):
+        # zero-padded, so that chunks are listed in offset order
+        return f"{self._s3_partial_chunk_prefix(log_key, io_type)}{offset:020d}"
+
+    def _list_s3_objects(self, prefix):
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=prefix):
+            yield from page.get("Contents", [])
+
+    def _delete_s3_keys(self, s3_keys):
+        # delete_objects accepts at most 1000 keys per request
+        for i in range(0, len(s3_keys), 1000):
+            to_delete = [{"Key": key} for key in s3_keys[i : i + 1000]]
+            self._s3_session.delete_objects(Bucket=self._s3_bucket, Delete={"Objects": to_delete})
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with super().capture_logs(log_key) as local_context:
@@ -196,17 +232,23 @@ def delete_logs(
                 self._s3_key(log_key, ComputeIOType.STDOUT, partial=True),
                 self._s3_key(log_key, ComputeIOType.STDERR, partial=True),
             ]
+            for io_type in ComputeIOType:
+                s3_chunk_prefix = self._s3_partial_chunk_prefix(log_key, io_type)
+                s3_keys_to_remove.extend(
+                    obj["Key"] for obj in self._list_s3_objects(s3_chunk_prefix)
+                )
         elif prefix:
             # add the trailing '' to make sure that ['a'] does not match ['apple']
             s3_prefix = "/".join([self._s3_prefix, "storage", *prefix, ""])
             matching = self._s3_session.list_objects(Bucket=self._s3_bucket, Prefix=s3_prefix)
             s3_keys_to_remove = [obj["Key"] for obj in matching.get("Contents", [])]
+            s3_chunk_prefix = "/".join([self._s3_prefix, "partial_chunks", *prefix, ""])
+            s3_keys_to_remove.extend(obj["Key"] for obj in self._list_s3_objects(s3_chunk_prefix))
         else:
             check.failed("Must pass in either `log_key` or `prefix` argument to delete_logs")
 
         if s3_keys_to_remove:
-            to_delete = [{"Key": key} for key in s3_keys_to_remove]
-            self._s3_session.delete_objects(Bucket=self._s3_bucket, Delete={"Objects": to_delete})
+            self._delete_s3_keys(s3_keys_to_remove)
 
     def download_url_for_type(self, log_key: Sequence[str], io_type: ComputeIOType):
         if not self.is_capture_complete(log_key):
@@ -261,6 +303,55 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    def upload_partial_log_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, offset: int, data: bytes
+    ) -> None:
+        s3_key = self._s3_partial_chunk_key(log_key, io_type, offset)
+        extra_args = {
+            "ContentType": "text/plain",
+            **(self._upload_extra_args if self._upload_extra_args else {}),
+        }
+        self._s3_session.upload_fileobj(
+            io.BytesIO(data), self._s3_bucket, s3_key, ExtraArgs=extra_args
+        )
+
+    def get_partial_log_chunks(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Sequence[Tuple[int, int]]:
+        return sorted(
+            (int(obj["Key"].split("/")[-1]), obj["Size"])
+            for obj in self._list_s3_objects(self._s3_partial_chunk_prefix(log_key, io_type))
+        )
+
+    def download_partial_log_chunk(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunk_offset: int,
+        start: int = 0,
+        max_bytes: Optional[int] = None,
+    ) -> Optional[bytes]:
+        s3_key = self._s3_partial_chunk_key(log_key, io_type, chunk_offset)
+        end = str(start + max_bytes - 1) if max_bytes is not None else ""
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=s3_key, Range=f"bytes={start}-{end}"
+            )
+        except ClientError as e:
+            # deleted once the capture completed and the complete logs were uploaded
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def delete_partial_log_chunks(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        s3_keys = [
+            obj["Key"]
+            for obj in self._list_s3_objects(self._s3_partial_chunk_prefix(log_key, io_type))
+        ]
+        if s3_keys:
+            self._delete_s3_keys(s3_keys)
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
@@ -289,6 +380,9 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         self._subscription_manager.remove_subscription(subscription)
 
+    def on_partial_logs_uploaded(self, log_key: Sequence[str]) -> None:
+        self._subscription_manager.notify_subscriptions(log_key)
+
     def dispose(self):
         self._subscription_manager.dispose()
         self._local_manager.dispose()
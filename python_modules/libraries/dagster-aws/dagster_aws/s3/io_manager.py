@@ -28,13 +28,16 @@ def __init__(
         s3_bucket: str,
         s3_session: Any,
         s3_prefix: Optional[str] = None,
+        max_concurrent_partition_loads: Optional[int] = None,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         check.opt_str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session
         self.s3.list_objects(Bucket=s3_bucket, Prefix=s3_prefix, MaxKeys=1)
         base_path = UPath(s3_prefix) if s3_prefix else None
-        super().__init__(base_path=base_path)
+        super().__init__(
+            base_path=base_path, max_concurrent_partition_loads=max_concurrent_partition_loads
+        )
 
     def load_from_path(self, context: InputContext, path: UPath) -> Any:
         try:
@@ -130,6 +133,14 @@ def asset2(asset1):
     s3_prefix: str = Field(
         default="dagster", description="Prefix to use for the S3 bucket for this file manager."
     )
+    max_concurrent_partition_loads: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of partitions to load from S3 at the same time when an asset depends"
+            " on multiple partitions of an upstream asset. By default, partitions are loaded one"
+            " at a time."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -141,6 +152,7 @@ def inner_io_manager(self) -> PickledObjectS3IOManager:
             s3_bucket=self.s3_bucket,
             s3_session=self.s3_resource.get_client(),
             s3_prefix=self.s3_prefix,
+            max_concurrent_partition_loads=self.max_concurrent_partition_loads,
         )
 
     def load_input(self, context: InputContext) -> Any:
@@ -232,5 +244,12 @@ def my_job():
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        max_concurrent_partition_loads=init_context.resource_config.get(
+            "max_concurrent_partition_loads"
+        ),
+    )
     return pickled_io_manager
@@ -1,6 +1,8 @@
 import os
 import sys
 import tempfile
+import time
+from unittest import mock
 
 import pytest
 from botocore.exceptions import ClientError
@@ -245,6 +247,90 @@ def write_log_file(file_id: int, io_type: ComputeIOType):
     ]
 
 
+def test_partial_chunks(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as write_dir, tempfile.TemporaryDirectory() as read_dir:
+        write_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=write_dir,
+            upload_interval=1,
+            upload_partial_chunks=True,
+        )
+        read_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=read_dir,
+            upload_partial_chunks=True,
+        )
+        log_key = ["arbitrary", "log", "key"]
+
+        with write_manager.capture_logs(log_key):
+            print("hello")  # noqa: T201
+            time.sleep(2)
+
+            log_data = read_manager.get_log_data(log_key)
+            assert log_data.stdout == b"hello\n"
+            assert read_manager.get_partial_log_chunks(log_key, ComputeIOType.STDOUT) == [(0, 6)]
+            # the whole partial file is not uploaded
+            assert not read_manager.cloud_storage_has_logs(
+                log_key, ComputeIOType.STDOUT, partial=True
+            )
+
+            print("world")  # noqa: T201
+            time.sleep(2)
+
+            # only the bytes logged since the previous upload are uploaded
+            assert read_manager.get_partial_log_chunks(log_key, ComputeIOType.STDOUT) == [
+                (0, 6),
+                (6, 6),
+            ]
+            # reads only return the bytes past the cursor, across chunk boundaries
+            log_data = read_manager.get_log_data(log_key, cursor=log_data.cursor)
+            assert log_data.stdout == b"world\n"
+            assert read_manager.get_log_data_for_type(
+                log_key, ComputeIOType.STDOUT, offset=3, max_bytes=5
+            ) == (b"lo\nwo", 8)
+
+        assert read_manager.is_capture_complete(log_key)
+        assert read_manager.get_log_data(log_key).stdout == b"hello\nworld\n"
+        # the partial chunks are superseded by the complete logs
+        assert read_manager.get_partial_log_chunks(log_key, ComputeIOType.STDOUT) == []
+
+
+def test_partial_chunks_deleted_while_reading(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as write_dir, tempfile.TemporaryDirectory() as read_dir:
+        write_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=write_dir,
+            upload_interval=1,
+            upload_partial_chunks=True,
+        )
+        read_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=read_dir,
+            upload_partial_chunks=True,
+        )
+        log_key = ["arbitrary", "log", "key"]
+
+        with write_manager.capture_logs(log_key):
+            print("hello")  # noqa: T201
+            time.sleep(2)
+            stale_chunks = read_manager.get_partial_log_chunks(log_key, ComputeIOType.STDOUT)
+        assert stale_chunks == [(0, 6)]
+        assert read_manager.download_partial_log_chunk(log_key, ComputeIOType.STDOUT, 0) is None
+
+        # the capture completes between listing the chunks and downloading them
+        with (
+            mock.patch.object(read_manager, "get_partial_log_chunks", return_value=stale_chunks),
+            mock.patch.object(read_manager, "cloud_storage_has_logs", side_effect=[False, True]),
+        ):
+            assert read_manager.get_log_data_for_type(
+                log_key, ComputeIOType.STDOUT, offset=0, max_bytes=None
+            ) == (b"hello\n", 6)
+
+
 class TestS3ComputeLogManager(TestComputeLogManager):
     __test__ = True
 
@@ -15,6 +15,7 @@
     asset,
     graph,
     job,
+    materialize,
     op,
     resource,
 )
@@ -220,3 +221,29 @@ def test_s3_pickle_io_manager_asset_execution(mock_s3_bucket):
             "/".join(["dagster", "storage", result2.run_id, "graph_asset.first_op", "result"]),
         ),
     }
+
+
+def test_s3_pickle_io_manager_concurrent_partition_loads(mock_s3_bucket):
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+    for partition_key in partitions_def.get_partition_keys():
+        mock_s3_bucket.put_object(
+            Key=f"dagster/upstream/{partition_key}", Body=pickle.dumps(int(partition_key))
+        )
+
+    upstream = SourceAsset("upstream", partitions_def=partitions_def)
+
+    @asset
+    def downstream(upstream):
+        return upstream
+
+    result = materialize(
+        [upstream, downstream],
+        resources={
+            "io_manager": S3PickleIOManager(
+                s3_resource=S3TestResource(),
+                s3_bucket=mock_s3_bucket.name,
+                max_concurrent_partition_loads=4,
+            ),
+        },
+    )
+    assert result.output_for_node("downstream") == {str(i): i for i in range(10)}
@@ -69,7 +69,7 @@ def dbt_assets(
         required_resource_keys (Optional[Set[str]]): Set of required resource handles.
         project (Optional[DbtProject]): A DbtProject instance which provides a pointer to the dbt
             project location and manifest. Not required, but needed to attach code references from
-            model code to Dagster assets.
+            model code to Dagster assets, and to persist the translation cache.
         retry_policy (Optional[RetryPolicy]): The retry policy for the op that computes the asset.
 
     Examples:
@@ -53,6 +53,11 @@
 from dagster._core.definitions.tags import build_kind_tag
 from dagster._utils.merger import merge_dicts
 
+from dagster_dbt.dbt_translation_cache import (
+    TRANSLATION_CACHE_FILE_NAME,
+    get_translation_cache,
+    translate_dbt_nodes,
+)
 from dagster_dbt.metadata_set import DbtMetadataSet
 from dagster_dbt.utils import (
     ASSET_RESOURCE_TYPES,
@@ -759,29 +764,41 @@ def build_dbt_multi_asset_args(
         asset_resource_types=ASSET_RESOURCE_TYPES,
     )
 
+    translation_cache = None
+    if dagster_dbt_translator.settings.enable_translation_cache:
+        if not project:
+            raise DagsterInvalidDefinitionError(
+                "enable_translation_cache requires a DbtProject to be supplied"
+                " to the @dbt_assets decorator."
+            )
+
+        translation_cache = get_translation_cache(
+            project.manifest_path.parent.joinpath(TRANSLATION_CACHE_FILE_NAME)
+        )
+
+    translations = translate_dbt_nodes(
+        manifest=manifest,
+        dbt_nodes=dbt_resource_props_by_dbt_unique_id,
+        dagster_dbt_translator=dagster_dbt_translator,
+        dbt_unique_id_deps=dbt_unique_id_deps,
+        translation_cache=translation_cache,
+    )
+
     deps: Dict[AssetKey, AssetDep] = {}
     outs: Dict[str, AssetOut] = {}
     internal_asset_deps: Dict[str, Set[AssetKey]] = {}
     check_specs_by_key: Dict[AssetCheckKey, AssetCheckSpec] = {}
 
     dbt_unique_id_and_resource_types_by_asset_key: Dict[AssetKey, Tuple[Set[str], Set[str]]] = {}
-    dbt_group_resource_props_by_group_name: Dict[str, Dict[str, Any]] = {
-        dbt_group_resource_props["name"]: dbt_group_resource_props
-        for dbt_group_resource_props in manifest["groups"].values()
-    }
 
     dbt_adapter_type = manifest.get("metadata", {}).get("adapter_type")
 
     for unique_id, parent_unique_ids in dbt_unique_id_deps.items():
         dbt_resource_props = dbt_resource_props_by_dbt_unique_id[unique_id]
-
-        dbt_group_name = dbt_resource_props.get("group")
-        dbt_group_resource_props = (
-            dbt_group_resource_props_by_group_name.get(dbt_group_name) if dbt_group_name else None
-        )
+        translation = translations[unique_id]
 
         output_name = dagster_name_fn(dbt_resource_props)
-        asset_key = dagster_dbt_translator.get_asset_key(dbt_resource_props)
+        asset_key = translation.asset_key
 
         unique_ids_for_asset_key, resource_types_for_asset_key = (
             dbt_unique_id_and_resource_types_by_asset_key.setdefault(asset_key, (set(), set()))
@@ -790,7 +807,7 @@ def build_dbt_multi_asset_args(
         resource_types_for_asset_key.add(dbt_resource_props["resource_type"])
 
         metadata = {
-            **dagster_dbt_translator.get_metadata(dbt_resource_props),
+            **translation.metadata,
             DAGSTER_DBT_MANIFEST_METADATA_KEY: DbtManifestWrapper(manifest=manifest),
             DAGSTER_DBT_TRANSLATOR_METADATA_KEY: dagster_dbt_translator,
         }
@@ -811,53 +828,30 @@ def build_dbt_multi_asset_args(
             key=asset_key,
             dagster_type=Nothing,
             io_manager_key=io_manager_key,
-            description=dagster_dbt_translator.get_description(dbt_resource_props),
+            description=translation.description,
             is_required=False,
             metadata=metadata,
-            owners=dagster_dbt_translator.get_owners(
-                {
-                    **dbt_resource_props,
-                    **({"group": dbt_group_resource_props} if dbt_group_resource_props else {}),
-                }
-            ),
+            owners=translation.owners,
             tags={
                 **build_kind_tag("dbt"),
                 **(build_kind_tag(dbt_adapter_type) if dbt_adapter_type else {}),
-                **dagster_dbt_translator.get_tags(dbt_resource_props),
+                **translation.tags,
             },
-            group_name=dagster_dbt_translator.get_group_name(dbt_resource_props),
-            code_version=dagster_dbt_translator.get_code_version(dbt_resource_props),
-            freshness_policy=dagster_dbt_translator.get_freshness_policy(dbt_resource_props),
-            automation_condition=dagster_dbt_translator.get_automation_condition(
-                dbt_resource_props
-            ),
+            group_name=translation.group_name,
+            code_version=translation.code_version,
+            freshness_policy=translation.freshness_policy,
+            automation_condition=translation.automation_condition,
         )
 
-        test_unique_ids = [
-            child_unique_id
-            for child_unique_id in manifest["child_map"][unique_id]
-            if child_unique_id.startswith("test")
-        ]
-        for test_unique_id in test_unique_ids:
-            check_spec = default_asset_check_fn(
-                manifest,
-                dbt_resource_props_by_dbt_unique_id,
-                dagster_dbt_translator,
-                asset_key,
-                test_unique_id,
-            )
-            if check_spec:
-                check_specs_by_key[check_spec.key] = check_spec
+        for check_spec in translation.check_specs:
+            check_specs_by_key[check_spec.key] = check_spec
 
         # Translate parent unique ids to dependencies
         output_internal_deps = internal_asset_deps.setdefault(output_name, set())
         for parent_unique_id in parent_unique_ids:
             dbt_parent_resource_props = dbt_resource_props_by_dbt_unique_id[parent_unique_id]
-            parent_asset_key = dagster_dbt_translator.get_asset_key(dbt_parent_resource_props)
-            parent_partition_mapping = dagster_dbt_translator.get_partition_mapping(
-                dbt_resource_props,
-                dbt_parent_resource_props=dbt_parent_resource_props,
-            )
+            parent_asset_key = translation.parent_asset_keys[parent_unique_id]
+            parent_partition_mapping = translation.parent_partition_mappings[parent_unique_id]
 
             parent_unique_ids_for_asset_key, parent_resource_types_for_asset_key = (
                 dbt_unique_id_and_resource_types_by_asset_key.setdefault(
@@ -877,10 +871,7 @@ def build_dbt_multi_asset_args(
                     partition_mapping=parent_partition_mapping,
                 )
 
-        self_partition_mapping = dagster_dbt_translator.get_partition_mapping(
-            dbt_resource_props,
-            dbt_parent_resource_props=dbt_resource_props,
-        )
+        self_partition_mapping = translation.self_partition_mapping
         if self_partition_mapping and has_self_dependency(dbt_resource_props):
             deps[asset_key] = AssetDep(
                 asset=asset_key,
@@ -37,12 +37,18 @@ class DagsterDbtTranslatorSettings:
             Defaults to False.
         enable_dbt_selection_by_name (bool): Whether to enable selecting dbt resources by name,
             rather than fully qualified name. Defaults to False.
+        enable_translation_cache (bool): Whether to persist the Dagster definitions translated
+            from dbt resources next to the manifest of the DbtProject, so that only the dbt
+            resources that changed are translated again when the code location is reloaded.
+            Translations are reused as long as the translator's class and state are unchanged, so
+            translators should not depend on anything else. Defaults to False.
     """
 
     enable_asset_checks: bool = True
     enable_duplicate_source_asset_keys: bool = False
     enable_code_references: bool = False
     enable_dbt_selection_by_name: bool = False
+    enable_translation_cache: bool = False
 
 
 class DagsterDbtTranslator:
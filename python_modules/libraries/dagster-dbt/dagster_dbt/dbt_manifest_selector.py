@@ -0,0 +1,499 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatch
+from functools import cached_property
+from pathlib import PurePath
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from dagster import get_dagster_logger
+
+logger = get_dagster_logger()
+
+# Same as `RAW_SELECTOR_PATTERN` in `dbt.graph.selector_spec`
+RAW_SELECTOR_PATTERN = re.compile(
+    r"\A"
+    r"(?P<childrens_parents>(\@))?"
+    r"(?P<parents>((?P<parents_depth>(\d*))\+))?"
+    r"((?P<method>([\w.]+)):)?(?P<value>(.*?))"
+    r"(?P<children>(\+(?P<children_depth>(\d*))))?"
+    r"\Z"
+)
+SELECTOR_GLOB = "*"
+UNION_DELIMITER = " "
+INTERSECTION_DELIMITER = ","
+
+# Resource types that are selected along with their parents, as with dbt's default "eager"
+# indirect selection
+INDIRECTLY_SELECTED_RESOURCE_TYPES = {"test", "unit_test"}
+
+MANIFEST_SELECTOR_CACHE_SIZE = 4
+
+
+class UnsupportedDbtSelectionError(Exception):
+    """Raised for selection strings that can only be resolved by dbt itself."""
+
+
+class _SelectionCriteria(NamedTuple):
+    method: str
+    value: str
+    childrens_parents: bool
+    parents: bool
+    parents_depth: Optional[int]
+    children: bool
+    children_depth: Optional[int]
+
+
+# A union of intersections of selection criteria, along with the raw string of each intersection
+_SelectionUnion = Sequence[Tuple[str, Sequence[_SelectionCriteria]]]
+
+
+def _match_to_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+def _default_method(value: str) -> str:
+    if os.path.sep in value or (os.path.altsep is not None and os.path.altsep in value):
+        return "path"
+    elif value.lower().endswith((".sql", ".py", ".csv")):
+        return "file"
+    else:
+        return "fqn"
+
+
+def _flatten_fqn(fqn: Sequence[str]) -> Sequence[str]:
+    # Dots in names act as namespace separators
+    return [item for segment in fqn for item in segment.split(".")]
+
+
+def _is_selected_fqn(fqn: Sequence[str], flat_fqn: Sequence[str], selector: str) -> bool:
+    """Port of `dbt.graph.selector_methods.is_selected_node` for nodes that are not versioned."""
+    if not fqn:
+        return False
+    if fqn[-1] == selector:
+        return True
+
+    selector_parts = selector.split(".")
+    if len(flat_fqn) < len(selector_parts):
+        return False
+
+    for i, selector_part in enumerate(selector_parts):
+        if any(wildcard in selector_part for wildcard in ("*", "?", "[", "]")):
+            return fnmatch(".".join(flat_fqn[i:]), ".".join(selector_parts[i:]))
+        elif flat_fqn[i] != selector_part:
+            return False
+
+    return True
+
+
+def _match_path_parts(parts: Sequence[str], pattern_parts: Sequence[str]) -> bool:
+    if not pattern_parts:
+        return not parts
+
+    pattern_part, *rest = pattern_parts
+    if pattern_part == "**":
+        return any(_match_path_parts(parts[i:], rest) for i in range(len(parts) + 1))
+
+    return bool(parts) and fnmatch(parts[0], pattern_part) and _match_path_parts(parts[1:], rest)
+
+
+class DbtManifestSelector:
+    """Resolves dbt selection strings against a manifest, without building dbt's manifest,
+    graph and selector objects.
+
+    Selections are resolved exactly as they are by dbt in `select_unique_ids_from_manifest`, over
+    indexes of the manifest's graph that are built once per manifest. The fqn, tag, path, file,
+    package, group, source, resource_type, exposure, metric, semantic_model, saved_query and
+    unit_test methods are supported, along with the graph operators (``+``, ``n+``, ``+n`` and
+    ``@``), unions, intersections and exclusions. Other selections raise
+    :py:class:`UnsupportedDbtSelectionError`.
+
+    Paths are matched against the paths of the resources in the manifest, relative to the dbt
+    project, rather than against the files on disk.
+    """
+
+    def __init__(self, manifest: Mapping[str, Any]):
+        resources_by_category: Mapping[str, Mapping[str, Mapping[str, Any]]] = {
+            category: manifest.get(category) or {}
+            for category in [
+                "nodes",
+                "sources",
+                "exposures",
+                "metrics",
+                "semantic_models",
+                "saved_queries",
+                "unit_tests",
+            ]
+        }
+
+        # The graph contains the resources in the child map that are enabled
+        child_map: Mapping[str, Sequence[str]] = manifest["child_map"]
+        graph_unique_ids = set(child_map).union(*child_map.values())
+
+        self._resources_by_category: Dict[str, Dict[str, Mapping[str, Any]]] = {
+            category: {
+                unique_id: resource_props
+                for unique_id, resource_props in resources.items()
+                if unique_id in graph_unique_ids and self._is_graph_member(category, resource_props)
+            }
+            for category, resources in resources_by_category.items()
+        }
+        self._resources: Dict[str, Mapping[str, Any]] = {
+            unique_id: resource_props
+            for resources in self._resources_by_category.values()
+            for unique_id, resource_props in resources.items()
+        }
+
+        self._children: Dict[str, List[str]] = {
+            unique_id: [
+                child_unique_id
+                for child_unique_id in dict.fromkeys(child_map.get(unique_id, []))
+                if child_unique_id in self._resources
+            ]
+            for unique_id in self._resources
+        }
+        self._parents: Dict[str, List[str]] = {unique_id: [] for unique_id in self._resources}
+        for unique_id, child_unique_ids in self._children.items():
+            for child_unique_id in child_unique_ids:
+                self._parents[child_unique_id].append(unique_id)
+
+        self._indirectly_selectable_unique_ids = {
+            unique_id
+            for category in ["nodes", "unit_tests"]
+            for unique_id, resource_props in self._resources_by_category[category].items()
+            if resource_props["resource_type"] in INDIRECTLY_SELECTED_RESOURCE_TYPES
+        }
+
+        # fqns with and without their package, for the nodes searched by the fqn method
+        self._fqns: Sequence[Tuple[str, Sequence[str], Sequence[str], Sequence[str]]] = [
+            (
+                unique_id,
+                resource_props["fqn"],
+                _flatten_fqn(resource_props["fqn"]),
+                _flatten_fqn(resource_props["fqn"][1:]),
+            )
+            for unique_id, resource_props in self._iter_resources(
+                "nodes", "exposures", "metrics", "unit_tests", "semantic_models", "saved_queries"
+            )
+        ]
+
+        self._search_methods: Mapping[str, Callable[[str], Iterable[str]]] = {
+            "fqn": self._search_fqn,
+            "tag": self._search_tag,
+            "path": self._search_path,
+            "file": self._search_file,
+            "package": self._search_package,
+            "group": self._search_group,
+            "source": self._search_source,
+            "resource_type": self._search_resource_type,
+            "exposure": lambda selector: self._search_by_name("exposures", selector),
+            "metric": lambda selector: self._search_by_name("metrics", selector),
+            "semantic_model": lambda selector: self._search_by_name("semantic_models", selector),
+            "saved_query": lambda selector: self._search_by_name("saved_queries", selector),
+            "unit_test": lambda selector: self._search_by_name("unit_tests", selector),
+        }
+
+        self._selections: Dict[Tuple[str, str], FrozenSet[str]] = {}
+
+    @staticmethod
+    def _is_graph_member(category: str, resource_props: Mapping[str, Any]) -> bool:
+        if category in ("exposures", "unit_tests"):
+            return True
+
+        enabled = bool(resource_props["config"].get("enabled"))
+        if category == "nodes":
+            return enabled and not resource_props.get("empty")
+
+        return enabled
+
+    @cached_property
+    def _paths(self) -> Sequence[Tuple[str, Sequence[Tuple[str, ...]]]]:
+        """The files of the resources searched by the path method and the directories containing
+        them, as path parts.
+        """
+        paths_by_unique_id = []
+        for unique_id, resource_props in self._iter_all_resources():
+            original_file_path = PurePath(resource_props["original_file_path"])
+            paths = [original_file_path, *original_file_path.parents]
+
+            patch_path = resource_props.get("patch_path")
+            if patch_path:
+                paths.append(PurePath(patch_path.split("://")[1]))
+
+            paths_by_unique_id.append((unique_id, [path.parts for path in paths]))
+
+        return paths_by_unique_id
+
+    def _iter_resources(self, *categories: str) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        for category in categories:
+            yield from self._resources_by_category[category].items()
+
+    def _iter_all_resources(self) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        # Saved queries are not searched by the methods that search all resources
+        return self._iter_resources(
+            "nodes", "sources", "exposures", "metrics", "unit_tests", "semantic_models"
+        )
+
+    def select(self, select: str, exclude: str) -> AbstractSet[str]:
+        """Returns the unique ids of the resources selected by ``select`` and not by ``exclude``."""
+        selection_key = (select, exclude)
+        if selection_key not in self._selections:
+            self._selections[selection_key] = frozenset(self._select(select, exclude))
+
+        return self._selections[selection_key]
+
+    def _select(self, select: str, exclude: str) -> Set[str]:
+        # Parse everything up front, so that unsupported selections are rejected before any of
+        # the selection is resolved
+        parsed_select = self._parse_union(select)
+        parsed_exclude = self._parse_union(exclude) if exclude else []
+
+        empty_intersections: List[str] = []
+        selected = self._select_union(parsed_select, empty_intersections)
+        if parsed_exclude:
+            selected -= self._select_union(parsed_exclude, [])
+
+        for raw in empty_intersections:
+            logger.warning(f"The selection criterion '{raw}' does not match any enabled nodes")
+
+        return selected
+
+    def _parse_union(self, raw: str) -> _SelectionUnion:
+        return [
+            (
+                raw_intersection,
+                [
+                    self._parse_criteria(raw_criteria)
+                    for raw_criteria in raw_intersection.split(INTERSECTION_DELIMITER)
+                ],
+            )
+            for raw_intersection in raw.split(UNION_DELIMITER)
+        ]
+
+    def _parse_criteria(self, raw: str) -> _SelectionCriteria:
+        match = RAW_SELECTOR_PATTERN.match(raw)
+        if match is None:
+            raise UnsupportedDbtSelectionError(f'Invalid selector spec "{raw}"')
+
+        groups = match.groupdict()
+        method = groups["method"] or _default_method(groups["value"])
+        if method not in self._search_methods:
+            raise UnsupportedDbtSelectionError(f"Unsupported selection method '{method}'")
+
+        if groups["childrens_parents"] and groups["children"]:
+            raise UnsupportedDbtSelectionError(
+                f'Invalid node spec {raw} - "@" prefix and "+" suffix are incompatible'
+            )
+
+        return _SelectionCriteria(
+            method=method,
+            value=groups["value"],
+            childrens_parents=bool(groups["childrens_parents"]),
+            parents=bool(groups["parents"]),
+            parents_depth=_match_to_int(groups["parents_depth"]),
+            children=bool(groups["children"]),
+            children_depth=_match_to_int(groups["children_depth"]),
+        )
+
+    def _select_union(self, union: _SelectionUnion, empty_intersections: List[str]) -> Set[str]:
+        selected: Set[str] = set()
+        for raw_intersection, intersection in union:
+            intersection_selected = set.intersection(
+                *(self._select_criteria(criteria) for criteria in intersection)
+            )
+            if not intersection_selected:
+                empty_intersections.append(raw_intersection)
+
+            selected |= intersection_selected
+
+        return selected
+
+    def _select_criteria(self, criteria: _SelectionCriteria) -> Set[str]:
+        collected = set(self._search_methods[criteria.method](criteria.value))
+
+        selected = set(collected)
+        if criteria.childrens_parents:
+            selected |= self._select_childrens_parents(collected)
+        if criteria.parents:
+            selected |= self._select_relatives(collected, self._parents, criteria.parents_depth)
+        if criteria.children:
+            selected |= self._select_relatives(collected, self._children, criteria.children_depth)
+
+        # Tests are selected along with any of the resources that they test
+        selected.update(
+            child_unique_id
+            for unique_id in list(selected)
+            for child_unique_id in self._children[unique_id]
+            if child_unique_id in self._indirectly_selectable_unique_ids
+        )
+
+        return selected
+
+    @staticmethod
+    def _select_relatives(
+        selected: AbstractSet[str], edges: Mapping[str, Sequence[str]], max_depth: Optional[int]
+    ) -> Set[str]:
+        """Breadth-first search of the resources up to ``max_depth`` edges away from ``selected``,
+        which are only included themselves if they can be reached from one another.
+        """
+        relatives: Set[str] = set()
+        layer = selected
+        depth = 0
+        while layer and (max_depth is None or depth < max_depth):
+            next_layer = {
+                relative for unique_id in layer for relative in edges[unique_id]
+            } - relatives
+            relatives |= next_layer
+            layer = next_layer
+            depth += 1
+
+        return relatives
+
+    def _select_childrens_parents(self, selected: AbstractSet[str]) -> Set[str]:
+        ancestors_for = self._select_relatives(selected, self._children, None) | selected
+        return self._select_relatives(ancestors_for, self._parents, None) | ancestors_for
+
+    def _search_fqn(self, selector: str) -> Iterable[str]:
+        # Like `select_unique_ids_from_manifest`, versioned models are only matched on their
+        # full fqn, which includes their version
+        for unique_id, fqn, flat_fqn, unscoped_flat_fqn in self._fqns:
+            if _is_selected_fqn(fqn, flat_fqn, selector) or _is_selected_fqn(
+                fqn[1:], unscoped_flat_fqn, selector
+            ):
+                yield unique_id
+
+    def _search_tag(self, selector: str) -> Iterable[str]:
+        # Unit tests are not matched on their tags by `select_unique_ids_from_manifest`, since
+        # their tags are only in their config
+        for unique_id, resource_props in self._iter_resources(
+            "nodes", "sources", "exposures", "metrics", "semantic_models"
+        ):
+            if any(fnmatch(tag, selector) for tag in resource_props.get("tags") or []):
+                yield unique_id
+
+    def _search_path(self, selector: str) -> Iterable[str]:
+        path_selector = PurePath(selector)
+        if path_selector.is_absolute() or ".." in path_selector.parts:
+            raise UnsupportedDbtSelectionError(f"Unsupported path selector '{selector}'")
+
+        pattern_parts = path_selector.parts
+        matches: Dict[Tuple[str, ...], bool] = {}
+        for unique_id, paths in self._paths:
+            for path in paths:
+                if path not in matches:
+                    matches[path] = _match_path_parts(path, pattern_parts)
+                if matches[path]:
+                    yield unique_id
+                    break
+
+    def _search_file(self, selector: str) -> Iterable[str]:
+        for unique_id, resource_props in self._iter_all_resources():
+            original_file_path = PurePath(resource_props["original_file_path"])
+            if fnmatch(original_file_path.name, selector) or fnmatch(
+                original_file_path.stem, selector
+            ):
+                yield unique_id
+
+    def _search_package(self, selector: str) -> Iterable[str]:
+        for unique_id, resource_props in self._iter_all_resources():
+            if fnmatch(resource_props["package_name"], selector):
+                yield unique_id
+
+    def _search_group(self, selector: str) -> Iterable[str]:
+        for unique_id, resource_props in self._iter_resources("nodes", "metrics"):
+            group = resource_props["config"].get("group")
+            if group and fnmatch(group, selector):
+                yield unique_id
+
+    def _search_source(self, selector: str) -> Iterable[str]:
+        parts = selector.split(".")
+        target_package = SELECTOR_GLOB
+        if len(parts) == 1:
+            target_source, target_table = parts[0], SELECTOR_GLOB
+        elif len(parts) == 2:
+            target_source, target_table = parts
+        elif len(parts) == 3:
+            target_package, target_source, target_table = parts
+        else:
+            raise UnsupportedDbtSelectionError(f"Invalid source selector value '{selector}'")
+
+        for unique_id, resource_props in self._iter_resources("sources"):
+            if (
+                fnmatch(resource_props["package_name"], target_package)
+                and fnmatch(resource_props["source_name"], target_source)
+                and fnmatch(resource_props["name"], target_table)
+            ):
+                yield unique_id
+
+    def _search_resource_type(self, selector: str) -> Iterable[str]:
+        unique_ids = [
+            unique_id
+            for unique_id, resource_props in self._iter_all_resources()
+            if resource_props["resource_type"] == selector
+        ]
+        if not unique_ids:
+            # Leave it to dbt to decide whether this is a valid resource type
+            raise UnsupportedDbtSelectionError(f"Unknown resource type '{selector}'")
+
+        return unique_ids
+
+    def _search_by_name(self, category: str, selector: str) -> Iterable[str]:
+        parts = selector.split(".")
+        target_package = SELECTOR_GLOB
+        if len(parts) == 1:
+            target_name = parts[0]
+        elif len(parts) == 2:
+            target_package, target_name = parts
+        else:
+            raise UnsupportedDbtSelectionError(f"Invalid {category} selector value '{selector}'")
+
+        for unique_id, resource_props in self._iter_resources(category):
+            if fnmatch(resource_props["package_name"], target_package) and fnmatch(
+                resource_props["name"], target_name
+            ):
+                yield unique_id
+
+
+_manifest_selectors_lock = threading.Lock()
+_manifest_selectors: "OrderedDict[int, Tuple[Mapping[str, Any], DbtManifestSelector]]" = (
+    OrderedDict()
+)
+
+
+def get_manifest_selector(manifest: Mapping[str, Any]) -> DbtManifestSelector:
+    """Returns the selector for a manifest, building its indexes only the first time it is used.
+
+    Selectors are cached for the most recently used manifests. Manifests are identified by their
+    object rather than by their contents, since hashing a large manifest costs about as much as
+    indexing it. Manifests read from the same path are shared, see `read_manifest_path`.
+    """
+    with _manifest_selectors_lock:
+        cached = _manifest_selectors.get(id(manifest))
+        if cached and cached[0] is manifest:
+            _manifest_selectors.move_to_end(id(manifest))
+            return cached[1]
+
+    selector = DbtManifestSelector(manifest)
+
+    with _manifest_selectors_lock:
+        # Keep a reference to the manifest, so that its id is not reused while it is cached
+        _manifest_selectors[id(manifest)] = (manifest, selector)
+        while len(_manifest_selectors) > MANIFEST_SELECTOR_CACHE_SIZE:
+            _manifest_selectors.popitem(last=False)
+
+    return selector
@@ -0,0 +1,471 @@
+import hashlib
+import inspect
+import os
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import orjson
+from dagster import (
+    AssetCheckSpec,
+    AssetKey,
+    AutomationCondition,
+    FreshnessPolicy,
+    PartitionMapping,
+    get_dagster_logger,
+)
+from dagster._serdes.serdes import JsonSerializableValue, pack_value, unpack_value
+from dagster._utils.timing import format_duration, time_execution_scope
+
+from dagster_dbt.version import __version__
+
+if TYPE_CHECKING:
+    from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
+
+logger = get_dagster_logger()
+
+TRANSLATION_CACHE_FILE_NAME = "dagster_dbt_translation_cache.json"
+TRANSLATION_CACHE_FORMAT_VERSION = 1
+
+
+class DbtNodeTranslation(NamedTuple):
+    """Everything that a translator derives from a single dbt resource selected as an asset.
+
+    The translation of a resource only depends on its own properties, the properties of its
+    group, its parents and its tests, so it can be reused as long as none of those change.
+    """
+
+    asset_key: AssetKey
+    description: Optional[str]
+    metadata: Dict[str, Any]
+    owners: Optional[List[str]]
+    tags: Dict[str, str]
+    group_name: Optional[str]
+    code_version: Optional[str]
+    freshness_policy: Optional[FreshnessPolicy]
+    automation_condition: Optional[AutomationCondition]
+    self_partition_mapping: Optional[PartitionMapping]
+    parent_asset_keys: Dict[str, AssetKey]
+    parent_partition_mappings: Dict[str, Optional[PartitionMapping]]
+    check_specs: List[AssetCheckSpec]
+
+
+class DbtTranslationMetrics(NamedTuple):
+    """Time spent translating dbt resources into Dagster definitions in this process."""
+
+    num_translated: int
+    num_reused: int
+    seconds: float
+
+
+_translation_metrics = DbtTranslationMetrics(num_translated=0, num_reused=0, seconds=0.0)
+_translation_metrics_lock = threading.Lock()
+
+
+def get_dbt_translation_metrics() -> DbtTranslationMetrics:
+    """Returns how many dbt resources have been translated in this process, how many of those
+    translations were reused from a translation cache, and the total time spent translating.
+    """
+    return _translation_metrics
+
+
+def _record_translation_metrics(num_translated: int, num_reused: int, seconds: float) -> None:
+    global _translation_metrics  # noqa: PLW0603
+
+    with _translation_metrics_lock:
+        _translation_metrics = DbtTranslationMetrics(
+            num_translated=_translation_metrics.num_translated + num_translated,
+            num_reused=_translation_metrics.num_reused + num_reused,
+            seconds=_translation_metrics.seconds + seconds,
+        )
+
+
+def get_translator_fingerprint(dagster_dbt_translator: "DagsterDbtTranslator") -> Optional[str]:
+    """Identifies the behavior of a translator, or returns ``None`` if it cannot be identified.
+
+    The fingerprint covers the version of dagster-dbt, the translator settings, the source of the
+    translator classes defined outside of dagster-dbt and the state of the translator instance.
+    Translators whose state has no stable representation cannot be fingerprinted.
+    """
+    parts = [__version__, repr(dagster_dbt_translator.settings)]
+
+    for cls in type(dagster_dbt_translator).__mro__:
+        if cls is object or cls.__module__.split(".")[0] == "dagster_dbt":
+            continue
+
+        try:
+            parts.append(f"{cls.__module__}.{cls.__qualname__}:{inspect.getsource(cls)}")
+        except (OSError, TypeError):
+            return None
+
+    state = repr(
+        sorted(
+            (name, value)
+            for name, value in vars(dagster_dbt_translator).items()
+            if name != "_settings"
+        )
+    )
+    # Default object representations include memory addresses, which change between processes
+    if " at 0x" in state:
+        return None
+    parts.append(state)
+
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _pack_translation(translation: DbtNodeTranslation) -> JsonSerializableValue:
+    # Check specs are not serializable, so only the fields set by dbt tests are stored
+    return pack_value(
+        {
+            **translation._asdict(),
+            "check_specs": [
+                {
+                    "name": check_spec.name,
+                    "asset_key": check_spec.asset_key,
+                    "description": check_spec.description,
+                    "additional_deps": [dep.asset_key for dep in check_spec.additional_deps],
+                }
+                for check_spec in translation.check_specs
+            ],
+        }
+    )
+
+
+def _unpack_translation(packed: JsonSerializableValue) -> DbtNodeTranslation:
+    fields = unpack_value(packed, dict)
+    return DbtNodeTranslation(
+        **{
+            **fields,
+            "check_specs": [
+                AssetCheckSpec(
+                    name=check_spec["name"],
+                    asset=check_spec["asset_key"],
+                    description=check_spec["description"],
+                    additional_deps=check_spec["additional_deps"],
+                )
+                for check_spec in fields["check_specs"]
+            ],
+        }
+    )
+
+
+class DbtTranslationCache:
+    """Translations of dbt resources, persisted to a file so that they can be reused when the
+    code location is loaded again.
+
+    Translations are keyed on a digest of everything they were derived from, so a stale
+    translation is never looked up. Whenever new translations are written, the file is pruned to
+    the translations used by this process, which drops those of resources that have since changed
+    or been removed.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._used_keys: Set[str] = set()
+        self._packed: Dict[str, JsonSerializableValue] = {}
+        self._translations: Dict[str, DbtNodeTranslation] = {}
+        self._persisted_keys: AbstractSet[str] = set()
+
+        try:
+            cache = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError):
+            logger.debug(f"Ignoring unreadable dbt translation cache at `{path}`.", exc_info=True)
+            return
+
+        if (
+            isinstance(cache, dict)
+            and cache.get("version") == TRANSLATION_CACHE_FORMAT_VERSION
+            and isinstance(cache.get("translations"), dict)
+        ):
+            self._packed = cache["translations"]
+            self._persisted_keys = set(self._packed)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: str) -> Optional[DbtNodeTranslation]:
+        with self._lock:
+            translation = self._translations.get(key)
+            packed = self._packed.get(key)
+
+        if translation is None and packed is not None:
+            try:
+                translation = _unpack_translation(packed)
+            except Exception:
+                logger.debug(f"Ignoring unreadable dbt translation `{key}`.", exc_info=True)
+                return None
+
+        if translation is not None:
+            with self._lock:
+                self._translations[key] = translation
+                self._used_keys.add(key)
+
+        return translation
+
+    def put(self, key: str, translation: DbtNodeTranslation) -> None:
+        """Stores a translation, unless it does not survive serialization unchanged, e.g. because
+        a translator returned values that Dagster cannot serialize.
+        """
+        try:
+            packed = _pack_translation(translation)
+            if _unpack_translation(packed) != translation:
+                return
+        except Exception:
+            return
+
+        with self._lock:
+            self._packed[key] = packed
+            self._translations[key] = translation
+            self._used_keys.add(key)
+
+    def flush(self) -> None:
+        """Writes the translations used by this process, if some of them are not on disk yet."""
+        with self._lock:
+            if self._used_keys <= self._persisted_keys:
+                return
+
+            used_keys = set(self._used_keys)
+            contents = orjson.dumps(
+                {
+                    "version": TRANSLATION_CACHE_FORMAT_VERSION,
+                    "translations": {key: self._packed[key] for key in sorted(used_keys)},
+                }
+            )
+
+        # Write atomically, since other processes may be reading the cache at the same time
+        temp_path = self._path.with_name(f".{self._path.name}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_bytes(contents)
+            os.replace(temp_path, self._path)
+        except OSError:
+            logger.debug(f"Could not write dbt translation cache to `{self._path}`.", exc_info=True)
+            temp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._persisted_keys = used_keys
+
+
+_translation_caches: Dict[Path, DbtTranslationCache] = {}
+_translation_caches_lock = threading.Lock()
+
+
+def get_translation_cache(path: Path) -> DbtTranslationCache:
+    """Returns the translation cache persisted at a path, reading it only the first time it is
+    used in this process.
+    """
+    path = path.resolve()
+    with _translation_caches_lock:
+        if path not in _translation_caches:
+            _translation_caches[path] = DbtTranslationCache(path)
+
+        return _translation_caches[path]
+
+
+class _DbtNodeDigests:
+    """Digests of the properties of dbt resources, computed at most once per resource."""
+
+    def __init__(self, dbt_nodes: Mapping[str, Any]):
+        self._dbt_nodes = dbt_nodes
+        self._digests: Dict[str, str] = {}
+
+    def __getitem__(self, unique_id: str) -> str:
+        digest = self._digests.get(unique_id)
+        if digest is None:
+            digest = hashlib.blake2b(
+                orjson.dumps(self._dbt_nodes[unique_id], option=orjson.OPT_SORT_KEYS),
+                digest_size=16,
+            ).hexdigest()
+            self._digests[unique_id] = digest
+
+        return digest
+
+
+def _get_translation_key(
+    fingerprint: str,
+    digests: _DbtNodeDigests,
+    manifest: Mapping[str, Any],
+    unique_id: str,
+    parent_unique_ids: AbstractSet[str],
+    test_unique_ids: Sequence[str],
+    dbt_group_resource_props: Optional[Mapping[str, Any]],
+) -> str:
+    def _parts() -> Iterator[str]:
+        yield fingerprint
+        yield unique_id
+        yield digests[unique_id]
+        yield orjson.dumps(dbt_group_resource_props, option=orjson.OPT_SORT_KEYS).decode()
+        for parent_unique_id in sorted(parent_unique_ids):
+            yield parent_unique_id
+            yield digests[parent_unique_id]
+        for test_unique_id in sorted(test_unique_ids):
+            yield test_unique_id
+            yield digests[test_unique_id]
+            for test_parent_unique_id in sorted(manifest["parent_map"].get(test_unique_id, [])):
+                yield test_parent_unique_id
+                yield digests[test_parent_unique_id]
+
+    return hashlib.blake2b("\0".join(_parts()).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def translate_dbt_node(
+    manifest: Mapping[str, Any],
+    dbt_nodes: Mapping[str, Any],
+    dagster_dbt_translator: "DagsterDbtTranslator",
+    unique_id: str,
+    parent_unique_ids: AbstractSet[str],
+    test_unique_ids: Sequence[str],
+    dbt_group_resource_props: Optional[Mapping[str, Any]],
+) -> DbtNodeTranslation:
+    from dagster_dbt.asset_utils import default_asset_check_fn
+
+    dbt_resource_props = dbt_nodes[unique_id]
+    asset_key = dagster_dbt_translator.get_asset_key(dbt_resource_props)
+    owners = dagster_dbt_translator.get_owners(
+        {
+            **dbt_resource_props,
+            **({"group": dbt_group_resource_props} if dbt_group_resource_props else {}),
+        }
+    )
+
+    check_specs = []
+    for test_unique_id in test_unique_ids:
+        check_spec = default_asset_check_fn(
+            manifest,
+            dbt_nodes,
+            dagster_dbt_translator,
+            asset_key,
+            test_unique_id,
+        )
+        if check_spec:
+            check_specs.append(check_spec)
+
+    return DbtNodeTranslation(
+        asset_key=asset_key,
+        description=dagster_dbt_translator.get_description(dbt_resource_props),
+        metadata=dict(dagster_dbt_translator.get_metadata(dbt_resource_props)),
+        owners=list(owners) if owners is not None else None,
+        tags=dict(dagster_dbt_translator.get_tags(dbt_resource_props)),
+        group_name=dagster_dbt_translator.get_group_name(dbt_resource_props),
+        code_version=dagster_dbt_translator.get_code_version(dbt_resource_props),
+        freshness_policy=dagster_dbt_translator.get_freshness_policy(dbt_resource_props),
+        automation_condition=dagster_dbt_translator.get_automation_condition(dbt_resource_props),
+        self_partition_mapping=dagster_dbt_translator.get_partition_mapping(
+            dbt_resource_props,
+            dbt_parent_resource_props=dbt_resource_props,
+        ),
+        parent_asset_keys={
+            parent_unique_id: dagster_dbt_translator.get_asset_key(dbt_nodes[parent_unique_id])
+            for parent_unique_id in parent_unique_ids
+        },
+        parent_partition_mappings={
+            parent_unique_id: dagster_dbt_translator.get_partition_mapping(
+                dbt_resource_props,
+                dbt_parent_resource_props=dbt_nodes[parent_unique_id],
+            )
+            for parent_unique_id in parent_unique_ids
+        },
+        check_specs=check_specs,
+    )
+
+
+def translate_dbt_nodes(
+    manifest: Mapping[str, Any],
+    dbt_nodes: Mapping[str, Any],
+    dagster_dbt_translator: "DagsterDbtTranslator",
+    dbt_unique_id_deps: Mapping[str, AbstractSet[str]],
+    translation_cache: Optional[DbtTranslationCache],
+) -> Mapping[str, DbtNodeTranslation]:
+    """Translates the dbt resources selected as assets, reusing the translations in the cache
+    for the resources that have not changed since they were last translated.
+    """
+    dbt_group_resource_props_by_group_name: Dict[str, Dict[str, Any]] = {
+        dbt_group_resource_props["name"]: dbt_group_resource_props
+        for dbt_group_resource_props in manifest["groups"].values()
+    }
+
+    fingerprint = get_translator_fingerprint(dagster_dbt_translator) if translation_cache else None
+    if fingerprint:
+        # Check specs resolve refs against the manifest's project
+        fingerprint = f"{fingerprint}:{manifest.get('metadata', {}).get('project_name')}"
+    digests = _DbtNodeDigests(dbt_nodes)
+
+    translations: Dict[str, DbtNodeTranslation] = {}
+    num_reused = 0
+    with time_execution_scope() as timer_result:
+        for unique_id, parent_unique_ids in dbt_unique_id_deps.items():
+            dbt_group_name = dbt_nodes[unique_id].get("group")
+            dbt_group_resource_props = (
+                dbt_group_resource_props_by_group_name.get(dbt_group_name)
+                if dbt_group_name
+                else None
+            )
+            test_unique_ids = [
+                child_unique_id
+                for child_unique_id in manifest["child_map"][unique_id]
+                if child_unique_id.startswith("test")
+            ]
+
+            key = None
+            if translation_cache and fingerprint:
+                try:
+                    key = _get_translation_key(
+                        fingerprint,
+                        digests,
+                        manifest,
+                        unique_id,
+                        parent_unique_ids,
+                        test_unique_ids,
+                        dbt_group_resource_props,
+                    )
+                except (KeyError, TypeError, orjson.JSONEncodeError):
+                    key = None
+
+                translation = translation_cache.get(key) if key else None
+                if translation:
+                    translations[unique_id] = translation
+                    num_reused += 1
+                    continue
+
+            translation = translate_dbt_node(
+                manifest,
+                dbt_nodes,
+                dagster_dbt_translator,
+                unique_id,
+                parent_unique_ids,
+                test_unique_ids,
+                dbt_group_resource_props,
+            )
+            if translation_cache and key:
+                translation_cache.put(key, translation)
+            translations[unique_id] = translation
+
+        if translation_cache:
+            translation_cache.flush()
+
+    _record_translation_metrics(len(translations), num_reused, timer_result.seconds)
+    metrics = get_dbt_translation_metrics()
+    logger.debug(
+        f"Translated {len(translations)} dbt resources in {format_duration(timer_result.millis)}"
+        + (f" ({num_reused} reused from `{translation_cache.path}`)" if translation_cache else "")
+        + f". {format_duration(metrics.seconds * 1000)} spent translating"
+        f" {metrics.num_translated} dbt resources in this process so far."
+    )
+
+    return translations
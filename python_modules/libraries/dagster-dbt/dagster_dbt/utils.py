@@ -4,6 +4,8 @@
 from dagster import AssetKey
 from packaging import version
 
+from dagster_dbt.dbt_manifest_selector import UnsupportedDbtSelectionError, get_manifest_selector
+
 # dbt resource types that may be considered assets
 ASSET_RESOURCE_TYPES = ["model", "seed", "snapshot"]
 
@@ -21,7 +23,24 @@ def select_unique_ids_from_manifest(
     exclude: str,
     manifest_json: Mapping[str, Any],
 ) -> AbstractSet[str]:
-    """Method to apply a selection string to an existing manifest.json file."""
+    """Method to apply a selection string to an existing manifest.json file.
+
+    Selections are resolved natively over the manifest when possible, and otherwise by dbt.
+    """
+    try:
+        return get_manifest_selector(manifest_json).select(select, exclude)
+    except UnsupportedDbtSelectionError:
+        return select_unique_ids_from_manifest_with_dbt(select, exclude, manifest_json)
+
+
+def select_unique_ids_from_manifest_with_dbt(
+    select: str,
+    exclude: str,
+    manifest_json: Mapping[str, Any],
+) -> AbstractSet[str]:
+    """Method to apply a selection string to an existing manifest.json file, using dbt's graph
+    selector.
+    """
     import dbt.graph.cli as graph_cli
     import dbt.graph.selector as graph_selector
     from dbt.contracts.graph.manifest import Manifest
@@ -0,0 +1,171 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from dagster_dbt.dbt_manifest_selector import (
+    DbtManifestSelector,
+    UnsupportedDbtSelectionError,
+    get_manifest_selector,
+)
+from dagster_dbt.utils import (
+    select_unique_ids_from_manifest,
+    select_unique_ids_from_manifest_with_dbt,
+)
+
+from dagster_dbt_tests.dbt_projects import (
+    test_dbt_model_versions_path,
+    test_dbt_python_interleaving_path,
+    test_dbt_unit_tests_path,
+    test_jaffle_shop_path,
+    test_meta_config_path,
+)
+
+SELECTIONS = [
+    "fqn:*",
+    "*",
+    "customers",
+    "customers orders",
+    "orders,customers",
+    "stg_customers stg_customers",
+    "jaffle_shop.staging",
+    "staging",
+    "staging.*",
+    "staging.stg_*",
+    "staging.stg_customers",
+    "staging.stg_customers.v2",
+    "stg_customers.v1",
+    "*.stg_customers",
+    "+customers",
+    "customers+",
+    "2+customers",
+    "+1 customers",
+    "stg_customers+1",
+    "1+orders+1",
+    "+orders,customers+",
+    "@stg_orders",
+    "@raw_customers",
+    "@customers,resource_type:seed",
+    "tag:foo",
+    "tag:bar-*",
+    "tag:*",
+    "tag:foo+",
+    "tag:does-not-exist customers",
+    "resource_type:model",
+    "resource_type:seed",
+    "resource_type:test",
+    "raw_customers+,resource_type:model",
+    "resource_type:model,tag:*",
+    "source:*",
+    "source:jaffle_shop",
+    "source:jaffle_shop.raw_customers+",
+    "source:*.*.raw_*",
+    "path:models/staging",
+    "path:models/staging/",
+    "models/staging",
+    "path:models/*.sql",
+    "path:models/**",
+    "path:models/staging/schema.yml",
+    "path:seeds",
+    "file:customers.sql",
+    "customers.sql",
+    "file:stg_*",
+    "file:schema.yml",
+    "package:jaffle_shop",
+    "package:test_*",
+    "group:customized*",
+    "unit_test:*",
+    "test_first_order",
+    "exposure:*",
+    "metric:*",
+    "semantic_model:*",
+    "saved_query:*",
+]
+
+EXCLUSIONS = [
+    "",
+    "orders",
+    "raw_customers+",
+    "+stg_orders",
+    "resource_type:test",
+    "tag:does-not-exist",
+    "path:models/staging",
+]
+
+
+@pytest.mark.parametrize(
+    ["manifest_fixture_name", "project_dir"],
+    [
+        ("test_jaffle_shop_manifest", test_jaffle_shop_path),
+        ("test_meta_config_manifest", test_meta_config_path),
+        ("test_dbt_model_versions_manifest", test_dbt_model_versions_path),
+        ("test_dbt_python_interleaving_manifest", test_dbt_python_interleaving_path),
+        ("test_dbt_unit_tests_manifest", test_dbt_unit_tests_path),
+    ],
+)
+def test_selection_conforms_to_dbt(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    manifest_fixture_name: str,
+    project_dir: Path,
+) -> None:
+    manifest = request.getfixturevalue(manifest_fixture_name)
+    selector = DbtManifestSelector(manifest)
+
+    # dbt resolves paths relative to the working directory
+    monkeypatch.chdir(project_dir)
+
+    for select in SELECTIONS:
+        for exclude in EXCLUSIONS:
+            assert selector.select(select, exclude) == select_unique_ids_from_manifest_with_dbt(
+                select=select, exclude=exclude, manifest_json=manifest
+            ), f"--select {select} --exclude {exclude}"
+
+
+@pytest.mark.parametrize(
+    "select",
+    [
+        "config.materialized:table",
+        "test_type:generic",
+        "access:protected",
+        "resource_type:does-not-exist",
+        "source:a.b.c.d",
+        "path:/models",
+    ],
+)
+def test_unsupported_selection(test_jaffle_shop_manifest: Dict[str, Any], select: str) -> None:
+    with pytest.raises(UnsupportedDbtSelectionError):
+        DbtManifestSelector(test_jaffle_shop_manifest).select(select, "")
+
+
+def test_unsupported_selection_falls_back_to_dbt(
+    test_jaffle_shop_manifest: Dict[str, Any],
+) -> None:
+    selected = select_unique_ids_from_manifest(
+        select="config.materialized:table",
+        exclude="customers",
+        manifest_json=test_jaffle_shop_manifest,
+    )
+
+    assert selected == select_unique_ids_from_manifest_with_dbt(
+        select="config.materialized:table",
+        exclude="customers",
+        manifest_json=test_jaffle_shop_manifest,
+    )
+    assert {unique_id for unique_id in selected if unique_id.startswith("model.")} == {
+        "model.jaffle_shop.orders"
+    }
+
+
+def test_manifest_selector_cache(test_jaffle_shop_manifest: Dict[str, Any]) -> None:
+    selector = get_manifest_selector(test_jaffle_shop_manifest)
+    assert get_manifest_selector(test_jaffle_shop_manifest) is selector
+    assert get_manifest_selector(dict(test_jaffle_shop_manifest)) is not selector
+
+    selected = selector.select("+customers", "")
+    assert selector.select("+customers", "") is selected
+    assert (
+        select_unique_ids_from_manifest(
+            select="+customers", exclude="", manifest_json=test_jaffle_shop_manifest
+        )
+        is selected
+    )
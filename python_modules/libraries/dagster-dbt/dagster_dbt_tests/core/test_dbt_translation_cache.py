@@ -0,0 +1,203 @@
+import copy
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+import pytest
+from dagster import AssetKey, DagsterInvalidDefinitionError
+from dagster_dbt import DagsterDbtTranslator, DagsterDbtTranslatorSettings, DbtProject
+from dagster_dbt.asset_utils import (
+    DAGSTER_DBT_MANIFEST_METADATA_KEY,
+    DAGSTER_DBT_TRANSLATOR_METADATA_KEY,
+    build_dbt_multi_asset_args,
+)
+from dagster_dbt.dbt_translation_cache import (
+    TRANSLATION_CACHE_FILE_NAME,
+    get_dbt_translation_metrics,
+    get_translator_fingerprint,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore::dagster.ExperimentalWarning")
+
+CACHED_SETTINGS = DagsterDbtTranslatorSettings(enable_translation_cache=True)
+
+
+class CustomDagsterDbtTranslator(DagsterDbtTranslator):
+    def get_asset_key(self, dbt_resource_props: Mapping[str, Any]) -> AssetKey:
+        return super().get_asset_key(dbt_resource_props).with_prefix("custom")
+
+
+class UnserializableMetadataDagsterDbtTranslator(DagsterDbtTranslator):
+    def get_metadata(self, dbt_resource_props: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"unserializable": object()}
+
+
+@pytest.fixture(name="project")
+def project_fixture(tmp_path: Path) -> DbtProject:
+    tmp_path.joinpath("dbt_project.yml").write_text("name: test_dagster_asset_checks\n")
+    tmp_path.joinpath("target").mkdir()
+
+    return DbtProject(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Simulate a fresh process, which only sees the translations persisted by previous ones
+    monkeypatch.setattr("dagster_dbt.dbt_translation_cache._translation_caches", {})
+
+
+def _build(
+    manifest: Mapping[str, Any],
+    dagster_dbt_translator: DagsterDbtTranslator,
+    project: DbtProject,
+    select: str = "fqn:*",
+) -> Any:
+    deps, outs, internal_asset_deps, check_specs = build_dbt_multi_asset_args(
+        manifest=manifest,
+        dagster_dbt_translator=dagster_dbt_translator,
+        select=select,
+        exclude="",
+        io_manager_key=None,
+        project=project,
+    )
+
+    return (
+        deps,
+        {
+            output_name: (
+                out.key,
+                out.description,
+                {
+                    key: value
+                    for key, value in out.metadata.items()
+                    if key
+                    not in (DAGSTER_DBT_MANIFEST_METADATA_KEY, DAGSTER_DBT_TRANSLATOR_METADATA_KEY)
+                },
+                out.owners,
+                out.tags,
+                out.group_name,
+                out.code_version,
+                out.freshness_policy,
+                out.automation_condition,
+            )
+            for output_name, out in outs.items()
+        },
+        internal_asset_deps,
+        check_specs,
+    )
+
+
+def _build_and_count_reused(
+    manifest: Mapping[str, Any],
+    dagster_dbt_translator: DagsterDbtTranslator,
+    project: DbtProject,
+    select: str = "fqn:*",
+) -> Any:
+    num_reused = get_dbt_translation_metrics().num_reused
+    result = _build(manifest, dagster_dbt_translator, project, select)
+
+    return result, get_dbt_translation_metrics().num_reused - num_reused
+
+
+def test_translation_cache(test_asset_checks_manifest: Dict[str, Any], project: DbtProject) -> None:
+    expected = _build(test_asset_checks_manifest, DagsterDbtTranslator(), project)
+    assert expected[3]
+
+    result, num_reused = _build_and_count_reused(
+        test_asset_checks_manifest, DagsterDbtTranslator(CACHED_SETTINGS), project
+    )
+    assert result == expected
+    assert num_reused == 0
+    assert project.manifest_path.parent.joinpath(TRANSLATION_CACHE_FILE_NAME).exists()
+
+    result, num_reused = _build_and_count_reused(
+        test_asset_checks_manifest, DagsterDbtTranslator(CACHED_SETTINGS), project
+    )
+    assert result == expected
+    assert num_reused == len(expected[1])
+
+
+def test_translation_cache_invalidation(
+    test_asset_checks_manifest: Dict[str, Any], project: DbtProject
+) -> None:
+    _build(test_asset_checks_manifest, DagsterDbtTranslator(CACHED_SETTINGS), project)
+
+    manifest = copy.deepcopy(test_asset_checks_manifest)
+    manifest["nodes"]["model.test_dagster_asset_checks.stg_orders"]["description"] = "changed"
+
+    expected = _build(manifest, DagsterDbtTranslator(), project)
+    result, num_reused = _build_and_count_reused(
+        manifest, DagsterDbtTranslator(CACHED_SETTINGS), project
+    )
+    assert result == expected
+    assert [
+        description.startswith("changed")
+        for key, description, *_ in result[1].values()
+        if key == AssetKey("stg_orders")
+    ] == [True]
+
+    # The changed model and its children, `customers` and `orders`, are translated again
+    assert num_reused == len(expected[1]) - 3
+
+    # A different translator doesn't reuse the translations of the default one
+    expected = _build(manifest, CustomDagsterDbtTranslator(), project)
+    result, num_reused = _build_and_count_reused(
+        manifest, CustomDagsterDbtTranslator(CACHED_SETTINGS), project
+    )
+    assert result == expected
+    assert num_reused == 0
+
+
+def test_translation_cache_selection(
+    test_asset_checks_manifest: Dict[str, Any], project: DbtProject
+) -> None:
+    _build(test_asset_checks_manifest, DagsterDbtTranslator(CACHED_SETTINGS), project)
+
+    expected = _build(test_asset_checks_manifest, DagsterDbtTranslator(), project, "customers")
+    result, num_reused = _build_and_count_reused(
+        test_asset_checks_manifest, DagsterDbtTranslator(CACHED_SETTINGS), project, "customers"
+    )
+    assert result == expected
+    assert num_reused == 1
+
+
+def test_translation_cache_unserializable(
+    test_asset_checks_manifest: Dict[str, Any], project: DbtProject
+) -> None:
+    for _ in range(2):
+        result, num_reused = _build_and_count_reused(
+            test_asset_checks_manifest,
+            UnserializableMetadataDagsterDbtTranslator(CACHED_SETTINGS),
+            project,
+        )
+        assert result[1]
+        assert num_reused == 0
+
+
+def test_translation_cache_requires_project(test_asset_checks_manifest: Dict[str, Any]) -> None:
+    with pytest.raises(DagsterInvalidDefinitionError, match="requires a DbtProject"):
+        build_dbt_multi_asset_args(
+            manifest=test_asset_checks_manifest,
+            dagster_dbt_translator=DagsterDbtTranslator(CACHED_SETTINGS),
+            select="fqn:*",
+            exclude="",
+            io_manager_key=None,
+            project=None,
+        )
+
+
+def test_translator_fingerprint() -> None:
+    fingerprint = get_translator_fingerprint(DagsterDbtTranslator())
+
+    assert fingerprint
+    assert get_translator_fingerprint(DagsterDbtTranslator()) == fingerprint
+    assert get_translator_fingerprint(DagsterDbtTranslator(CACHED_SETTINGS)) != fingerprint
+    assert get_translator_fingerprint(CustomDagsterDbtTranslator()) not in (fingerprint, None)
+
+    translator = CustomDagsterDbtTranslator()
+    translator.prefix = "foo"  # type: ignore
+    assert get_translator_fingerprint(translator) != get_translator_fingerprint(
+        CustomDagsterDbtTranslator()
+    )
+
+    translator.prefix = object()  # type: ignore
+    assert get_translator_fingerprint(translator) is None
@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional, cast
+from typing import Dict, Iterator, List, Optional, cast
 
 import kubernetes.config
 from dagster import (
@@ -35,7 +35,9 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
+from dagster_k8s.job_status_cache import K8sJobStatusCache
 from dagster_k8s.launcher import K8sRunLauncher
+from dagster_k8s.utils import sanitize_k8s_label
 
 _K8S_EXECUTOR_CONFIG_SCHEMA = merge_dicts(
     DagsterK8sJobConfig.config_type_job(),
@@ -80,6 +82,17 @@
             default_value={},
             description="Per op k8s configuration overrides.",
         ),
+        "watch_job_statuses": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Whether to check the health of launched steps against an in-process cache of "
+                "Kubernetes job statuses, kept up to date by a single watch on the step jobs of "
+                "the run, rather than reading the status of each step's job from the Kubernetes "
+                "API on every health check."
+            ),
+        ),
     },
 )
 
@@ -169,6 +182,7 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             load_incluster_config=load_incluster_config,
             kubeconfig_file=kubeconfig_file,
             per_step_k8s_config=exc_cfg.get("per_step_k8s_config", {}),
+            watch_job_statuses=cast(bool, exc_cfg.get("watch_job_statuses", False)),
         ),
         retries=RetryMode.from_config(exc_cfg["retries"]),  # type: ignore
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
@@ -190,6 +204,7 @@ def __init__(
         kubeconfig_file: Optional[str],
         k8s_client_batch_api=None,
         per_step_k8s_config=None,
+        watch_job_statuses: bool = False,
     ):
         super().__init__()
 
@@ -214,6 +229,8 @@ def __init__(
         self._per_step_k8s_config = check.opt_dict_param(
             per_step_k8s_config, "per_step_k8s_config", key_type=str, value_type=dict
         )
+        self._watch_job_statuses = check.bool_param(watch_job_statuses, "watch_job_statuses")
+        self._job_status_caches: Dict[str, K8sJobStatusCache] = {}
 
     def _get_step_key(self, step_handler_context: StepHandlerContext) -> str:
         step_keys_to_execute = cast(
@@ -261,6 +278,19 @@ def _get_k8s_step_job_name(self, step_handler_context: StepHandlerContext):
 
         return "dagster-step-%s" % (name_key)
 
+    def _get_job_status_cache(self, run_id: str) -> K8sJobStatusCache:
+        # step jobs are watched per run so that each run worker only receives events for the
+        # jobs that it launched
+        if run_id not in self._job_status_caches:
+            self._job_status_caches[run_id] = K8sJobStatusCache(
+                self._api_client.batch_api,
+                label_selector=(
+                    "app.kubernetes.io/component=step_worker,"
+                    f"dagster/run-id={sanitize_k8s_label(run_id)}"
+                ),
+            )
+        return self._job_status_caches[run_id]
+
     def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         step_key = self._get_step_key(step_handler_context)
 
@@ -331,10 +361,16 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
 
         container_context = self._get_container_context(step_handler_context)
 
-        status = self._api_client.get_job_status(
-            namespace=container_context.namespace,  # pyright: ignore[reportArgumentType]
-            job_name=job_name,
-        )
+        namespace = check.not_none(container_context.namespace)
+
+        status = None
+        if self._watch_job_statuses:
+            status = self._get_job_status_cache(
+                step_handler_context.execute_step_args.run_id
+            ).get_job_status(job_name=job_name, namespace=namespace)
+        if not status:
+            status = self._api_client.get_job_status(namespace=namespace, job_name=job_name)
+
         if not status:
             return CheckStepHealthResult.unhealthy(
                 reason=f"Kubernetes job {job_name} for step {step_key} could not be found."
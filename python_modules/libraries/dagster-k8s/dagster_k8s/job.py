@@ -508,6 +508,14 @@ def config_type_run_launcher(cls):
                     description="List of environment variable names that are allowed to be set on "
                     "a per-run or per-code-location basis - e.g. using tags on the run. ",
                 ),
+                "watch_job_statuses": Field(
+                    bool,
+                    is_required=False,
+                    description="Whether to check the health of run workers against an in-process "
+                    "cache of Kubernetes job statuses, kept up to date by a single watch on the run "
+                    "worker jobs in each namespace, rather than reading the status of each run's job "
+                    "from the Kubernetes API on every health check.",
+                ),
             },
         )
 
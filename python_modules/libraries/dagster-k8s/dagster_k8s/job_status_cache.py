@@ -0,0 +1,190 @@
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+import kubernetes.client.rest
+import kubernetes.watch
+from dagster import _check as check
+from kubernetes.client.models import V1JobStatus
+
+DEFAULT_WATCH_TIMEOUT_SECONDS = 300
+DEFAULT_WATCH_RETRY_INTERVAL = 5.0
+
+HTTP_STATUS_GONE = 410
+
+
+class _NamespacedJobWatch:
+    """Keeps the statuses of the jobs in one namespace that match a label selector up to date
+    using a single list followed by a watch, run in a background thread.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        namespace: str,
+        label_selector: str,
+        watch_factory: Callable[[], kubernetes.watch.Watch],
+        watch_timeout_seconds: int,
+        retry_interval: float,
+        logger: logging.Logger,
+    ):
+        self._batch_api = batch_api
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._watch_factory = watch_factory
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._retry_interval = retry_interval
+        self._logger = logger
+
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, Optional[V1JobStatus]] = {}
+        self._synced = threading.Event()
+        self._shutdown_event = threading.Event()
+        self._watch: Optional[kubernetes.watch.Watch] = None
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"k8s-job-watch-{namespace}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def get_job_status(self, job_name: str) -> Optional[V1JobStatus]:
+        if not self._synced.is_set():
+            return None
+        with self._lock:
+            return self._statuses.get(job_name)
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def shutdown(self) -> None:
+        self._shutdown_event.set()
+        watch = self._watch
+        if watch:
+            watch.stop()
+
+    def _list(self) -> str:
+        jobs = self._batch_api.list_namespaced_job(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        with self._lock:
+            self._statuses = {job.metadata.name: job.status for job in jobs.items}
+        self._synced.set()
+        return jobs.metadata.resource_version
+
+    def _run(self) -> None:
+        resource_version = None
+        while not self._shutdown_event.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list()
+
+                self._watch = self._watch_factory()
+                for event in self._watch.stream(
+                    self._batch_api.list_namespaced_job,
+                    namespace=self._namespace,
+                    label_selector=self._label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=self._watch_timeout_seconds,
+                ):
+                    if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+
+                    job = event["object"]
+                    with self._lock:
+                        if event["type"] == "DELETED":
+                            self._statuses.pop(job.metadata.name, None)
+                        else:
+                            self._statuses[job.metadata.name] = job.status
+                    resource_version = job.metadata.resource_version
+                continue
+            except kubernetes.client.rest.ApiException as e:
+                if e.status == HTTP_STATUS_GONE:
+                    # The resource version we were watching from has been compacted away, so
+                    # the watch has to start over from a fresh list
+                    resource_version = None
+                    continue
+                self._logger.warning(
+                    f"Error watching Kubernetes jobs in namespace {self._namespace}: {e}"
+                )
+            except Exception:
+                self._logger.exception(
+                    f"Error watching Kubernetes jobs in namespace {self._namespace}"
+                )
+
+            # Statuses may be stale until the next successful list, so stop serving them
+            self._synced.clear()
+            resource_version = None
+            self._shutdown_event.wait(self._retry_interval)
+
+
+class K8sJobStatusCache:
+    """In-process cache of the statuses of Kubernetes jobs.
+
+    Rather than reading the status of each job from the API server every time it is checked, the
+    cache keeps one list+watch per namespace for the jobs matching ``label_selector``, started the
+    first time a job in that namespace is looked up. Lookups return ``None`` when the status is not
+    known to the cache - before the first list has completed, while the watch is recovering from an
+    error, or for jobs that the watch has not (yet) seen - in which case callers should fall back
+    to reading the job from the API server.
+
+    Args:
+        batch_api (kubernetes.client.BatchV1Api): API client used to list and watch jobs.
+        label_selector (str): Label selector restricting the jobs that are watched.
+        watch_timeout_seconds (int): Server-side timeout of each watch request, after which the
+            watch is restarted from the last seen resource version.
+        retry_interval (float): Time to wait before listing again after a watch error.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        label_selector: str,
+        watch_timeout_seconds: int = DEFAULT_WATCH_TIMEOUT_SECONDS,
+        retry_interval: float = DEFAULT_WATCH_RETRY_INTERVAL,
+        logger: Optional[logging.Logger] = None,
+        watch_factory: Callable[[], kubernetes.watch.Watch] = kubernetes.watch.Watch,
+    ):
+        self._batch_api = batch_api
+        self._label_selector = check.str_param(label_selector, "label_selector")
+        self._watch_timeout_seconds = check.int_param(
+            watch_timeout_seconds, "watch_timeout_seconds"
+        )
+        self._retry_interval = check.numeric_param(retry_interval, "retry_interval")
+        self._logger = logger or logging.getLogger("dagster_k8s")
+        self._watch_factory = watch_factory
+
+        self._lock = threading.Lock()
+        self._watches: Dict[str, _NamespacedJobWatch] = {}
+
+    def _get_watch(self, namespace: str) -> _NamespacedJobWatch:
+        with self._lock:
+            if namespace not in self._watches:
+                self._watches[namespace] = _NamespacedJobWatch(
+                    batch_api=self._batch_api,
+                    namespace=namespace,
+                    label_selector=self._label_selector,
+                    watch_factory=self._watch_factory,
+                    watch_timeout_seconds=self._watch_timeout_seconds,
+                    retry_interval=self._retry_interval,
+                    logger=self._logger,
+                )
+            return self._watches[namespace]
+
+    def get_job_status(self, job_name: str, namespace: str) -> Optional[V1JobStatus]:
+        """Look up the status of a job, returning ``None`` if it is not known to the cache."""
+        check.str_param(job_name, "job_name")
+        check.str_param(namespace, "namespace")
+        return self._get_watch(namespace).get_job_status(job_name)
+
+    def wait_for_sync(self, namespace: str, timeout: Optional[float] = None) -> bool:
+        """Start watching ``namespace`` if needed and block until its initial list has completed."""
+        return self._get_watch(namespace).wait_for_sync(timeout)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            watches = list(self._watches.values())
+            self._watches = {}
+        for watch in watches:
+            watch.shutdown()
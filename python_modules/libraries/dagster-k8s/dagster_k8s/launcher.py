@@ -17,6 +17,7 @@
 from dagster_k8s.client import DagsterKubernetesClient
 from dagster_k8s.container_context import K8sContainerContext
 from dagster_k8s.job import DagsterK8sJobConfig, construct_dagster_k8s_job, get_job_name_from_run_id
+from dagster_k8s.job_status_cache import K8sJobStatusCache
 
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
@@ -68,6 +69,7 @@ def __init__(
         run_k8s_config=None,
         only_allow_user_defined_k8s_config_fields=None,
         only_allow_user_defined_env_vars=None,
+        watch_job_statuses=False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.job_namespace = check.str_param(job_namespace, "job_namespace")
@@ -123,6 +125,15 @@ def __init__(
 
         self._only_allow_user_defined_k8s_config_fields = only_allow_user_defined_k8s_config_fields
         self._only_allow_user_defined_env_vars = only_allow_user_defined_env_vars
+
+        self._job_status_cache = (
+            K8sJobStatusCache(
+                self._api_client.batch_api,
+                label_selector="app.kubernetes.io/component=run_worker",
+            )
+            if check.bool_param(watch_job_statuses, "watch_job_statuses")
+            else None
+        )
         super().__init__()
 
     @property
@@ -418,10 +429,17 @@ def check_run_worker_health(self, run: DagsterRun):
             run.run_id, resume_attempt_number=self._get_resume_attempt_number(run)
         )
         try:
-            status = self._api_client.get_job_status(
-                namespace=container_context.namespace,  # pyright: ignore[reportArgumentType]
-                job_name=job_name,
-            )
+            status = None
+            if self._job_status_cache:
+                status = self._job_status_cache.get_job_status(
+                    job_name=job_name,
+                    namespace=container_context.namespace,  # pyright: ignore[reportArgumentType]
+                )
+            if not status:
+                status = self._api_client.get_job_status(
+                    namespace=container_context.namespace,  # pyright: ignore[reportArgumentType]
+                    job_name=job_name,
+                )
         except Exception:
             return CheckRunHealthResult(
                 WorkerStatus.UNKNOWN, str(serializable_error_info_from_exc_info(sys.exc_info()))
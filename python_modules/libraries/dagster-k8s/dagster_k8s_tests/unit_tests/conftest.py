@@ -1,5 +1,14 @@
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import kubernetes.client.rest
 import pytest
 from dagster._core.test_utils import environ, instance_for_test
+from kubernetes.client import ApiClient
+from kubernetes.client.models import V1Job, V1JobList, V1JobStatus, V1ListMeta, V1ObjectMeta
 
 MINIMAL_KUBECONFIG_CONTENT = """
 apiVersion: v1
@@ -55,3 +64,193 @@ def k8s_run_launcher_instance(kubeconfig_file):
             }
         ) as instance:
             yield instance
+
+
+class FakeK8sBatchApi:
+    """In-memory stand-in for the job endpoints of the Kubernetes API server, including watches,
+    that counts the requests made against it.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self._condition = threading.Condition()
+        self._jobs = {}
+        self._events = []
+        self._resource_version = 0
+        self._compacted_resource_version = 0
+        self._watch_generation = 0
+        self._serializer = ApiClient()
+
+    def _record(self, event_type, namespace, job):
+        self._resource_version += 1
+        job.metadata.resource_version = str(self._resource_version)
+        self._events.append(
+            (
+                self._resource_version,
+                namespace,
+                json.dumps(
+                    {"type": event_type, "object": self._serializer.sanitize_for_serialization(job)}
+                ),
+                dict(job.metadata.labels or {}),
+            )
+        )
+        self._condition.notify_all()
+
+    def _get_job(self, name, namespace):
+        if (namespace, name) not in self._jobs:
+            raise kubernetes.client.rest.ApiException(status=404, reason="Not Found")
+        return self._jobs[(namespace, name)]
+
+    @staticmethod
+    def _matches(labels, label_selector):
+        if not label_selector:
+            return True
+        return all(
+            labels.get(key) == value
+            for key, value in (term.split("=", 1) for term in label_selector.split(","))
+        )
+
+    def update_job_status(self, name, namespace, status):
+        with self._condition:
+            job = self._get_job(name, namespace)
+            job.status = status
+            self._record("MODIFIED", namespace, job)
+
+    @contextmanager
+    def expiring_watches(self):
+        """Close all open watches once the block exits and forget the history of events made
+        within it, so that watches can only be resumed by listing again.
+        """
+        with self._condition:
+            yield
+            self._compacted_resource_version = self._resource_version
+            self._watch_generation += 1
+            self._condition.notify_all()
+
+    def create_namespaced_job(self, body, namespace):
+        with self._condition:
+            self.calls["create_namespaced_job"] += 1
+            job = V1Job(
+                metadata=V1ObjectMeta(
+                    name=body.metadata.name, namespace=namespace, labels=body.metadata.labels
+                ),
+                spec=body.spec,
+                status=V1JobStatus(active=1),
+            )
+            self._jobs[(namespace, job.metadata.name)] = job
+            self._record("ADDED", namespace, job)
+            return job
+
+    def delete_namespaced_job(self, name, namespace):
+        with self._condition:
+            self.calls["delete_namespaced_job"] += 1
+            job = self._jobs.pop((namespace, self._get_job(name, namespace).metadata.name))
+            self._record("DELETED", namespace, job)
+
+    def read_namespaced_job_status(self, name, namespace):
+        with self._condition:
+            self.calls["read_namespaced_job_status"] += 1
+            return self._get_job(name, namespace)
+
+    def list_namespaced_job(
+        self,
+        namespace,
+        label_selector=None,
+        field_selector=None,
+        watch=False,
+        resource_version=None,
+        timeout_seconds=None,
+        _preload_content=True,
+    ):
+        """:return: V1JobList"""
+        with self._condition:
+            if watch:
+                self.calls["watch_namespaced_job"] += 1
+                return _FakeWatchResponse(
+                    self, namespace, label_selector, int(resource_version), timeout_seconds
+                )
+
+            self.calls["list_namespaced_job"] += 1
+            return V1JobList(
+                items=[
+                    job
+                    for (job_namespace, name), job in self._jobs.items()
+                    if job_namespace == namespace
+                    and self._matches(job.metadata.labels or {}, label_selector)
+                    and (not field_selector or field_selector == f"metadata.name={name}")
+                ],
+                metadata=V1ListMeta(resource_version=str(self._resource_version)),
+            )
+
+    def get_watch_generation(self):
+        return self._watch_generation
+
+    def wait_for_events(self, namespace, label_selector, resource_version, generation, deadline):
+        """Block until there are events newer than ``resource_version``, returning ``None`` once
+        the watch should end.
+        """
+        with self._condition:
+            if resource_version < self._compacted_resource_version:
+                return [
+                    json.dumps(
+                        {
+                            "type": "ERROR",
+                            "object": {"code": 410, "reason": "Expired", "message": "too old"},
+                        }
+                    )
+                ]
+
+            while generation == self._watch_generation and time.time() < deadline:
+                events = [
+                    line
+                    for event_resource_version, event_namespace, line, labels in self._events
+                    if event_resource_version > resource_version
+                    and event_namespace == namespace
+                    and self._matches(labels, label_selector)
+                ]
+                if events:
+                    return events
+                self._condition.wait(timeout=deadline - time.time())
+
+            return None
+
+
+class _FakeWatchResponse:
+    def __init__(self, api, namespace, label_selector, resource_version, timeout_seconds):
+        self._api = api
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._resource_version = resource_version
+        self._deadline = time.time() + (timeout_seconds or 60)
+        self._generation = api.get_watch_generation()
+        self._closed = False
+
+    def stream(self, amt=None, decode_content=False):
+        while not self._closed:
+            lines = self._api.wait_for_events(
+                self._namespace,
+                self._label_selector,
+                self._resource_version,
+                self._generation,
+                self._deadline,
+            )
+            if lines is None:
+                return
+            for line in lines:
+                event = json.loads(line)
+                if event["type"] == "ERROR":
+                    yield line + "\n"
+                    return
+                self._resource_version = int(event["object"]["metadata"]["resourceVersion"])
+                yield line + "\n"
+
+    def close(self):
+        self._closed = True
+
+    def release_conn(self):
+        pass
+
+
+@pytest.fixture
+def fake_k8s_batch_api():
+    return FakeK8sBatchApi()
@@ -1,4 +1,5 @@
 import json
+import time
 from unittest import mock
 
 import pytest
@@ -25,6 +26,7 @@
 from dagster_k8s.container_context import K8sContainerContext
 from dagster_k8s.executor import _K8S_EXECUTOR_CONFIG_SCHEMA, K8sStepHandler, k8s_job_executor
 from dagster_k8s.job import UserDefinedDagsterK8sConfig
+from kubernetes.client.models import V1JobStatus
 
 
 @job(
@@ -115,6 +117,23 @@ def foo():
     foo()
 
 
+NUM_MANY_STEPS = 20
+
+
+@job(
+    executor_def=k8s_job_executor,
+    resource_defs={"io_manager": fs_io_manager},
+)
+def many_steps():
+    for i in range(NUM_MANY_STEPS):
+
+        @op(name=f"step_{i}")
+        def step():
+            return 1
+
+        step()
+
+
 @repository
 def bar_repo():
     return [bar]
@@ -211,7 +230,7 @@ def _get_executor(instance, job_def, executor_config=None):
     )
 
 
-def _step_handler_context(job_def, dagster_run, instance, executor):
+def _step_handler_context(job_def, dagster_run, instance, executor, step_key="foo"):
     execution_plan = create_execution_plan(job_def)
     log_manager = create_context_free_log_manager(instance, dagster_run)
 
@@ -230,9 +249,9 @@ def _step_handler_context(job_def, dagster_run, instance, executor):
     )
 
     execute_step_args = ExecuteStepArgs(
-        reconstructable(bar).get_python_origin(),
+        job_def.get_python_origin(),
         dagster_run.run_id,
-        ["foo"],
+        [step_key],
         print_serialized_events=False,
     )
 
@@ -734,3 +753,55 @@ def test_per_step_k8s_config(k8s_run_launcher_instance, python_origin_with_conta
     assert raw_k8s_config.container_config["resources"] == FOURTH_RESOURCES_TAGS
     assert raw_k8s_config.container_config["working_dir"] == "MY_WORKING_DIR"
     assert raw_k8s_config.container_config["volume_mounts"] == OTHER_VOLUME_MOUNTS_TAGS
+
+
+@pytest.mark.parametrize("watch_job_statuses", [False, True])
+def test_step_handler_health_check_api_calls(
+    kubeconfig_file, k8s_instance, fake_k8s_batch_api, watch_job_statuses
+):
+    num_health_checks = 10
+
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=fake_k8s_batch_api,
+        watch_job_statuses=watch_job_statuses,
+    )
+
+    recon_job = reconstructable(many_steps)
+    run = create_run_for_test(
+        k8s_instance, job_name="many_steps", job_code_origin=recon_job.get_python_origin()
+    )
+    executor = _get_executor(k8s_instance, recon_job)
+    step_handler_contexts = [
+        _step_handler_context(recon_job, run, k8s_instance, executor, step_key=f"step_{i}")
+        for i in range(NUM_MANY_STEPS)
+    ]
+
+    for step_handler_context in step_handler_contexts:
+        list(handler.launch_step(step_handler_context))
+
+    for _ in range(num_health_checks):
+        for step_handler_context in step_handler_contexts:
+            assert handler.check_step_health(step_handler_context).is_healthy
+
+    failed_job_name = handler._get_k8s_step_job_name(step_handler_contexts[0])  # noqa: SLF001
+    fake_k8s_batch_api.update_job_status(failed_job_name, "foo", V1JobStatus(failed=1))
+
+    start = time.time()
+    while handler.check_step_health(step_handler_contexts[0]).is_healthy:
+        assert time.time() - start < 10, "Timed out waiting for the failed job to be noticed"
+        time.sleep(0.01)
+
+    calls = fake_k8s_batch_api.calls
+    assert calls["create_namespaced_job"] == NUM_MANY_STEPS
+    if watch_job_statuses:
+        # a single list+watch for the run rather than a read for each health check of each step;
+        # only checks made before the initial list completes read the job
+        assert calls["list_namespaced_job"] == 1
+        assert calls["watch_namespaced_job"] == 1
+        assert calls["read_namespaced_job_status"] < NUM_MANY_STEPS
+    else:
+        assert calls["read_namespaced_job_status"] > NUM_MANY_STEPS * num_health_checks
@@ -0,0 +1,82 @@
+import time
+
+from dagster_k8s.job_status_cache import K8sJobStatusCache
+from kubernetes.client.models import V1Job, V1JobStatus, V1ObjectMeta
+
+
+def _job(name, labels):
+    return V1Job(metadata=V1ObjectMeta(name=name, labels=labels))
+
+
+def _wait_for(condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, "Timed out waiting for condition"
+        time.sleep(0.01)
+
+
+def test_job_status_cache(fake_k8s_batch_api):
+    fake_k8s_batch_api.create_namespaced_job(_job("existing", {"app": "dagster"}), "foo")
+    fake_k8s_batch_api.create_namespaced_job(_job("other_app", {"app": "other"}), "foo")
+
+    cache = K8sJobStatusCache(fake_k8s_batch_api, label_selector="app=dagster")
+    try:
+        assert cache.wait_for_sync("foo", timeout=10)
+        assert cache.get_job_status("existing", "foo").active == 1
+        assert cache.get_job_status("other_app", "foo") is None
+
+        fake_k8s_batch_api.create_namespaced_job(_job("new", {"app": "dagster"}), "foo")
+        _wait_for(lambda: cache.get_job_status("new", "foo") is not None)
+
+        fake_k8s_batch_api.update_job_status("new", "foo", V1JobStatus(failed=1))
+        _wait_for(lambda: cache.get_job_status("new", "foo").failed == 1)
+
+        fake_k8s_batch_api.delete_namespaced_job("existing", "foo")
+        _wait_for(lambda: cache.get_job_status("existing", "foo") is None)
+
+        # jobs in other namespaces are watched separately
+        fake_k8s_batch_api.create_namespaced_job(_job("existing", {"app": "dagster"}), "bar")
+        assert cache.wait_for_sync("bar", timeout=10)
+        assert cache.get_job_status("existing", "bar").active == 1
+        assert cache.get_job_status("existing", "foo") is None
+
+        assert fake_k8s_batch_api.calls["list_namespaced_job"] == 2
+        assert fake_k8s_batch_api.calls["read_namespaced_job_status"] == 0
+    finally:
+        cache.shutdown()
+
+
+def test_job_status_cache_relists_after_watch_expires(fake_k8s_batch_api):
+    fake_k8s_batch_api.create_namespaced_job(_job("first", {"app": "dagster"}), "foo")
+
+    cache = K8sJobStatusCache(fake_k8s_batch_api, label_selector="app=dagster")
+    try:
+        assert cache.wait_for_sync("foo", timeout=10)
+        assert cache.get_job_status("first", "foo").active == 1
+
+        with fake_k8s_batch_api.expiring_watches():
+            fake_k8s_batch_api.update_job_status("first", "foo", V1JobStatus(succeeded=1))
+            fake_k8s_batch_api.create_namespaced_job(_job("second", {"app": "dagster"}), "foo")
+
+        # the watch can't resume from its last resource version, so it lists again
+        _wait_for(lambda: cache.get_job_status("second", "foo") is not None)
+        assert cache.get_job_status("first", "foo").succeeded == 1
+        assert fake_k8s_batch_api.calls["list_namespaced_job"] == 2
+    finally:
+        cache.shutdown()
+
+
+def test_job_status_cache_watch_timeout(fake_k8s_batch_api):
+    cache = K8sJobStatusCache(
+        fake_k8s_batch_api, label_selector="app=dagster", watch_timeout_seconds=1
+    )
+    try:
+        assert cache.wait_for_sync("foo", timeout=10)
+        _wait_for(lambda: fake_k8s_batch_api.calls["watch_namespaced_job"] >= 2)
+
+        # watches that time out resume from the last resource version without listing again
+        fake_k8s_batch_api.create_namespaced_job(_job("new", {"app": "dagster"}), "foo")
+        _wait_for(lambda: cache.get_job_status("new", "foo") is not None)
+        assert fake_k8s_batch_api.calls["list_namespaced_job"] == 1
+    finally:
+        cache.shutdown()
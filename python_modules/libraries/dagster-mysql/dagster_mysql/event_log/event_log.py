@@ -148,7 +148,7 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         values = self._get_asset_entry_values(
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
-        with self.index_connection() as conn:
+        with self._index_write_connection() as conn:
             if values:
                 conn.execute(
                     db_dialects.mysql.insert(AssetKeyTable)